@@ -10,7 +10,7 @@ import os
 import sys
 import uuid
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, HTTPException, Response, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from typing import Optional, List, Dict, Any
@@ -225,6 +225,7 @@ async def health_check():
         "status": "healthy",
         "service": "orchestrator-3-stream",
         "websocket_connections": ws_manager.get_connection_count(),
+        "logging": logger.stats(),
     }
 
 
@@ -527,6 +528,7 @@ async def get_events_endpoint(
     event_types: str = "all",
     limit: int = 50,
     offset: int = 0,
+    cursor: Optional[str] = None,
 ):
     """
     Get events from all sources for EventStream component.
@@ -536,12 +538,14 @@ async def get_events_endpoint(
         - task_slug: Optional filter by task
         - event_types: Comma-separated list or "all" (default: "all")
         - limit: Max events to return (default 50)
-        - offset: Pagination offset (default 0)
+        - offset: Pagination offset (default 0, prefer cursor)
+        - cursor: Keyset cursor from a previous response's next_cursor
 
     Returns:
         - status: success/error
         - events: List of unified events with sourceType field
         - count: Total event count
+        - next_cursor: Cursor for the next (older) page, or null when exhausted
     """
     try:
         logger.http_request("GET", "/get_events")
@@ -552,68 +556,42 @@ async def get_events_endpoint(
             if event_types != "all"
             else ["agent_logs", "orchestrator_chat"]
         )
+        sources = [t for t in requested_types if t in database.EVENT_TIMELINE_SOURCES]
 
-        all_events = []
+        try:
+            before = database.decode_event_cursor(cursor) if cursor else None
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
 
-        # Fetch agent logs
-        if "agent_logs" in requested_types:
-            agent_uuid = uuid.UUID(agent_id) if agent_id else None
-            if agent_uuid:
-                agent_logs = await database.get_agent_logs(
-                    agent_id=agent_uuid, task_slug=task_slug, limit=limit, offset=offset
-                )
-            else:
-                agent_logs = await database.list_agent_logs(
-                    orchestrator_agent_id=app.state.orchestrator.id,
-                    limit=limit,
-                    offset=offset
-                )
+        # Single UNION ALL query, oldest at top and newest at bottom
+        rows = await database.list_event_timeline(
+            orchestrator_agent_id=app.state.orchestrator.id,
+            sources=sources,
+            agent_id=uuid.UUID(agent_id) if agent_id else None,
+            task_slug=task_slug,
+            limit=limit,
+            before=before,
+            offset=offset,
+        )
 
-            # Add sourceType field
-            for log in agent_logs:
-                log["sourceType"] = "agent_log"
-                all_events.append(log)
-
-        # Fetch system logs
-        if "system_logs" in requested_types:
-            system_logs = await database.list_system_logs(limit=limit, offset=offset)
-            for log in system_logs:
-                log["sourceType"] = "system_log"
-                all_events.append(log)
-
-        # Fetch orchestrator chat (filtered by current orchestrator)
-        if "orchestrator_chat" in requested_types:
-            chat_logs = await database.list_orchestrator_chat(
-                orchestrator_agent_id=app.state.orchestrator.id,
-                limit=limit,
-                offset=offset
+        next_cursor = None
+        if len(rows) == limit and rows:
+            next_cursor = database.encode_event_cursor(
+                rows[0]["event_ts"], rows[0]["event_id"]
             )
-            for log in chat_logs:
-                log["sourceType"] = "orchestrator_chat"
-                all_events.append(log)
 
-        # Sort by timestamp (newest first for limiting)
-        all_events.sort(
-            key=lambda x: x.get("timestamp") or x.get("created_at"), reverse=True
+        # Rows are already JSON-encoded by PostgreSQL - splice them into the body
+        body = (
+            '{"status":"success","events":['
+            + ",".join(row["event_json"] for row in rows)
+            + f'],"count":{len(rows)},"next_cursor":{json.dumps(next_cursor)}}}'
         )
 
-        # Apply limit to get most recent events
-        all_events = all_events[:limit]
-
-        # Reverse to show oldest at top, newest at bottom
-        all_events.reverse()
-
-        # Convert UUIDs and datetimes to strings for JSON
-        for event in all_events:
-            for key, value in list(event.items()):
-                if isinstance(value, uuid.UUID):
-                    event[key] = str(value)
-                elif hasattr(value, "isoformat"):
-                    event[key] = value.isoformat()
-
         logger.http_request("GET", "/get_events", 200)
-        return {"status": "success", "events": all_events, "count": len(all_events)}
+        return Response(content=body, media_type="application/json")
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to get events: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -74,6 +74,25 @@ DATABASE_MAX_OVERFLOW = int(os.getenv("DATABASE_MAX_OVERFLOW", "20"))
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 LOG_DIR = Path(os.getenv("LOG_DIR", "backend/logs"))
 
+# Background log writer: records beyond LOG_QUEUE_SIZE are dropped (and counted)
+# instead of blocking the event loop; files are flushed every LOG_FLUSH_INTERVAL s
+LOG_QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
+LOG_FLUSH_INTERVAL = float(os.getenv("LOG_FLUSH_INTERVAL", "1.0"))
+LOG_BATCH_SIZE = int(os.getenv("LOG_BATCH_SIZE", "500"))
+
+# Fraction of DEBUG records kept (1.0 = all, 0.1 = every 10th) for hot debug paths
+LOG_DEBUG_SAMPLE_RATE = float(os.getenv("LOG_DEBUG_SAMPLE_RATE", "1.0"))
+
+# ============================================================================
+# FILE TRACKING CONFIGURATION
+# ============================================================================
+
+# Max concurrent LLM calls when summarizing an agent's file changes
+FILE_SUMMARY_CONCURRENCY = int(os.getenv("FILE_SUMMARY_CONCURRENCY", "8"))
+
+# Summaries kept in memory, keyed by diff hash (identical diffs are not re-summarized)
+FILE_SUMMARY_CACHE_SIZE = int(os.getenv("FILE_SUMMARY_CACHE_SIZE", "512"))
+
 # ============================================================================
 # CORS CONFIGURATION
 # ============================================================================
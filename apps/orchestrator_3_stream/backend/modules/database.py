@@ -13,10 +13,12 @@ Reference:
 """
 
 import asyncpg
+import base64
 import uuid
 import json
 import os
-from typing import Optional, List, Dict, Any
+from datetime import datetime
+from typing import Optional, List, Dict, Any, Tuple
 from contextlib import asynccontextmanager
 
 from .orch_database_models import Agent, AgentLog
@@ -1600,6 +1602,161 @@ async def list_orchestrator_chat(
         return results
 
 
+# Event sources that can be merged into the /get_events timeline
+EVENT_TIMELINE_SOURCES = ("agent_logs", "system_logs", "orchestrator_chat")
+
+
+def encode_event_cursor(event_ts: datetime, event_id: uuid.UUID) -> str:
+    """
+    Encode a (timestamp, id) timeline position as an opaque cursor string.
+
+    Args:
+        event_ts: Timestamp of the event at the page boundary
+        event_id: UUID of the event at the page boundary
+
+    Returns:
+        URL-safe base64 cursor
+    """
+    raw = f"{event_ts.isoformat()}|{event_id}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def decode_event_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+    """
+    Decode a cursor produced by encode_event_cursor().
+
+    Args:
+        cursor: Opaque cursor string
+
+    Returns:
+        Tuple of (timestamp, id)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        ts_part, id_part = raw.split("|", 1)
+        return datetime.fromisoformat(ts_part), uuid.UUID(id_part)
+    except (ValueError, UnicodeError) as e:
+        raise ValueError(f"Invalid event cursor: {cursor}") from e
+
+
+async def list_event_timeline(
+    orchestrator_agent_id: uuid.UUID,
+    sources: List[str],
+    agent_id: Optional[uuid.UUID] = None,
+    task_slug: Optional[str] = None,
+    limit: int = DEFAULT_AGENT_LOG_LIMIT,
+    before: Optional[Tuple[datetime, uuid.UUID]] = None,
+    offset: int = 0,
+) -> List[Dict[str, Any]]:
+    """
+    Get a unified page of agent logs, system logs and orchestrator chat.
+
+    Runs a single UNION ALL query. Each branch seeks on its own
+    (timestamp, id) index and is capped at limit + offset rows, so the
+    merged page is exact without over-fetching whole tables. Rows are
+    encoded to JSON by PostgreSQL (to_jsonb) so the API can stream them
+    straight into the response body without per-field conversion.
+
+    Args:
+        orchestrator_agent_id: UUID of the orchestrator whose events to list
+        sources: Subset of EVENT_TIMELINE_SOURCES to include
+        agent_id: Optional filter for agent_logs by agent UUID
+        task_slug: Optional filter for agent_logs by task (requires agent_id)
+        limit: Maximum number of events to return
+        before: Optional (timestamp, id) keyset cursor - only older events are returned
+        offset: Number of events to skip (legacy pagination, prefer before)
+
+    Returns:
+        List of dicts with event_ts, event_id and event_json (JSON text including
+        a sourceType field), ordered oldest to newest
+    """
+    params: List[Any] = []
+
+    def param(value: Any) -> str:
+        params.append(value)
+        return f"${len(params)}"
+
+    branch_limit = param(limit + offset)
+    cursor_ts = param(before[0]) if before else None
+    cursor_id = param(before[1]) if before else None
+
+    def keyset(ts_col: str, id_col: str) -> str:
+        if not before:
+            return ""
+        return f" AND ({ts_col}, {id_col}) < ({cursor_ts}, {cursor_id})"
+
+    branches = []
+
+    if "agent_logs" in sources:
+        if agent_id:
+            where = f"al.agent_id = {param(agent_id)}"
+            if task_slug:
+                where += f" AND al.task_slug = {param(task_slug)}"
+        else:
+            where = f"a.orchestrator_agent_id = {param(orchestrator_agent_id)}"
+        branches.append(
+            f"""
+            (SELECT al.timestamp AS event_ts, al.id AS event_id,
+                    (to_jsonb(al) || jsonb_build_object(
+                        'agent_name', a.name, 'sourceType', 'agent_log'))::text AS event_json
+             FROM agent_logs al
+             LEFT JOIN agents a ON al.agent_id = a.id
+             WHERE {where}{keyset("al.timestamp", "al.id")}
+             ORDER BY al.timestamp DESC, al.id DESC
+             LIMIT {branch_limit})
+            """
+        )
+
+    if "system_logs" in sources:
+        branches.append(
+            f"""
+            (SELECT sl.timestamp AS event_ts, sl.id AS event_id,
+                    (to_jsonb(sl) || jsonb_build_object(
+                        'sourceType', 'system_log'))::text AS event_json
+             FROM system_logs sl
+             WHERE TRUE{keyset("sl.timestamp", "sl.id")}
+             ORDER BY sl.timestamp DESC, sl.id DESC
+             LIMIT {branch_limit})
+            """
+        )
+
+    if "orchestrator_chat" in sources:
+        branches.append(
+            f"""
+            (SELECT oc.created_at AS event_ts, oc.id AS event_id,
+                    (to_jsonb(oc) || jsonb_build_object(
+                        'sourceType', 'orchestrator_chat'))::text AS event_json
+             FROM orchestrator_chat oc
+             WHERE oc.orchestrator_agent_id = {param(orchestrator_agent_id)}
+                   {keyset("oc.created_at", "oc.id")}
+             ORDER BY oc.created_at DESC, oc.id DESC
+             LIMIT {branch_limit})
+            """
+        )
+
+    if not branches:
+        return []
+
+    query = f"""
+        SELECT event_ts, event_id, event_json
+        FROM (
+            SELECT event_ts, event_id, event_json
+            FROM ({" UNION ALL ".join(branches)}) timeline
+            ORDER BY event_ts DESC, event_id DESC
+            LIMIT {param(limit)} OFFSET {param(offset)}
+        ) page
+        ORDER BY event_ts ASC, event_id ASC
+    """
+
+    async with get_connection() as conn:
+        rows = await conn.fetch(query, *params)
+
+    return [dict(row) for row in rows]
+
+
 # ═══════════════════════════════════════════════════════════
 # AI DEVELOPER WORKFLOW OPERATIONS
 # ═══════════════════════════════════════════════════════════
@@ -5,7 +5,10 @@ Tracks file modifications and reads during agent execution.
 Maintains separate registries for modified and read files per agent.
 """
 
+import asyncio
+import hashlib
 import os
+from collections import OrderedDict
 from datetime import datetime
 from typing import Dict, Any, List, Set, Optional
 from uuid import UUID
@@ -16,6 +19,7 @@ from pydantic import BaseModel
 # Add parent directory to path to import git_utils
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../../')))
 from apps.orchestrator_db.git_utils import GitUtils
+from . import config
 
 
 # Pydantic models for type safety
@@ -52,6 +56,9 @@ class AgentLogMetadata(BaseModel):
 FILE_MODIFYING_TOOLS = ["Write", "Edit", "MultiEdit", "Bash"]
 FILE_READING_TOOLS = ["Read"]
 
+# LLM summaries keyed by diff hash, shared by all trackers (LRU, bounded)
+_summary_cache: "OrderedDict[str, str]" = OrderedDict()
+
 
 class FileTracker:
     """Tracks file operations for a single agent."""
@@ -122,19 +129,35 @@ class FileTracker:
         """
         Generate comprehensive summary of file modifications with diffs and AI summaries.
 
+        Status, stats and diffs for all files come from one batched git pass;
+        AI summaries then run concurrently (bounded by FILE_SUMMARY_CONCURRENCY).
+
         Returns:
             List of file change dictionaries with diffs, stats, and AI summaries
         """
-        file_changes = []
+        if not self.modified_files:
+            return []
+
+        file_paths = list(self.modified_files)
+
+        try:
+            changes = await asyncio.to_thread(
+                GitUtils.get_changes_batch, file_paths, self.working_dir
+            )
+        except Exception as e:
+            print(f"Error collecting git changes in {self.working_dir}: {e}")
+            return []
 
-        for file_path in self.modified_files:
+        semaphore = asyncio.Semaphore(config.FILE_SUMMARY_CONCURRENCY)
+
+        async def build_change(file_path: str) -> Optional[Dict[str, Any]]:
             try:
                 # Get tool info
                 tool_info = self._file_details.get(file_path, {})
                 tool_name = tool_info.get("tool_name", "Unknown")
 
-                # Resolve absolute path
-                abs_path = GitUtils.resolve_absolute_path(file_path, self.working_dir)
+                change = changes[file_path]
+                abs_path = change["absolute_path"]
 
                 # Get relative path for display
                 try:
@@ -143,38 +166,29 @@ class FileTracker:
                     # If paths are on different drives (Windows), use filename
                     rel_path = os.path.basename(abs_path)
 
-                # Generate diff
-                diff = GitUtils.get_file_diff(file_path, self.working_dir)
-
-                # Parse stats
-                lines_added, lines_removed = GitUtils.parse_diff_stats(diff) if diff else (0, 0)
+                diff = change["diff"]
+                async with semaphore:
+                    summary = await cached_file_change_summary(file_path, diff, tool_name)
 
-                # Determine status
-                status = GitUtils.get_file_status(file_path, self.working_dir)
-
-                # Generate AI summary
-                summary = await generate_file_change_summary(file_path, diff, tool_name)
-
-                file_change = {
+                return {
                     "path": rel_path,
                     "absolute_path": abs_path,
-                    "status": status,
-                    "lines_added": lines_added,
-                    "lines_removed": lines_removed,
+                    "status": change["status"],
+                    "lines_added": change["lines_added"],
+                    "lines_removed": change["lines_removed"],
                     "diff": diff,
                     "summary": summary,
                     "agent_id": self.agent_id,
                     "agent_name": self.agent_name
                 }
 
-                file_changes.append(file_change)
-
             except Exception as e:
                 # Log error but continue processing other files
                 print(f"Error generating summary for {file_path}: {e}")
-                continue
+                return None
 
-        return file_changes
+        results = await asyncio.gather(*(build_change(path) for path in file_paths))
+        return [change for change in results if change is not None]
 
     def generate_read_files_summary(self) -> List[Dict[str, Any]]:
         """
@@ -216,6 +230,44 @@ class FileTracker:
         return read_files
 
 
+async def cached_file_change_summary(
+    file_path: str,
+    diff: Optional[str],
+    tool_name: str
+) -> str:
+    """
+    Return the AI summary for a diff, reusing earlier results for identical diffs.
+
+    Args:
+        file_path: Path to the modified file
+        diff: Git diff string
+        tool_name: Tool that made the change
+
+    Returns:
+        Summary from cache or from generate_file_change_summary
+    """
+    # No diff means no LLM call - nothing worth caching
+    if not diff or not diff.strip():
+        return await generate_file_change_summary(file_path, diff, tool_name)
+
+    key = hashlib.sha256(
+        f"{os.path.basename(file_path)}\0{diff}".encode("utf-8", "replace")
+    ).hexdigest()
+
+    cached = _summary_cache.get(key)
+    if cached is not None:
+        _summary_cache.move_to_end(key)
+        return cached
+
+    summary = await generate_file_change_summary(file_path, diff, tool_name)
+
+    _summary_cache[key] = summary
+    if len(_summary_cache) > config.FILE_SUMMARY_CACHE_SIZE:
+        _summary_cache.popitem(last=False)
+
+    return summary
+
+
 async def generate_file_change_summary(
     file_path: str,
     diff: Optional[str],
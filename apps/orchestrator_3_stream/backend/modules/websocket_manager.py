@@ -90,9 +90,7 @@ class WebSocketManager:
             return
 
         event_type = data.get("type", "unknown")
-        logger.websocket_event(
-            event_type, {k: v for k, v in data.items() if k != "type"}
-        )
+        logger.websocket_event(event_type, data)
 
         # Add timestamp if not present
         if "timestamp" not in data:
@@ -0,0 +1,114 @@
+"""
+Completion Index Tests
+
+Tests the local completion index used by AutocompleteAgent:
+- Prefix matches at path segment boundaries
+- Fuzzy trigram matches for typos
+- Delta sync (add/remove without rebuilding)
+- Local completions that bypass the LLM
+
+Run with: uv run pytest tests/test_completion_index.py -v
+"""
+
+import sys
+import time
+import uuid
+from pathlib import Path
+from unittest.mock import Mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from modules.autocomplete_agent import AutocompleteAgent
+from modules.completion_index import (
+    KIND_AGENT,
+    KIND_COMMAND,
+    KIND_FILE,
+    CompletionIndex,
+)
+
+FILES = [
+    "backend/main.py",
+    "backend/modules/file_tracker.py",
+    "backend/modules/database.py",
+    "frontend/src/App.vue",
+] + [f"generated/module_{i}.py" for i in range(500)]
+
+
+def test_prefix_matches_any_segment() -> None:
+    """Typing the start of a basename or inner segment finds the full path"""
+    index = CompletionIndex()
+    index.sync(KIND_FILE, FILES)
+
+    matches = index.search("file_tr", kinds=[KIND_FILE])
+    assert matches[0][1] == "backend/modules/file_tracker.py"
+    assert matches[0][2] > 1.0
+
+    matches = index.search("tracker")
+    assert matches[0][1] == "backend/modules/file_tracker.py"
+
+
+def test_fuzzy_match_survives_typo() -> None:
+    """A typo with no prefix match still finds the file via trigrams"""
+    index = CompletionIndex()
+    index.sync(KIND_FILE, FILES)
+
+    matches = index.search("databse.py", kinds=[KIND_FILE])
+    assert matches
+    assert matches[0][1] == "backend/modules/database.py"
+    assert matches[0][2] < 1.0
+
+
+def test_sync_applies_deltas() -> None:
+    """sync() reports and applies only the changed entries"""
+    index = CompletionIndex()
+    assert index.sync(KIND_FILE, FILES) == (len(FILES), 0)
+    assert index.sync(KIND_FILE, FILES) == (0, 0)
+
+    updated = [f for f in FILES if f != "backend/main.py"] + ["backend/routes.py"]
+    assert index.sync(KIND_FILE, updated) == (1, 1)
+    assert index.search("main.py") == []
+    assert index.search("routes")[0][1] == "backend/routes.py"
+
+    index.sync(KIND_AGENT, ["builder"])
+    assert index.search("buil", kinds=[KIND_FILE]) == []
+    assert index.search("buil")[0][:2] == (KIND_AGENT, "builder")
+
+
+def test_prefix_lookup_is_sub_millisecond() -> None:
+    """Prefix lookups on a few thousand files stay well under a millisecond"""
+    index = CompletionIndex()
+    index.sync(KIND_FILE, [f"pkg_{i}/sub/file_{i}.py" for i in range(5000)])
+
+    started = time.perf_counter()
+    for _ in range(100):
+        index.search("file_42")
+    elapsed_ms = (time.perf_counter() - started) * 1000 / 100
+
+    assert elapsed_ms < 1.0
+
+
+def test_agent_completes_locally(tmp_path: Path) -> None:
+    """AutocompleteAgent answers token completions from the index"""
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "file_tracker.py").write_text("")
+    commands_dir = tmp_path / ".claude" / "commands"
+    commands_dir.mkdir(parents=True)
+    (commands_dir / "plan.md").write_text("---\ndescription: Plan work\n---\nPlan $1\n")
+
+    agent = AutocompleteAgent(str(uuid.uuid4()), Mock(), str(tmp_path))
+    agent._cached_agents = [{"id": "1", "name": "builder", "status": "idle"}]
+
+    items = agent.complete_locally("open file_tr")
+    assert items[0].completion == "src/file_tracker.py"
+    assert items[0].replace_length == len("file_tr")
+
+    items = agent.complete_locally("/pl")
+    assert items[0].completion == "/plan"
+
+    items = agent.complete_locally("ask buil")
+    assert items[0].completion == "builder"
+
+    assert agent.completion_index.values(KIND_COMMAND) == ["plan"]
+
+    # Trailing space means the user wants a semantic suggestion
+    assert agent.complete_locally("open file_tr ") is None
@@ -182,6 +182,49 @@ async def test_update_orchestrator_costs(db_pool):
     print(f"✅ Costs updated: tokens={orch['input_tokens']+orch['output_tokens']}, cost=${orch['total_cost']:.4f}")
 
 
+@pytest.mark.asyncio
+async def test_list_event_timeline_keyset_pages(db_pool: Any) -> None:
+    """Test unified timeline pagination with (timestamp, id) cursors"""
+    orch = await database.get_orchestrator()
+    assert orch is not None
+    orch_id = orch['id']
+
+    # Insert a few chat messages so there is something to page through
+    for i in range(3):
+        await database.insert_chat_message(
+            orchestrator_agent_id=orch_id,
+            sender_type="user",
+            receiver_type="orchestrator",
+            message=f"Timeline test message {i}",
+            agent_id=None,
+            metadata={"test": True}
+        )
+
+    first_page = await database.list_event_timeline(
+        orchestrator_agent_id=orch_id, sources=["orchestrator_chat"], limit=2
+    )
+    assert len(first_page) == 2
+
+    # Pages are returned oldest → newest
+    assert (first_page[0]['event_ts'], first_page[0]['event_id']) < (
+        first_page[1]['event_ts'], first_page[1]['event_id']
+    )
+    assert '"sourceType": "orchestrator_chat"' in first_page[0]['event_json']
+
+    # Cursor round-trips and the next page is strictly older
+    cursor = database.encode_event_cursor(first_page[0]['event_ts'], first_page[0]['event_id'])
+    before = database.decode_event_cursor(cursor)
+    assert before == (first_page[0]['event_ts'], first_page[0]['event_id'])
+
+    second_page = await database.list_event_timeline(
+        orchestrator_agent_id=orch_id, sources=["orchestrator_chat"], limit=2, before=before
+    )
+    for row in second_page:
+        assert (row['event_ts'], row['event_id']) < before
+
+    print(f"✅ Timeline pages: {len(first_page)} + {len(second_page)} events")
+
+
 if __name__ == "__main__":
     # Run tests
     pytest.main([__file__, "-v"])
@@ -0,0 +1,120 @@
+"""
+File Tracker Tests
+
+Tests the batched git pass behind FileTracker (status, numstat and per-file
+diffs from a fixed number of git commands) and the diff-hash summary cache.
+
+Run with: uv run pytest tests/test_file_tracker.py -v
+"""
+
+import asyncio
+import subprocess
+import sys
+import uuid
+from pathlib import Path
+from typing import List
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from modules import file_tracker
+from modules.file_tracker import FileTracker, GitUtils
+
+
+def git(repo: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    """Git repository with one committed, one modified, one deleted and one new file"""
+    git(tmp_path, "init", "-q")
+    git(tmp_path, "config", "user.email", "test@example.com")
+    git(tmp_path, "config", "user.name", "Test")
+
+    (tmp_path / "kept.py").write_text("a = 1\n")
+    (tmp_path / "edited.py").write_text("x = 1\ny = 2\n")
+    (tmp_path / "removed.py").write_text("gone = True\n")
+    git(tmp_path, "add", ".")
+    git(tmp_path, "commit", "-q", "-m", "init")
+
+    (tmp_path / "edited.py").write_text("x = 1\ny = 3\nz = 4\n")
+    (tmp_path / "removed.py").unlink()
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "new file.py").write_text("print('hi')\nprint('bye')\n")
+    return tmp_path
+
+
+def test_get_changes_batch_matches_per_file_helpers(repo: Path) -> None:
+    """One batched pass reports the same status and stats as the per-file helpers"""
+    paths = ["edited.py", "removed.py", str(repo / "src" / "new file.py"), "kept.py"]
+
+    changes = GitUtils.get_changes_batch(paths, str(repo))
+
+    assert changes["edited.py"]["status"] == "modified"
+    assert (changes["edited.py"]["lines_added"], changes["edited.py"]["lines_removed"]) == (2, 1)
+    assert changes["edited.py"]["diff"] == GitUtils.get_file_diff("edited.py", str(repo))
+
+    assert changes["removed.py"]["status"] == "deleted"
+    assert changes["removed.py"]["lines_removed"] == 1
+
+    new_file = changes[str(repo / "src" / "new file.py")]
+    assert new_file["status"] == "created"
+    assert new_file["lines_added"] == 2
+    assert "+++ b/src/new file.py" in new_file["diff"]
+
+    assert changes["kept.py"]["diff"] is None
+    assert changes["kept.py"]["lines_added"] == 0
+
+
+def test_split_diff_keeps_file_order() -> None:
+    """Multi-file diff output is split at each file header"""
+    diff = (
+        "diff --git a/a.py b/a.py\n--- a/a.py\n+++ b/a.py\n@@ -1 +1 @@\n-1\n+2\n"
+        "diff --git a/b.py b/b.py\n--- a/b.py\n+++ b/b.py\n@@ -1 +1 @@\n-3\n+4\n"
+    )
+
+    chunks = GitUtils.split_diff(diff)
+
+    assert len(chunks) == 2
+    assert chunks[0].startswith("diff --git a/a.py")
+    assert chunks[1].endswith("+4\n")
+
+
+def test_summaries_run_concurrently_and_are_cached(
+    repo: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Summaries overlap up to the concurrency bound and identical diffs hit the cache"""
+    calls: List[str] = []
+    active = 0
+    peak = 0
+
+    async def fake_summary(file_path: str, diff: str, tool_name: str) -> str:
+        nonlocal active, peak
+        calls.append(file_path)
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return f"summary of {Path(file_path).name}"
+
+    monkeypatch.setattr(file_tracker, "generate_file_change_summary", fake_summary)
+    monkeypatch.setattr(file_tracker.config, "FILE_SUMMARY_CONCURRENCY", 2)
+    file_tracker._summary_cache.clear()
+
+    for index in range(4):
+        (repo / f"extra_{index}.py").write_text(f"value = {index}\n")
+
+    tracker = FileTracker(uuid.uuid4(), "builder", str(repo))
+    for name in ["edited.py", "removed.py"] + [f"extra_{i}.py" for i in range(4)]:
+        tracker.track_modified_file("Write", {"file_path": name})
+
+    first = asyncio.run(tracker.generate_file_changes_summary())
+    assert len(first) == 6
+    assert len(calls) == 6
+    assert peak == 2
+
+    second = asyncio.run(tracker.generate_file_changes_summary())
+    assert len(calls) == 6
+    assert sorted(c["summary"] for c in second) == sorted(c["summary"] for c in first)
@@ -0,0 +1,126 @@
+"""
+Logging Pipeline Tests
+
+Tests the non-blocking OrchestratorLogger pipeline: bounded queue, background
+writer thread, DEBUG sampling and dropped-record counters.
+
+Run with: uv run pytest tests/test_logger.py -v
+"""
+
+import io
+import logging
+import queue
+import sys
+from pathlib import Path
+from typing import Any, List
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from modules.logger import (
+    DroppingQueueHandler,
+    HourlyRotatingFileHandler,
+    LevelSampler,
+    LogWriterThread,
+    _PayloadRepr,
+)
+from rich.console import Console
+from rich.logging import RichHandler
+
+
+def make_record(level: int, msg: str, *args: Any) -> logging.LogRecord:
+    return logging.LogRecord("test", level, __file__, 1, msg, args, None)
+
+
+def test_level_sampler_keeps_one_in_n() -> None:
+    """Only every Nth DEBUG record passes; other levels are untouched"""
+    sampler = LevelSampler(logging.DEBUG, 0.25)
+
+    kept = sum(sampler.filter(make_record(logging.DEBUG, "d")) for _ in range(100))
+    assert kept == 25
+    assert sampler.sampled_out == 75
+    assert sampler.filter(make_record(logging.INFO, "i"))
+
+
+def test_queue_handler_drops_instead_of_blocking() -> None:
+    """A full queue increments the dropped counter rather than blocking the caller"""
+    handler = DroppingQueueHandler(queue.Queue(maxsize=2))
+
+    for i in range(5):
+        handler.handle(make_record(logging.INFO, "msg %s", i))
+
+    assert handler.queued == 2
+    assert handler.dropped == 3
+
+
+def test_queue_handler_merges_args_at_enqueue() -> None:
+    """Arbitrary args are rendered on enqueue so later mutation cannot leak into the log"""
+    log_queue: "queue.Queue[Any]" = queue.Queue()
+    handler = DroppingQueueHandler(log_queue)
+    payload = {"a": 1}
+
+    handler.handle(make_record(logging.INFO, "payload %s", payload))
+    payload["b"] = 2
+
+    record = log_queue.get_nowait()
+    assert record.msg == "payload {'a': 1}"
+    assert record.args is None
+
+
+def test_queue_handler_defers_payload_repr() -> None:
+    """WebSocket payloads are snapshotted on enqueue but only repr'd on the writer thread"""
+    reprs: List[str] = []
+
+    class Value:
+        def __repr__(self) -> str:
+            reprs.append("called")
+            return "value"
+
+    log_queue: "queue.Queue[Any]" = queue.Queue()
+    handler = DroppingQueueHandler(log_queue)
+    payload = {"type": "chat", "a": Value()}
+
+    handler.handle(make_record(logging.INFO, "event %s | %s", "chat", _PayloadRepr(payload)))
+    payload["b"] = 2
+
+    record = log_queue.get_nowait()
+    assert reprs == []
+    assert record.getMessage() == "event chat | {'a': value}"
+
+
+def test_writer_thread_batches_to_hourly_file(tmp_path: Path) -> None:
+    """Records written by the background thread are flushed to the hourly file on stop"""
+    log_queue: "queue.Queue[Any]" = queue.Queue()
+    file_handler = HourlyRotatingFileHandler(tmp_path)
+    file_handler.setFormatter(logging.Formatter("%(message)s"))
+    writer = LogWriterThread(log_queue, [file_handler], flush_interval=60)
+    writer.start()
+
+    for i in range(10):
+        log_queue.put(make_record(logging.INFO, f"line {i}"))
+    writer.stop()
+    file_handler.close()
+
+    assert writer.written == 10
+    contents = "".join(p.read_text() for p in tmp_path.glob("*.log"))
+    assert "line 0" in contents and "line 9" in contents
+
+
+def test_writer_thread_renders_panels_off_the_caller_thread(tmp_path: Path) -> None:
+    """Panel records are drawn by the writer on the console; the file gets plain text"""
+    output = io.StringIO()
+    console_handler = RichHandler(console=Console(file=output, width=60))
+    file_handler = HourlyRotatingFileHandler(tmp_path)
+    file_handler.setFormatter(logging.Formatter("%(message)s"))
+    log_queue: "queue.Queue[Any]" = queue.Queue()
+    writer = LogWriterThread(log_queue, [console_handler, file_handler], flush_interval=60)
+    writer.start()
+
+    record = make_record(logging.INFO, "[PANEL] Title: body")
+    record.rich_panel = ("body", "Title", "cyan", True)
+    log_queue.put(record)
+    writer.stop()
+    file_handler.close()
+
+    assert "╭" in output.getvalue() and "[PANEL]" not in output.getvalue()
+    contents = "".join(p.read_text() for p in tmp_path.glob("*.log"))
+    assert "[PANEL] Title: body" in contents
@@ -36,7 +36,11 @@ export function useAutocomplete() {
   function acceptAutocomplete(index: number) {
     const item = store.autocompleteItems[index]
     if (!item) return null
-    return { completion: item.completion, reasoning: item.reasoning }
+    return {
+      completion: item.completion,
+      reasoning: item.reasoning,
+      replaceLength: item.replace_length ?? 0
+    }
   }
 
   /**
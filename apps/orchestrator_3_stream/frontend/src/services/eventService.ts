@@ -18,6 +18,7 @@ export interface EventsResponse {
   status: string
   events: UnifiedEvent[]
   count: number
+  next_cursor: string | null  // Pass as `cursor` to fetch the next (older) page
 }
 
 // Query parameters for /get_events
@@ -27,6 +28,7 @@ export interface GetEventsParams {
   event_types?: string  // "all" or comma-separated: "agent_logs,system_logs,orchestrator_chat"
   limit?: number
   offset?: number
+  cursor?: string  // Keyset cursor from a previous response's next_cursor
 }
 
 /**
@@ -0,0 +1,328 @@
+#!/usr/bin/env -S uv run
+# /// script
+# requires-python = ">=3.12"
+# dependencies = [
+#     "python-dotenv",
+#     "rich",
+#     "click",
+# ]
+# ///
+
+"""
+Log Retention Job for Multi-Agent Orchestration Database
+
+Archives monthly agent_logs / system_logs partitions older than the retention
+window to gzipped CSV files, rolls them up into the *_daily_rollup tables and
+drops them. Also pre-creates partitions for the coming months.
+
+Usage:
+    # Preview what would be archived (no changes)
+    uv run apps/orchestrator_db/log_retention.py --dry-run
+
+    # Keep 3 months of raw logs, archive the rest
+    uv run apps/orchestrator_db/log_retention.py --retention-months 3 --yes
+
+    # Only process agent_logs, archive into a custom directory
+    uv run apps/orchestrator_db/log_retention.py --table agent_logs --archive-dir /backups/logs
+
+Features:
+    - Streams each partition through psql \\copy into gzip (constant memory)
+    - Rollup + DETACH + DROP run in one transaction (safe to re-run)
+    - Rollups are keyed per day, so re-running never double counts
+    - Rich terminal output with a summary table
+    - Loads DATABASE_URL from .env file
+
+Requirements:
+    - Migration 13_log_partitioning.sql applied
+    - psql command-line tool installed
+    - DATABASE_URL set in root .env file
+
+Note: The <table>_legacy partition created by the conversion holds all rows
+written before partitioning and is never archived automatically.
+"""
+
+import gzip
+import os
+import re
+import shutil
+import subprocess
+import sys
+from datetime import date
+from pathlib import Path
+from typing import List, Tuple
+
+import click
+from dotenv import load_dotenv
+from rich.console import Console
+from rich.panel import Panel
+from rich.prompt import Confirm
+from rich.table import Table
+
+console = Console()
+
+# Rollup statement per partitioned table. {partition} and {archive} are filled in
+# per partition; one day always falls into exactly one monthly partition, so
+# DO UPDATE can overwrite instead of accumulate.
+ROLLUP_SQL = {
+    "agent_logs": """
+        INSERT INTO agent_logs_daily_rollup (
+            day, agent_id, event_category, event_type,
+            event_count, first_timestamp, last_timestamp, archive_file
+        )
+        SELECT timestamp::date, agent_id, event_category, event_type,
+               COUNT(*), MIN(timestamp), MAX(timestamp), {archive}
+        FROM {partition}
+        GROUP BY 1, 2, 3, 4
+        ON CONFLICT (day, agent_id, event_category, event_type) DO UPDATE SET
+            event_count = EXCLUDED.event_count,
+            first_timestamp = EXCLUDED.first_timestamp,
+            last_timestamp = EXCLUDED.last_timestamp,
+            archive_file = EXCLUDED.archive_file;
+    """,
+    "system_logs": """
+        INSERT INTO system_logs_daily_rollup (
+            day, level, event_count, first_timestamp, last_timestamp, archive_file
+        )
+        SELECT timestamp::date, level,
+               COUNT(*), MIN(timestamp), MAX(timestamp), {archive}
+        FROM {partition}
+        GROUP BY 1, 2
+        ON CONFLICT (day, level) DO UPDATE SET
+            event_count = EXCLUDED.event_count,
+            first_timestamp = EXCLUDED.first_timestamp,
+            last_timestamp = EXCLUDED.last_timestamp,
+            archive_file = EXCLUDED.archive_file;
+    """,
+}
+
+
+def load_database_url() -> str:
+    """Load DATABASE_URL from .env file"""
+    script_dir = Path(__file__).parent
+    project_root = script_dir.parent.parent
+    env_file = project_root / ".env"
+
+    if env_file.exists():
+        load_dotenv(env_file)
+
+    database_url = os.getenv("DATABASE_URL")
+    if not database_url:
+        console.print(
+            "[red]✗ Error:[/red] DATABASE_URL environment variable is required",
+            style="bold",
+        )
+        console.print(f"Add DATABASE_URL to {env_file}")
+        sys.exit(1)
+
+    return database_url
+
+
+def check_psql_installed() -> None:
+    """Verify psql command is available"""
+    try:
+        subprocess.run(["psql", "--version"], capture_output=True, check=True)
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        console.print("[red]✗ Error:[/red] psql command not found", style="bold")
+        console.print("Install PostgreSQL client tools to use this script")
+        sys.exit(1)
+
+
+def run_sql(database_url: str, sql: str, single_transaction: bool = False) -> str:
+    """Run SQL through psql and return unaligned, tuples-only output"""
+    cmd = ["psql", database_url, "-At", "-v", "ON_ERROR_STOP=1"]
+    if single_transaction:
+        cmd.append("-1")
+    result = subprocess.run(cmd, input=sql, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip())
+    return result.stdout
+
+
+def add_months(day: date, months: int) -> date:
+    """Shift the first day of a month by a number of months"""
+    index = day.year * 12 + (day.month - 1) + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def list_expired_partitions(database_url: str, table: str, cutoff: date) -> List[Tuple[str, date]]:
+    """Return (partition_name, month_start) for monthly partitions ending on or before cutoff"""
+    output = run_sql(
+        database_url,
+        f"""
+        SELECT c.relname
+        FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = '{table}'::regclass
+        ORDER BY c.relname;
+        """,
+    )
+
+    pattern = re.compile(rf"^{table}_p(\d{{4}})(\d{{2}})$")
+    expired = []
+    for name in output.split():
+        match = pattern.match(name)
+        if not match:
+            continue  # _legacy / _default partitions
+        month_start = date(int(match.group(1)), int(match.group(2)), 1)
+        if add_months(month_start, 1) <= cutoff:
+            expired.append((name, month_start))
+    return expired
+
+
+def archive_partition(database_url: str, partition: str, archive_path: Path) -> int:
+    """Stream a partition to a gzipped CSV file, returning the compressed size in bytes"""
+    archive_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = archive_path.with_suffix(archive_path.suffix + ".tmp")
+
+    copy_cmd = f"\\copy (SELECT * FROM {partition} ORDER BY timestamp) TO STDOUT WITH CSV HEADER"
+    with subprocess.Popen(
+        ["psql", database_url, "-v", "ON_ERROR_STOP=1", "-c", copy_cmd],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    ) as proc:
+        assert proc.stdout is not None and proc.stderr is not None  # both are pipes
+        with gzip.open(tmp_path, "wb") as gz:
+            shutil.copyfileobj(proc.stdout, gz)
+        stderr = proc.stderr.read().decode()
+
+    if proc.returncode != 0:
+        tmp_path.unlink(missing_ok=True)
+        raise RuntimeError(stderr.strip())
+
+    tmp_path.replace(archive_path)
+    return archive_path.stat().st_size
+
+
+def retire_partition(database_url: str, table: str, partition: str, archive_path: Path) -> None:
+    """Roll up, detach and drop a partition in a single transaction"""
+    archive_literal = "'" + str(archive_path).replace("'", "''") + "'"
+    sql = (
+        ROLLUP_SQL[table].format(partition=partition, archive=archive_literal)
+        + f"\nALTER TABLE {table} DETACH PARTITION {partition};"
+        + f"\nDROP TABLE {partition};"
+    )
+    run_sql(database_url, sql, single_transaction=True)
+
+
+@click.command()
+@click.option(
+    "--table",
+    "-t",
+    "tables",
+    multiple=True,
+    type=click.Choice(sorted(ROLLUP_SQL)),
+    help="Table to process (default: all partitioned log tables)",
+)
+@click.option(
+    "--retention-months",
+    default=3,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Full months of raw logs to keep in the database",
+)
+@click.option(
+    "--months-ahead",
+    default=3,
+    show_default=True,
+    type=click.IntRange(min=0),
+    help="Future monthly partitions to pre-create",
+)
+@click.option(
+    "--archive-dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=Path(__file__).parent / "archive",
+    show_default=True,
+    help="Directory for compressed partition archives",
+)
+@click.option("--dry-run", is_flag=True, help="Show expired partitions without changing anything")
+@click.option("--yes", "-y", is_flag=True, help="Skip confirmation prompt")
+def main(
+    tables: Tuple[str, ...],
+    retention_months: int,
+    months_ahead: int,
+    archive_dir: Path,
+    dry_run: bool,
+    yes: bool,
+) -> None:
+    """
+    Archive and drop log partitions older than the retention window.
+    """
+    console.print(
+        Panel.fit(
+            "[bold cyan]Orchestrator Log Retention[/bold cyan]",
+            border_style="cyan",
+        )
+    )
+
+    database_url = load_database_url()
+    check_psql_installed()
+
+    tables = tables or tuple(sorted(ROLLUP_SQL))
+    cutoff = add_months(date.today().replace(day=1), -retention_months)
+    console.print(f"[dim]Keeping raw logs from:[/dim] {cutoff.isoformat()}")
+    console.print(f"[dim]Archive directory:[/dim] {archive_dir}\n")
+
+    expired = {}
+    for table in tables:
+        if not dry_run:
+            created = run_sql(
+                database_url, f"SELECT ensure_log_partitions('{table}', {months_ahead});"
+            )
+            console.print(
+                f"[green]✓[/green] {table}: {created.strip()} future partition(s) created"
+            )
+        expired[table] = list_expired_partitions(database_url, table, cutoff)
+
+    plan = [(table, name, month) for table, parts in expired.items() for name, month in parts]
+    if not plan:
+        console.print("\n[green]✓ Nothing to archive[/green]")
+        return
+
+    preview = Table(title="Expired Partitions", border_style="cyan")
+    preview.add_column("Table", style="cyan")
+    preview.add_column("Partition", style="yellow")
+    preview.add_column("Month")
+    for table, name, month in plan:
+        preview.add_row(table, name, month.strftime("%Y-%m"))
+    console.print(preview)
+
+    if dry_run:
+        console.print("\n[dim]Dry run - no changes made[/dim]")
+        return
+
+    if not yes and not Confirm.ask(
+        f"\n[bold]Archive and drop {len(plan)} partition(s)?[/bold]", default=False
+    ):
+        console.print("\n[yellow]✗ Operation cancelled[/yellow]")
+        sys.exit(0)
+
+    failed = []
+    summary = Table(title="Archived Partitions", border_style="green")
+    summary.add_column("Partition", style="cyan")
+    summary.add_column("Archive", style="dim")
+    summary.add_column("Size", justify="right")
+
+    for table, name, _ in plan:
+        archive_path = archive_dir / table / f"{name}.csv.gz"
+        try:
+            size = archive_partition(database_url, name, archive_path)
+            retire_partition(database_url, table, name, archive_path)
+        except RuntimeError as e:
+            console.print(f"[red]✗[/red] Failed: {name}")
+            console.print(f"[dim]{e}[/dim]")
+            failed.append(name)
+            continue
+
+        console.print(f"[green]✓[/green] Archived: {name}")
+        summary.add_row(name, str(archive_path), f"{size / 1024 / 1024:.1f} MB")
+
+    console.print()
+    console.print(summary)
+
+    if failed:
+        console.print(f"\n[red]✗ {len(failed)} partition(s) failed:[/red] {', '.join(failed)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
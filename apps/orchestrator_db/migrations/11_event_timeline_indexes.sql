@@ -0,0 +1,24 @@
+-- ============================================================================
+-- EVENT TIMELINE INDEXES
+-- ============================================================================
+-- Keyset indexes for the unified /get_events timeline (list_event_timeline)
+--
+-- Each UNION ALL branch orders by (timestamp, id) DESC and seeks with
+-- WHERE (timestamp, id) < (cursor_ts, cursor_id), so every branch needs an
+-- index whose leading columns match its filter followed by (timestamp, id).
+--
+-- Dependencies: agent_logs (3), system_logs (4), orchestrator_chat (8)
+-- Note: Idempotent - can be run multiple times safely
+
+-- agent_logs: orchestrator-wide timeline (joined through agents)
+CREATE INDEX IF NOT EXISTS idx_agent_logs_timeline ON agent_logs(timestamp DESC, id DESC);
+
+-- agent_logs: single agent timeline, optionally narrowed to one task
+CREATE INDEX IF NOT EXISTS idx_agent_logs_agent_timeline ON agent_logs(agent_id, timestamp DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_agent_logs_agent_task_timeline ON agent_logs(agent_id, task_slug, timestamp DESC, id DESC) WHERE task_slug IS NOT NULL;
+
+-- system_logs: global timeline
+CREATE INDEX IF NOT EXISTS idx_system_logs_timeline ON system_logs(timestamp DESC, id DESC);
+
+-- orchestrator_chat: per-orchestrator timeline
+CREATE INDEX IF NOT EXISTS idx_orchestrator_chat_timeline ON orchestrator_chat(orchestrator_agent_id, created_at DESC, id DESC);
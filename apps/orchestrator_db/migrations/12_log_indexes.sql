@@ -0,0 +1,37 @@
+-- ============================================================================
+-- LOG QUERY INDEXES
+-- ============================================================================
+-- Composite and partial indexes for the hot agent_logs / system_logs queries
+-- in apps/orchestrator_3_stream/backend/modules/database.py
+--
+-- The single-column indexes from 5_indexes.sql force the planner to pick one
+-- filter column and then sort or filter the rest. Once the log tables reach
+-- tens of millions of rows, these composite indexes let each query run as an
+-- ordered index range scan that stops after LIMIT rows.
+--
+-- Dependencies: agent_logs (3), system_logs (4)
+-- Note: Idempotent - can be run multiple times safely
+
+-- get_agent_logs(agent_id, task_slug) ORDER BY entry_index ASC
+-- get_tail_raw(agent_id, task_slug) ORDER BY entry_index DESC (backward scan)
+CREATE INDEX IF NOT EXISTS idx_agent_logs_agent_task_entry ON agent_logs(agent_id, task_slug, entry_index) WHERE task_slug IS NOT NULL;
+
+-- get_tail_summaries(agent_id, task_slug) WHERE summary IS NOT NULL ORDER BY entry_index DESC
+CREATE INDEX IF NOT EXISTS idx_agent_logs_agent_task_summary ON agent_logs(agent_id, task_slug, entry_index DESC) WHERE summary IS NOT NULL;
+
+-- get_latest_task_slug(agent_id): GROUP BY task_slug ORDER BY MAX(timestamp)
+CREATE INDEX IF NOT EXISTS idx_agent_logs_agent_task_ts ON agent_logs(agent_id, task_slug, timestamp DESC);
+
+-- get_adw_logs(adw_id [, event_type]) ORDER BY timestamp DESC
+CREATE INDEX IF NOT EXISTS idx_agent_logs_adw_ts ON agent_logs(adw_id, timestamp DESC) WHERE adw_id IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_agent_logs_adw_type_ts ON agent_logs(adw_id, event_type, timestamp DESC) WHERE adw_id IS NOT NULL;
+
+-- get_adw_system_logs(adw_id) ORDER BY timestamp DESC
+CREATE INDEX IF NOT EXISTS idx_system_logs_adw_ts ON system_logs(adw_id, timestamp DESC) WHERE adw_id IS NOT NULL;
+
+-- list_system_logs(level) ORDER BY timestamp DESC
+CREATE INDEX IF NOT EXISTS idx_system_logs_level_ts ON system_logs(level, timestamp DESC);
+
+-- get_orchestrator_action_blocks(orchestrator_agent_id) ORDER BY timestamp DESC
+CREATE INDEX IF NOT EXISTS idx_system_logs_orch_blocks ON system_logs((metadata->>'orchestrator_agent_id'), timestamp DESC)
+    WHERE metadata->>'type' IN ('thinking_block', 'tool_use_block');
@@ -0,0 +1,164 @@
+-- ============================================================================
+-- LOG PARTITIONING AND ROLLUPS
+-- ============================================================================
+-- Converts agent_logs and system_logs into monthly RANGE partitions on
+-- "timestamp" and creates the daily rollup tables used by log_retention.py
+--
+-- Conversion is done in place without copying rows:
+--   1. The existing table (and its indexes) is renamed to <table>_legacy
+--   2. A partitioned <table> is created with the same columns, defaults,
+--      CHECK/FK constraints and indexes; the primary key becomes
+--      (id, timestamp) because it must include the partition key
+--   3. The legacy table is attached as the partition covering everything
+--      up to the start of next month, so existing rows never move
+--   4. A DEFAULT partition plus monthly partitions for the coming months
+--      are created
+--
+-- Retention: log_retention.py archives monthly partitions older than the
+-- retention window to gzipped CSV, rolls them up into *_daily_rollup and
+-- drops them. Run it from cron; it also pre-creates future partitions.
+--
+-- Dependencies: agent_logs (3), system_logs (4), indexes (5, 11, 12)
+-- Note: Idempotent - already-partitioned tables are left untouched
+
+-- ----------------------------------------------------------------------------
+-- Create monthly partitions for the current month and months_ahead after it
+-- ----------------------------------------------------------------------------
+CREATE OR REPLACE FUNCTION ensure_log_partitions(parent_table TEXT, months_ahead INTEGER DEFAULT 3)
+RETURNS INTEGER AS $$
+DECLARE
+  month_start DATE := date_trunc('month', NOW())::date;
+  partition_start DATE;
+  partition_name TEXT;
+  created INTEGER := 0;
+BEGIN
+  FOR i IN 0..months_ahead LOOP
+    partition_start := (month_start + make_interval(months => i))::date;
+    partition_name := format('%s_p%s', parent_table, to_char(partition_start, 'YYYYMM'));
+
+    CONTINUE WHEN to_regclass(partition_name) IS NOT NULL;
+
+    BEGIN
+      EXECUTE format(
+        'CREATE TABLE %I PARTITION OF %I FOR VALUES FROM (%L) TO (%L)',
+        partition_name, parent_table, partition_start, (partition_start + interval '1 month')::date
+      );
+      created := created + 1;
+    EXCEPTION
+      -- Range still covered by the legacy partition, or rows for it already
+      -- landed in the DEFAULT partition - leave them where they are
+      WHEN invalid_object_definition OR check_violation THEN
+        RAISE NOTICE 'Skipping partition %: %', partition_name, SQLERRM;
+    END;
+  END LOOP;
+
+  RETURN created;
+END;
+$$ LANGUAGE plpgsql;
+
+-- ----------------------------------------------------------------------------
+-- Convert a plain log table into a partitioned one (no-op if already done)
+-- ----------------------------------------------------------------------------
+CREATE OR REPLACE FUNCTION partition_log_table(parent_table TEXT)
+RETURNS BOOLEAN AS $$
+DECLARE
+  legacy_table TEXT := parent_table || '_legacy';
+  legacy_upper DATE := (date_trunc('month', NOW()) + interval '1 month')::date;
+  rec RECORD;
+BEGIN
+  IF EXISTS (
+    SELECT 1 FROM pg_class WHERE oid = to_regclass(parent_table) AND relkind = 'p'
+  ) THEN
+    RETURN FALSE;
+  END IF;
+
+  EXECUTE format('ALTER TABLE %I RENAME TO %I', parent_table, legacy_table);
+
+  -- Free the index names so the partitioned parent can own them
+  FOR rec IN
+    SELECT indexrelid::regclass::text AS index_name
+    FROM pg_index
+    WHERE indrelid = to_regclass(legacy_table)
+  LOOP
+    EXECUTE format('ALTER INDEX %I RENAME TO %I', rec.index_name, rec.index_name || '_legacy');
+  END LOOP;
+
+  EXECUTE format(
+    'CREATE TABLE %I (LIKE %I INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING COMMENTS) '
+    'PARTITION BY RANGE ("timestamp")',
+    parent_table, legacy_table
+  );
+  EXECUTE format('ALTER TABLE %I ADD PRIMARY KEY (id, "timestamp")', parent_table);
+
+  -- LIKE does not copy foreign keys
+  FOR rec IN
+    SELECT conname, pg_get_constraintdef(oid) AS definition
+    FROM pg_constraint
+    WHERE conrelid = to_regclass(legacy_table) AND contype = 'f'
+  LOOP
+    EXECUTE format('ALTER TABLE %I ADD CONSTRAINT %I %s', parent_table, rec.conname, rec.definition);
+  END LOOP;
+
+  -- Recreate secondary indexes on the parent; ATTACH below reuses the
+  -- matching legacy indexes instead of rebuilding them
+  FOR rec IN
+    SELECT indexrelid::regclass::text AS index_name, pg_get_indexdef(indexrelid) AS definition
+    FROM pg_index
+    WHERE indrelid = to_regclass(legacy_table) AND NOT indisprimary
+  LOOP
+    EXECUTE regexp_replace(
+      regexp_replace(
+        rec.definition,
+        'INDEX \S+ ON ',
+        'INDEX ' || quote_ident(regexp_replace(rec.index_name, '_legacy$', '')) || ' ON '
+      ),
+      ' ON (\S+\.)?' || legacy_table || ' ',
+      ' ON ' || quote_ident(parent_table) || ' '
+    );
+  END LOOP;
+
+  EXECUTE format(
+    'ALTER TABLE %I ATTACH PARTITION %I FOR VALUES FROM (MINVALUE) TO (%L)',
+    parent_table, legacy_table, legacy_upper
+  );
+  EXECUTE format('CREATE TABLE IF NOT EXISTS %I PARTITION OF %I DEFAULT', parent_table || '_default', parent_table);
+
+  PERFORM ensure_log_partitions(parent_table);
+
+  RETURN TRUE;
+END;
+$$ LANGUAGE plpgsql;
+
+SELECT partition_log_table('agent_logs');
+SELECT partition_log_table('system_logs');
+
+-- ----------------------------------------------------------------------------
+-- Daily rollups (populated by log_retention.py before partitions are dropped)
+-- ----------------------------------------------------------------------------
+CREATE TABLE IF NOT EXISTS agent_logs_daily_rollup (
+    day DATE NOT NULL,
+    agent_id UUID NOT NULL,
+    event_category TEXT NOT NULL,
+    event_type TEXT NOT NULL,
+    event_count BIGINT NOT NULL DEFAULT 0,
+    first_timestamp TIMESTAMPTZ,
+    last_timestamp TIMESTAMPTZ,
+    archive_file TEXT,
+    PRIMARY KEY (day, agent_id, event_category, event_type)
+);
+
+CREATE TABLE IF NOT EXISTS system_logs_daily_rollup (
+    day DATE NOT NULL,
+    level TEXT NOT NULL,
+    event_count BIGINT NOT NULL DEFAULT 0,
+    first_timestamp TIMESTAMPTZ,
+    last_timestamp TIMESTAMPTZ,
+    archive_file TEXT,
+    PRIMARY KEY (day, level)
+);
+
+COMMENT ON TABLE agent_logs_daily_rollup IS 'Per-day event counts for archived agent_logs partitions';
+COMMENT ON COLUMN agent_logs_daily_rollup.agent_id IS 'Agent that generated the events (no FK - rollups outlive agents)';
+COMMENT ON COLUMN agent_logs_daily_rollup.archive_file IS 'Compressed CSV archive holding the raw rows';
+COMMENT ON TABLE system_logs_daily_rollup IS 'Per-day event counts for archived system_logs partitions';
+COMMENT ON COLUMN system_logs_daily_rollup.archive_file IS 'Compressed CSV archive holding the raw rows';
@@ -53,6 +53,9 @@ MIGRATIONS = [
     "7_triggers.sql",
     "8_orchestrator_chat.sql",
     "9_ai_developer_workflows.sql",
+    "11_event_timeline_indexes.sql",
+    "12_log_indexes.sql",
+    "13_log_partitioning.sql",
 ]
 
 def main():
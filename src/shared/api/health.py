@@ -21,6 +21,8 @@ Key Components:
 - Database connectivity check using SELECT 1
 - Response format: status, version, database, timestamp (ISO8601)
 - Exception handling for database failures
+- database_metrics(): GET /health/metrics with statement latency histograms,
+  slow-query log, pool checkout wait and N+1 findings (db_metrics)
 
 Invariants:
 - Always returns HTTP 200 (status field indicates healthy/degraded)
@@ -31,6 +33,9 @@ Invariants:
 - Response completes in <100ms under normal conditions
 - Status 'healthy' requires database connected
 - Status 'degraded' indicates database disconnected but service running
+- /health/metrics never touches the database; it reports in-process counters
+- N+1 findings are only recorded for requests run through QueryMetricsMiddleware;
+  the generator creates no app entry point, so the app must add it (see below)
 
 Usage Examples:
 
@@ -49,6 +54,11 @@ app.include_router(health_router, prefix="")
 
 # Option 3: Custom prefix (endpoint at /api/v1/health)
 app.include_router(health_router, prefix="/api/v1")
+
+# Required for n_plus_one in /health/metrics (otherwise detected stays 0)
+from src.shared.infrastructure.db_metrics import QueryMetricsMiddleware
+
+app.add_middleware(QueryMetricsMiddleware)
 ```
 
 ```python
@@ -126,6 +136,7 @@ monitor = {
 Collaborators:
 - FastAPI APIRouter: HTTP routing and dependency injection
 - database.py get_db(): Database session provider
+- db_metrics.query_metrics: Query and pool metrics collected by engine events
 - SQLAlchemy Session/AsyncSession: Database query execution
 - Load Balancers: AWS ALB, GCP Load Balancer, Kubernetes probes
 - Monitoring Tools: Datadog, New Relic, Prometheus, custom health checkers
@@ -149,7 +160,8 @@ from datetime import datetime
 from fastapi import APIRouter, Depends
 from sqlalchemy import text
 from sqlalchemy.orm import Session
-from src.shared.infrastructure.database import get_db
+from src.shared.infrastructure.database import DATABASE_PROFILE, engine, get_db
+from src.shared.infrastructure.db_metrics import query_metrics
 
 # Create router with /health prefix
 # Users can override prefix when mounting: app.include_router(router, prefix="")
@@ -222,3 +234,41 @@ def health_check(db: Session = Depends(get_db)):
         "database": database_status,
         "timestamp": datetime.utcnow().isoformat() + "Z"
     }
+
+
+@router.get("/metrics")
+def database_metrics():
+    """
+    IDK: query-metrics, pool-metrics, observability
+
+    Database metrics endpoint for dashboards and troubleshooting.
+
+    Reports process-local counters collected by the engine listeners in
+    db_metrics. Statement text is included (parameter values are not), so
+    mount this router behind authentication or an internal network in
+    public deployments.
+
+    N+1 findings are counted per request by QueryMetricsMiddleware. The
+    generated code never registers it, so call
+    app.add_middleware(QueryMetricsMiddleware) where the app is created;
+    otherwise n_plus_one.detected stays 0.
+
+    Returns:
+        dict: Metrics with fields:
+            - profile (str): Active engine profile (dev, prod, serverless)
+            - statements (dict): Latency histogram of all statements
+            - by_statement (list): Histograms of the 20 most expensive statements
+            - slow_queries (dict): Threshold and most recent slow statements
+            - pool (dict): Checkout wait histogram, timeouts and pool sizes
+            - n_plus_one (dict): Threshold, total findings and recent findings
+
+    Example Response:
+        {
+            "profile": "prod",
+            "statements": {"count": 1520, "sum_ms": 2310.4, "p95_ms": 5, ...},
+            "slow_queries": {"threshold_ms": 200, "recent": [...]},
+            "pool": {"checkout_wait": {...}, "checkout_timeouts": 0, "checkedout": 3, ...},
+            "n_plus_one": {"threshold": 10, "detected": 1, "recent": [...]}
+        }
+    """
+    return {"profile": DATABASE_PROFILE, **query_metrics.snapshot(engine.pool)}
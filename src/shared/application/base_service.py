@@ -82,11 +82,16 @@ Related Docs:
 - ai_docs/doc/create-crud-entity/
 """
 
-from typing import Generic, TypeVar, Any
+from collections.abc import Iterator
+from typing import Generic, TypeVar, Any, get_args, get_origin
 from math import ceil
 from pydantic import BaseModel
 from fastapi import HTTPException
 
+from src.shared.infrastructure.export import export_lines, projection_columns
+from src.shared.infrastructure.pagination import page_cursors
+from src.shared.infrastructure.serialization import validate_many
+
 # Generic type variables for service layer
 TCreate = TypeVar('TCreate', bound=BaseModel)      # Create schema (e.g., ProductCreate)
 TUpdate = TypeVar('TUpdate', bound=BaseModel)      # Update schema (e.g., ProductUpdate)
@@ -106,14 +111,19 @@ class PaginatedResponse(BaseModel, Generic[TResponse]):
 
     Invariants:
     - items contains the current page of results
-    - total reflects total count across all pages
-    - page is 1-indexed (starts at 1, not 0)
-    - total_pages calculated as ceil(total / page_size)
+    - total reflects total count across all pages (None in cursor mode)
+    - page is 1-indexed (starts at 1, not 0; None in cursor mode)
+    - total_pages calculated as ceil(total / page_size) (None in cursor mode)
+    - total and total_pages are None when the count mode is "none"
+    - has_more tells whether a following page exists, whatever the count mode
+    - next_cursor/prev_cursor are None when there is no page in that direction
+    - items are plain dicts (id + requested fields) when a projection was requested
 
     Usage Pattern:
     - Service layer returns this from get_all() methods
     - API routes use as response_model for list endpoints
-    - Clients use total_pages and page for navigation
+    - Clients use total_pages and page for navigation, or pass
+      next_cursor/prev_cursor back as ?cursor= for keyset pagination
 
     Example:
 
@@ -144,11 +154,14 @@ class PaginatedResponse(BaseModel, Generic[TResponse]):
     - docs/shared/application/pagination.md
     """
 
-    items: list[TResponse]
-    total: int
-    page: int
+    items: list[TResponse] | list[dict[str, Any]]
+    total: int | None = None
+    page: int | None = None
     page_size: int
-    total_pages: int
+    total_pages: int | None = None
+    has_more: bool | None = None
+    next_cursor: str | None = None
+    prev_cursor: str | None = None
 
 
 class BaseService(Generic[TCreate, TUpdate, TResponse, TModel, TDomain]):
@@ -168,6 +181,9 @@ class BaseService(Generic[TCreate, TUpdate, TResponse, TModel, TDomain]):
     - Hard delete performs physical deletion
     - All queries exclude state=2 entities (repository enforces)
     - Missing or deleted entities raise HTTPException(404)
+    - Response DTOs are built from response_schema (the TResponse generic
+      argument, or the class attribute); lists are validated in one
+      TypeAdapter call (validate_many)
 
     Generic Type Parameters:
     - TCreate: Pydantic schema for creation (e.g., ProductCreate)
@@ -214,6 +230,19 @@ class BaseService(Generic[TCreate, TUpdate, TResponse, TModel, TDomain]):
     - ai_docs/doc/create-crud-entity/
     """
 
+    # Response DTO class; taken from BaseService[..., TResponse, ...] when not set
+    response_schema: type[BaseModel] | None = None
+
+    def __init_subclass__(cls, **kwargs: Any):
+        super().__init_subclass__(**kwargs)
+        if cls.response_schema is not None:
+            return
+        for base in getattr(cls, "__orig_bases__", ()):
+            args = get_args(base)
+            if get_origin(base) is BaseService and len(args) == 5:
+                if isinstance(args[2], type) and issubclass(args[2], BaseModel):
+                    cls.response_schema = args[2]
+
     def __init__(self, repository: Any):
         """
         IDK: dependency-injection, constructor
@@ -281,7 +310,7 @@ class BaseService(Generic[TCreate, TUpdate, TResponse, TModel, TDomain]):
         created = self.repository.create(entity_data)
 
         # Return response DTO
-        return TResponse.model_validate(created)
+        return self._to_response(created)
 
     def get_by_id(self, entity_id: str) -> TResponse:
         """
@@ -320,7 +349,7 @@ class BaseService(Generic[TCreate, TUpdate, TResponse, TModel, TDomain]):
         if not entity or (hasattr(entity, 'state') and entity.state == 2):
             raise HTTPException(status_code=404, detail="Entity not found")
 
-        return TResponse.model_validate(entity)
+        return self._to_response(entity)
 
     def get_all(
         self,
@@ -328,10 +357,13 @@ class BaseService(Generic[TCreate, TUpdate, TResponse, TModel, TDomain]):
         page_size: int,
         filters: dict | None = None,
         sort_by: str = "created_at",
-        sort_order: str = "desc"
+        sort_order: str = "desc",
+        cursor: str | None = None,
+        count_mode: str | None = None,
+        fields: list[str] | None = None
     ) -> PaginatedResponse[TResponse]:
         """
-        IDK: list-operation, pagination, filtering, sorting
+        IDK: list-operation, pagination, keyset-pagination, filtering, sorting
 
         Responsibility:
         - Retrieve paginated list of entities
@@ -345,19 +377,31 @@ class BaseService(Generic[TCreate, TUpdate, TResponse, TModel, TDomain]):
         - page is 1-indexed (starts at 1)
         - total_pages calculated as ceil(total / page_size)
         - Invalid filters/sort columns raise ValueError → HTTPException(400)
+        - With a cursor, page is ignored and no COUNT query runs
+          (total, page and total_pages are None)
+        - Offset pages also carry cursors so clients can switch to keyset mode
+        - count_mode picks how total is computed (exact, estimated, cached, none);
+          None uses the repository's count_mode
+        - With fields, only those columns (plus id) are loaded and returned as dicts
 
         Inputs:
-        - page: page number (1-indexed)
+        - page: page number (1-indexed, offset mode only)
         - page_size: items per page
         - filters: dict of column:value for exact match filtering
         - sort_by: column name to sort by
         - sort_order: "asc" or "desc"
+        - cursor: next_cursor/prev_cursor from a previous response
+        - count_mode: "exact", "estimated", "cached" or "none" (None = repository default)
+        - fields: columns to return (None returns full response DTOs)
 
         Outputs:
         - PaginatedResponse[TResponse]: paginated results with metadata
 
         Failure Modes:
         - HTTPException(400): invalid filter column or sort column (from repository)
+        - HTTPException(400): malformed cursor or cursor issued for another sort
+        - HTTPException(400): unknown count mode
+        - HTTPException(400): unknown field in the projection
 
         Example:
 
@@ -370,6 +414,16 @@ class BaseService(Generic[TCreate, TUpdate, TResponse, TModel, TDomain]):
             sort_by="price",
             sort_order="asc"
         )
+
+        # Continue from there without OFFSET or COUNT
+        response = service.get_all(
+            page=1,
+            page_size=10,
+            filters={"category": "Electronics"},
+            sort_by="price",
+            sort_order="asc",
+            cursor=response.next_cursor
+        )
         ```
 
         Related Docs:
@@ -378,33 +432,136 @@ class BaseService(Generic[TCreate, TUpdate, TResponse, TModel, TDomain]):
         """
         filters = filters or {}
 
+        if cursor:
+            try:
+                # Keyset page: seeks past the cursor, skips COUNT
+                items, next_cursor, prev_cursor = self.repository.get_all_by_cursor(
+                    page_size=page_size,
+                    cursor=cursor,
+                    filters=filters,
+                    sort_by=sort_by,
+                    sort_order=sort_order,
+                    fields=fields
+                )
+            except ValueError as e:
+                # Invalid filter/sort column, field or cursor
+                raise HTTPException(status_code=400, detail=str(e))
+
+            return PaginatedResponse[TResponse](
+                items=self._response_items(items, fields),
+                page_size=page_size,
+                has_more=next_cursor is not None,
+                next_cursor=next_cursor,
+                prev_cursor=prev_cursor
+            )
+
         try:
             # Repository validates columns and excludes state=2
-            items, total = self.repository.get_all(
+            items, total, has_more = self.repository.get_page(
                 page=page,
                 page_size=page_size,
                 filters=filters,
                 sort_by=sort_by,
-                sort_order=sort_order
+                sort_order=sort_order,
+                count_mode=count_mode,
+                fields=fields
             )
         except ValueError as e:
-            # Invalid filter/sort column
+            # Invalid filter/sort column, field or count mode
             raise HTTPException(status_code=400, detail=str(e))
 
-        # Convert entities to response DTOs
-        response_items = [TResponse.model_validate(item) for item in items]
+        # Convert entities to response DTOs (or projected dicts)
+        response_items = self._response_items(items, fields)
 
-        # Calculate total pages
-        total_pages = ceil(total / page_size) if page_size > 0 else 0
+        # Calculate total pages (unknown when counting is skipped)
+        total_pages = None
+        if total is not None:
+            total_pages = ceil(total / page_size) if page_size > 0 else 0
+
+        # Cursors for the page boundaries, so clients can continue by keyset
+        next_cursor, prev_cursor = page_cursors(
+            items, sort_by, sort_order, "next", has_more, page > 1
+        )
 
         return PaginatedResponse[TResponse](
             items=response_items,
             total=total,
             page=page,
             page_size=page_size,
-            total_pages=total_pages
+            total_pages=total_pages,
+            has_more=has_more,
+            next_cursor=next_cursor,
+            prev_cursor=prev_cursor
         )
 
+    def _to_response(self, entity: Any) -> TResponse:
+        """Convert one entity to its response DTO."""
+        return self.response_schema.model_validate(entity, from_attributes=True)
+
+    def _response_items(self, items: list[Any], fields: list[str] | None) -> list[Any]:
+        """Convert entities to response DTOs, or to dicts of id + the projected fields."""
+        if not fields:
+            return validate_many(self.response_schema, items)
+        columns = list(dict.fromkeys(["id", *fields]))
+        return [{column: getattr(item, column) for column in columns} for item in items]
+
+    def export(
+        self,
+        export_format: str = "ndjson",
+        filters: dict | None = None,
+        sort_by: str | None = None,
+        sort_order: str = "asc",
+        fields: list[str] | None = None
+    ) -> Iterator[str]:
+        """
+        IDK: streaming-export, ndjson, csv, column-projection
+
+        Responsibility:
+        - Stream every matching entity as NDJSON or CSV lines
+        - Keep memory constant regardless of table size
+
+        Invariants:
+        - Rows come from repository.stream_all() (server-side cursor, no ORM objects)
+        - Soft-deleted entities (state=2) are excluded
+        - Invalid input fails before the first line is produced, so routes can
+          still answer 400 instead of a truncated stream
+        - CSV output starts with a header line of the exported columns
+
+        Inputs:
+        - export_format: "ndjson" or "csv"
+        - filters: dict of column:value for exact match filtering
+        - sort_by: column name to sort by (None sorts by id)
+        - sort_order: "asc" or "desc"
+        - fields: columns to export (None exports all columns)
+
+        Outputs:
+        - Iterator[str]: serialized lines, ready for a StreamingResponse
+
+        Failure Modes:
+        - HTTPException(400): unknown format, field or sort column
+
+        Example:
+
+        ```python
+        lines = service.export("csv", fields=["code", "price"])
+        return StreamingResponse(lines, media_type="text/csv")
+        ```
+
+        Related Docs:
+        - docs/shared/infrastructure/export.md
+        """
+        try:
+            columns = projection_columns(self.repository.model_class, fields)
+            rows = self.repository.stream_all(
+                filters=filters or {},
+                sort_by=sort_by,
+                sort_order=sort_order,
+                fields=fields
+            )
+            return export_lines(rows, export_format, columns)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
     def update(
         self,
         entity_id: str,
@@ -475,7 +632,7 @@ class BaseService(Generic[TCreate, TUpdate, TResponse, TModel, TDomain]):
         # Persist via repository
         updated = self.repository.update(entity)
 
-        return TResponse.model_validate(updated)
+        return self._to_response(updated)
 
     def delete(self, entity_id: str, user_id: str | None = None) -> bool:
         """
@@ -582,3 +739,108 @@ class BaseService(Generic[TCreate, TUpdate, TResponse, TModel, TDomain]):
         self.repository.delete(entity_id)
 
         return True
+
+    def bulk_create(self, items: list[TCreate], user_id: str | None = None) -> list[TResponse]:
+        """
+        IDK: bulk-create, batch-insert, audit-trail
+
+        Responsibility:
+        - Create many entities from DTOs in one INSERT ... RETURNING per chunk
+        - Set audit fields (created_by, updated_by) on every row
+
+        Invariants:
+        - Results are returned in input order
+        - Empty input returns an empty list without touching the database
+
+        Inputs:
+        - items: create DTOs
+        - user_id: user performing the operation (None for system)
+
+        Outputs:
+        - list[TResponse]: created entities as response DTOs
+
+        Failure Modes:
+        - RepositoryError: database constraint violation (whole batch rolls back)
+
+        Related Docs:
+        - docs/shared/infrastructure/bulk-operations.md
+        """
+        rows = [
+            {**item.model_dump(), 'created_by': user_id, 'updated_by': user_id}
+            for item in items
+        ]
+        created = self.repository.bulk_create(rows)
+        return validate_many(self.response_schema, created)
+
+    def bulk_update(self, items: list[dict[str, Any]], user_id: str | None = None) -> int:
+        """
+        IDK: bulk-update, executemany, audit-trail
+
+        Responsibility:
+        - Apply partial updates to many entities by id (executemany UPDATE)
+        - Set updated_by on every row
+
+        Invariants:
+        - Each item carries "id" plus only the fields to change
+        - Deleted entities (state=2) and unknown ids are skipped, not created
+
+        Inputs:
+        - items: dicts with "id" and the changed fields
+          (e.g. BulkUpdate.model_dump(exclude_unset=True))
+        - user_id: user performing the operation (None for system)
+
+        Outputs:
+        - int: number of rows updated
+
+        Failure Modes:
+        - HTTPException(400): an item has no id
+
+        Related Docs:
+        - docs/shared/infrastructure/bulk-operations.md
+        """
+        rows = [{**item, 'updated_by': user_id} for item in items]
+        try:
+            return self.repository.bulk_update(rows)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    def bulk_upsert(
+        self,
+        items: list[TCreate],
+        user_id: str | None = None,
+        conflict_columns: tuple[str, ...] = ("id",),
+    ) -> list[TResponse]:
+        """
+        IDK: bulk-upsert, on-conflict, audit-trail
+
+        Responsibility:
+        - Insert or update many entities in one INSERT ... ON CONFLICT per chunk
+
+        Invariants:
+        - Rows matching conflict_columns are updated, the rest inserted
+        - created_by is only kept for new rows; updated_by is always set
+        - Duplicate keys in the input collapse to the last item
+
+        Inputs:
+        - items: create DTOs
+        - user_id: user performing the operation (None for system)
+        - conflict_columns: unique columns identifying an existing row
+
+        Outputs:
+        - list[TResponse]: inserted or updated entities as response DTOs
+
+        Failure Modes:
+        - HTTPException(400): database dialect has no upsert support
+
+        Related Docs:
+        - docs/shared/infrastructure/bulk-operations.md
+        """
+        rows = [
+            {**item.model_dump(), 'created_by': user_id, 'updated_by': user_id}
+            for item in items
+        ]
+        try:
+            upserted = self.repository.bulk_upsert(rows, conflict_columns=conflict_columns)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        return validate_many(self.response_schema, upserted)
@@ -15,7 +15,11 @@ Key Components:
 - Soft-delete enforcement: All queries exclude state=2 entities
 - Transaction management: Each method handles commit/rollback
 - Dynamic filtering: Apply equality filters from dict
-- Pagination: offset/limit with total count
+- Pagination: offset/limit with total count, or keyset cursors without COUNT
+- Count strategies: exact, planner-estimated, cached (TTL) or none (has_more)
+- Bulk operations: INSERT ... RETURNING, executemany UPDATE and ON CONFLICT upsert
+- Entity cache: optional read-through cache for get_by_id/exists (cache_entities)
+- Projection and streaming: fields= on list methods, stream_all() for exports
 
 Invariants:
 - All queries filter out state=2 (soft-deleted) entities by default
@@ -102,9 +106,34 @@ Related Docs:
 - ai_docs/doc/create-crud-entity/
 """
 
+from collections.abc import Iterator, Sequence
 from typing import Generic, TypeVar, Dict, Any
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy.orm import Session, load_only
+from sqlalchemy import func, insert, select, text
+
+from src.shared.infrastructure.bulk import (
+    chunked,
+    dedupe_rows,
+    model_rows,
+    update_rows,
+    update_statement,
+    upsert_statement,
+)
+from src.shared.infrastructure.counting import (
+    CountMode,
+    count_cache,
+    estimate_statement,
+    plan_rows,
+)
+from src.shared.infrastructure.entity_cache import entity_cache, restore, snapshot
+from src.shared.infrastructure.export import projection_columns
+from src.shared.infrastructure.pagination import (
+    check_cursor,
+    decode_cursor,
+    page_cursors,
+    seek_condition,
+    seek_order,
+)
 
 # Generic type variable for ORM models
 TModel = TypeVar('TModel')
@@ -164,6 +193,19 @@ class BaseRepository(Generic[TModel]):
     - docs/shared/infrastructure/repository-pattern.md
     """
 
+    # How get_page() computes totals; override per entity repository
+    count_mode: CountMode = CountMode.EXACT
+    # Seconds a CACHED total stays valid (writes invalidate it earlier)
+    count_cache_ttl: float = 60.0
+    # Rows per bulk statement (further bounded by the bind parameter limit)
+    bulk_chunk_size: int = 1000
+    # Rows fetched per round trip by stream_all()
+    stream_batch_size: int = 1000
+    # Read-through cache for get_by_id/exists; enable per entity repository
+    cache_entities: bool = False
+    # Seconds a cached row stays valid (writes invalidate it earlier)
+    entity_cache_ttl: float = 300.0
+
     def __init__(self, session: Session, model_class: type[TModel]):
         """
         IDK: dependency-injection, constructor
@@ -197,11 +239,13 @@ class BaseRepository(Generic[TModel]):
         - Retrieve single entity by ID
         - Exclude soft-deleted entities (state=2)
         - Return None if not found or deleted
+        - Read through the entity cache when cache_entities is enabled
 
         Invariants:
         - Returns None if entity.state == 2
         - Returns None if entity_id doesn't exist
         - No exception raised on missing entity
+        - Cache hits are attached to the session without a SELECT
 
         Inputs:
         - entity_id: unique identifier of entity
@@ -221,18 +265,60 @@ class BaseRepository(Generic[TModel]):
         Related Docs:
         - docs/shared/infrastructure/soft-delete.md
         """
-        return self.session.query(self.model_class).filter(
+        if self.cache_entities:
+            cached = self._get_cached(entity_id)
+            if cached is not None:
+                return cached
+
+        entity = self.session.query(self.model_class).filter(
             self.model_class.id == entity_id,
             self.model_class.state != 2
         ).first()
 
+        if entity is not None and self.cache_entities:
+            entity_cache.set(
+                self.model_class.__table__.fullname,
+                entity.id,
+                snapshot(entity),
+                self.entity_cache_ttl,
+            )
+        return entity
+
+    def _get_cached(self, entity_id: str) -> TModel | None:
+        """
+        IDK: entity-cache, read-through, identity-map
+
+        Responsibility:
+        - Return the session's own instance, or a cached row merged into the session
+
+        Invariants:
+        - An instance already in the session wins (it may hold unflushed changes)
+        - merge(load=False) attaches the cached row without a SELECT
+        - Returns None on a cache miss
+        """
+        key = self.session.identity_key(self.model_class, entity_id)
+        current = self.session.identity_map.get(key)
+        if current is not None:
+            return current if current.state != 2 else None
+
+        values = entity_cache.get(self.model_class.__table__.fullname, entity_id)
+        if values is None:
+            return None
+        return self.session.merge(restore(self.model_class, values), load=False)
+
+    def _invalidate_cached(self, *entity_ids: Any) -> None:
+        """Drop written entities from the entity cache (called after commit)."""
+        if self.cache_entities:
+            entity_cache.invalidate(self.model_class.__table__.fullname, *entity_ids)
+
     def get_all(
         self,
         page: int,
         page_size: int,
         filters: Dict[str, Any] | None = None,
         sort_by: str | None = None,
-        sort_order: str = "asc"
+        sort_order: str = "asc",
+        fields: Sequence[str] | None = None
     ) -> tuple[list[TModel], int]:
         """
         IDK: list-operation, pagination, filtering, sorting
@@ -251,6 +337,7 @@ class BaseRepository(Generic[TModel]):
         - sort_by must be valid model attribute if provided
         - Offset calculated as (page - 1) * page_size
         - Total count reflects all matching entities (not just current page)
+        - Always counts exactly (get_page() applies count_mode)
 
         Inputs:
         - page: page number (1-indexed)
@@ -258,6 +345,7 @@ class BaseRepository(Generic[TModel]):
         - filters: dict of field:value for equality filtering
         - sort_by: field name to sort by (None for no sorting)
         - sort_order: "asc" or "desc"
+        - fields: columns to load (None loads all; id is always loaded)
 
         Outputs:
         - tuple[list[TModel], int]: (items in current page, total count)
@@ -285,6 +373,76 @@ class BaseRepository(Generic[TModel]):
         - docs/shared/infrastructure/pagination.md
         - docs/shared/infrastructure/filtering.md
         """
+        items, total, _ = self.get_page(
+            page=page,
+            page_size=page_size,
+            filters=filters,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            count_mode=CountMode.EXACT,
+            fields=fields
+        )
+        return items, total
+
+    def get_page(
+        self,
+        page: int,
+        page_size: int,
+        filters: Dict[str, Any] | None = None,
+        sort_by: str | None = None,
+        sort_order: str = "asc",
+        count_mode: CountMode | str | None = None,
+        fields: Sequence[str] | None = None
+    ) -> tuple[list[TModel], int | None, bool]:
+        """
+        IDK: list-operation, pagination, count-strategy, filtering, sorting
+
+        Responsibility:
+        - Retrieve paginated list of entities
+        - Compute the total with the configured count strategy
+        - Report whether another page exists without relying on the total
+
+        Invariants:
+        - Excludes entities with state=2
+        - page must be >= 1
+        - page_size must be >= 1
+        - sort_by must be valid model attribute if provided
+        - Fetches page_size + 1 rows; has_more is exact in every mode
+        - total is None when count_mode is NONE
+        - ESTIMATED totals are approximate; CACHED totals may lag by count_cache_ttl
+
+        Inputs:
+        - page: page number (1-indexed)
+        - page_size: number of items per page
+        - filters: dict of field:value for equality filtering
+        - sort_by: field name to sort by (None for no sorting)
+        - sort_order: "asc" or "desc"
+        - count_mode: override for self.count_mode (None uses the repository default)
+        - fields: columns to load (None loads all; id and sort_by are always loaded)
+
+        Outputs:
+        - tuple[list[TModel], int | None, bool]: (items, total, has_more)
+
+        Failure Modes:
+        - ValueError: page < 1 or page_size < 1
+        - ValueError: sort_by is not a valid model attribute
+        - ValueError: unknown count_mode
+        - ValueError: fields names a column the model does not have
+
+        Example:
+
+        ```python
+        items, total, has_more = repository.get_page(
+            page=3,
+            page_size=20,
+            filters={"category": "Electronics"},
+            count_mode="estimated"
+        )
+        ```
+
+        Related Docs:
+        - docs/shared/infrastructure/pagination.md
+        """
         # Validate inputs
         if page < 1:
             raise ValueError("page must be >= 1")
@@ -295,6 +453,9 @@ class BaseRepository(Generic[TModel]):
         if sort_by and not hasattr(self.model_class, sort_by):
             raise ValueError(f"Invalid sort field: {sort_by}")
 
+        mode = CountMode(count_mode or self.count_mode)
+        columns = projection_columns(self.model_class, fields, sort_by) if fields else None
+
         # Base query excludes soft-deleted entities
         query = self.session.query(self.model_class).filter(
             self.model_class.state != 2
@@ -306,8 +467,8 @@ class BaseRepository(Generic[TModel]):
                 if hasattr(self.model_class, key):
                     query = query.filter(getattr(self.model_class, key) == value)
 
-        # Get total count before pagination
-        total = query.count()
+        # Get total before pagination, according to the count strategy
+        total = self._count_total(query, filters, mode)
 
         # Apply sorting
         if sort_by:
@@ -317,11 +478,179 @@ class BaseRepository(Generic[TModel]):
             else:
                 query = query.order_by(sort_column.asc())
 
-        # Apply pagination
+        # Load only the projected columns
+        if columns:
+            query = query.options(load_only(*(getattr(self.model_class, c) for c in columns)))
+
+        # Apply pagination, fetching one extra row to detect a next page
         offset = (page - 1) * page_size
-        items = query.offset(offset).limit(page_size).all()
+        rows = query.offset(offset).limit(page_size + 1).all()
+        has_more = len(rows) > page_size
 
-        return items, total
+        return rows[:page_size], total, has_more
+
+    def _count_total(
+        self,
+        query: Any,
+        filters: Dict[str, Any] | None,
+        mode: CountMode
+    ) -> int | None:
+        """
+        IDK: count-strategy, planner-estimate, count-cache
+
+        Responsibility:
+        - Compute the total of a filtered query with the given strategy
+
+        Invariants:
+        - NONE returns None without touching the database
+        - ESTIMATED uses pg_class.reltuples without filters and EXPLAIN rows
+          with filters; other dialects fall back to an exact count
+        - CACHED reuses an exact count for count_cache_ttl seconds
+        """
+        if mode == CountMode.NONE:
+            return None
+
+        table = self.model_class.__table__.fullname
+
+        if mode == CountMode.ESTIMATED:
+            dialect = self.session.get_bind().dialect
+            if dialect.name == "postgresql":
+                if not filters:
+                    estimate = self.session.execute(
+                        text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:t)"),
+                        {"t": table},
+                    ).scalar()
+                else:
+                    sql, params = estimate_statement(query.statement, dialect)
+                    explain = self.session.connection().exec_driver_sql(sql, params).scalar()
+                    estimate = plan_rows(explain)
+                # reltuples is -1 until the table has been analyzed
+                if estimate is not None and estimate >= 0:
+                    return int(estimate)
+            return query.order_by(None).count()
+
+        if mode == CountMode.CACHED:
+            key = count_cache.key(table, filters)
+            total = count_cache.get(key)
+            if total is None:
+                total = query.order_by(None).count()
+                count_cache.set(key, total, self.count_cache_ttl)
+            return total
+
+        return query.order_by(None).count()
+
+    def get_all_by_cursor(
+        self,
+        page_size: int,
+        cursor: str | None = None,
+        filters: Dict[str, Any] | None = None,
+        sort_by: str | None = None,
+        sort_order: str = "asc",
+        fields: Sequence[str] | None = None
+    ) -> tuple[list[TModel], str | None, str | None]:
+        """
+        IDK: list-operation, keyset-pagination, filtering, sorting
+
+        Responsibility:
+        - Retrieve a page of entities by seeking past a cursor (no OFFSET)
+        - Apply dynamic filters with equality operator
+        - Exclude soft-deleted entities (state=2)
+        - Issue next/prev cursors for the page boundaries
+
+        Invariants:
+        - Excludes entities with state=2
+        - page_size must be >= 1
+        - sort_by must be valid model attribute if provided
+        - Orders by (sort_by, id) so pages are stable under ties
+        - Never runs COUNT; fetches page_size + 1 rows to detect more pages
+        - Cost per page is independent of how deep the page is
+
+        Inputs:
+        - page_size: number of items per page
+        - cursor: next_cursor/prev_cursor from a previous page (None = first page)
+        - filters: dict of field:value for equality filtering
+        - sort_by: field name to sort by (None sorts by id)
+        - sort_order: "asc" or "desc"
+        - fields: columns to load (None loads all; id and sort_by are always loaded)
+
+        Outputs:
+        - tuple[list[TModel], str | None, str | None]: (items, next_cursor, prev_cursor)
+
+        Failure Modes:
+        - ValueError: page_size < 1
+        - ValueError: sort_by is not a valid model attribute
+        - ValueError: cursor is malformed or was issued for another sort
+        - ValueError: fields names a column the model does not have
+
+        Example:
+
+        ```python
+        items, next_cursor, prev_cursor = repository.get_all_by_cursor(
+            page_size=20,
+            sort_by="created_at",
+            sort_order="desc"
+        )
+        # Following page
+        items, next_cursor, prev_cursor = repository.get_all_by_cursor(
+            page_size=20,
+            cursor=next_cursor,
+            sort_by="created_at",
+            sort_order="desc"
+        )
+        ```
+
+        Related Docs:
+        - docs/shared/infrastructure/pagination.md
+        """
+        # Validate inputs
+        if page_size < 1:
+            raise ValueError("page_size must be >= 1")
+
+        # Validate sort_by field if provided
+        if sort_by and not hasattr(self.model_class, sort_by):
+            raise ValueError(f"Invalid sort field: {sort_by}")
+
+        sort_order = sort_order.lower()
+        sort_column = getattr(self.model_class, sort_by) if sort_by else None
+        id_column = self.model_class.id
+        columns = projection_columns(self.model_class, fields, sort_by) if fields else None
+
+        # Base query excludes soft-deleted entities
+        query = self.session.query(self.model_class).filter(
+            self.model_class.state != 2
+        )
+
+        # Apply filters (equality only)
+        if filters:
+            for key, value in filters.items():
+                if hasattr(self.model_class, key):
+                    query = query.filter(getattr(self.model_class, key) == value)
+
+        # Seek past the cursor position
+        direction = "next"
+        if cursor:
+            position = decode_cursor(cursor)
+            check_cursor(position, sort_by, sort_order)
+            direction = position.direction
+            query = query.filter(seek_condition(sort_column, id_column, position))
+
+        query = query.order_by(*seek_order(sort_column, id_column, sort_order, direction))
+
+        # Load only the projected columns
+        if columns:
+            query = query.options(load_only(*(getattr(self.model_class, c) for c in columns)))
+
+        # Fetch one extra row to know whether another page exists
+        rows = query.limit(page_size + 1).all()
+        has_more = len(rows) > page_size
+        items = rows[:page_size]
+        if direction == "prev":
+            items.reverse()
+
+        next_cursor, prev_cursor = page_cursors(
+            items, sort_by, sort_order, direction, has_more, cursor is not None
+        )
+        return items, next_cursor, prev_cursor
 
     def create(self, model: TModel) -> TModel:
         """
@@ -367,6 +696,8 @@ class BaseRepository(Generic[TModel]):
             self.session.add(model)
             self.session.commit()
             self.session.refresh(model)
+            count_cache.invalidate(self.model_class.__table__.fullname)
+            self._invalidate_cached(model.id)
             return model
         except Exception as e:
             self.session.rollback()
@@ -424,6 +755,7 @@ class BaseRepository(Generic[TModel]):
             # Merge changes and commit
             self.session.merge(model)
             self.session.commit()
+            self._invalidate_cached(model.id)
             self.session.refresh(model)
             return model
         except Exception as e:
@@ -476,6 +808,8 @@ class BaseRepository(Generic[TModel]):
 
             entity.state = 2
             self.session.commit()
+            count_cache.invalidate(self.model_class.__table__.fullname)
+            self._invalidate_cached(entity_id)
             return True
         except Exception as e:
             self.session.rollback()
@@ -531,6 +865,8 @@ class BaseRepository(Generic[TModel]):
 
             self.session.delete(entity)
             self.session.commit()
+            count_cache.invalidate(self.model_class.__table__.fullname)
+            self._invalidate_cached(entity_id)
             return True
         except Exception as e:
             self.session.rollback()
@@ -549,6 +885,7 @@ class BaseRepository(Generic[TModel]):
         - Returns False for soft-deleted entities (state=2)
         - Returns False for non-existent entities
         - Returns True only for active/inactive entities (state=0 or 1)
+        - With cache_entities, answered through get_by_id (and the entity cache)
 
         Inputs:
         - entity_id: unique identifier of entity
@@ -569,6 +906,9 @@ class BaseRepository(Generic[TModel]):
         Related Docs:
         - docs/shared/infrastructure/query-methods.md
         """
+        if self.cache_entities:
+            return self.get_by_id(entity_id) is not None
+
         count = self.session.query(func.count(self.model_class.id)).filter(
             self.model_class.id == entity_id,
             self.model_class.state != 2
@@ -623,3 +963,272 @@ class BaseRepository(Generic[TModel]):
                     query = query.filter(getattr(self.model_class, key) == value)
 
         return query.scalar()
+
+    def stream_all(
+        self,
+        filters: Dict[str, Any] | None = None,
+        sort_by: str | None = None,
+        sort_order: str = "asc",
+        fields: Sequence[str] | None = None,
+        batch_size: int | None = None
+    ) -> Iterator[dict[str, Any]]:
+        """
+        IDK: streaming-read, server-side-cursor, column-projection, export
+
+        Responsibility:
+        - Iterate over every matching row without loading the table into memory
+        - Select only the requested columns (no ORM instances)
+
+        Invariants:
+        - Excludes entities with state=2
+        - Rows are fetched in batches of batch_size (yield_per), using a
+          server-side cursor where the driver supports one
+        - Ordered by (sort_by, id), or by id alone, so exports are repeatable
+        - Inputs are validated before the first row is fetched
+        - The session must stay open while the iterator is consumed
+
+        Inputs:
+        - filters: dict of field:value for equality filtering
+        - sort_by: field name to sort by (None sorts by id)
+        - sort_order: "asc" or "desc"
+        - fields: columns to select (None selects all; id is always selected)
+        - batch_size: rows per fetch (default: stream_batch_size)
+
+        Outputs:
+        - Iterator[dict[str, Any]]: one dict of column values per row
+
+        Failure Modes:
+        - ValueError: sort_by or a field is not a model column
+
+        Example:
+
+        ```python
+        for row in repository.stream_all(fields=["code", "price"]):
+            writer.writerow(row)
+        ```
+
+        Related Docs:
+        - docs/shared/infrastructure/export.md
+        """
+        if sort_by and not hasattr(self.model_class, sort_by):
+            raise ValueError(f"Invalid sort field: {sort_by}")
+
+        columns = projection_columns(self.model_class, fields)
+        stmt = select(*(getattr(self.model_class, c) for c in columns)).where(
+            self.model_class.state != 2
+        )
+
+        # Apply filters (equality only)
+        if filters:
+            for key, value in filters.items():
+                if hasattr(self.model_class, key):
+                    stmt = stmt.where(getattr(self.model_class, key) == value)
+
+        order = [getattr(self.model_class, sort_by)] if sort_by else []
+        order.append(self.model_class.id)
+        descending = sort_order.lower() == "desc"
+        stmt = stmt.order_by(*(c.desc() if descending else c.asc() for c in order))
+
+        stmt = stmt.execution_options(yield_per=batch_size or self.stream_batch_size)
+        return self._stream_rows(stmt)
+
+    def _stream_rows(self, stmt: Any) -> Iterator[dict[str, Any]]:
+        """Yield rows of stmt as dicts, closing the cursor when done or abandoned."""
+        result = self.session.execute(stmt)
+        try:
+            for row in result.mappings():
+                yield dict(row)
+        finally:
+            result.close()
+
+    def bulk_create(self, models: list[TModel | dict[str, Any]]) -> list[TModel]:
+        """
+        IDK: bulk-operation, batch-insert, insert-returning, transaction
+
+        Responsibility:
+        - Insert many entities with INSERT ... RETURNING, one statement per chunk
+        - Return persisted entities with database-generated fields
+        - Commits transaction on success, rollback on exception
+
+        Invariants:
+        - No per-row refresh: RETURNING hands back generated columns
+        - Rows are chunked by bulk_chunk_size and the bind parameter limit
+        - Python-side defaults (id, timestamps, state, version) are applied
+        - Returns new instances loaded from RETURNING, in input order
+        - Empty list input returns empty list
+
+        Inputs:
+        - models: ORM instances and/or dicts of column values
+
+        Outputs:
+        - list[TModel]: persisted entities with database-generated values
+
+        Failure Modes:
+        - DatabaseError: constraint violation on any entity
+        - Exception triggers rollback
+
+        Example:
+
+        ```python
+        created = repository.bulk_create([
+            {"code": "PROD-001", "name": "Laptop", "price": 999.99},
+            ProductModel(code="PROD-002", name="Mouse", price=29.99),
+        ])
+        ```
+
+        Related Docs:
+        - docs/shared/infrastructure/bulk-operations.md
+        """
+        if not models:
+            return []
+
+        try:
+            created: list[TModel] = []
+            rows = model_rows(self.model_class, models)
+            for chunk in chunked(rows, self.bulk_chunk_size):
+                result = self.session.scalars(
+                    insert(self.model_class).returning(
+                        self.model_class, sort_by_parameter_order=True
+                    ),
+                    chunk,
+                )
+                created.extend(result.all())
+            self.session.commit()
+        except Exception as e:
+            self.session.rollback()
+            raise e
+
+        count_cache.invalidate(self.model_class.__table__.fullname)
+        self._invalidate_cached(*(entity.id for entity in created))
+        return created
+
+    def bulk_update(self, models: list[TModel | dict[str, Any]]) -> int:
+        """
+        IDK: bulk-operation, batch-update, executemany, transaction
+
+        Responsibility:
+        - Update many entities by primary key with executemany UPDATE statements
+        - Commits transaction on success, rollback on exception
+
+        Invariants:
+        - One UPDATE statement per distinct set of changed columns, executed
+          with a list of bind parameters (executemany), chunked
+        - Dicts are partial updates: only the keys they carry are set
+        - ORM instances update every mapped column
+        - id, created_at, created_by and version are never set from input;
+          version is incremented by the database
+        - Soft-deleted rows (state=2) are skipped
+        - Instances already loaded in the session are not refreshed
+
+        Inputs:
+        - models: ORM instances and/or dicts with an "id" key
+
+        Outputs:
+        - int: number of rows updated (as reported by the driver)
+
+        Failure Modes:
+        - ValueError: an item has no id
+        - DatabaseError: constraint violation on any entity
+
+        Example:
+
+        ```python
+        updated = repository.bulk_update([
+            {"id": "550e8400-e29b-41d4-a716-446655440000", "price": 899.99},
+            {"id": "6ba7b810-9dad-11d1-80b4-00c04fd430c8", "price": 24.99},
+        ])
+        ```
+
+        Related Docs:
+        - docs/shared/infrastructure/bulk-operations.md
+        """
+        if not models:
+            return 0
+
+        groups = update_rows(self.model_class, models)
+        try:
+            updated = 0
+            for keys, params in groups.items():
+                if not keys:
+                    continue
+                stmt = update_statement(self.model_class, keys)
+                for chunk in chunked(params, self.bulk_chunk_size):
+                    result = self.session.execute(stmt, chunk)
+                    updated += max(result.rowcount, 0)
+            self.session.commit()
+        except Exception as e:
+            self.session.rollback()
+            raise e
+
+        self._invalidate_cached(*(row["b_id"] for params in groups.values() for row in params))
+        return updated
+
+    def bulk_upsert(
+        self,
+        models: list[TModel | dict[str, Any]],
+        conflict_columns: Sequence[str] = ("id",),
+        update_columns: Sequence[str] | None = None
+    ) -> list[TModel]:
+        """
+        IDK: bulk-operation, upsert, on-conflict, transaction
+
+        Responsibility:
+        - Insert or update many entities with INSERT ... ON CONFLICT DO UPDATE
+        - Return the resulting rows
+        - Commits transaction on success, rollback on exception
+
+        Invariants:
+        - One statement per chunk on PostgreSQL and SQLite
+        - conflict_columns must be backed by a unique index or primary key
+        - Duplicate keys in the input collapse to the last occurrence
+        - Existing rows keep id, created_at and created_by; version is incremented
+
+        Inputs:
+        - models: ORM instances and/or dicts of column values
+        - conflict_columns: unique columns that identify an existing row
+        - update_columns: columns to overwrite on conflict (default: all incoming)
+
+        Outputs:
+        - list[TModel]: inserted or updated entities
+
+        Failure Modes:
+        - ValueError: dialect without ON CONFLICT support
+        - DatabaseError: constraint violation other than the conflict target
+
+        Example:
+
+        ```python
+        products = repository.bulk_upsert(
+            [{"code": "PROD-001", "name": "Laptop", "price": 949.99}],
+            conflict_columns=["code"],
+        )
+        ```
+
+        Related Docs:
+        - docs/shared/infrastructure/bulk-operations.md
+        """
+        if not models:
+            return []
+
+        dialect_name = self.session.get_bind().dialect.name
+        rows = dedupe_rows(model_rows(self.model_class, models), conflict_columns)
+
+        try:
+            upserted: list[TModel] = []
+            for chunk in chunked(rows, self.bulk_chunk_size):
+                stmt = upsert_statement(
+                    self.model_class, dialect_name, chunk, conflict_columns, update_columns
+                )
+                result = self.session.scalars(
+                    stmt.returning(self.model_class),
+                    execution_options={"populate_existing": True},
+                )
+                upserted.extend(result.all())
+            self.session.commit()
+        except Exception as e:
+            self.session.rollback()
+            raise e
+
+        count_cache.invalidate(self.model_class.__table__.fullname)
+        self._invalidate_cached(*(entity.id for entity in upserted))
+        return upserted
@@ -16,8 +16,11 @@ Key Components:
 - Soft-delete enforcement: All queries exclude state=2 entities
 - Unit of Work: Repository does NOT commit, caller manages transactions
 - Dynamic filtering: Apply equality filters from dict
-- Pagination: offset/limit with total count
-- Bulk operations: bulk_create and bulk_update for batch processing
+- Pagination: offset/limit with total count, or keyset cursors without COUNT
+- Count strategies: exact, planner-estimated, cached (TTL) or none (has_more)
+- Bulk operations: INSERT ... RETURNING, executemany UPDATE and ON CONFLICT upsert
+- Entity cache: optional read-through cache for get_by_id/exists (cache_entities)
+- Projection and streaming: fields= on list methods, stream_all() for exports
 
 Invariants:
 - All queries filter out state=2 (soft-deleted) entities by default
@@ -119,9 +122,35 @@ Related Docs:
 - ai_docs/doc/create-crud-entity/
 """
 
+from collections.abc import AsyncIterator, Sequence
 from typing import Generic, TypeVar, Dict, Any
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, desc, asc
+from sqlalchemy.orm import load_only
+from sqlalchemy import select, func, desc, asc, insert, inspect, text
+
+from src.shared.infrastructure.bulk import (
+    chunked,
+    dedupe_rows,
+    model_rows,
+    update_rows,
+    update_statement,
+    upsert_statement,
+)
+from src.shared.infrastructure.counting import (
+    CountMode,
+    count_cache,
+    estimate_statement,
+    plan_rows,
+)
+from src.shared.infrastructure.entity_cache import entity_cache, restore, snapshot
+from src.shared.infrastructure.export import projection_columns
+from src.shared.infrastructure.pagination import (
+    check_cursor,
+    decode_cursor,
+    page_cursors,
+    seek_condition,
+    seek_order,
+)
 
 # Generic type variable for ORM models
 TModel = TypeVar('TModel')
@@ -188,6 +217,19 @@ class BaseRepositoryAsync(Generic[TModel]):
     - docs/shared/infrastructure/async-patterns.md
     """
 
+    # How get_page() computes totals; override per entity repository
+    count_mode: CountMode = CountMode.EXACT
+    # Seconds a CACHED total stays valid (writes invalidate it earlier)
+    count_cache_ttl: float = 60.0
+    # Rows per bulk statement (further bounded by the bind parameter limit)
+    bulk_chunk_size: int = 1000
+    # Rows fetched per round trip by stream_all()
+    stream_batch_size: int = 1000
+    # Read-through cache for get_by_id/exists; enable per entity repository
+    cache_entities: bool = False
+    # Seconds a cached row stays valid (writes invalidate it earlier)
+    entity_cache_ttl: float = 300.0
+
     def __init__(self, session: AsyncSession, model_class: type[TModel]):
         """
         IDK: dependency-injection, constructor
@@ -221,12 +263,14 @@ class BaseRepositoryAsync(Generic[TModel]):
         - Retrieve single entity by ID asynchronously
         - Exclude soft-deleted entities (state=2)
         - Return None if not found or deleted
+        - Read through the entity cache when cache_entities is enabled
 
         Invariants:
         - Returns None if entity.state == 2
         - Returns None if entity_id doesn't exist
         - No exception raised on missing entity
         - Uses SQLAlchemy 2.0 select() API
+        - Cache hits are attached to the session without a SELECT
 
         Inputs:
         - entity_id: unique identifier of entity
@@ -246,12 +290,59 @@ class BaseRepositoryAsync(Generic[TModel]):
         Related Docs:
         - docs/shared/infrastructure/soft-delete.md
         """
+        if self.cache_entities:
+            cached = await self._get_cached(entity_id)
+            if cached is not None:
+                return cached
+
         stmt = select(self.model_class).where(
             self.model_class.id == entity_id,
             self.model_class.state != 2
         )
         result = await self.session.execute(stmt)
-        return result.scalar_one_or_none()
+        entity = result.scalar_one_or_none()
+
+        if entity is not None and self.cache_entities:
+            entity_cache.set(
+                self.model_class.__table__.fullname,
+                entity.id,
+                snapshot(entity),
+                self.entity_cache_ttl,
+            )
+        return entity
+
+    async def _get_cached(self, entity_id: str) -> TModel | None:
+        """
+        IDK: entity-cache, read-through, identity-map, async
+
+        Responsibility:
+        - Return the session's own instance, or a cached row merged into the session
+
+        Invariants:
+        - An instance already in the session wins (it may hold unflushed changes);
+          if it was expired, None sends the caller to the database to reload it
+        - merge(load=False) attaches the cached row without a SELECT
+        - Returns None on a cache miss
+        """
+        key = self.session.identity_key(self.model_class, entity_id)
+        current = self.session.identity_map.get(key)
+        if current is not None:
+            # Expired attributes cannot lazy-load under asyncio
+            if "state" in inspect(current).unloaded:
+                return None
+            return current if current.state != 2 else None
+
+        values = entity_cache.get(self.model_class.__table__.fullname, entity_id)
+        if values is None:
+            return None
+        return await self.session.merge(restore(self.model_class, values), load=False)
+
+    def _invalidate_cached(self, *entity_ids: Any) -> None:
+        """Drop written entities from the entity cache now and after commit."""
+        if self.cache_entities:
+            entity_cache.invalidate_on_commit(
+                self.session.sync_session, self.model_class.__table__.fullname, *entity_ids
+            )
 
     async def get_all(
         self,
@@ -259,7 +350,8 @@ class BaseRepositoryAsync(Generic[TModel]):
         page_size: int,
         filters: Dict[str, Any] | None = None,
         sort_by: str | None = None,
-        sort_order: str = "asc"
+        sort_order: str = "asc",
+        fields: Sequence[str] | None = None
     ) -> tuple[list[TModel], int]:
         """
         IDK: list-operation, pagination, filtering, sorting, async
@@ -278,6 +370,7 @@ class BaseRepositoryAsync(Generic[TModel]):
         - sort_by must be valid model attribute if provided
         - Offset calculated as (page - 1) * page_size
         - Total count reflects all matching entities (not just current page)
+        - Always counts exactly (get_page() applies count_mode)
         - Uses SQLAlchemy 2.0 select() API
 
         Inputs:
@@ -286,6 +379,7 @@ class BaseRepositoryAsync(Generic[TModel]):
         - filters: dict of field:value for equality filtering
         - sort_by: field name to sort by (None for no sorting)
         - sort_order: "asc" or "desc"
+        - fields: columns to load (None loads all; id is always loaded)
 
         Outputs:
         - tuple[list[TModel], int]: (items in current page, total count)
@@ -313,6 +407,76 @@ class BaseRepositoryAsync(Generic[TModel]):
         - docs/shared/infrastructure/pagination.md
         - docs/shared/infrastructure/filtering.md
         """
+        items, total, _ = await self.get_page(
+            page=page,
+            page_size=page_size,
+            filters=filters,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            count_mode=CountMode.EXACT,
+            fields=fields
+        )
+        return items, total
+
+    async def get_page(
+        self,
+        page: int,
+        page_size: int,
+        filters: Dict[str, Any] | None = None,
+        sort_by: str | None = None,
+        sort_order: str = "asc",
+        count_mode: CountMode | str | None = None,
+        fields: Sequence[str] | None = None
+    ) -> tuple[list[TModel], int | None, bool]:
+        """
+        IDK: list-operation, pagination, count-strategy, filtering, sorting, async
+
+        Responsibility:
+        - Retrieve paginated list of entities
+        - Compute the total with the configured count strategy
+        - Report whether another page exists without relying on the total
+
+        Invariants:
+        - Excludes entities with state=2
+        - page must be >= 1
+        - page_size must be >= 1
+        - sort_by must be valid model attribute if provided
+        - Fetches page_size + 1 rows; has_more is exact in every mode
+        - total is None when count_mode is NONE
+        - ESTIMATED totals are approximate; CACHED totals may lag by count_cache_ttl
+
+        Inputs:
+        - page: page number (1-indexed)
+        - page_size: number of items per page
+        - filters: dict of field:value for equality filtering
+        - sort_by: field name to sort by (None for no sorting)
+        - sort_order: "asc" or "desc"
+        - count_mode: override for self.count_mode (None uses the repository default)
+        - fields: columns to load (None loads all; id and sort_by are always loaded)
+
+        Outputs:
+        - tuple[list[TModel], int | None, bool]: (items, total, has_more)
+
+        Failure Modes:
+        - ValueError: page < 1 or page_size < 1
+        - ValueError: sort_by is not a valid model attribute
+        - ValueError: unknown count_mode
+        - ValueError: fields names a column the model does not have
+
+        Example:
+
+        ```python
+        items, total, has_more = await repository.get_page(
+            page=3,
+            page_size=20,
+            filters={"category": "Electronics"},
+            count_mode="estimated"
+        )
+        ```
+
+        Related Docs:
+        - docs/shared/infrastructure/pagination.md
+        """
         # Validate inputs
         if page < 1:
             raise ValueError("page must be >= 1")
@@ -323,6 +487,9 @@ class BaseRepositoryAsync(Generic[TModel]):
         if sort_by and not hasattr(self.model_class, sort_by):
             raise ValueError(f"Invalid sort field: {sort_by}")
 
+        mode = CountMode(count_mode or self.count_mode)
+        columns = projection_columns(self.model_class, fields, sort_by) if fields else None
+
         # Base query excludes soft-deleted entities
         stmt = select(self.model_class).where(self.model_class.state != 2)
 
@@ -332,10 +499,8 @@ class BaseRepositoryAsync(Generic[TModel]):
                 if hasattr(self.model_class, key):
                     stmt = stmt.where(getattr(self.model_class, key) == value)
 
-        # Get total count before pagination
-        count_stmt = select(func.count()).select_from(stmt.subquery())
-        count_result = await self.session.execute(count_stmt)
-        total = count_result.scalar_one()
+        # Get total before pagination, according to the count strategy
+        total = await self._count_total(stmt, filters, mode)
 
         # Apply sorting
         if sort_by:
@@ -345,15 +510,183 @@ class BaseRepositoryAsync(Generic[TModel]):
             else:
                 stmt = stmt.order_by(asc(sort_column))
 
-        # Apply pagination
+        # Load only the projected columns
+        if columns:
+            stmt = stmt.options(load_only(*(getattr(self.model_class, c) for c in columns)))
+
+        # Apply pagination, fetching one extra row to detect a next page
         offset = (page - 1) * page_size
-        stmt = stmt.offset(offset).limit(page_size)
+        stmt = stmt.offset(offset).limit(page_size + 1)
 
         # Execute query
         result = await self.session.execute(stmt)
-        items = list(result.scalars().all())
+        rows = list(result.scalars().all())
+        has_more = len(rows) > page_size
 
-        return items, total
+        return rows[:page_size], total, has_more
+
+    async def _count_total(
+        self,
+        stmt: Any,
+        filters: Dict[str, Any] | None,
+        mode: CountMode
+    ) -> int | None:
+        """
+        IDK: count-strategy, planner-estimate, count-cache
+
+        Responsibility:
+        - Compute the total of a filtered query with the given strategy
+
+        Invariants:
+        - NONE returns None without touching the database
+        - ESTIMATED uses pg_class.reltuples without filters and EXPLAIN rows
+          with filters; other dialects fall back to an exact count
+        - CACHED reuses an exact count for count_cache_ttl seconds
+        """
+        if mode == CountMode.NONE:
+            return None
+
+        table = self.model_class.__table__.fullname
+
+        count_stmt = select(func.count()).select_from(stmt.subquery())
+
+        if mode == CountMode.ESTIMATED:
+            dialect = self.session.get_bind().dialect
+            if dialect.name == "postgresql":
+                if not filters:
+                    result = await self.session.execute(
+                        text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:t)"),
+                        {"t": table},
+                    )
+                    estimate = result.scalar()
+                else:
+                    sql, params = estimate_statement(stmt, dialect)
+                    connection = await self.session.connection()
+                    result = await connection.exec_driver_sql(sql, params)
+                    estimate = plan_rows(result.scalar())
+                # reltuples is -1 until the table has been analyzed
+                if estimate is not None and estimate >= 0:
+                    return int(estimate)
+            result = await self.session.execute(count_stmt)
+            return result.scalar_one()
+
+        if mode == CountMode.CACHED:
+            key = count_cache.key(table, filters)
+            total = count_cache.get(key)
+            if total is None:
+                result = await self.session.execute(count_stmt)
+                total = result.scalar_one()
+                count_cache.set(key, total, self.count_cache_ttl)
+            return total
+
+        result = await self.session.execute(count_stmt)
+        return result.scalar_one()
+
+    async def get_all_by_cursor(
+        self,
+        page_size: int,
+        cursor: str | None = None,
+        filters: Dict[str, Any] | None = None,
+        sort_by: str | None = None,
+        sort_order: str = "asc",
+        fields: Sequence[str] | None = None
+    ) -> tuple[list[TModel], str | None, str | None]:
+        """
+        IDK: list-operation, keyset-pagination, filtering, sorting, async
+
+        Responsibility:
+        - Retrieve a page of entities by seeking past a cursor (no OFFSET)
+        - Apply dynamic filters with equality operator
+        - Exclude soft-deleted entities (state=2)
+        - Issue next/prev cursors for the page boundaries
+
+        Invariants:
+        - Excludes entities with state=2
+        - page_size must be >= 1
+        - sort_by must be valid model attribute if provided
+        - Orders by (sort_by, id) so pages are stable under ties
+        - Never runs COUNT; fetches page_size + 1 rows to detect more pages
+        - Uses SQLAlchemy 2.0 select() API
+
+        Inputs:
+        - page_size: number of items per page
+        - cursor: next_cursor/prev_cursor from a previous page (None = first page)
+        - filters: dict of field:value for equality filtering
+        - sort_by: field name to sort by (None sorts by id)
+        - sort_order: "asc" or "desc"
+        - fields: columns to load (None loads all; id and sort_by are always loaded)
+
+        Outputs:
+        - tuple[list[TModel], str | None, str | None]: (items, next_cursor, prev_cursor)
+
+        Failure Modes:
+        - ValueError: page_size < 1
+        - ValueError: sort_by is not a valid model attribute
+        - ValueError: cursor is malformed or was issued for another sort
+        - ValueError: fields names a column the model does not have
+
+        Example:
+
+        ```python
+        items, next_cursor, prev_cursor = await repository.get_all_by_cursor(
+            page_size=20,
+            cursor=request_cursor,
+            sort_by="created_at",
+            sort_order="desc"
+        )
+        ```
+
+        Related Docs:
+        - docs/shared/infrastructure/pagination.md
+        """
+        # Validate inputs
+        if page_size < 1:
+            raise ValueError("page_size must be >= 1")
+
+        # Validate sort_by field if provided
+        if sort_by and not hasattr(self.model_class, sort_by):
+            raise ValueError(f"Invalid sort field: {sort_by}")
+
+        sort_order = sort_order.lower()
+        sort_column = getattr(self.model_class, sort_by) if sort_by else None
+        id_column = self.model_class.id
+        columns = projection_columns(self.model_class, fields, sort_by) if fields else None
+
+        # Base query excludes soft-deleted entities
+        stmt = select(self.model_class).where(self.model_class.state != 2)
+
+        # Apply filters (equality only)
+        if filters:
+            for key, value in filters.items():
+                if hasattr(self.model_class, key):
+                    stmt = stmt.where(getattr(self.model_class, key) == value)
+
+        # Seek past the cursor position
+        direction = "next"
+        if cursor:
+            position = decode_cursor(cursor)
+            check_cursor(position, sort_by, sort_order)
+            direction = position.direction
+            stmt = stmt.where(seek_condition(sort_column, id_column, position))
+
+        stmt = stmt.order_by(*seek_order(sort_column, id_column, sort_order, direction))
+
+        # Load only the projected columns
+        if columns:
+            stmt = stmt.options(load_only(*(getattr(self.model_class, c) for c in columns)))
+
+        # Fetch one extra row to know whether another page exists
+        result = await self.session.execute(stmt.limit(page_size + 1))
+        rows = list(result.scalars().all())
+        has_more = len(rows) > page_size
+        items = rows[:page_size]
+        if direction == "prev":
+            items.reverse()
+
+        next_cursor, prev_cursor = page_cursors(
+            items, sort_by, sort_order, direction, has_more, cursor is not None
+        )
+        return items, next_cursor, prev_cursor
 
     async def create(self, model: TModel) -> TModel:
         """
@@ -403,6 +736,8 @@ class BaseRepositoryAsync(Generic[TModel]):
         self.session.add(model)
         await self.session.flush()
         await self.session.refresh(model)
+        count_cache.invalidate(self.model_class.__table__.fullname)
+        self._invalidate_cached(model.id)
         return model
 
     async def update(self, model: TModel) -> TModel:
@@ -461,6 +796,7 @@ class BaseRepositoryAsync(Generic[TModel]):
         # Merge changes and flush
         await self.session.merge(model)
         await self.session.flush()
+        self._invalidate_cached(model.id)
         await self.session.refresh(model)
         return model
 
@@ -515,6 +851,8 @@ class BaseRepositoryAsync(Generic[TModel]):
 
         entity.state = 2
         await self.session.flush()
+        count_cache.invalidate(self.model_class.__table__.fullname)
+        self._invalidate_cached(entity_id)
         return True
 
     async def hard_delete(self, entity_id: str) -> bool:
@@ -572,6 +910,8 @@ class BaseRepositoryAsync(Generic[TModel]):
 
         await self.session.delete(entity)
         await self.session.flush()
+        count_cache.invalidate(self.model_class.__table__.fullname)
+        self._invalidate_cached(entity_id)
         return True
 
     async def exists(self, entity_id: str) -> bool:
@@ -587,6 +927,7 @@ class BaseRepositoryAsync(Generic[TModel]):
         - Returns False for soft-deleted entities (state=2)
         - Returns False for non-existent entities
         - Returns True only for active/inactive entities (state=0 or 1)
+        - With cache_entities, answered through get_by_id (and the entity cache)
         - Uses SQLAlchemy 2.0 select() API
 
         Inputs:
@@ -608,6 +949,9 @@ class BaseRepositoryAsync(Generic[TModel]):
         Related Docs:
         - docs/shared/infrastructure/query-methods.md
         """
+        if self.cache_entities:
+            return await self.get_by_id(entity_id) is not None
+
         stmt = select(func.count(self.model_class.id)).where(
             self.model_class.id == entity_id,
             self.model_class.state != 2
@@ -667,27 +1011,102 @@ class BaseRepositoryAsync(Generic[TModel]):
         result = await self.session.execute(stmt)
         return result.scalar_one()
 
-    async def bulk_create(self, models: list[TModel]) -> list[TModel]:
+    def stream_all(
+        self,
+        filters: Dict[str, Any] | None = None,
+        sort_by: str | None = None,
+        sort_order: str = "asc",
+        fields: Sequence[str] | None = None,
+        batch_size: int | None = None
+    ) -> AsyncIterator[dict[str, Any]]:
         """
-        IDK: bulk-operation, batch-insert, unit-of-work, async
+        IDK: streaming-read, server-side-cursor, column-projection, export
 
         Responsibility:
-        - Insert multiple entities into database asynchronously
-        - Flush session to populate DB-generated fields
-        - Return persisted entities with generated fields
+        - Iterate over every matching row without loading the table into memory
+        - Select only the requested columns (no ORM instances)
+
+        Invariants:
+        - Excludes entities with state=2
+        - Rows are fetched in batches of batch_size (yield_per), using a
+          server-side cursor where the driver supports one
+        - Ordered by (sort_by, id), or by id alone, so exports are repeatable
+        - Inputs are validated when called (this method is not a coroutine)
+        - The session must stay open while the iterator is consumed
+
+        Inputs:
+        - filters: dict of field:value for equality filtering
+        - sort_by: field name to sort by (None sorts by id)
+        - sort_order: "asc" or "desc"
+        - fields: columns to select (None selects all; id is always selected)
+        - batch_size: rows per fetch (default: stream_batch_size)
+
+        Outputs:
+        - AsyncIterator[dict[str, Any]]: one dict of column values per row
+
+        Failure Modes:
+        - ValueError: sort_by or a field is not a model column
+
+        Example:
+
+        ```python
+        async for row in repository.stream_all(fields=["code", "price"]):
+            writer.writerow(row)
+        ```
+
+        Related Docs:
+        - docs/shared/infrastructure/export.md
+        """
+        if sort_by and not hasattr(self.model_class, sort_by):
+            raise ValueError(f"Invalid sort field: {sort_by}")
+
+        columns = projection_columns(self.model_class, fields)
+        stmt = select(*(getattr(self.model_class, c) for c in columns)).where(
+            self.model_class.state != 2
+        )
+
+        # Apply filters (equality only)
+        if filters:
+            for key, value in filters.items():
+                if hasattr(self.model_class, key):
+                    stmt = stmt.where(getattr(self.model_class, key) == value)
+
+        order = [getattr(self.model_class, sort_by)] if sort_by else []
+        order.append(self.model_class.id)
+        descending = sort_order.lower() == "desc"
+        stmt = stmt.order_by(*(c.desc() if descending else c.asc() for c in order))
+
+        stmt = stmt.execution_options(yield_per=batch_size or self.stream_batch_size)
+        return self._stream_rows(stmt)
+
+    async def _stream_rows(self, stmt: Any) -> AsyncIterator[dict[str, Any]]:
+        """Yield rows of stmt as dicts, closing the cursor when done or abandoned."""
+        result = await self.session.stream(stmt)
+        try:
+            async for row in result.mappings():
+                yield dict(row)
+        finally:
+            await result.close()
+
+    async def bulk_create(self, models: list[TModel | dict[str, Any]]) -> list[TModel]:
+        """
+        IDK: bulk-operation, batch-insert, insert-returning, unit-of-work, async
+
+        Responsibility:
+        - Insert many entities with INSERT ... RETURNING, one statement per chunk
+        - Return persisted entities with database-generated fields
         - Does NOT commit (caller manages transaction)
-        - Atomic operation within session
 
         Invariants:
-        - All entities inserted in single database round-trip
-        - Flushes session but does NOT commit
-        - Returns entities with database-generated fields (id, timestamps)
+        - No per-row refresh: RETURNING hands back generated columns
+        - Rows are chunked by bulk_chunk_size and the bind parameter limit
+        - Python-side defaults (id, timestamps, state, version) are applied
+        - Returns new instances loaded from RETURNING, in input order
         - Empty list input returns empty list
         - Caller is responsible for commit/rollback
-        - If flush fails, no entities are persisted (atomic)
 
         Inputs:
-        - models: list of entity instances to persist
+        - models: ORM instances and/or dicts of column values
 
         Outputs:
         - list[TModel]: persisted entities with database-generated values
@@ -695,18 +1114,14 @@ class BaseRepositoryAsync(Generic[TModel]):
         Failure Modes:
         - DatabaseError: constraint violation on any entity
         - Exception propagated to caller for rollback
-        - All-or-nothing: if one fails, none are persisted
 
         Example:
 
         ```python
-        products = [
-            ProductModel(code="PROD-001", name="Laptop", price=999.99),
+        created = await repository.bulk_create([
+            {"code": "PROD-001", "name": "Laptop", "price": 999.99},
             ProductModel(code="PROD-002", name="Mouse", price=29.99),
-            ProductModel(code="PROD-003", name="Keyboard", price=79.99),
-        ]
-        created = await repository.bulk_create(products)
-        # All products now have database-generated IDs
+        ])
         # Service layer commits the transaction
         await session.commit()
         ```
@@ -718,74 +1133,141 @@ class BaseRepositoryAsync(Generic[TModel]):
         if not models:
             return []
 
-        self.session.add_all(models)
-        await self.session.flush()
-        for model in models:
-            await self.session.refresh(model)
-        return models
+        created: list[TModel] = []
+        rows = model_rows(self.model_class, models)
+        for chunk in chunked(rows, self.bulk_chunk_size):
+            result = await self.session.scalars(
+                insert(self.model_class).returning(self.model_class, sort_by_parameter_order=True),
+                chunk,
+            )
+            created.extend(result.all())
+
+        count_cache.invalidate(self.model_class.__table__.fullname)
+        self._invalidate_cached(*(entity.id for entity in created))
+        return created
 
-    async def bulk_update(self, models: list[TModel]) -> list[TModel]:
+    async def bulk_update(self, models: list[TModel | dict[str, Any]]) -> int:
         """
-        IDK: bulk-operation, batch-update, unit-of-work, async
+        IDK: bulk-operation, batch-update, executemany, unit-of-work, async
 
         Responsibility:
-        - Update multiple entities in database asynchronously
-        - Flush session to persist changes
-        - Return updated entities
+        - Update many entities by primary key with executemany UPDATE statements
         - Does NOT commit (caller manages transaction)
-        - Atomic operation within session
 
         Invariants:
-        - All entities updated in single database round-trip
-        - Flushes session but does NOT commit
-        - Returns updated entities
-        - Empty list input returns empty list
+        - One UPDATE statement per distinct set of changed columns, executed
+          with a list of bind parameters (executemany), chunked
+        - Dicts are partial updates: only the keys they carry are set
+        - ORM instances update every mapped column
+        - id, created_at, created_by and version are never set from input;
+          version is incremented by the database
+        - Soft-deleted rows (state=2) are skipped
+        - Instances already loaded in the session are not refreshed
         - Caller is responsible for commit/rollback
-        - If flush fails, no entities are updated (atomic)
-        - Does NOT validate entity existence (assumes valid entities)
 
         Inputs:
-        - models: list of entity instances to update
+        - models: ORM instances and/or dicts with an "id" key
 
         Outputs:
-        - list[TModel]: updated entities
+        - int: number of rows updated (as reported by the driver)
 
         Failure Modes:
+        - ValueError: an item has no id
         - DatabaseError: constraint violation on any entity
-        - Exception propagated to caller for rollback
-        - All-or-nothing: if one fails, none are updated
 
         Example:
 
         ```python
-        # Fetch products to update
-        products = await repository.get_all(page=1, page_size=10)
-        items, _ = products
+        updated = await repository.bulk_update([
+            {"id": "550e8400-e29b-41d4-a716-446655440000", "price": 899.99},
+            {"id": "6ba7b810-9dad-11d1-80b4-00c04fd430c8", "price": 24.99},
+        ])
+        await session.commit()
+        ```
 
-        # Apply bulk price increase
-        for product in items:
-            product.price *= 1.1  # 10% increase
-            product.mark_updated(user_id="admin-123")
+        Related Docs:
+        - docs/shared/infrastructure/bulk-operations.md
+        - docs/shared/infrastructure/unit-of-work-pattern.md
+        """
+        if not models:
+            return 0
+
+        groups = update_rows(self.model_class, models)
+        updated = 0
+        for keys, params in groups.items():
+            if not keys:
+                continue
+            stmt = update_statement(self.model_class, keys)
+            for chunk in chunked(params, self.bulk_chunk_size):
+                result = await self.session.execute(stmt, chunk)
+                updated += max(result.rowcount, 0)
+
+        self._invalidate_cached(*(row["b_id"] for params in groups.values() for row in params))
+        return updated
+
+    async def bulk_upsert(
+        self,
+        models: list[TModel | dict[str, Any]],
+        conflict_columns: Sequence[str] = ("id",),
+        update_columns: Sequence[str] | None = None
+    ) -> list[TModel]:
+        """
+        IDK: bulk-operation, upsert, on-conflict, unit-of-work, async
 
-        updated = await repository.bulk_update(items)
-        # All products updated
-        # Service layer commits the transaction
+        Responsibility:
+        - Insert or update many entities with INSERT ... ON CONFLICT DO UPDATE
+        - Return the resulting rows
+        - Does NOT commit (caller manages transaction)
+
+        Invariants:
+        - One statement per chunk on PostgreSQL and SQLite
+        - conflict_columns must be backed by a unique index or primary key
+        - Duplicate keys in the input collapse to the last occurrence
+        - Existing rows keep id, created_at and created_by; version is incremented
+        - Caller is responsible for commit/rollback
+
+        Inputs:
+        - models: ORM instances and/or dicts of column values
+        - conflict_columns: unique columns that identify an existing row
+        - update_columns: columns to overwrite on conflict (default: all incoming)
+
+        Outputs:
+        - list[TModel]: inserted or updated entities
+
+        Failure Modes:
+        - ValueError: dialect without ON CONFLICT support
+        - DatabaseError: constraint violation other than the conflict target
+
+        Example:
+
+        ```python
+        products = await repository.bulk_upsert(
+            [{"code": "PROD-001", "name": "Laptop", "price": 949.99}],
+            conflict_columns=["code"],
+        )
         await session.commit()
         ```
 
         Related Docs:
         - docs/shared/infrastructure/bulk-operations.md
-        - docs/shared/infrastructure/unit-of-work-pattern.md
         """
         if not models:
             return []
 
-        for model in models:
-            await self.session.merge(model)
-
-        await self.session.flush()
+        dialect_name = self.session.get_bind().dialect.name
+        rows = dedupe_rows(model_rows(self.model_class, models), conflict_columns)
 
-        for model in models:
-            await self.session.refresh(model)
+        upserted: list[TModel] = []
+        for chunk in chunked(rows, self.bulk_chunk_size):
+            stmt = upsert_statement(
+                self.model_class, dialect_name, chunk, conflict_columns, update_columns
+            )
+            result = await self.session.scalars(
+                stmt.returning(self.model_class),
+                execution_options={"populate_existing": True},
+            )
+            upserted.extend(result.all())
 
-        return models
+        count_cache.invalidate(self.model_class.__table__.fullname)
+        self._invalidate_cached(*(entity.id for entity in upserted))
+        return upserted
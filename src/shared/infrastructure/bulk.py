@@ -0,0 +1,252 @@
+"""
+IDK: bulk-operations, batch-insert, upsert, executemany
+
+Module: bulk
+
+Responsibility:
+- Turn ORM instances or dicts into uniform column rows for bulk statements
+- Split large row sets into chunks that fit the driver's bind parameter limit
+- Build dialect-aware upsert (INSERT ... ON CONFLICT) statements
+- Build executemany UPDATE statements keyed by primary key
+
+Key Components:
+- column_values: mapped column values of an ORM instance or dict
+- model_rows: ORM instances / dicts -> rows with identical key sets
+- dedupe_rows: last row wins per conflict key
+- chunked: yield slices sized to stay under MAX_BIND_PARAMS
+- upsert_statement: PostgreSQL / SQLite ON CONFLICT DO UPDATE
+- update_statement: UPDATE ... WHERE id = :b_id AND state != 2, version + 1
+- update_rows: group partial update rows by the columns they set
+
+Invariants:
+- Every row in a batch has the same keys, so SQLAlchemy sends one
+  multi-row INSERT (insertmanyvalues) or one executemany per chunk
+- Python-side column defaults (ids, timestamps, state, version) are
+  resolved up front because explicit None would override them
+- Upserts are supported on PostgreSQL and SQLite only
+
+Usage Examples:
+
+```python
+from src.shared.infrastructure.bulk import chunked, model_rows
+
+rows = model_rows(ProductModel, [{"code": "P-1", "name": "Laptop"}, product_model])
+for chunk in chunked(rows, 1000):
+    session.scalars(insert(ProductModel).returning(ProductModel), chunk)
+```
+
+Collaborators:
+- BaseRepository / BaseRepositoryAsync: bulk_create, bulk_update, bulk_upsert
+- BaseService: bulk endpoints in generated routes
+
+Failure Modes:
+- ValueError: upsert requested on an unsupported dialect
+- ValueError: update row without an id
+
+Related Docs:
+- docs/shared/infrastructure/bulk-operations.md
+"""
+
+from collections.abc import Iterator, Mapping, Sequence
+from typing import Any
+
+from sqlalchemy import bindparam, inspect, update
+
+# PostgreSQL (asyncpg) caps a statement at 32767 bind parameters and SQLite
+# at 32766; stay below both
+MAX_BIND_PARAMS = 32000
+
+# Columns a bulk update never sets directly
+_UPDATE_EXCLUDED = ("id", "created_at", "created_by", "version")
+
+
+def column_values(model_class: type, item: Any) -> dict[str, Any]:
+    """Return the mapped column values of an ORM instance or dict (unset keys omitted)."""
+    attributes = inspect(model_class).column_attrs
+    if isinstance(item, Mapping):
+        return {a.key: item[a.key] for a in attributes if a.key in item}
+    return {a.key: getattr(item, a.key, None) for a in attributes}
+
+
+def model_rows(model_class: type, items: Sequence[Any]) -> list[dict[str, Any]]:
+    """
+    IDK: row-normalization, column-defaults
+
+    Responsibility:
+    - Convert ORM instances or dicts into dicts keyed by column attribute
+
+    Invariants:
+    - Unknown dict keys are ignored
+    - Missing or None values take the column's Python-side default
+    - All rows share the same keys (columns without a default and no
+      value in any row are left out)
+
+    Inputs:
+    - model_class: ORM model class
+    - items: ORM instances and/or dicts
+
+    Outputs:
+    - list[dict[str, Any]]: one row per item
+    """
+    attributes = inspect(model_class).column_attrs
+    rows = []
+    for item in items:
+        values = column_values(model_class, item)
+        row = {}
+        for attribute in attributes:
+            value = values.get(attribute.key)
+            if value is None:
+                default = attribute.columns[0].default
+                if default is not None and default.is_scalar:
+                    value = default.arg
+                elif default is not None and default.is_callable:
+                    value = default.arg(None)
+            row[attribute.key] = value
+        rows.append(row)
+
+    # Drop keys no row provides so server-side defaults still apply
+    if rows:
+        empty = [key for key in rows[0] if all(row[key] is None for row in rows)]
+        for row in rows:
+            for key in empty:
+                del row[key]
+    return rows
+
+
+def dedupe_rows(rows: list[dict[str, Any]], key_columns: Sequence[str]) -> list[dict[str, Any]]:
+    """
+    Keep the last row for each key so one upsert never touches a row twice
+    (PostgreSQL rejects ON CONFLICT DO UPDATE hitting the same row again).
+    """
+    unique = {tuple(row.get(column) for column in key_columns): row for row in rows}
+    return list(unique.values())
+
+
+def chunked(rows: list[dict[str, Any]], chunk_size: int) -> Iterator[list[dict[str, Any]]]:
+    """
+    IDK: chunking, bind-parameter-limit
+
+    Responsibility:
+    - Yield consecutive slices of rows, bounded by chunk_size and by
+      MAX_BIND_PARAMS for multi-row VALUES clauses
+    """
+    if not rows:
+        return
+    per_row = max(len(rows[0]), 1)
+    size = max(min(chunk_size, MAX_BIND_PARAMS // per_row), 1)
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
+
+
+def upsert_statement(
+    model_class: type,
+    dialect_name: str,
+    rows: list[dict[str, Any]],
+    conflict_columns: Sequence[str],
+    update_columns: Sequence[str] | None = None,
+) -> Any:
+    """
+    IDK: upsert, on-conflict, dialect-aware
+
+    Responsibility:
+    - Build INSERT ... ON CONFLICT (conflict_columns) DO UPDATE for a chunk
+
+    Invariants:
+    - Conflicting rows are updated from the incoming (excluded) values
+    - id, created_at and created_by are never overwritten; version is bumped
+    - Soft-deleted rows (state=2) that conflict are revived with the incoming state
+
+    Inputs:
+    - model_class: ORM model class
+    - dialect_name: engine dialect ("postgresql" or "sqlite")
+    - rows: chunk of rows from model_rows()
+    - conflict_columns: unique columns identifying an existing row
+    - update_columns: columns to overwrite (default: all incoming non-key columns)
+
+    Outputs:
+    - ORM-enabled insert statement (call .returning() before executing)
+
+    Failure Modes:
+    - ValueError: dialect has no ON CONFLICT support
+    """
+    if dialect_name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    elif dialect_name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    else:
+        raise ValueError(f"Bulk upsert is not supported on {dialect_name}")
+
+    stmt = dialect_insert(model_class).values(rows)
+    if update_columns is None:
+        update_columns = [
+            key for key in rows[0]
+            if key not in conflict_columns and key not in _UPDATE_EXCLUDED
+        ]
+    set_ = {key: stmt.excluded[key] for key in update_columns}
+    if hasattr(model_class, "version"):
+        set_["version"] = model_class.version + 1
+    return stmt.on_conflict_do_update(index_elements=list(conflict_columns), set_=set_)
+
+
+def update_statement(model_class: type, keys: Sequence[str]) -> Any:
+    """
+    IDK: executemany-update, bind-parameters
+
+    Responsibility:
+    - Build one UPDATE that is executed once per row (executemany)
+
+    Invariants:
+    - Rows are matched by primary key through the b_id parameter
+    - Soft-deleted rows (state=2) are never updated
+    - version is incremented server-side when the model has one
+
+    Inputs:
+    - model_class: ORM model class
+    - keys: column keys set by every row of the batch
+
+    Outputs:
+    - Core update statement expecting params {"b_id": ..., <keys>...}
+    """
+    table = model_class.__table__
+    stmt = (
+        update(table)
+        .where(table.c.id == bindparam("b_id"))
+        .where(table.c.state != 2)
+        .values({key: bindparam(key) for key in keys})
+    )
+    if "version" in table.c:
+        stmt = stmt.values(version=table.c.version + 1)
+    return stmt
+
+
+def update_rows(model_class: type, items: Sequence[Any]) -> dict[tuple[str, ...], list]:
+    """
+    IDK: executemany-update, batching
+
+    Responsibility:
+    - Group update rows (ORM instances or partial dicts) by the columns they set
+
+    Invariants:
+    - Each row must carry an id; it is passed as the b_id parameter
+    - Keys that are not mapped columns, or never set by bulk updates, are dropped
+
+    Inputs:
+    - model_class: ORM model class
+    - items: ORM instances and/or dicts with an "id" key
+
+    Outputs:
+    - dict mapping a sorted key tuple to its executemany parameter list
+
+    Failure Modes:
+    - ValueError: a row has no id
+    """
+    groups: dict[tuple[str, ...], list] = {}
+    for item in items:
+        values = column_values(model_class, item)
+        entity_id = values.get("id")
+        if entity_id is None:
+            raise ValueError("Every bulk update item needs an id")
+        values = {key: value for key, value in values.items() if key not in _UPDATE_EXCLUDED}
+        keys = tuple(sorted(values))
+        groups.setdefault(keys, []).append({"b_id": entity_id, **values})
+    return groups
@@ -0,0 +1,175 @@
+"""
+IDK: count-strategy, pagination-totals, planner-estimates, ttl-cache
+
+Module: counting
+
+Responsibility:
+- Define how paginated lists obtain their total (exact, estimated, cached, none)
+- Cache totals per table and filter set with a TTL, invalidated on writes
+- Read planner row estimates from PostgreSQL instead of scanning the table
+
+Key Components:
+- CountMode: count strategy selected per entity (or per request)
+- CountCache: in-process TTL cache of totals keyed by (table, filters)
+- count_cache: shared CountCache instance used by all repositories
+- estimate_statement / plan_rows: build and parse EXPLAIN (FORMAT JSON) output
+
+Invariants:
+- EXACT runs SELECT count(*) and is the default
+- ESTIMATED is PostgreSQL-only; other dialects fall back to EXACT
+- CACHED entries expire after their TTL and are dropped whenever a
+  repository creates or deletes rows in the table
+- NONE never counts; callers rely on has_more (LIMIT n + 1) instead
+
+Usage Examples:
+
+```python
+from src.shared.infrastructure.counting import CountMode
+
+class ProductRepository(BaseRepository[ProductModel]):
+    count_mode = CountMode.ESTIMATED
+
+    def __init__(self, session: Session):
+        super().__init__(session, ProductModel)
+
+# Per request override
+items, total, has_more = repository.get_page(
+    page=1, page_size=20, count_mode=CountMode.NONE
+)
+```
+
+Collaborators:
+- BaseRepository / BaseRepositoryAsync: count rows according to CountMode
+- BaseService: exposes total (or None) and has_more on PaginatedResponse
+
+Failure Modes:
+- ValueError: unknown count mode string
+
+Related Docs:
+- docs/shared/infrastructure/pagination.md
+"""
+
+import json
+import time
+from enum import Enum
+from threading import Lock
+from typing import Any
+
+
+class CountMode(str, Enum):
+    """
+    IDK: count-strategy, enum
+
+    Responsibility:
+    - Name the strategies a repository can use to compute list totals
+
+    Values:
+    - EXACT: SELECT count(*) over the filtered query
+    - ESTIMATED: planner estimate (pg_class.reltuples or EXPLAIN rows)
+    - CACHED: exact count reused for count_cache_ttl seconds
+    - NONE: no total; has_more tells whether another page exists
+    """
+
+    EXACT = "exact"
+    ESTIMATED = "estimated"
+    CACHED = "cached"
+    NONE = "none"
+
+
+class CountCache:
+    """
+    IDK: ttl-cache, count-cache, write-invalidation
+
+    Responsibility:
+    - Remember totals per (table, filters) for a limited time
+    - Forget every total of a table when its rows change
+
+    Invariants:
+    - Expired entries are never returned
+    - Thread-safe (sync repositories may run in a thread pool)
+    - Process-local: each worker keeps its own totals
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self._entries: dict[tuple[str, str], tuple[float, int]] = {}
+        self._max_entries = max_entries
+        self._lock = Lock()
+
+    @staticmethod
+    def key(table: str, filters: dict[str, Any] | None) -> tuple[str, str]:
+        """Build a cache key from the table name and its equality filters."""
+        return table, json.dumps(filters or {}, sort_keys=True, default=str)
+
+    def get(self, key: tuple[str, str]) -> int | None:
+        """Return a cached total, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, total = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            return total
+
+    def set(self, key: tuple[str, str], total: int, ttl: float) -> None:
+        """Store a total for ttl seconds."""
+        with self._lock:
+            if len(self._entries) >= self._max_entries:
+                # Drop the entry closest to expiry to stay bounded
+                oldest = min(self._entries, key=lambda k: self._entries[k][0])
+                del self._entries[oldest]
+            self._entries[key] = (time.monotonic() + ttl, total)
+
+    def invalidate(self, table: str) -> None:
+        """Drop all totals cached for table."""
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == table]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop every cached total."""
+        with self._lock:
+            self._entries.clear()
+
+
+count_cache = CountCache()
+
+
+def estimate_statement(statement: Any, dialect: Any) -> tuple[str, Any]:
+    """
+    IDK: planner-estimate, explain
+
+    Responsibility:
+    - Compile statement into an EXPLAIN (FORMAT JSON) driver-level query
+
+    Inputs:
+    - statement: SQLAlchemy select to estimate
+    - dialect: dialect of the bound engine
+
+    Outputs:
+    - tuple[str, Any]: (SQL, parameters) for exec_driver_sql()
+    """
+    compiled = statement.compile(dialect=dialect)
+    params: Any = compiled.params
+    if compiled.positional:
+        params = tuple(compiled.params[name] for name in compiled.positiontup)
+    return f"EXPLAIN (FORMAT JSON) {compiled}", params
+
+
+def plan_rows(explain_output: Any) -> int:
+    """
+    IDK: planner-estimate, explain-parsing
+
+    Responsibility:
+    - Read the top-level "Plan Rows" estimate from EXPLAIN (FORMAT JSON)
+
+    Inputs:
+    - explain_output: first column of the EXPLAIN row (JSON string or list)
+
+    Outputs:
+    - int: estimated row count (never negative)
+    """
+    if isinstance(explain_output, str):
+        explain_output = json.loads(explain_output)
+    return max(int(explain_output[0]["Plan"]["Plan Rows"]), 0)
@@ -17,7 +17,10 @@ Responsibility:
 
 Key Components:
 - DATABASE_URL: Connection string from environment with fallback chain
-- engine: SQLAlchemy engine with optional connection pool configuration
+- DATABASE_PROFILE: Engine profile (dev, prod, serverless) from environment or config.yml
+- ENGINE_PROFILES / engine_options(): Pool settings per profile
+- engine: SQLAlchemy engine tuned by the selected profile and instrumented
+  with query metrics (db_metrics)
 - SessionLocal: Session factory for creating database sessions
 - Base: Declarative base class for ORM models
 - get_db(): Generator function for dependency injection with cleanup
@@ -26,7 +29,10 @@ Invariants:
 - DATABASE_URL priority: os.getenv('DATABASE_URL') → config.project.database_url → 'sqlite:///./app.db'
 - Session cleanup happens in finally block (guaranteed)
 - get_db() yields session, ensures cleanup even on exception
-- Connection pool settings available as commented examples
+- DATABASE_PROFILE priority: os.getenv('DATABASE_PROFILE') → config.database.profile
+- dev: driver default pool; prod: sized pool with pre-ping and recycle;
+  serverless: NullPool (no connections kept between checkouts)
+- SQLite connections always get WAL journaling and the SQLITE_PRAGMAS
 - Async mode uses AsyncSession and async_sessionmaker
 - Sync mode uses Session and sessionmaker
 
@@ -78,10 +84,13 @@ Collaborators:
 - SQLAlchemy Session: Transaction and query execution
 - ORM Models: Entities that inherit from Base
 - FastAPI: Dependency injection system uses get_db()
+- db_metrics: Statement, pool and N+1 metrics served by GET /health/metrics
 
 Failure Modes:
 - ConnectionError: Database URL invalid or database unreachable
-- OperationalError: Database connection timeout or pool exhausted
+- OperationalError: Database connection timeout
+- TimeoutError: Pool exhausted for pool_timeout seconds (prod profile)
+- ValueError: Unknown DATABASE_PROFILE at import time
 - ProgrammingError: SQL syntax errors in queries
 - All exceptions propagate to FastAPI's exception handlers
 
@@ -92,25 +101,100 @@ Related Docs:
 """
 
 import os
+from typing import Any
+
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.pool import NullPool
+
+from src.shared.infrastructure.db_metrics import instrument_engine, query_metrics
 
 # Database URL with environment variable priority chain
 # Priority: DATABASE_URL env var → config.project.database_url → hardcoded sqlite default
 DATABASE_URL = os.getenv("DATABASE_URL") or "sqlite:///./app.db"
 
-# Create SQLAlchemy engine with optional connection pool settings
+# Engine profile with environment variable priority chain
+# Priority: DATABASE_PROFILE env var → config.yml database.profile
+DATABASE_PROFILE = os.getenv("DATABASE_PROFILE") or "dev"
+
+# Engine options per profile
+ENGINE_PROFILES: dict[str, dict[str, Any]] = {
+    # Local development: driver default pool (SQLite pragmas applied below)
+    "dev": {},
+    # Long-running servers: sized pool, stale connections detected and replaced
+    "prod": {
+        "pool_size": 10,
+        "max_overflow": 20,
+        "pool_timeout": 30,
+        "pool_recycle": 1800,
+        "pool_pre_ping": True,
+        "pool_use_lifo": True,  # idle surplus connections age out after load spikes
+    },
+    # Serverless / short-lived workers: no pooling, the platform or an
+    # external pooler (PgBouncer, RDS Proxy) owns connection reuse
+    "serverless": {"poolclass": NullPool},
+}
+
+# Applied to every new SQLite connection
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",  # readers no longer block the writer
+    "synchronous": "NORMAL",  # durable with WAL, far fewer fsyncs
+    "foreign_keys": "ON",
+    "busy_timeout": "5000",  # wait up to 5s for a lock instead of failing
+    "cache_size": "-64000",  # 64 MB page cache
+    "temp_store": "MEMORY",
+}
+
+# Query metrics thresholds (see GET /health/metrics)
+SLOW_QUERY_MS = 200
+N_PLUS_ONE_THRESHOLD = 10
+
+
+def engine_options(profile: str, url: str) -> dict[str, Any]:
+    """
+    IDK: engine-profile, connection-pool
+
+    Responsibility:
+    - Return create_engine() keyword arguments for a named profile
+
+    Invariants:
+    - In-memory SQLite keeps its single shared connection (no pool sizing)
+
+    Failure Modes:
+    - ValueError: unknown profile name
+    """
+    if profile not in ENGINE_PROFILES:
+        raise ValueError(
+            f"Unknown database profile: {profile} (expected one of {', '.join(ENGINE_PROFILES)})"
+        )
+    options = dict(ENGINE_PROFILES[profile])
+    database = make_url(url)
+    if database.get_backend_name() == "sqlite" and database.database in (None, "", ":memory:"):
+        for key in ("pool_size", "max_overflow", "pool_timeout", "pool_use_lifo"):
+            options.pop(key, None)
+    return options
+
+
+def _apply_sqlite_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+    cursor = dbapi_connection.cursor()
+    for name, value in SQLITE_PRAGMAS.items():
+        cursor.execute(f"PRAGMA {name}={value}")
+    cursor.close()
+
+
+# Create SQLAlchemy engine tuned by the selected profile
 engine = create_engine(
     DATABASE_URL,
-    # Uncomment for custom connection pool configuration:
-    # pool_size=5,
-    # max_overflow=10,
-    # pool_pre_ping=True,  # Enable connection health checks
-    # pool_recycle=3600,   # Recycle connections after 1 hour
     echo=False,  # Set to True for SQL query logging
+    **engine_options(DATABASE_PROFILE, DATABASE_URL),
 )
 
+if engine.dialect.name == "sqlite":
+    event.listen(engine, "connect", _apply_sqlite_pragmas)
+
 # Create session factory
 SessionLocal = sessionmaker(
     bind=engine,
@@ -118,6 +202,10 @@ SessionLocal = sessionmaker(
     autoflush=False,
 )
 
+# Statement latency, slow-query log, pool checkout wait and N+1 detection
+query_metrics.configure(slow_query_ms=SLOW_QUERY_MS, n_plus_one_threshold=N_PLUS_ONE_THRESHOLD)
+instrument_engine(engine)
+
 # Declarative Base for ORM models
 # All models should inherit from this Base class
 Base = declarative_base()
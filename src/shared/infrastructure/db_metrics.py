@@ -0,0 +1,486 @@
+"""
+IDK: query-metrics, latency-histogram, slow-query-log, pool-metrics, n-plus-one
+
+Module: db_metrics
+
+Responsibility:
+- Time every SQL statement with SQLAlchemy engine events
+- Keep latency histograms overall and per statement shape
+- Keep a bounded log of slow statements
+- Time how long callers wait to obtain a pooled connection
+- Count repeated statements per request and report likely N+1 patterns
+
+Key Components:
+- LatencyHistogram: fixed-bucket latency histogram with percentile estimates
+- QueryMetrics: thread-safe collector behind the /health/metrics endpoint
+- query_metrics: shared QueryMetrics instance used by database.py
+- instrument_engine: attach the listeners to a sync or async engine
+- track_queries: context manager counting statements of one unit of work
+- QueryMetricsMiddleware: ASGI middleware running track_queries per request
+
+Invariants:
+- Memory use is bounded: statement shapes, slow queries and N+1 reports
+  are capped, and histograms have fixed buckets
+- Statements are grouped by their SQL text; SQLAlchemy binds values as
+  parameters, so one shape covers every execution (expanded IN lists are
+  collapsed to "(...)")
+- Bound parameter values are never recorded
+- executemany statements (bulk writes) are not counted towards N+1
+- Metrics are process-local: each worker reports its own numbers
+
+Usage Examples:
+
+```python
+from src.shared.infrastructure.db_metrics import (
+    QueryMetricsMiddleware,
+    instrument_engine,
+    query_metrics,
+    track_queries,
+)
+
+instrument_engine(engine)               # done by database.py
+app.add_middleware(QueryMetricsMiddleware)  # in your app factory; enables N+1 findings
+
+# Outside HTTP requests (jobs, scripts)
+with track_queries("nightly-import"):
+    run_import()
+
+query_metrics.snapshot(engine.pool)["slow_queries"]
+```
+
+Collaborators:
+- database.py: instruments the engine selected by the configured profile
+- health.py: GET /health/metrics returns query_metrics.snapshot()
+- SQLAlchemy Engine / Pool: cursor execute events and Pool.connect()
+
+Failure Modes:
+- Listeners never raise into the statement being executed
+- Pool timeouts are counted, then re-raised unchanged
+
+Related Docs:
+- docs/shared/infrastructure/database-setup.md
+- docs/shared/infrastructure/monitoring.md
+"""
+
+import logging
+import re
+import time
+from collections import Counter, deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from threading import Lock
+from typing import Any
+
+from sqlalchemy import event, exc
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (ms) of the histogram buckets; slower observations go to "+Inf"
+LATENCY_BUCKETS_MS = (1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+# Connection.info key holding statement start times (a stack, for nested cursors)
+_START_KEY = "db_metrics.start"
+
+# Expanded IN lists: (?, ?, ?) / (%s, %s) / ($1, $2) / (%(a)s, %(b)s)
+_PARAM = r"(?:\?|%s|\$\d+|%\(\w+\)s|:\w+)"
+_PARAM_LIST = re.compile(rf"\(\s*{_PARAM}(?:\s*,\s*{_PARAM})+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+# Statement shapes beyond max_statements are grouped under this key
+OTHER_STATEMENTS = "<other>"
+
+
+def statement_key(statement: str, max_length: int = 500) -> str:
+    """Normalize SQL text into a bounded statement shape."""
+    shape = _PARAM_LIST.sub("(...)", _WHITESPACE.sub(" ", statement).strip())
+    return shape[:max_length]
+
+
+class LatencyHistogram:
+    """
+    IDK: latency-histogram, percentiles
+
+    Responsibility:
+    - Count observations per latency bucket, with sum and max
+
+    Invariants:
+    - Not thread-safe on its own; QueryMetrics guards every access
+    - Percentiles are estimated as the upper bound of the bucket holding
+      the requested rank (the max for the "+Inf" bucket)
+    """
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.count = 0
+        self.sum_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, duration_ms: float) -> None:
+        index = len(LATENCY_BUCKETS_MS)
+        for i, bound in enumerate(LATENCY_BUCKETS_MS):
+            if duration_ms <= bound:
+                index = i
+                break
+        self.counts[index] += 1
+        self.count += 1
+        self.sum_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+
+    def percentile(self, quantile: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = quantile * self.count
+        seen = 0
+        for i, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                return LATENCY_BUCKETS_MS[i] if i < len(LATENCY_BUCKETS_MS) else self.max_ms
+        return self.max_ms
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return counts, sum, max, p50/p95/p99 and cumulative buckets."""
+        buckets = {}
+        cumulative = 0
+        for bound, bucket_count in zip((*LATENCY_BUCKETS_MS, "+Inf"), self.counts):
+            cumulative += bucket_count
+            buckets[str(bound)] = cumulative
+        return {
+            "count": self.count,
+            "sum_ms": round(self.sum_ms, 3),
+            "max_ms": round(self.max_ms, 3),
+            "p50_ms": self.percentile(0.50),
+            "p95_ms": self.percentile(0.95),
+            "p99_ms": self.percentile(0.99),
+            "buckets": buckets,
+        }
+
+
+@dataclass
+class SlowQuery:
+    """One statement that exceeded slow_query_ms."""
+
+    statement: str
+    duration_ms: float
+    at: str
+
+
+@dataclass
+class NPlusOne:
+    """One statement repeated at least n_plus_one_threshold times in a request."""
+
+    request: str
+    statement: str
+    count: int
+    at: str
+
+
+@dataclass
+class RequestQueries:
+    """Statements executed by one request (or other tracked unit of work)."""
+
+    label: str
+    counts: Counter = field(default_factory=Counter)
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+
+_current_request: ContextVar[RequestQueries | None] = ContextVar(
+    "db_metrics_request", default=None
+)
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+class QueryMetrics:
+    """
+    IDK: metrics-collector, thread-safe, bounded-memory
+
+    Responsibility:
+    - Aggregate statement latencies, slow queries, pool waits and N+1 reports
+
+    Invariants:
+    - Thread-safe (sync requests run in a thread pool)
+    - At most max_statements statement histograms, slow_log_size slow
+      queries and report_size N+1 reports are kept
+    """
+
+    def __init__(
+        self,
+        slow_query_ms: float = 200.0,
+        n_plus_one_threshold: int = 10,
+        max_statements: int = 200,
+        slow_log_size: int = 100,
+        report_size: int = 50,
+    ):
+        self.slow_query_ms = slow_query_ms
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.max_statements = max_statements
+        self._slow_log_size = slow_log_size
+        self._report_size = report_size
+        self._lock = Lock()
+        self.reset()
+
+    def configure(
+        self,
+        slow_query_ms: float | None = None,
+        n_plus_one_threshold: int | None = None,
+    ) -> None:
+        """Change thresholds (database.py passes the values from config.yml)."""
+        if slow_query_ms is not None:
+            self.slow_query_ms = slow_query_ms
+        if n_plus_one_threshold is not None:
+            self.n_plus_one_threshold = n_plus_one_threshold
+
+    def reset(self) -> None:
+        """Drop every collected metric."""
+        with self._lock:
+            self._statements = LatencyHistogram()
+            self._by_statement: dict[str, LatencyHistogram] = {}
+            self._slow_queries: deque[SlowQuery] = deque(maxlen=self._slow_log_size)
+            self._checkout_wait = LatencyHistogram()
+            self._checkout_timeouts = 0
+            self._n_plus_one: deque[NPlusOne] = deque(maxlen=self._report_size)
+            self._n_plus_one_total = 0
+
+    def record_statement(self, statement: str, duration_ms: float) -> None:
+        """Record one executed statement."""
+        key = statement_key(statement)
+        with self._lock:
+            self._statements.observe(duration_ms)
+            histogram = self._by_statement.get(key)
+            if histogram is None:
+                if len(self._by_statement) >= self.max_statements:
+                    key = OTHER_STATEMENTS
+                histogram = self._by_statement.setdefault(key, LatencyHistogram())
+            histogram.observe(duration_ms)
+            slow = duration_ms >= self.slow_query_ms
+            if slow:
+                self._slow_queries.append(SlowQuery(key, round(duration_ms, 3), _now()))
+        if slow:
+            logger.warning("Slow query (%.1f ms): %s", duration_ms, key)
+
+    def record_checkout(self, wait_ms: float, timed_out: bool = False) -> None:
+        """Record the time spent obtaining a pooled connection."""
+        with self._lock:
+            self._checkout_wait.observe(wait_ms)
+            if timed_out:
+                self._checkout_timeouts += 1
+
+    def record_request(self, queries: RequestQueries) -> list[NPlusOne]:
+        """
+        IDK: n-plus-one-detection
+
+        Responsibility:
+        - Report statements a request repeated n_plus_one_threshold times or more
+
+        Outputs:
+        - list[NPlusOne]: reports for this request (empty when none)
+        """
+        reports = [
+            NPlusOne(queries.label, statement, count, _now())
+            for statement, count in queries.counts.items()
+            if count >= self.n_plus_one_threshold
+        ]
+        if reports:
+            with self._lock:
+                self._n_plus_one.extend(reports)
+                self._n_plus_one_total += len(reports)
+            for report in reports:
+                logger.warning(
+                    "Possible N+1 in %s: %d x %s", report.request, report.count, report.statement
+                )
+        return reports
+
+    def snapshot(self, pool: Any = None, top: int = 20) -> dict[str, Any]:
+        """
+        IDK: metrics-snapshot
+
+        Responsibility:
+        - Return a JSON-ready view of every metric
+
+        Inputs:
+        - pool: engine pool to report sizes for (optional)
+        - top: number of statement shapes to list, by total time
+
+        Outputs:
+        - dict with statements, by_statement, slow_queries, pool and n_plus_one
+        """
+        with self._lock:
+            by_statement = sorted(
+                self._by_statement.items(), key=lambda item: item[1].sum_ms, reverse=True
+            )
+            result = {
+                "statements": self._statements.snapshot(),
+                "by_statement": [
+                    {"statement": key, **histogram.snapshot()}
+                    for key, histogram in by_statement[:top]
+                ],
+                "slow_queries": {
+                    "threshold_ms": self.slow_query_ms,
+                    "recent": [asdict(query) for query in self._slow_queries],
+                },
+                "pool": {
+                    "checkout_wait": self._checkout_wait.snapshot(),
+                    "checkout_timeouts": self._checkout_timeouts,
+                },
+                "n_plus_one": {
+                    "threshold": self.n_plus_one_threshold,
+                    "detected": self._n_plus_one_total,
+                    "recent": [asdict(report) for report in self._n_plus_one],
+                },
+            }
+        if pool is not None:
+            result["pool"].update(pool_status(pool))
+        return result
+
+
+query_metrics = QueryMetrics()
+
+
+def pool_status(pool: Any) -> dict[str, Any]:
+    """Return the pool class and whichever size counters it supports."""
+    status: dict[str, Any] = {"class": type(pool).__name__}
+    for name in ("size", "checkedin", "checkedout", "overflow"):
+        method = getattr(pool, name, None)
+        if callable(method):
+            status[name] = method()
+    return status
+
+
+def _instrument_pool(pool: Any, metrics: QueryMetrics) -> None:
+    """Wrap pool.connect() to time checkouts (queue wait plus any new connect)."""
+    if getattr(pool, "_db_metrics", None) is metrics:
+        return
+    connect = pool.connect
+
+    def timed_connect() -> Any:
+        start = time.perf_counter()
+        try:
+            connection = connect()
+        except exc.TimeoutError:
+            metrics.record_checkout((time.perf_counter() - start) * 1000, timed_out=True)
+            raise
+        metrics.record_checkout((time.perf_counter() - start) * 1000)
+        return connection
+
+    pool.connect = timed_connect
+    pool._db_metrics = metrics
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault(_START_KEY, []).append(time.perf_counter())
+
+
+def instrument_engine(engine: Any, metrics: QueryMetrics = query_metrics) -> None:
+    """
+    IDK: engine-instrumentation, event-listeners
+
+    Responsibility:
+    - Attach statement timing, N+1 counting and pool checkout timing to engine
+
+    Invariants:
+    - Accepts a sync Engine or an AsyncEngine (listeners go on sync_engine)
+    - Idempotent per engine
+    - Pool timing is re-attached when engine.dispose() recreates the pool
+
+    Inputs:
+    - engine: SQLAlchemy Engine or AsyncEngine
+    - metrics: collector to record into (default: query_metrics)
+    """
+    sync_engine = getattr(engine, "sync_engine", engine)
+    if event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+        return
+
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        starts = conn.info.get(_START_KEY)
+        if not starts:
+            return
+        metrics.record_statement(statement, (time.perf_counter() - starts.pop()) * 1000)
+        queries = _current_request.get()
+        if queries is not None and not executemany:
+            queries.counts[statement_key(statement)] += 1
+
+    @event.listens_for(sync_engine, "handle_error")
+    def _handle_error(context):
+        connection = context.connection
+        if connection is not None and connection.info.get(_START_KEY):
+            connection.info[_START_KEY].pop()
+
+    @event.listens_for(sync_engine, "engine_disposed")
+    def _engine_disposed(disposed_engine):
+        _instrument_pool(disposed_engine.pool, metrics)
+
+    _instrument_pool(sync_engine.pool, metrics)
+
+
+@contextmanager
+def track_queries(
+    label: str,
+    metrics: QueryMetrics = query_metrics,
+) -> Iterator[RequestQueries]:
+    """
+    IDK: request-tracking, n-plus-one-detection, contextvars
+
+    Responsibility:
+    - Count statements executed inside the block and report N+1 patterns on exit
+
+    Invariants:
+    - Uses a ContextVar, so concurrent requests are counted separately and
+      sync routes run in worker threads still report to their request
+    - Nested blocks count into the innermost one only
+
+    Inputs:
+    - label: name reported with N+1 findings (e.g. "GET /products")
+    - metrics: collector to report into
+
+    Outputs:
+    - RequestQueries: live counters (label may be changed before exit)
+    """
+    queries = RequestQueries(label)
+    token = _current_request.set(queries)
+    try:
+        yield queries
+    finally:
+        _current_request.reset(token)
+        metrics.record_request(queries)
+
+
+class QueryMetricsMiddleware:
+    """
+    IDK: asgi-middleware, request-tracking
+
+    Responsibility:
+    - Run every HTTP request inside track_queries()
+
+    Invariants:
+    - Findings are labelled with the matched route template
+      (e.g. "GET /products/{id}") when the router provides one
+    - Non-HTTP scopes (lifespan, websocket) pass through untouched
+    """
+
+    def __init__(self, app: Any, metrics: QueryMetrics = query_metrics):
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope: dict, receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries(f"{scope['method']} {scope['path']}", self.metrics) as queries:
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                route = scope.get("route")
+                if getattr(route, "path", None):
+                    queries.label = f"{scope['method']} {route.path}"
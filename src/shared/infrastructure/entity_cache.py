@@ -0,0 +1,307 @@
+"""
+IDK: entity-cache, read-through, lru-ttl, write-invalidation
+
+Module: entity_cache
+
+Responsibility:
+- Cache entity rows by (table, id) so hot reads skip the database
+- Drop cached rows whenever a repository writes them
+- Count hits and misses per table
+
+Key Components:
+- CacheBackend: protocol for cache stores (get / set / delete / clear)
+- MemoryCacheBackend: in-process LRU store with per-entry TTL (default)
+- RedisCacheBackend: adapter for any Redis-compatible client
+- CacheStats: hit/miss/invalidation counters of one table
+- EntityCache: read-through facade used by repositories
+- entity_cache: shared EntityCache instance used by all repositories
+
+Invariants:
+- Cached values are plain column dicts, never session-bound ORM instances
+- Soft-deleted rows (state=2) are never cached
+- Writes invalidate immediately and again after the transaction commits,
+  so a concurrent read cannot re-cache the pre-commit row
+- MemoryCacheBackend is process-local: with several workers use a shared
+  backend (RedisCacheBackend) or keep the TTL short
+- Disabled per repository unless cache_entities = True
+
+Usage Examples:
+
+```python
+from src.shared.infrastructure.entity_cache import RedisCacheBackend, entity_cache
+
+class ProductRepository(BaseRepository[ProductModel]):
+    cache_entities = True
+    entity_cache_ttl = 300.0
+
+    def __init__(self, session: Session):
+        super().__init__(session, ProductModel)
+
+# Optional: share the cache between workers
+entity_cache.use_backend(RedisCacheBackend(redis.Redis()))
+
+entity_cache.stats()["products"].hit_ratio
+```
+
+Collaborators:
+- BaseRepository / BaseRepositoryAsync: get_by_id / exists read through the cache
+- SQLAlchemy Session: after_commit hook runs deferred invalidations
+
+Failure Modes:
+- Backend errors propagate to the caller (no silent fallback)
+
+Related Docs:
+- docs/shared/infrastructure/entity-cache.md
+"""
+
+import copy
+import pickle
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, Protocol
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+# Session.info key holding invalidations deferred until commit
+_PENDING_KEY = "entity_cache.pending"
+
+
+class CacheBackend(Protocol):
+    """
+    IDK: cache-backend, protocol
+
+    Responsibility:
+    - Store values by string key with a TTL
+
+    Invariants:
+    - get() returns None for missing or expired keys
+    """
+
+    def get(self, key: str) -> Any | None: ...
+
+    def set(self, key: str, value: Any, ttl: float) -> None: ...
+
+    def delete(self, *keys: str) -> None: ...
+
+    def clear(self) -> None: ...
+
+
+class MemoryCacheBackend:
+    """
+    IDK: lru-cache, ttl-cache, in-process
+
+    Responsibility:
+    - Keep up to max_entries values, evicting the least recently used
+
+    Invariants:
+    - Expired entries are never returned
+    - Thread-safe (sync repositories may run in a thread pool)
+    """
+
+    def __init__(self, max_entries: int = 10_000):
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._max_entries = max_entries
+        self._lock = Lock()
+
+    def get(self, key: str) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, *keys: str) -> None:
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class RedisCacheBackend:
+    """
+    IDK: redis-cache, shared-cache, adapter
+
+    Responsibility:
+    - Store pickled values in a Redis-compatible server shared by all workers
+
+    Invariants:
+    - Only needs get / set(ex=) / delete / scan_iter on the client, so any
+      Redis-compatible client or local stand-in works
+    - Keys are namespaced with prefix; clear() only removes those keys
+    """
+
+    def __init__(self, client: Any, prefix: str = "entity:"):
+        self._client = client
+        self._prefix = prefix
+
+    def get(self, key: str) -> Any | None:
+        raw = self._client.get(self._prefix + key)
+        return None if raw is None else pickle.loads(raw)
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        self._client.set(self._prefix + key, pickle.dumps(value), ex=max(int(ttl), 1))
+
+    def delete(self, *keys: str) -> None:
+        if keys:
+            self._client.delete(*(self._prefix + key for key in keys))
+
+    def clear(self) -> None:
+        keys = list(self._client.scan_iter(match=self._prefix + "*"))
+        if keys:
+            self._client.delete(*keys)
+
+
+@dataclass
+class CacheStats:
+    """Hit, miss and invalidation counters of one table."""
+
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def snapshot(instance: Any) -> dict[str, Any]:
+    """Return the mapped column values of a loaded ORM instance."""
+    return {a.key: getattr(instance, a.key) for a in inspect(type(instance)).column_attrs}
+
+
+def restore(model_class: type, values: dict[str, Any]) -> Any:
+    """
+    IDK: cache-restore, detached-instance
+
+    Responsibility:
+    - Rebuild a detached ORM instance from a snapshot
+
+    Invariants:
+    - The instance has no pending changes, so session.merge(load=False)
+      attaches it without a SELECT
+    - Mutable values (JSON dicts/lists) are copied so callers cannot
+      modify the cached snapshot
+    """
+    instance = inspect(model_class).class_manager.new_instance()
+    for key, value in values.items():
+        if isinstance(value, (dict, list)):
+            value = copy.deepcopy(value)
+        setattr(instance, key, value)
+    make_transient_to_detached(instance)
+    return instance
+
+
+class EntityCache:
+    """
+    IDK: read-through-cache, entity-cache, metrics
+
+    Responsibility:
+    - Map (table, id) to a row snapshot in the configured backend
+    - Track hits, misses and invalidations per table
+    - Defer a second invalidation to the session's next commit
+
+    Invariants:
+    - Keys are "<table>:<id>"
+    - Swapping the backend starts from an empty cache
+    """
+
+    def __init__(self, backend: CacheBackend | None = None):
+        self.backend: CacheBackend = backend or MemoryCacheBackend()
+        self._stats: dict[str, CacheStats] = {}
+        self._lock = Lock()
+
+    @staticmethod
+    def key(table: str, entity_id: Any) -> str:
+        return f"{table}:{entity_id}"
+
+    def use_backend(self, backend: CacheBackend) -> None:
+        """Replace the backend (e.g. a RedisCacheBackend shared by workers)."""
+        self.backend = backend
+
+    def _record(self, table: str, field: str, amount: int = 1) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(table, CacheStats())
+            setattr(stats, field, getattr(stats, field) + amount)
+
+    def get(self, table: str, entity_id: Any) -> dict[str, Any] | None:
+        """Return the cached snapshot, recording a hit or a miss."""
+        values = self.backend.get(self.key(table, entity_id))
+        self._record(table, "hits" if values is not None else "misses")
+        return values
+
+    def set(self, table: str, entity_id: Any, values: dict[str, Any], ttl: float) -> None:
+        self.backend.set(self.key(table, entity_id), values, ttl)
+
+    def invalidate(self, table: str, *entity_ids: Any) -> None:
+        """Drop the cached rows of entity_ids."""
+        if not entity_ids:
+            return
+        self.backend.delete(*(self.key(table, entity_id) for entity_id in entity_ids))
+        self._record(table, "invalidations", len(entity_ids))
+
+    def invalidate_on_commit(self, session: Session, table: str, *entity_ids: Any) -> None:
+        """
+        IDK: write-invalidation, commit-hook
+
+        Responsibility:
+        - Invalidate now and again once session commits
+
+        Invariants:
+        - Covers reads that re-cache the old row between flush and commit
+        - Pending ids are discarded on rollback
+
+        Inputs:
+        - session: sync Session (AsyncSession.sync_session for async code)
+        - table: table name
+        - entity_ids: ids written in the current transaction
+        """
+        self.invalidate(table, *entity_ids)
+        pending = session.info.setdefault(_PENDING_KEY, set())
+        pending.update((table, entity_id) for entity_id in entity_ids)
+
+    def stats(self) -> dict[str, CacheStats]:
+        """Return a copy of the per-table counters."""
+        with self._lock:
+            return {table: copy.copy(stats) for table, stats in self._stats.items()}
+
+    def clear(self) -> None:
+        """Drop every cached row and reset the counters."""
+        self.backend.clear()
+        with self._lock:
+            self._stats.clear()
+
+
+entity_cache = EntityCache()
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session: Session) -> None:
+    pending = session.info.pop(_PENDING_KEY, None)
+    if pending:
+        # Second pass of invalidate_on_commit(); not counted in the stats again
+        keys = [entity_cache.key(table, entity_id) for table, entity_id in pending]
+        entity_cache.backend.delete(*keys)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
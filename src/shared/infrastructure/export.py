@@ -0,0 +1,148 @@
+"""
+IDK: column-projection, streaming-export, ndjson, csv
+
+Module: export
+
+Responsibility:
+- Validate column projections requested by clients
+- Serialize streamed rows as NDJSON or CSV one line at a time
+
+Key Components:
+- EXPORT_MEDIA_TYPES: export format -> HTTP media type
+- projection_columns: validated column list for load_only / select(columns)
+- export_lines: rows -> iterator of NDJSON or CSV lines
+
+Invariants:
+- Projections always include the primary key (id)
+- Serializers hold one row at a time, so memory use does not grow with
+  the size of the export
+- Values are converted with pydantic's JSON rules (datetime, Decimal, UUID)
+
+Usage Examples:
+
+```python
+from src.shared.infrastructure.export import export_lines, projection_columns
+
+columns = projection_columns(ProductModel, ["name", "price"])
+rows = repository.stream_all(fields=columns)
+for line in export_lines(rows, "csv", columns):
+    output.write(line)
+```
+
+Collaborators:
+- BaseRepository / BaseRepositoryAsync: stream_all(), fields= projections
+- BaseService: export() and projected get_all()
+
+Failure Modes:
+- ValueError: unknown field in a projection
+- ValueError: unsupported export format
+
+Related Docs:
+- docs/shared/infrastructure/export.md
+"""
+
+import csv
+import io
+import json
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any
+
+from pydantic_core import to_jsonable_python
+from sqlalchemy import inspect
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+def projection_columns(
+    model_class: type,
+    fields: Sequence[str] | None = None,
+    *required: str | None,
+) -> list[str]:
+    """
+    IDK: column-projection, input-validation
+
+    Responsibility:
+    - Resolve requested fields to mapped column names
+
+    Invariants:
+    - No fields means every mapped column
+    - id comes first, then required columns (e.g. the sort key), then fields
+    - Duplicates are dropped, order is kept
+
+    Inputs:
+    - model_class: ORM model class
+    - fields: requested column names (None for all)
+    - required: extra columns the caller needs loaded (None entries ignored)
+
+    Outputs:
+    - list[str]: column names to select
+
+    Failure Modes:
+    - ValueError: a field is not a mapped column
+    """
+    available = [attribute.key for attribute in inspect(model_class).column_attrs]
+    if not fields:
+        return available
+
+    for field in fields:
+        if field not in available:
+            raise ValueError(f"Invalid field: {field}")
+    columns = ["id", *(column for column in required if column), *fields]
+    return list(dict.fromkeys(columns))
+
+
+def ndjson_lines(rows: Iterable[dict[str, Any]]) -> Iterator[str]:
+    """Yield one JSON document per row, newline terminated."""
+    for row in rows:
+        yield json.dumps(to_jsonable_python(row), separators=(",", ":")) + "\n"
+
+
+def csv_lines(rows: Iterable[dict[str, Any]], columns: Sequence[str]) -> Iterator[str]:
+    """Yield a header line, then one CSV line per row (missing keys left empty)."""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=list(columns), extrasaction="ignore")
+
+    def flush() -> str:
+        line = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate(0)
+        return line
+
+    writer.writeheader()
+    yield flush()
+    for row in rows:
+        values = to_jsonable_python(row)
+        # Nested JSON columns are written as JSON text
+        for key, value in values.items():
+            if isinstance(value, (dict, list)):
+                values[key] = json.dumps(value, separators=(",", ":"))
+        writer.writerow(values)
+        yield flush()
+
+
+def export_lines(
+    rows: Iterable[dict[str, Any]],
+    export_format: str,
+    columns: Sequence[str],
+) -> Iterator[str]:
+    """
+    IDK: streaming-export, format-dispatch
+
+    Responsibility:
+    - Pick the serializer for export_format
+
+    Invariants:
+    - The format is checked before any row is read, so errors surface
+      before a streaming response starts
+
+    Failure Modes:
+    - ValueError: export_format is not "ndjson" or "csv"
+    """
+    if export_format == "ndjson":
+        return ndjson_lines(rows)
+    if export_format == "csv":
+        return csv_lines(rows, columns)
+    raise ValueError(f"Unsupported export format: {export_format}")
@@ -0,0 +1,299 @@
+"""
+IDK: keyset-pagination, cursor-encoding, seek-method
+
+Module: pagination
+
+Responsibility:
+- Encode and decode opaque pagination cursors
+- Build keyset (seek) conditions shared by sync and async repositories
+- Keep cursor pagination independent of table size (no OFFSET, no COUNT)
+
+Key Components:
+- CursorPosition: decoded cursor (direction, sort field, sort value, id)
+- encode_cursor / decode_cursor: opaque URL-safe cursor strings
+- seek_condition: WHERE (sort_key, id) > (value, id) for the requested direction
+- seek_order: ORDER BY (sort_key, id) matching the seek direction
+
+Invariants:
+- A cursor always encodes (sort_key, id); id breaks ties so pages never overlap
+- A cursor is bound to the sort field and order it was issued for
+- "next" cursors point at the last item of a page, "prev" cursors at the first
+- Invalid or mismatched cursors raise ValueError (services map it to HTTP 400)
+
+Usage Examples:
+
+```python
+from src.shared.infrastructure.pagination import decode_cursor, encode_cursor
+
+# Repositories issue cursors for the boundary items of a page
+next_cursor = encode_cursor("next", "created_at", "desc", last.created_at, last.id)
+
+# Clients send them back unchanged
+items, next_cursor, prev_cursor = repository.get_all_by_cursor(
+    page_size=20,
+    cursor=next_cursor,
+    sort_by="created_at",
+    sort_order="desc",
+)
+```
+
+Collaborators:
+- BaseRepository / BaseRepositoryAsync: build keyset queries from CursorPosition
+- BaseService: exposes next_cursor/prev_cursor on PaginatedResponse
+
+Failure Modes:
+- ValueError: malformed cursor, or cursor issued for another sort field/order
+
+Related Docs:
+- docs/shared/infrastructure/pagination.md
+"""
+
+import base64
+import json
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import tuple_
+
+CURSOR_DIRECTIONS = ("next", "prev")
+
+
+@dataclass(frozen=True)
+class CursorPosition:
+    """
+    IDK: cursor, keyset-position, value-object
+
+    Responsibility:
+    - Hold the decoded contents of a pagination cursor
+
+    Invariants:
+    - direction is "next" or "prev"
+    - sort_by is None when paginating by id only
+    """
+
+    direction: str
+    sort_by: str | None
+    sort_order: str
+    sort_value: Any
+    id: Any
+
+
+def _encode_value(value: Any) -> Any:
+    """Tag non-JSON values so they decode back to the same Python type."""
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    if isinstance(value, Decimal):
+        return {"dec": str(value)}
+    if isinstance(value, UUID):
+        return {"uuid": str(value)}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    """Reverse _encode_value."""
+    if isinstance(value, dict) and len(value) == 1:
+        (tag, raw), = value.items()
+        if tag == "dt":
+            return datetime.fromisoformat(raw)
+        if tag == "d":
+            return date.fromisoformat(raw)
+        if tag == "dec":
+            return Decimal(raw)
+        if tag == "uuid":
+            return UUID(raw)
+    return value
+
+
+def encode_cursor(
+    direction: str,
+    sort_by: str | None,
+    sort_order: str,
+    sort_value: Any,
+    entity_id: Any,
+) -> str:
+    """
+    IDK: cursor-encoding, opaque-token
+
+    Responsibility:
+    - Serialize a keyset position into an opaque URL-safe string
+
+    Inputs:
+    - direction: "next" (items after the position) or "prev" (items before)
+    - sort_by: sort field the page was ordered by (None for id only)
+    - sort_order: "asc" or "desc"
+    - sort_value: value of sort_by on the boundary item
+    - entity_id: id of the boundary item (tie-breaker)
+
+    Outputs:
+    - str: base64url cursor without padding
+    """
+    payload = [
+        direction,
+        sort_by,
+        sort_order.lower(),
+        _encode_value(sort_value),
+        _encode_value(entity_id),
+    ]
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> CursorPosition:
+    """
+    IDK: cursor-decoding, input-validation
+
+    Responsibility:
+    - Parse a cursor produced by encode_cursor
+
+    Inputs:
+    - cursor: opaque cursor string from a previous response
+
+    Outputs:
+    - CursorPosition: decoded keyset position
+
+    Failure Modes:
+    - ValueError: cursor is not valid base64/JSON or has an unexpected shape
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        direction, sort_by, sort_order, sort_value, entity_id = payload
+    except (ValueError, TypeError, UnicodeError) as e:
+        raise ValueError("Invalid pagination cursor") from e
+
+    if direction not in CURSOR_DIRECTIONS or sort_order not in ("asc", "desc"):
+        raise ValueError("Invalid pagination cursor")
+
+    try:
+        return CursorPosition(
+            direction=direction,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            sort_value=_decode_value(sort_value),
+            id=_decode_value(entity_id),
+        )
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid pagination cursor") from e
+
+
+def check_cursor(position: CursorPosition, sort_by: str | None, sort_order: str) -> None:
+    """
+    IDK: cursor-validation, sort-consistency
+
+    Responsibility:
+    - Reject cursors issued for a different sort field or order
+
+    Failure Modes:
+    - ValueError: cursor does not match the requested sort
+    """
+    if position.sort_by != sort_by or position.sort_order != sort_order.lower():
+        raise ValueError("Cursor does not match the requested sort order")
+
+
+def seek_condition(
+    sort_column: Any,
+    id_column: Any,
+    position: CursorPosition,
+) -> Any:
+    """
+    IDK: keyset-condition, row-value-comparison
+
+    Responsibility:
+    - Build the WHERE clause that seeks past the cursor position
+
+    Invariants:
+    - Forward on ascending order (or backward on descending) seeks ">",
+      otherwise "<"
+    - Uses a row-value comparison (sort_key, id) > (value, id), which
+      PostgreSQL, MySQL and SQLite (3.15+) can answer from a composite index
+    - Without a sort column, seeks on id alone
+    - sort_column should be NOT NULL: rows with a NULL sort key never
+      satisfy a row-value comparison and are skipped in cursor mode
+
+    Inputs:
+    - sort_column: mapped column being sorted on (None for id only)
+    - id_column: mapped primary key column
+    - position: decoded cursor
+
+    Outputs:
+    - SQLAlchemy boolean expression
+    """
+    forward = position.direction == "next"
+    ascending = position.sort_order == "asc"
+    greater = forward == ascending
+
+    if sort_column is None:
+        return id_column > position.id if greater else id_column < position.id
+
+    # Comparing against a plain tuple binds each value with its column's type
+    key = tuple_(sort_column, id_column)
+    bound = (position.sort_value, position.id)
+    return key > bound if greater else key < bound
+
+
+def seek_order(sort_column: Any, id_column: Any, sort_order: str, direction: str) -> list[Any]:
+    """
+    IDK: keyset-ordering
+
+    Responsibility:
+    - Return ORDER BY clauses for a keyset page
+
+    Invariants:
+    - "prev" pages are fetched in reverse order; callers reverse the rows
+      before returning them so items always follow sort_order
+    """
+    descending = (sort_order.lower() == "desc") != (direction == "prev")
+    columns = [sort_column, id_column] if sort_column is not None else [id_column]
+    return [column.desc() if descending else column.asc() for column in columns]
+
+
+def page_cursors(
+    items: list[Any],
+    sort_by: str | None,
+    sort_order: str,
+    direction: str,
+    has_more: bool,
+    has_cursor: bool,
+) -> tuple[str | None, str | None]:
+    """
+    IDK: cursor-issuing, page-boundaries
+
+    Responsibility:
+    - Issue next/prev cursors for the first and last items of a page
+
+    Invariants:
+    - items are already in sort_order (prev pages reversed by the caller)
+    - Walking forward, a next cursor exists only when more rows were found
+      and a prev cursor only when the page was reached through a cursor
+    - Walking backward, the roles are swapped
+
+    Inputs:
+    - items: page items in display order
+    - sort_by / sort_order: sort the page was fetched with
+    - direction: "next" or "prev" (direction the page was fetched in)
+    - has_more: whether a row beyond the page was found (LIMIT n + 1)
+    - has_cursor: whether the page was requested with a cursor
+
+    Outputs:
+    - tuple[str | None, str | None]: (next_cursor, prev_cursor)
+    """
+    if not items:
+        return None, None
+
+    def cursor_for(direction_: str, item: Any) -> str:
+        value = getattr(item, sort_by) if sort_by else None
+        return encode_cursor(direction_, sort_by, sort_order, value, item.id)
+
+    if direction == "prev":
+        has_next, has_prev = has_cursor, has_more
+    else:
+        has_next, has_prev = has_more, has_cursor
+
+    next_cursor = cursor_for("next", items[-1]) if has_next else None
+    prev_cursor = cursor_for("prev", items[0]) if has_prev else None
+    return next_cursor, prev_cursor
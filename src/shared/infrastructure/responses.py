@@ -116,16 +116,21 @@ class PaginatedResponse(BaseModel, Generic[T]):
 
     Fields:
     - data: list[T] - The paginated items for current page
-    - total: int - Total count of items across all pages (>= 0)
-    - page: int - Current page number (1-indexed, >= 1)
+    - total: int | None - Total count of items across all pages (>= 0)
+    - page: int | None - Current page number (1-indexed, >= 1)
     - page_size: int - Items per page (1-100)
-    - pages: int - Total pages (computed automatically)
+    - pages: int | None - Total pages (computed automatically)
+    - has_more: bool | None - Whether a following page exists (set even without a total)
+    - next_cursor: str | None - Cursor for the following page (keyset pagination)
+    - prev_cursor: str | None - Cursor for the preceding page (keyset pagination)
 
     Pagination Rules:
     - Uses 1-indexed pagination (page 1 is first page)
     - page_size limited to 1-100 to prevent abuse
     - pages calculated as ceil(total / page_size)
     - Empty data for out-of-range pages (page > pages returns [])
+    - Cursor pages leave total/page unset (no COUNT query), so pages is None
+    - Lists with count mode "none" leave total unset and rely on has_more
 
     Edge Cases:
     - total=0 → pages=0, data=[]
@@ -182,16 +187,16 @@ class PaginatedResponse(BaseModel, Generic[T]):
         description="List of items for the current page"
     )
 
-    total: int = Field(
-        ...,
+    total: int | None = Field(
+        None,
         ge=0,
-        description="Total count of items across all pages"
+        description="Total count of items across all pages (None for cursor pages)"
     )
 
-    page: int = Field(
-        ...,
+    page: int | None = Field(
+        None,
         ge=1,
-        description="Current page number (1-indexed)"
+        description="Current page number (1-indexed, None for cursor pages)"
     )
 
     page_size: int = Field(
@@ -201,9 +206,24 @@ class PaginatedResponse(BaseModel, Generic[T]):
         description="Number of items per page (1-100)"
     )
 
+    has_more: bool | None = Field(
+        None,
+        description="Whether a following page exists (works without a total)"
+    )
+
+    next_cursor: str | None = Field(
+        None,
+        description="Opaque cursor for the following page, None on the last page"
+    )
+
+    prev_cursor: str | None = Field(
+        None,
+        description="Opaque cursor for the preceding page, None on the first page"
+    )
+
     @computed_field
     @property
-    def pages(self) -> int:
+    def pages(self) -> int | None:
         """
         Calculate total number of pages.
 
@@ -211,7 +231,10 @@ class PaginatedResponse(BaseModel, Generic[T]):
         This ensures:
         - Empty dataset has 0 pages
         - Partial last page counted (e.g., 11 items with page_size=10 → 2 pages)
+        - Cursor pages without a total have no page count (None)
         """
+        if self.total is None:
+            return None
         if self.total == 0:
             return 0
         return ceil(self.total / self.page_size)
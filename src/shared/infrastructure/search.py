@@ -0,0 +1,354 @@
+"""
+IDK: full-text-search, tsvector, fts5, trigram, keyset-pagination
+
+Module: search
+
+Responsibility:
+- Describe the full-text index of a table (which columns, which language)
+- Emit the per-dialect DDL for that index (create_all listeners and migrations)
+- Run ranked, tenant-filtered searches with keyset (cursor) pagination
+
+Key Components:
+- SearchIndex: searchable columns of one table plus its DDL
+- SearchPage: one page of ranked results and the cursor of the next page
+- ranked_search: execute a search through a Session
+- encode_cursor / decode_cursor: opaque keyset cursors
+
+Invariants:
+- PostgreSQL: a generated tsvector column (search_vector) with a GIN index,
+  plus a pg_trgm GIN index on the same text for typo-tolerant fallback
+- SQLite: an external-content FTS5 table (<table>_fts) kept in sync by
+  AFTER INSERT / UPDATE / DELETE triggers
+- Other dialects fall back to ILIKE filters (no index, rank 0)
+- Results are ordered by rank descending, then id ascending; cursors hold
+  the (rank, id) of the last row, so pages never skip or repeat rows
+- On PostgreSQL, a first page with no full-text hit is retried with trigram
+  similarity; the cursor remembers which mode produced the page
+- SQLite FTS5 rows are keyed by the implicit rowid, which VACUUM may
+  renumber: run rebuild_statements() after a VACUUM
+
+Usage Examples:
+
+```python
+from src.shared.infrastructure.search import SearchIndex, ranked_search
+
+SEARCH_INDEX = SearchIndex("products", ("name", "description"))
+SEARCH_INDEX.attach(ProductModel.__table__)
+
+page = ranked_search(
+    session, ProductModel, SEARCH_INDEX, "red shoes",
+    ProductModel.organization_id == organization_id,
+    limit=20, cursor=None,
+)
+page.items, page.next_cursor
+```
+
+Collaborators:
+- Generated ORM models: attach() adds the index DDL to metadata.create_all()
+- Generated Alembic migrations: create_statements() / drop_statements()
+- Generated repositories: search() delegates to ranked_search()
+
+Failure Modes:
+- ValueError: malformed cursor
+- sqlalchemy.exc.OperationalError: index DDL not applied (run the migration)
+
+Related Docs:
+- docs/shared/infrastructure/search.md
+"""
+
+import base64
+import json
+from dataclasses import dataclass, field
+from typing import Any, Generic, TypeVar
+
+from sqlalchemy import (
+    DDL,
+    ColumnElement,
+    Float,
+    String,
+    and_,
+    bindparam,
+    cast,
+    column,
+    event,
+    func,
+    literal,
+    literal_column,
+    or_,
+    select,
+    table,
+)
+from sqlalchemy.orm import Session
+
+T = TypeVar("T")
+
+FULLTEXT = "fulltext"
+TRIGRAM = "trigram"
+
+# Dialects with a real search index; others use ILIKE
+INDEXED_DIALECTS = ("postgresql", "sqlite")
+
+
+@dataclass
+class SearchPage(Generic[T]):
+    """One page of search results, best match first."""
+
+    items: list[T] = field(default_factory=list)
+    next_cursor: str | None = None
+
+
+@dataclass(frozen=True)
+class SearchIndex:
+    """
+    IDK: search-index, ddl, postgres, sqlite
+
+    Responsibility:
+    - Name the searchable columns of a table
+    - Render CREATE / DROP / rebuild statements per dialect
+
+    Invariants:
+    - Statements are idempotent (IF [NOT] EXISTS), so create_all() and a
+      migration can both run them
+    - Column and table names come from generated code, never from requests
+
+    Inputs:
+    - table: table name
+    - columns: searchable text columns, in ranking order
+    - language: PostgreSQL text search configuration ("simple" does no
+      stemming; use "english" etc. for single-language content)
+    """
+
+    table: str
+    columns: tuple[str, ...]
+    language: str = "simple"
+
+    @property
+    def fts_table(self) -> str:
+        return f"{self.table}_fts"
+
+    @property
+    def regconfig(self) -> str:
+        return f"'{self.language}'::regconfig"
+
+    def document(self) -> str:
+        """SQL text of all searchable columns joined by spaces (NULLs as '')."""
+        return " || ' ' || ".join(f"coalesce({name}, '')" for name in self.columns)
+
+    def create_statements(self, dialect: str) -> list[str]:
+        """
+        IDK: ddl, index-creation
+
+        Responsibility:
+        - Return the statements creating the index on dialect
+
+        Invariants:
+        - SQLite statements end with a rebuild, which backfills rows that
+          existed before the FTS table
+        - Empty for dialects without index support
+        """
+        if dialect == "postgresql":
+            return [
+                "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+                f"ALTER TABLE {self.table} ADD COLUMN IF NOT EXISTS search_vector tsvector "
+                f"GENERATED ALWAYS AS (to_tsvector({self.regconfig}, {self.document()})) STORED",
+                f"CREATE INDEX IF NOT EXISTS ix_{self.table}_search_vector "
+                f"ON {self.table} USING gin (search_vector)",
+                f"CREATE INDEX IF NOT EXISTS ix_{self.table}_search_trgm "
+                f"ON {self.table} USING gin (({self.document()}) gin_trgm_ops)",
+            ]
+        if dialect == "sqlite":
+            names = ", ".join(self.columns)
+            new_values = ", ".join(f"new.{name}" for name in self.columns)
+            old_values = ", ".join(f"old.{name}" for name in self.columns)
+            insert_new = (
+                f"INSERT INTO {self.fts_table}(rowid, {names}) VALUES (new.rowid, {new_values});"
+            )
+            delete_old = (
+                f"INSERT INTO {self.fts_table}({self.fts_table}, rowid, {names}) "
+                f"VALUES ('delete', old.rowid, {old_values});"
+            )
+            return [
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {self.fts_table} USING fts5({names}, "
+                f"content='{self.table}', content_rowid='rowid', "
+                "tokenize='unicode61 remove_diacritics 2')",
+                f"CREATE TRIGGER IF NOT EXISTS {self.table}_fts_insert "
+                f"AFTER INSERT ON {self.table} BEGIN {insert_new} END",
+                f"CREATE TRIGGER IF NOT EXISTS {self.table}_fts_delete "
+                f"AFTER DELETE ON {self.table} BEGIN {delete_old} END",
+                f"CREATE TRIGGER IF NOT EXISTS {self.table}_fts_update "
+                f"AFTER UPDATE OF {names} ON {self.table} BEGIN {delete_old} {insert_new} END",
+                *self.rebuild_statements(dialect),
+            ]
+        return []
+
+    def drop_statements(self, dialect: str) -> list[str]:
+        """Return the statements removing the index from dialect."""
+        if dialect == "postgresql":
+            return [
+                f"DROP INDEX IF EXISTS ix_{self.table}_search_trgm",
+                f"DROP INDEX IF EXISTS ix_{self.table}_search_vector",
+                f"ALTER TABLE {self.table} DROP COLUMN IF EXISTS search_vector",
+            ]
+        if dialect == "sqlite":
+            return [
+                f"DROP TRIGGER IF EXISTS {self.table}_fts_update",
+                f"DROP TRIGGER IF EXISTS {self.table}_fts_delete",
+                f"DROP TRIGGER IF EXISTS {self.table}_fts_insert",
+                f"DROP TABLE IF EXISTS {self.fts_table}",
+            ]
+        return []
+
+    def rebuild_statements(self, dialect: str) -> list[str]:
+        """Return the statements re-indexing every row (SQLite only; no-op elsewhere)."""
+        if dialect == "sqlite":
+            return [f"INSERT INTO {self.fts_table}({self.fts_table}) VALUES ('rebuild')"]
+        return []
+
+    def attach(self, sa_table: Any) -> None:
+        """
+        IDK: ddl-events, create-all
+
+        Responsibility:
+        - Create the index right after metadata.create_all() creates sa_table
+        - Drop it right before metadata.drop_all() drops sa_table
+        """
+        for dialect in INDEXED_DIALECTS:
+            for statement in self.create_statements(dialect):
+                event.listen(sa_table, "after_create", DDL(statement).execute_if(dialect=dialect))
+            # The FTS table is separate on SQLite; PostgreSQL objects go with the table
+            if dialect == "sqlite":
+                for statement in self.drop_statements(dialect):
+                    event.listen(
+                        sa_table, "before_drop", DDL(statement).execute_if(dialect=dialect)
+                    )
+
+
+def encode_cursor(mode: str, rank: float, entity_id: Any) -> str:
+    """Pack the keyset position of the last row of a page into an opaque string."""
+    raw = json.dumps([mode, rank, str(entity_id)], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[str, float, str]:
+    """
+    IDK: cursor-decoding, input-validation
+
+    Responsibility:
+    - Unpack a cursor produced by encode_cursor
+
+    Failure Modes:
+    - ValueError: cursor was not produced by encode_cursor
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        mode, rank, entity_id = json.loads(base64.urlsafe_b64decode(padded))
+        if mode not in (FULLTEXT, TRIGRAM):
+            raise ValueError(mode)
+        return mode, float(rank), str(entity_id)
+    except (ValueError, TypeError) as exc:
+        raise ValueError("Invalid search cursor") from exc
+
+
+def fts5_query(query: str) -> str:
+    """Quote every term so user input is never parsed as FTS5 syntax (terms are ANDed)."""
+    return " ".join('"' + term.replace('"', '""') + '"' for term in query.split())
+
+
+def _rank_and_match(
+    model: type, index: SearchIndex, query: str, dialect: str, mode: str
+) -> tuple[ColumnElement, ColumnElement]:
+    """Return (rank expression, match condition) for dialect and mode."""
+    term = bindparam("search_query", query, type_=String)
+    if dialect == "postgresql" and mode == TRIGRAM:
+        # Same expression text as the trigram index, so the planner can use it
+        document = literal_column(f"({index.document()})")
+        # Casting to double keeps the rank exact across the cursor round trip
+        return cast(func.similarity(document, term), Float(53)), document.op("%")(term)
+    if dialect == "postgresql":
+        vector = literal_column(f"{index.table}.search_vector")
+        tsquery = func.websearch_to_tsquery(literal_column(index.regconfig), term)
+        return cast(func.ts_rank(vector, tsquery), Float(53)), vector.op("@@")(tsquery)
+    if dialect == "sqlite":
+        fts = literal_column(index.fts_table)
+        # bm25() is lower for better matches; negate so higher is better everywhere
+        return -func.bm25(fts), fts.op("MATCH")(fts5_query(query))
+    match = or_(*(getattr(model, name).ilike(f"%{query}%") for name in index.columns))
+    return literal(0.0, Float), match
+
+
+def _fetch(
+    session: Session,
+    model: type,
+    index: SearchIndex,
+    query: str,
+    criteria: tuple[ColumnElement, ...],
+    limit: int,
+    position: tuple[str, float, str] | None,
+    dialect: str,
+    mode: str,
+) -> SearchPage:
+    rank, match = _rank_and_match(model, index, query, dialect, mode)
+    stmt = select(model, rank.label("search_rank")).where(match, *criteria)
+    if dialect == "sqlite":
+        fts = table(index.fts_table, column("rowid"))
+        stmt = stmt.join(fts, fts.c.rowid == literal_column(f"{index.table}.rowid"))
+    if position is not None:
+        _, last_rank, last_id = position
+        stmt = stmt.where(or_(rank < last_rank, and_(rank == last_rank, model.id > last_id)))
+    stmt = stmt.order_by(rank.desc(), model.id.asc()).limit(limit + 1)
+
+    rows = session.execute(stmt).all()
+    page = SearchPage(items=[row[0] for row in rows[:limit]])
+    if len(rows) > limit:
+        last_item, last_rank = rows[limit - 1]
+        page.next_cursor = encode_cursor(mode, last_rank, last_item.id)
+    return page
+
+
+def ranked_search(
+    session: Session,
+    model: type,
+    index: SearchIndex,
+    query: str,
+    *criteria: ColumnElement,
+    limit: int = 20,
+    cursor: str | None = None,
+) -> SearchPage:
+    """
+    IDK: ranked-search, keyset-pagination, tenant-filter
+
+    Responsibility:
+    - Return the page of model rows best matching query
+
+    Invariants:
+    - criteria (e.g. organization_id == ...) are applied in the same
+      statement as the match, so the index scan stays tenant-filtered
+    - Blank queries return an empty page without touching the database
+    - Executes one statement per page (two for an empty first page on
+      PostgreSQL: full-text, then trigram)
+
+    Inputs:
+    - session: sync Session
+    - model: ORM model class with an id column
+    - index: SearchIndex of model's table
+    - query: user search text (plain words; no query syntax required)
+    - criteria: extra WHERE conditions
+    - limit: page size
+    - cursor: next_cursor of the previous page, None for the first page
+
+    Outputs:
+    - SearchPage: ORM instances, best match first, and the next cursor
+
+    Failure Modes:
+    - ValueError: invalid cursor
+    """
+    if not query.split():
+        return SearchPage()
+    position = decode_cursor(cursor) if cursor else None
+    dialect = session.get_bind().dialect.name
+    mode = position[0] if position else FULLTEXT
+
+    page = _fetch(session, model, index, query, criteria, limit, position, dialect, mode)
+    if not page.items and position is None and dialect == "postgresql":
+        page = _fetch(session, model, index, query, criteria, limit, None, dialect, TRIGRAM)
+    return page
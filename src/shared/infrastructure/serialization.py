@@ -0,0 +1,129 @@
+"""
+IDK: fast-serialization, batch-validation, json-response, orjson
+
+Module: serialization
+
+Responsibility:
+- Validate lists of entities into response DTOs in one pydantic call
+- Encode response bodies with orjson when installed, pydantic-core otherwise
+- Let routes return already-validated data without FastAPI validating it again
+
+Key Components:
+- list_adapter: cached TypeAdapter(list[Schema]) per response schema
+- validate_many: entities / ORM rows -> list of response DTOs
+- dump_json: any response content -> JSON bytes
+- FastJSONResponse: JSONResponse that renders with dump_json
+
+Invariants:
+- One TypeAdapter is built per schema and reused for the process lifetime
+- Items that already are instances of the schema are not re-validated
+- dump_json produces the same JSON as FastAPI's encoder for pydantic
+  models, datetimes, dates, UUIDs and Decimals (Decimal as a string)
+- Returning a Response from a route skips FastAPI's response_model
+  validation; response_model is still used for the OpenAPI schema, so the
+  returned content must already match it
+
+Usage Examples:
+
+```python
+from src.shared.infrastructure.serialization import FastJSONResponse, validate_many
+
+items = validate_many(ProductResponse, repository.get_all())
+
+@router.get("/", response_model=PaginatedResponse[ProductResponse])
+async def list_products(service: ProductService = Depends(get_service)):
+    return FastJSONResponse(service.get_all(page=1, page_size=20))
+```
+
+Collaborators:
+- BaseService: builds response DTOs with validate_many
+- Generated routes: return FastJSONResponse from list and bulk endpoints
+- orjson (optional): faster encoder, used automatically when importable
+
+Failure Modes:
+- pydantic.ValidationError: an item does not match the response schema
+- TypeError: content holds a value neither encoder can serialize
+
+Related Docs:
+- docs/shared/infrastructure/serialization.md
+"""
+
+from collections.abc import Iterable
+from functools import lru_cache
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import to_json, to_jsonable_python
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; pydantic-core is always installed
+    orjson = None
+
+
+@lru_cache(maxsize=None)
+def list_adapter(schema: type[BaseModel]) -> TypeAdapter:
+    """Return the cached TypeAdapter validating list[schema]."""
+    return TypeAdapter(list[schema])
+
+
+def validate_many(schema: type[BaseModel], items: Iterable[Any]) -> list[Any]:
+    """
+    IDK: batch-validation, from-attributes
+
+    Responsibility:
+    - Validate every item into schema with a single TypeAdapter call
+
+    Invariants:
+    - Reads attributes of ORM models / domain entities (from_attributes)
+    - Same result as [schema.model_validate(item) for item in items],
+      without a Python-level call per item
+
+    Inputs:
+    - schema: pydantic response model
+    - items: entities, ORM rows, dicts or schema instances
+
+    Outputs:
+    - list[schema]: validated DTOs in input order
+
+    Failure Modes:
+    - pydantic.ValidationError: an item does not match schema
+    """
+    if not isinstance(items, list):
+        items = list(items)
+    return list_adapter(schema).validate_python(items, from_attributes=True)
+
+
+def dump_json(content: Any) -> bytes:
+    """
+    IDK: json-encoding, orjson, fallback
+
+    Responsibility:
+    - Encode content (models, dicts, lists, scalars) as compact JSON bytes
+
+    Invariants:
+    - orjson handles native types; pydantic models, Decimals and other
+      non-native values go through pydantic's JSON rules
+    - Without orjson, pydantic-core's Rust encoder is used
+    """
+    if orjson is not None:
+        return orjson.dumps(content, default=to_jsonable_python)
+    return to_json(content)
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    IDK: json-response, response-class
+
+    Responsibility:
+    - Render response bodies with dump_json instead of json.dumps
+
+    Invariants:
+    - Content is serialized as given; FastAPI does not validate or
+      re-encode it when a route returns this response directly
+    - Usable as default_response_class / response_class as well
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dump_json(content)
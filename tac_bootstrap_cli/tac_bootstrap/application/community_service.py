@@ -3,7 +3,9 @@ IDK: community-service, plugin-registry, template-sharing, achievements, showcas
 Responsibility: Manages community plugin/template sharing, user profiles, achievements,
                 and community browsing
 Invariants: Community data stored locally in ~/.tac-bootstrap/community/, supports offline
-            browsing with built-in templates, achievement badges are earned automatically
+            browsing with built-in templates, achievement badges are earned automatically,
+            items and the profile live in a SQLite database updated row by row, browsing
+            queries a persisted search index that catches up with the database revision
 
 Example usage:
     from tac_bootstrap.application.community_service import CommunityService
@@ -15,12 +17,16 @@ Example usage:
 """
 
 import json
+import sqlite3
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
+from tac_bootstrap.infrastructure.registry_db import RegistryDatabase, revision_triggers
+from tac_bootstrap.infrastructure.search_index import IndexDocument, SearchIndex
+
 
 class CommunityItem(BaseModel):
     """A community-shared item (plugin or template)."""
@@ -233,12 +239,119 @@ BUILT_IN_TEMPLATES: List[CommunityItem] = [
 ]
 
 
+
+INDEX_FIELD_WEIGHTS = {"name": 3.0, "tags": 2.0, "description": 1.0}
+
+COMMUNITY_SCHEMA = [
+    """
+    CREATE TABLE items (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        item_type TEXT NOT NULL,
+        description TEXT NOT NULL DEFAULT '',
+        author TEXT NOT NULL DEFAULT 'anonymous',
+        category TEXT NOT NULL DEFAULT 'general',
+        tags TEXT NOT NULL DEFAULT '[]',
+        version TEXT NOT NULL DEFAULT '1.1.0',
+        created_at TEXT NOT NULL DEFAULT '',
+        downloads INTEGER NOT NULL DEFAULT 0,
+        rating REAL NOT NULL DEFAULT 0,
+        source_path TEXT,
+        rev INTEGER NOT NULL DEFAULT 0
+    );
+    CREATE INDEX idx_items_type_category ON items(item_type, category);
+    CREATE INDEX idx_items_rating ON items(rating);
+    CREATE INDEX idx_items_rev ON items(rev);
+    CREATE TABLE profile (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        username TEXT NOT NULL DEFAULT 'anonymous',
+        email TEXT,
+        projects_created INTEGER NOT NULL DEFAULT 0,
+        plugins_shared INTEGER NOT NULL DEFAULT 0,
+        templates_published INTEGER NOT NULL DEFAULT 0,
+        total_points INTEGER NOT NULL DEFAULT 0,
+        member_since TEXT NOT NULL DEFAULT ''
+    );
+    CREATE TABLE achievements (
+        id TEXT PRIMARY KEY,
+        name TEXT NOT NULL,
+        description TEXT NOT NULL DEFAULT '',
+        icon TEXT NOT NULL DEFAULT '*',
+        category TEXT NOT NULL DEFAULT 'general',
+        points INTEGER NOT NULL DEFAULT 10,
+        earned INTEGER NOT NULL DEFAULT 0,
+        earned_at TEXT
+    );
+    """
+    + revision_triggers("items", "id"),
+]
+
+_ITEM_COLUMNS = (
+    "name",
+    "item_type",
+    "description",
+    "author",
+    "category",
+    "tags",
+    "version",
+    "created_at",
+    "downloads",
+    "rating",
+    "source_path",
+)
+_INSERT_ITEM = (
+    f"INSERT INTO items ({', '.join(_ITEM_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * len(_ITEM_COLUMNS))})"
+)
+_PROFILE_COLUMNS = (
+    "username",
+    "email",
+    "projects_created",
+    "plugins_shared",
+    "templates_published",
+    "total_points",
+    "member_since",
+)
+_ACHIEVEMENT_COLUMNS = (
+    "id",
+    "name",
+    "description",
+    "icon",
+    "category",
+    "points",
+    "earned",
+    "earned_at",
+)
+_UPSERT_ACHIEVEMENT = (
+    f"INSERT INTO achievements ({', '.join(_ACHIEVEMENT_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * len(_ACHIEVEMENT_COLUMNS))}) "
+    "ON CONFLICT(id) DO UPDATE SET earned = 1, earned_at = excluded.earned_at "
+    "WHERE achievements.earned = 0"
+)
+
+# SQLite limits bound parameters per statement; fetch id lists in chunks
+_CHUNK = 500
+
+
+def _index_document(item: CommunityItem) -> IndexDocument:
+    """Searchable text and filter facets of a community item."""
+    return IndexDocument(
+        fields={"name": item.name, "description": item.description, "tags": item.tags},
+        facets={
+            "item_type": [item.item_type],
+            "category": [item.category],
+            "tags": item.tags,
+            "topic": [item.category, *item.tags],
+        },
+    )
+
+
 class CommunityService:
     """
     IDK: community-core, plugin-registry, template-browser, achievement-tracker
     Responsibility: Manages community content, user achievements, and content browsing
     Invariants: Local-first storage, built-in templates always available, achievements are
-                tracked per-user in ~/.tac-bootstrap/community/
+                tracked per-user in ~/.tac-bootstrap/community/, reads never create files
     """
 
     def __init__(self, base_dir: Optional[Path] = None) -> None:
@@ -251,43 +364,154 @@ class CommunityService:
         self._base_dir = base_dir or (Path.home() / ".tac-bootstrap" / "community")
         self._items_file = self._base_dir / "items.json"
         self._profile_file = self._base_dir / "profile.json"
+        self._index_file = self._base_dir / "search-index.json"
+        self._index: Optional[SearchIndex] = None
+        self._db = RegistryDatabase(self._base_dir / "community.db", COMMUNITY_SCHEMA)
+        self._legacy_checked = False
+
+    def _import_legacy(self) -> None:
+        """Import items.json and profile.json written by earlier versions, once."""
+        if not self._legacy_checked:
+            self._legacy_checked = True
+            if self._items_file.is_file() or self._profile_file.is_file():
+                self._db.import_legacy_json(self._items_file, _import_items)
+                self._db.import_legacy_json(self._profile_file, _import_profile)
+
+    def _readable(self) -> Optional[RegistryDatabase]:
+        """Return the database if it exists; browsing a fresh install writes nothing."""
+        self._import_legacy()
+        return self._db if self._db.exists() else None
+
+    def _writable(self) -> RegistryDatabase:
+        """Return the database, creating it on first use."""
+        self._import_legacy()
+        return self._db
+
+    def _fetch_items(self, item_ids: List[int]) -> Dict[int, CommunityItem]:
+        """Load the custom items for item_ids keyed by id."""
+        db = self._readable()
+        items: Dict[int, CommunityItem] = {}
+        if db is None:
+            return items
+        for start in range(0, len(item_ids), _CHUNK):
+            chunk = item_ids[start : start + _CHUNK]
+            placeholders = ", ".join("?" * len(chunk))
+            for row in db.query(f"SELECT * FROM items WHERE id IN ({placeholders})", chunk):
+                items[row["id"]] = _hydrate_item(row)
+        return items
 
-    def _load_items(self) -> List[CommunityItem]:
-        """Load community items from local storage + built-in templates."""
-        items = list(BUILT_IN_TEMPLATES)
+    def _search_index(self) -> SearchIndex:
+        """Return the search index, caught up with the built-ins and the database.
 
-        if self._items_file.exists():
-            try:
-                data = json.loads(self._items_file.read_text())
-                for item_data in data:
-                    items.append(CommunityItem(**item_data))
-            except (json.JSONDecodeError, Exception):
-                pass
+        Built-ins are keyed "builtin:<position>" and re-added (a no-op unless they
+        changed); shared items are keyed "item:<id>" and only rows stamped with a
+        revision newer than the index are re-indexed.
+        """
+        if self._index is None:
+            self._index = SearchIndex(self._index_file, INDEX_FIELD_WEIGHTS)
+        index = self._index
+        builtins = {
+            f"builtin:{position}": _index_document(item)
+            for position, item in enumerate(BUILT_IN_TEMPLATES)
+        }
+        db = self._readable()
+        revision = db.revision() if db is not None else 0
+
+        if index.revision is None or index.revision > revision:
+            rows = db.query("SELECT * FROM items") if db is not None else []
+            documents = dict(builtins)
+            for row in rows:
+                documents[f"item:{row['id']}"] = _index_document(_hydrate_item(row))
+            index.sync(documents)
+        else:
+            for doc_id, document in builtins.items():
+                index.add(doc_id, document)
+            if db is not None and index.revision != revision:
+                for row in db.query("SELECT * FROM items WHERE rev > ?", (index.revision,)):
+                    index.add(f"item:{row['id']}", _index_document(_hydrate_item(row)))
+                existing = {f"item:{row[0]}" for row in db.query("SELECT id FROM items")}
+                for doc_id in index.doc_ids() - existing - builtins.keys():
+                    index.remove(doc_id)
+        index.revision = revision
+        if self._base_dir.exists():
+            index.save()
+        return index
+
+    def _search_items(
+        self,
+        item_type: str,
+        category: Optional[str],
+        query: Optional[str],
+        limit: int,
+        category_in_tags: bool,
+    ) -> List[CommunityItem]:
+        """Query the search index for items of one type.
 
-        return items
+        Every query word must match the name, description or tags. Results are ranked
+        by relevance, then by rating and downloads.
 
-    def _save_items(self, custom_items: List[CommunityItem]) -> None:
-        """Save custom community items to local storage."""
-        self._items_file.parent.mkdir(parents=True, exist_ok=True)
-        data = [item.model_dump() for item in custom_items]
-        self._items_file.write_text(json.dumps(data, indent=2))
+        Args:
+            item_type: "template" or "plugin"
+            category: Filter by category
+            query: Search query
+            limit: Maximum results
+            category_in_tags: Also accept items with a tag containing the category
+
+        Returns:
+            List of matching CommunityItem objects
+        """
+        index = self._search_index()
+
+        filters = {"item_type": [item_type]}
+        if category:
+            category_lower = category.lower()
+            if category_in_tags:
+                filters["topic"] = [category_lower] + [
+                    tag for tag in index.facet_values("tags") if category_lower in tag
+                ]
+            else:
+                filters["category"] = [category_lower]
+
+        hits = index.search(query or "", filters, match_all=True)
+        custom = self._fetch_items(
+            [int(doc_id[5:]) for doc_id, _ in hits if doc_id.startswith("item:")]
+        )
+        ranked = []
+        for doc_id, score in hits:
+            kind, _, key = doc_id.partition(":")
+            item = BUILT_IN_TEMPLATES[int(key)] if kind == "builtin" else custom.get(int(key))
+            if item is not None:
+                ranked.append((score, item))
+        ranked.sort(key=lambda hit: (hit[0], hit[1].rating, hit[1].downloads), reverse=True)
+        return [item for _, item in ranked[:limit]]
 
     def _load_profile(self) -> UserProfile:
         """Load user profile from local storage."""
-        if self._profile_file.exists():
-            try:
-                data = json.loads(self._profile_file.read_text())
-                return UserProfile(**data)
-            except (json.JSONDecodeError, Exception):
-                pass
+        db = self._readable()
+        row = db.query_one("SELECT * FROM profile WHERE id = 1") if db is not None else None
+        if db is None or row is None:
+            return UserProfile(
+                member_since=datetime.now(timezone.utc).isoformat(),
+            )
+        achievements = [
+            Achievement(
+                **{column: achievement[column] for column in _ACHIEVEMENT_COLUMNS[:-2]},
+                earned=bool(achievement["earned"]),
+                earned_at=achievement["earned_at"],
+            )
+            for achievement in db.query("SELECT * FROM achievements ORDER BY rowid")
+        ]
         return UserProfile(
-            member_since=datetime.now(timezone.utc).isoformat(),
+            **{column: row[column] for column in _PROFILE_COLUMNS},
+            achievements=achievements,
         )
 
-    def _save_profile(self, profile: UserProfile) -> None:
-        """Save user profile to local storage."""
-        self._profile_file.parent.mkdir(parents=True, exist_ok=True)
-        self._profile_file.write_text(profile.model_dump_json(indent=2))
+    def _share(self, item: CommunityItem, counter: str) -> None:
+        """Store a shared item and bump a profile counter in one transaction."""
+        with self._writable().transaction() as connection:
+            connection.execute(_INSERT_ITEM, _item_values(item))
+            _ensure_profile(connection)
+            connection.execute(f"UPDATE profile SET {counter} = {counter} + 1 WHERE id = 1")
 
     def share_plugin(
         self,
@@ -325,23 +549,7 @@ class CommunityService:
             created_at=datetime.now(timezone.utc).isoformat(),
         )
 
-        # Load existing custom items
-        existing = []
-        if self._items_file.exists():
-            try:
-                data = json.loads(self._items_file.read_text())
-                existing = [CommunityItem(**d) for d in data]
-            except Exception:
-                pass
-
-        existing.append(item)
-        self._save_items(existing)
-
-        # Update profile
-        profile = self._load_profile()
-        profile.plugins_shared += 1
-        self._save_profile(profile)
-
+        self._share(item, "plugins_shared")
         return item
 
     def publish_template(
@@ -380,23 +588,8 @@ class CommunityService:
             created_at=datetime.now(timezone.utc).isoformat(),
         )
 
-        existing = []
-        if self._items_file.exists():
-            try:
-                data = json.loads(self._items_file.read_text())
-                existing = [CommunityItem(**d) for d in data]
-            except Exception:
-                pass
-
-        existing.append(item)
-        self._save_items(existing)
-
-        profile = self._load_profile()
-        profile.templates_published += 1
-        self._save_profile(profile)
-
+        self._share(item, "templates_published")
         return item
-
     def browse_templates(
         self,
         category: Optional[str] = None,
@@ -413,31 +606,7 @@ class CommunityService:
         Returns:
             List of matching CommunityItem objects
         """
-        items = self._load_items()
-        results = [i for i in items if i.item_type == "template"]
-
-        if category:
-            category_lower = category.lower()
-            results = [
-                i
-                for i in results
-                if i.category.lower() == category_lower
-                or any(category_lower in t.lower() for t in i.tags)
-            ]
-
-        if query:
-            query_lower = query.lower()
-            results = [
-                i
-                for i in results
-                if query_lower in i.name.lower()
-                or query_lower in i.description.lower()
-                or any(query_lower in t.lower() for t in i.tags)
-            ]
-
-        # Sort by rating/downloads
-        results.sort(key=lambda i: (i.rating, i.downloads), reverse=True)
-        return results[:limit]
+        return self._search_items("template", category, query, limit, category_in_tags=True)
 
     def browse_plugins(
         self,
@@ -455,22 +624,7 @@ class CommunityService:
         Returns:
             List of matching plugin CommunityItem objects
         """
-        items = self._load_items()
-        results = [i for i in items if i.item_type == "plugin"]
-
-        if category:
-            results = [i for i in results if i.category.lower() == category.lower()]
-
-        if query:
-            query_lower = query.lower()
-            results = [
-                i
-                for i in results
-                if query_lower in i.name.lower() or query_lower in i.description.lower()
-            ]
-
-        results.sort(key=lambda i: (i.rating, i.downloads), reverse=True)
-        return results[:limit]
+        return self._search_items("plugin", category, query, limit, category_in_tags=False)
 
     def get_awards(self) -> List[Achievement]:
         """Get all achievements with earned status.
@@ -523,11 +677,6 @@ class CommunityService:
         if ach_data is None:
             return None
 
-        profile = self._load_profile()
-        for existing in profile.achievements:
-            if existing.id == achievement_id and existing.earned:
-                return None  # Already earned
-
         achievement = Achievement(
             id=ach_data["id"],
             name=ach_data["name"],
@@ -539,9 +688,17 @@ class CommunityService:
             earned_at=datetime.now(timezone.utc).isoformat(),
         )
 
-        profile.achievements.append(achievement)
-        profile.total_points += ach_data["points"]
-        self._save_profile(profile)
+        with self._writable().transaction() as connection:
+            _ensure_profile(connection)
+            earned = connection.execute(
+                _UPSERT_ACHIEVEMENT, _achievement_values(achievement)
+            ).rowcount
+            if not earned:
+                return None  # Already earned
+            connection.execute(
+                "UPDATE profile SET total_points = total_points + ? WHERE id = 1",
+                (achievement.points,),
+            )
 
         return achievement
 
@@ -559,21 +716,97 @@ class CommunityService:
         Returns:
             CommunityStats with aggregate data
         """
-        items = self._load_items()
-
         categories: Dict[str, int] = {}
-        for item in items:
+        type_counts: Dict[str, int] = {}
+        for item in BUILT_IN_TEMPLATES:
             categories[item.category] = categories.get(item.category, 0) + 1
+            type_counts[item.item_type] = type_counts.get(item.item_type, 0) + 1
+        top_items = list(BUILT_IN_TEMPLATES)
+
+        db = self._readable()
+        if db is not None:
+            for category, count in db.query(
+                "SELECT category, COUNT(*) FROM items GROUP BY category ORDER BY MIN(id)"
+            ):
+                categories[category] = categories.get(category, 0) + count
+            for item_type, count in db.query(
+                "SELECT item_type, COUNT(*) FROM items GROUP BY item_type"
+            ):
+                type_counts[item_type] = type_counts.get(item_type, 0) + count
+            top_items += [
+                _hydrate_item(row)
+                for row in db.query("SELECT * FROM items ORDER BY rating DESC, id LIMIT 5")
+            ]
 
-        plugins = [i for i in items if i.item_type == "plugin"]
-        templates = [i for i in items if i.item_type == "template"]
-
-        top_items = sorted(items, key=lambda i: i.rating, reverse=True)[:5]
+        top_items = sorted(top_items, key=lambda i: i.rating, reverse=True)[:5]
 
         return CommunityStats(
-            total_plugins=len(plugins),
-            total_templates=len(templates),
+            total_plugins=type_counts.get("plugin", 0),
+            total_templates=type_counts.get("template", 0),
             total_users=1,
             categories=categories,
             top_items=top_items,
         )
+
+
+def _item_values(item: CommunityItem) -> List[Any]:
+    """Column values of an item, in _ITEM_COLUMNS order."""
+    data = item.model_dump()
+    data["tags"] = json.dumps(item.tags)
+    return [data[column] for column in _ITEM_COLUMNS]
+
+
+def _hydrate_item(row: sqlite3.Row) -> CommunityItem:
+    """Build the model for one items row."""
+    data = {column: row[column] for column in _ITEM_COLUMNS}
+    data["tags"] = json.loads(data["tags"])
+    return CommunityItem.model_validate(data)
+
+
+def _achievement_values(achievement: Achievement) -> List[Any]:
+    """Column values of an achievement, in _ACHIEVEMENT_COLUMNS order."""
+    data = achievement.model_dump()
+    data["earned"] = int(achievement.earned)
+    return [data[column] for column in _ACHIEVEMENT_COLUMNS]
+
+
+def _ensure_profile(connection: sqlite3.Connection) -> None:
+    """Create the profile row on first write."""
+    connection.execute(
+        "INSERT OR IGNORE INTO profile (id, member_since) VALUES (1, ?)",
+        (datetime.now(timezone.utc).isoformat(),),
+    )
+
+
+def _import_items(connection: sqlite3.Connection, data: Any) -> None:
+    """Insert the items of a legacy items.json in order, skipping invalid entries."""
+    if not isinstance(data, list):
+        return
+    for item_data in data:
+        try:
+            item = CommunityItem(**item_data)
+        except Exception:
+            continue
+        connection.execute(_INSERT_ITEM, _item_values(item))
+
+
+def _import_profile(connection: sqlite3.Connection, data: Any) -> None:
+    """Insert the profile and achievements of a legacy profile.json."""
+    try:
+        profile = UserProfile(**data)
+    except Exception:
+        return
+    values = profile.model_dump(include=set(_PROFILE_COLUMNS))
+    columns = ", ".join(_PROFILE_COLUMNS)
+    connection.execute(
+        f"INSERT OR REPLACE INTO profile (id, {columns}) "
+        f"VALUES (1, {', '.join('?' * len(_PROFILE_COLUMNS))})",
+        [values[column] for column in _PROFILE_COLUMNS],
+    )
+    for achievement in profile.achievements:
+        connection.execute(
+            "INSERT OR REPLACE INTO achievements "
+            f"({', '.join(_ACHIEVEMENT_COLUMNS)}) "
+            f"VALUES ({', '.join('?' * len(_ACHIEVEMENT_COLUMNS))})",
+            _achievement_values(achievement),
+        )
@@ -1,14 +1,18 @@
 """
-IDK: detect-service, auto-detection, tech-stack, language-detection, framework-detection
-Responsibility: Auto-detects project technology stack from existing files
-Invariants: Detection is read-only, never modifies files, returns confidence scores
+IDK: detect-service, auto-detection, tech-stack, language-detection, framework-detection, monorepo
+Responsibility: Auto-detects project technology stack from existing files, per workspace package
+Invariants: Detection is read-only, never modifies files, returns confidence scores,
+            the tree is listed once and each manifest is parsed at most once per detection
 """
 
 import json
+import os
 import sys
-from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from threading import Lock
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 
 from tac_bootstrap.domain.models import Framework, Language, PackageManager
 
@@ -22,12 +26,93 @@ else:
         tomllib = None  # type: ignore[assignment,unused-ignore]
 
 
+# Directories never descended into: vendored dependencies, virtualenvs and build output.
+# Hidden directories (.git, .venv, .next, ...) are pruned as well.
+PRUNED_DIRS = frozenset(
+    {
+        "node_modules",
+        "bower_components",
+        "vendor",
+        "third_party",
+        "venv",
+        "site-packages",
+        "__pycache__",
+        "dist",
+        "build",
+        "target",
+        "coverage",
+        "htmlcov",
+    }
+)
+
+PYTHON_MARKERS = (
+    "pyproject.toml",
+    "setup.py",
+    "requirements.txt",
+    "Pipfile",
+    "poetry.lock",
+    "uv.lock",
+)
+JAVA_MARKERS = ("pom.xml", "build.gradle", "build.gradle.kts")
+
+# Manifests that make a nested directory a workspace package
+PACKAGE_MARKERS = frozenset(
+    {
+        "pyproject.toml",
+        "setup.py",
+        "requirements.txt",
+        "Pipfile",
+        "package.json",
+        "go.mod",
+        "Cargo.toml",
+        *JAVA_MARKERS,
+    }
+)
+
+# Manifests that name the stack unambiguously; the rest are weaker hints
+STRONG_MANIFESTS = frozenset(
+    {"pyproject.toml", "package.json", "go.mod", "Cargo.toml", *JAVA_MARKERS}
+)
+
+# Lock files per language, checked in the package directory and then its ancestors
+LOCK_FILES: Dict[Language, Tuple[Tuple[str, PackageManager], ...]] = {
+    Language.PYTHON: (
+        ("uv.lock", PackageManager.UV),
+        (".python-version", PackageManager.UV),
+        ("poetry.lock", PackageManager.POETRY),
+        ("Pipfile.lock", PackageManager.PIPENV),
+    ),
+    Language.TYPESCRIPT: (
+        ("pnpm-lock.yaml", PackageManager.PNPM),
+        ("yarn.lock", PackageManager.YARN),
+        ("bun.lockb", PackageManager.BUN),
+        ("package-lock.json", PackageManager.NPM),
+    ),
+    Language.GO: (("go.sum", PackageManager.GO_MOD),),
+    Language.RUST: (("Cargo.lock", PackageManager.CARGO),),
+}
+LOCK_FILES[Language.JAVASCRIPT] = LOCK_FILES[Language.TYPESCRIPT]
+
+# Confidence contributions, summed and clamped to [0, 1]
+CONFIDENCE_WEIGHTS = {
+    "strong_manifest": 0.5,
+    "weak_marker": 0.35,
+    "no_marker": 0.1,
+    "lock_file": 0.2,
+    "framework": 0.15,
+    "layout": 0.1,
+    "unparseable": -0.2,
+    "ambiguous": -0.15,
+}
+
+
 @dataclass
 class DetectedProject:
     """
-    IDK: detection-result, confidence-scoring, tech-metadata
+    IDK: detection-result, confidence-scoring, tech-metadata, workspace-packages
     Responsibility: Contains detected technology stack with confidence score
-    Invariants: Confidence is between 0-1, language is always set, framework may be None
+    Invariants: Confidence is between 0-1, language is always set, framework may be None,
+                only the repository-level result carries packages
     """
 
     language: Language
@@ -36,30 +121,225 @@ class DetectedProject:
     app_root: Optional[str] = None
     commands: Dict[str, str] = field(default_factory=dict)
     confidence: float = 0.0
+    path: str = "."
+    name: Optional[str] = None
+    evidence: List[str] = field(default_factory=list)
+    packages: List["DetectedProject"] = field(default_factory=list)
+
+    @property
+    def is_monorepo(self) -> bool:
+        """True when more than one package was found in the repository."""
+        return len(self.packages) > 1
+
+
+@dataclass
+class _Listing:
+    """Names of the files and subdirectories of one scanned directory."""
+
+    files: Set[str] = field(default_factory=set)
+    dirs: Set[str] = field(default_factory=set)
+
+
+class _ManifestCache:
+    """
+    IDK: manifest-cache, parse-once, thread-safe
+    Responsibility: Reads and parses each manifest file at most once per detection run
+    Invariants: Unreadable or invalid manifests are cached as None
+    """
+
+    def __init__(self, repo_path: Path):
+        self.repo_path = repo_path
+        self._parsed: Dict[str, Any] = {}
+        self._lock = Lock()
+
+    def get(self, rel_path: str) -> Any:
+        """Return the parsed manifest: dict for JSON/TOML, names for requirements, else text."""
+        with self._lock:
+            if rel_path in self._parsed:
+                return self._parsed[rel_path]
+        value = self._parse(rel_path)
+        with self._lock:
+            return self._parsed.setdefault(rel_path, value)
+
+    def _parse(self, rel_path: str) -> Any:
+        try:
+            raw = (self.repo_path / rel_path).read_bytes()
+        except OSError:
+            return None
+
+        name = rel_path.rsplit("/", 1)[-1]
+        try:
+            if name == "package.json":
+                data = json.loads(raw)
+                return data if isinstance(data, dict) else None
+            if name == "pyproject.toml":
+                return tomllib.loads(raw.decode("utf-8")) if tomllib is not None else None
+            text = raw.decode("utf-8", errors="replace")
+        except Exception:
+            return None
+
+        if name == "requirements.txt":
+            return [
+                _requirement_name(line)
+                for line in text.splitlines()
+                if line.strip() and not line.strip().startswith(("#", "-"))
+            ]
+        return text
+
+
+def _requirement_name(spec: str) -> str:
+    """Extract the package name from a dependency spec: "django[extra]>=4" -> "django"."""
+    name = spec.strip()
+    for separator in ("[", ";", "@", " ", "~=", "!=", ">=", "<=", "==", ">", "<"):
+        name = name.split(separator)[0]
+    return name.strip().lower()
+
+
+def _join(directory: str, name: str) -> str:
+    return name if directory == "." else f"{directory}/{name}"
+
+
+def _ancestors(directory: str) -> Iterator[str]:
+    """Yield the directory itself, then each parent up to the repository root."""
+    while directory != ".":
+        yield directory
+        directory = directory.rsplit("/", 1)[0] if "/" in directory else "."
+    yield "."
 
 
 class DetectService:
     """
-    IDK: stack-analysis, dependency-parsing, file-inspection
+    IDK: stack-analysis, dependency-parsing, file-inspection, workspace-scan
     Responsibility: Analyzes repository to identify language, framework, and commands
     Invariants: All detection methods are pure functions, defaults to Python if unknown
     """
 
+    def __init__(self, max_depth: int = 4, max_workers: Optional[int] = None):
+        """
+        Args:
+            max_depth: Deepest directory level searched for workspace packages
+            max_workers: Thread count for per-package detection (None = executor default)
+        """
+        self.max_depth = max_depth
+        self.max_workers = max_workers
+
     def detect(self, repo_path: Path) -> DetectedProject:
         """
         Detect project technology stack from repository.
 
+        The root result describes the repository itself. When the root has no
+        manifest of its own, it is derived from the most confident package.
+        Every detected package, including the root, is listed in `packages`.
+
         Args:
             repo_path: Path to repository root
 
         Returns:
             DetectedProject with all detected values
         """
-        language = self._detect_language(repo_path)
-        package_manager = self._detect_package_manager(repo_path, language)
-        framework = self._detect_framework(repo_path, language)
-        app_root = self._detect_app_root(repo_path, language)
-        commands = self._detect_commands(repo_path, language, package_manager)
+        listings = self._scan(repo_path)
+        cache = _ManifestCache(repo_path)
+
+        package_dirs = sorted(
+            directory
+            for directory, listing in listings.items()
+            if directory != "."
+            and directory.count("/") < self.max_depth
+            and listing.files & PACKAGE_MARKERS
+        )
+        root_files = listings.get(".", _Listing()).files
+        root_is_package = bool(root_files & (PACKAGE_MARKERS | {"tsconfig.json", *PYTHON_MARKERS}))
+        if root_is_package:
+            package_dirs.insert(0, ".")
+
+        if len(package_dirs) > 1:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                packages = list(
+                    pool.map(lambda d: self._detect_package(d, listings, cache), package_dirs)
+                )
+        else:
+            packages = [self._detect_package(d, listings, cache) for d in package_dirs]
+
+        if root_is_package:
+            root = packages[0]
+        elif packages:
+            root = self._root_from_package(
+                max(packages, key=lambda package: (package.confidence, -package.path.count("/")))
+            )
+        else:
+            root = self._detect_package(".", listings, cache)
+
+        return replace(root, packages=packages)
+
+    def _scan(self, repo_path: Path) -> Dict[str, _Listing]:
+        """
+        List the tree once with os.scandir, pruning vendored and hidden directories.
+
+        Directories one level below max_depth are listed too, so the app root
+        of the deepest packages can be resolved without touching the disk again.
+
+        Args:
+            repo_path: Path to repository root
+
+        Returns:
+            Mapping of POSIX paths relative to the root ("." for the root) to listings
+        """
+        listings: Dict[str, _Listing] = {}
+        stack: List[Tuple[str, Path, int]] = [(".", repo_path, 0)]
+
+        while stack:
+            directory, path, depth = stack.pop()
+            listing = _Listing()
+            descend: List[str] = []
+            try:
+                with os.scandir(path) as entries:
+                    for entry in entries:
+                        try:
+                            if not entry.is_dir():
+                                listing.files.add(entry.name)
+                                continue
+                            listing.dirs.add(entry.name)
+                            if not entry.is_symlink():
+                                descend.append(entry.name)
+                        except OSError:
+                            continue
+            except OSError:
+                pass
+            listings[directory] = listing
+
+            if depth > self.max_depth:
+                continue
+            for name in descend:
+                if name in PRUNED_DIRS or name.startswith("."):
+                    continue
+                stack.append((_join(directory, name), path / name, depth + 1))
+
+        return listings
+
+    def _detect_package(
+        self, directory: str, listings: Dict[str, _Listing], cache: _ManifestCache
+    ) -> DetectedProject:
+        """
+        Detect the stack of a single package directory.
+
+        Args:
+            directory: Package directory relative to the repository root
+            listings: Result of _scan
+            cache: Manifest cache shared by all packages of this detection
+
+        Returns:
+            DetectedProject for the package
+        """
+        files = listings[directory].files
+        language, marker = self._detect_language(directory, files, cache)
+        package_manager, lock_file = self._detect_package_manager(directory, language, listings)
+        framework = self._detect_framework(directory, language, files, cache)
+        app_root = self._detect_app_root(directory, language, listings)
+        commands = self._detect_commands(directory, language, package_manager, files, cache)
+
+        evidence = [name for name in (marker, lock_file) if name]
+        if framework and framework != Framework.NONE:
+            evidence.append(f"framework:{framework.value}")
 
         return DetectedProject(
             language=language,
@@ -67,115 +347,127 @@ class DetectService:
             package_manager=package_manager,
             app_root=app_root,
             commands=commands,
-            confidence=0.8,  # TODO: calculate real confidence
+            confidence=self._score(
+                directory, language, marker, lock_file, framework, app_root, files, cache
+            ),
+            path=directory,
+            name=self._package_name(directory, files, cache),
+            evidence=evidence,
         )
 
-    def _detect_language(self, repo_path: Path) -> Language:
+    def _root_from_package(self, package: DetectedProject) -> DetectedProject:
         """
-        Detect programming language by checking for language-specific files.
+        Describe a repository without root manifests by its most confident package.
+
+        Paths and commands are rewritten so they work from the repository root.
+        """
+        app_root = package.app_root or "."
+        return replace(
+            package,
+            path=".",
+            name=None,
+            app_root=package.path if app_root == "." else _join(package.path, app_root),
+            commands={
+                name: f"cd {package.path} && {command}"
+                for name, command in package.commands.items()
+            },
+            evidence=[_join(package.path, item) for item in package.evidence],
+        )
+
+    def _detect_language(
+        self, directory: str, files: Set[str], cache: _ManifestCache
+    ) -> Tuple[Language, Optional[str]]:
+        """
+        Detect programming language from the marker files of a directory.
 
         Args:
-            repo_path: Path to repository root
+            directory: Package directory relative to the repository root
+            files: File names in the directory
+            cache: Manifest cache
 
         Returns:
-            Detected Language (defaults to PYTHON if none found)
+            Detected Language (defaults to PYTHON if none found) and the deciding marker
         """
         # Python detection
-        python_files = [
-            "pyproject.toml",
-            "setup.py",
-            "requirements.txt",
-            "Pipfile",
-            "poetry.lock",
-            "uv.lock",
-        ]
-        if any((repo_path / file).exists() for file in python_files):
-            return Language.PYTHON
+        for marker in PYTHON_MARKERS:
+            if marker in files:
+                return Language.PYTHON, marker
 
         # TypeScript detection
-        if (repo_path / "tsconfig.json").exists():
-            return Language.TYPESCRIPT
+        if "tsconfig.json" in files:
+            return Language.TYPESCRIPT, "tsconfig.json"
 
         # JavaScript with TypeScript dependency
-        pkg_json = self._read_package_json(repo_path)
-        if pkg_json:
-            deps = {**pkg_json.get("dependencies", {}), **pkg_json.get("devDependencies", {})}
-            if "typescript" in deps:
-                return Language.TYPESCRIPT
-            return Language.JAVASCRIPT
+        if "package.json" in files:
+            if "typescript" in self._js_deps(directory, files, cache):
+                return Language.TYPESCRIPT, "package.json"
+            return Language.JAVASCRIPT, "package.json"
 
         # Go detection
-        if (repo_path / "go.mod").exists():
-            return Language.GO
+        if "go.mod" in files:
+            return Language.GO, "go.mod"
 
         # Rust detection
-        if (repo_path / "Cargo.toml").exists():
-            return Language.RUST
+        if "Cargo.toml" in files:
+            return Language.RUST, "Cargo.toml"
 
         # Java detection
-        java_files = ["pom.xml", "build.gradle", "build.gradle.kts"]
-        if any((repo_path / file).exists() for file in java_files):
-            return Language.JAVA
+        for marker in JAVA_MARKERS:
+            if marker in files:
+                return Language.JAVA, marker
 
         # Default
-        return Language.PYTHON
+        return Language.PYTHON, None
 
-    def _detect_package_manager(self, repo_path: Path, language: Language) -> PackageManager:
+    def _detect_package_manager(
+        self, directory: str, language: Language, listings: Dict[str, _Listing]
+    ) -> Tuple[PackageManager, Optional[str]]:
         """
-        Detect package manager based on language and lock files.
+        Detect package manager from lock files in the package or a parent workspace.
 
         Args:
-            repo_path: Path to repository root
+            directory: Package directory relative to the repository root
             language: Detected programming language
+            listings: Result of _scan
 
         Returns:
-            Detected PackageManager
+            Detected PackageManager and the lock file that decided it, if any
         """
-        if language == Language.PYTHON:
-            if (repo_path / "uv.lock").exists() or (repo_path / ".python-version").exists():
-                return PackageManager.UV
-            if (repo_path / "poetry.lock").exists():
-                return PackageManager.POETRY
-            if (repo_path / "Pipfile.lock").exists():
-                return PackageManager.PIPENV
-            return PackageManager.PIP
+        for ancestor in _ancestors(directory):
+            files = listings.get(ancestor, _Listing()).files
+            for lock_file, package_manager in LOCK_FILES.get(language, ()):
+                if lock_file in files:
+                    return package_manager, _join(ancestor, lock_file)
 
         if language in (Language.TYPESCRIPT, Language.JAVASCRIPT):
-            if (repo_path / "pnpm-lock.yaml").exists():
-                return PackageManager.PNPM
-            if (repo_path / "yarn.lock").exists():
-                return PackageManager.YARN
-            if (repo_path / "bun.lockb").exists():
-                return PackageManager.BUN
-            return PackageManager.NPM
-
+            return PackageManager.NPM, None
         if language == Language.GO:
-            return PackageManager.GO_MOD
-
+            return PackageManager.GO_MOD, None
         if language == Language.RUST:
-            return PackageManager.CARGO
-
+            return PackageManager.CARGO, None
         if language == Language.JAVA:
-            if (repo_path / "pom.xml").exists():
-                return PackageManager.MAVEN
-            return PackageManager.GRADLE
-
-        return PackageManager.PIP
+            files = listings[directory].files
+            return (PackageManager.MAVEN if "pom.xml" in files else PackageManager.GRADLE), None
+        return PackageManager.PIP, None
 
-    def _detect_framework(self, repo_path: Path, language: Language) -> Optional[Framework]:
+    def _detect_framework(
+        self, directory: str, language: Language, files: Set[str], cache: _ManifestCache
+    ) -> Optional[Framework]:
         """
         Detect web framework by analyzing dependencies.
 
         Args:
-            repo_path: Path to repository root
+            directory: Package directory relative to the repository root
             language: Detected programming language
+            files: File names in the directory
+            cache: Manifest cache
 
         Returns:
             Detected Framework or None
         """
         # Python frameworks
         if language == Language.PYTHON:
-            deps = self._get_python_deps(repo_path)
+            deps = self._python_deps(directory, files, cache)
             if "fastapi" in deps:
                 return Framework.FASTAPI
             if "django" in deps:
@@ -185,198 +477,227 @@ class DetectService:
 
         # TypeScript/JavaScript frameworks
         if language in (Language.TYPESCRIPT, Language.JAVASCRIPT):
-            pkg_json = self._read_package_json(repo_path)
-            if pkg_json:
-                js_deps: Dict[str, Any] = {
-                    **pkg_json.get("dependencies", {}),
-                    **pkg_json.get("devDependencies", {}),
-                }
-                if "next" in js_deps:
-                    return Framework.NEXTJS
-                if "@nestjs/core" in js_deps:
-                    return Framework.NESTJS
-                if "express" in js_deps:
-                    return Framework.EXPRESS
-                if "react" in js_deps:
-                    return Framework.REACT
-                if "vue" in js_deps:
-                    return Framework.VUE
+            js_deps = self._js_deps(directory, files, cache)
+            if "next" in js_deps:
+                return Framework.NEXTJS
+            if "@nestjs/core" in js_deps:
+                return Framework.NESTJS
+            if "express" in js_deps:
+                return Framework.EXPRESS
+            if "react" in js_deps:
+                return Framework.REACT
+            if "vue" in js_deps:
+                return Framework.VUE
 
         # Go frameworks
-        if language == Language.GO:
-            go_mod_path = repo_path / "go.mod"
-            if go_mod_path.exists():
-                content = go_mod_path.read_text()
-                if "gin-gonic/gin" in content:
-                    return Framework.GIN
-                if "labstack/echo" in content:
-                    return Framework.ECHO
+        if language == Language.GO and "go.mod" in files:
+            content = cache.get(_join(directory, "go.mod")) or ""
+            if "gin-gonic/gin" in content:
+                return Framework.GIN
+            if "labstack/echo" in content:
+                return Framework.ECHO
 
         # Rust frameworks
-        if language == Language.RUST:
-            cargo_path = repo_path / "Cargo.toml"
-            if cargo_path.exists():
-                content = cargo_path.read_text()
-                if "axum" in content:
-                    return Framework.AXUM
-                if "actix" in content:
-                    return Framework.ACTIX
+        if language == Language.RUST and "Cargo.toml" in files:
+            content = cache.get(_join(directory, "Cargo.toml")) or ""
+            if "axum" in content:
+                return Framework.AXUM
+            if "actix" in content:
+                return Framework.ACTIX
 
         # Java frameworks
-        if language == Language.JAVA:
-            pom_path = repo_path / "pom.xml"
-            if pom_path.exists():
-                content = pom_path.read_text().lower()
-                if "spring" in content:
-                    return Framework.SPRING
+        if language == Language.JAVA and "pom.xml" in files:
+            content = cache.get(_join(directory, "pom.xml")) or ""
+            if "spring" in content.lower():
+                return Framework.SPRING
 
         return Framework.NONE
 
-    def _detect_app_root(self, repo_path: Path, language: Language) -> Optional[str]:
+    def _detect_app_root(
+        self, directory: str, language: Language, listings: Dict[str, _Listing]
+    ) -> Optional[str]:
         """
-        Detect application root directory.
+        Detect application root directory, relative to the package directory.
 
         Args:
-            repo_path: Path to repository root
+            directory: Package directory relative to the repository root
             language: Detected programming language
+            listings: Result of _scan
 
         Returns:
             App root directory name or "."
         """
+        subdirs = listings[directory].dirs
+
         # Check common root directories
-        common_roots = ["src", "app", "lib"]
-        for root in common_roots:
-            if (repo_path / root).is_dir():
+        for root in ("src", "app", "lib"):
+            if root in subdirs:
                 return root
 
         # Python: look for directory with __init__.py
         if language == Language.PYTHON:
-            try:
-                for item in repo_path.iterdir():
-                    if item.is_dir() and (item / "__init__.py").exists():
-                        return item.name
-            except (PermissionError, OSError):
-                pass
+            for name in sorted(subdirs):
+                child = listings.get(_join(directory, name))
+                if child is not None and "__init__.py" in child.files:
+                    return name
 
         return "."
 
     def _detect_commands(
-        self, repo_path: Path, language: Language, package_manager: PackageManager
+        self,
+        directory: str,
+        language: Language,
+        package_manager: PackageManager,
+        files: Set[str],
+        cache: _ManifestCache,
     ) -> Dict[str, str]:
         """
-        Detect existing project commands from configuration files.
+        Detect existing project commands from package.json scripts.
+
+        Python entry points in pyproject.toml are not commands, so Python packages
+        fall back to the defaults of their package manager.
 
         Args:
-            repo_path: Path to repository root
+            directory: Package directory relative to the repository root
             language: Detected programming language
             package_manager: Detected package manager
+            files: File names in the directory
+            cache: Manifest cache
 
         Returns:
             Dictionary mapping command names to command strings
         """
-        commands = {}
+        commands: Dict[str, str] = {}
+        if language not in (Language.TYPESCRIPT, Language.JAVASCRIPT):
+            return commands
 
-        # TypeScript/JavaScript commands from package.json
-        if language in (Language.TYPESCRIPT, Language.JAVASCRIPT):
-            pkg_json = self._read_package_json(repo_path)
-            if pkg_json and "scripts" in pkg_json:
-                scripts = pkg_json["scripts"]
+        pkg_json = cache.get(_join(directory, "package.json")) if "package.json" in files else None
+        scripts = (pkg_json or {}).get("scripts") or {}
+        if not isinstance(scripts, dict):
+            return commands
 
-                # Start/dev command
-                if "start" in scripts:
-                    commands["start"] = f"{package_manager.value} run start"
-                elif "dev" in scripts:
-                    commands["start"] = f"{package_manager.value} run dev"
+        # Start/dev command
+        if "start" in scripts:
+            commands["start"] = f"{package_manager.value} run start"
+        elif "dev" in scripts:
+            commands["start"] = f"{package_manager.value} run dev"
 
-                # Test command
-                if "test" in scripts:
-                    commands["test"] = f"{package_manager.value} test"
+        # Test command
+        if "test" in scripts:
+            commands["test"] = f"{package_manager.value} test"
 
-                # Lint command
-                if "lint" in scripts:
-                    commands["lint"] = f"{package_manager.value} run lint"
+        # Lint command
+        if "lint" in scripts:
+            commands["lint"] = f"{package_manager.value} run lint"
 
-                # Build command
-                if "build" in scripts:
-                    commands["build"] = f"{package_manager.value} run build"
-
-        # Python commands from pyproject.toml
-        if language == Language.PYTHON:
-            pyproject_path = repo_path / "pyproject.toml"
-            if pyproject_path.exists() and tomllib is not None:
-                try:
-                    with open(pyproject_path, "rb") as f:
-                        data = tomllib.load(f)
-                        scripts = data.get("project", {}).get("scripts", {})
-                        # Map common scripts if they exist
-                        # Note: pyproject.toml scripts are entry points, not commands
-                        # This is optional/limited functionality
-                except Exception:
-                    pass
+        # Build command
+        if "build" in scripts:
+            commands["build"] = f"{package_manager.value} run build"
 
         return commands
 
-    def _read_package_json(self, repo_path: Path) -> Optional[Dict[str, Any]]:
+    def _score(
+        self,
+        directory: str,
+        language: Language,
+        marker: Optional[str],
+        lock_file: Optional[str],
+        framework: Optional[Framework],
+        app_root: Optional[str],
+        files: Set[str],
+        cache: _ManifestCache,
+    ) -> float:
         """
-        Read and parse package.json file.
+        Score how much evidence backs the detected stack.
 
-        Args:
-            repo_path: Path to repository root
+        A strong manifest (pyproject.toml, package.json, go.mod, ...) counts more than
+        weak hints such as requirements.txt or tsconfig.json. Lock files, a framework
+        dependency and a recognizable source layout add to the score; manifests that
+        fail to parse and markers of several languages in one directory subtract.
 
         Returns:
-            Parsed package.json as dict, or None if not found/invalid
+            Confidence between 0 and 1
         """
-        pkg_path = repo_path / "package.json"
-        if not pkg_path.exists():
-            return None
-
-        try:
-            result: Dict[str, Any] = json.loads(pkg_path.read_text())
-            return result
-        except json.JSONDecodeError:
-            return None
+        weights = CONFIDENCE_WEIGHTS
+        if marker is None:
+            return weights["no_marker"]
+
+        manifests = files & STRONG_MANIFESTS
+        score = weights["strong_manifest"] if manifests else weights["weak_marker"]
+        if lock_file:
+            score += weights["lock_file"]
+        if framework not in (None, Framework.NONE):
+            score += weights["framework"]
+        if app_root not in (None, "."):
+            score += weights["layout"]
+        if any(
+            name in ("package.json", "pyproject.toml") and cache.get(_join(directory, name)) is None
+            for name in manifests
+        ):
+            score += weights["unparseable"]
+
+        languages = {
+            "python": bool(files & set(PYTHON_MARKERS)),
+            "js": "package.json" in files,
+            "go": "go.mod" in files,
+            "rust": "Cargo.toml" in files,
+            "java": bool(files & set(JAVA_MARKERS)),
+        }
+        if sum(languages.values()) > 1:
+            score += weights["ambiguous"]
+
+        return round(min(max(score, 0.0), 1.0), 2)
+
+    def _package_name(
+        self, directory: str, files: Set[str], cache: _ManifestCache
+    ) -> Optional[str]:
+        """Read the package name from package.json or pyproject.toml, if declared."""
+        for manifest, section in (("package.json", None), ("pyproject.toml", "project")):
+            if manifest not in files:
+                continue
+            data = cache.get(_join(directory, manifest)) or {}
+            if section:
+                data = data.get(section) or {}
+            name = data.get("name") if isinstance(data, dict) else None
+            if isinstance(name, str) and name:
+                return name
+        return None
+
+    def _js_deps(self, directory: str, files: Set[str], cache: _ManifestCache) -> Dict[str, Any]:
+        """Merge dependencies and devDependencies of the package.json, if any."""
+        if "package.json" not in files:
+            return {}
+        pkg_json = cache.get(_join(directory, "package.json")) or {}
+        deps: Dict[str, Any] = {}
+        for key in ("dependencies", "devDependencies"):
+            section = pkg_json.get(key)
+            if isinstance(section, dict):
+                deps.update(section)
+        return deps
 
-    def _get_python_deps(self, repo_path: Path) -> List[str]:
+    def _python_deps(self, directory: str, files: Set[str], cache: _ManifestCache) -> Set[str]:
         """
-        Get list of Python dependencies from pyproject.toml and requirements.txt.
+        Get Python dependency names from pyproject.toml and requirements.txt.
 
         Args:
-            repo_path: Path to repository root
+            directory: Package directory relative to the repository root
+            files: File names in the directory
+            cache: Manifest cache
 
         Returns:
-            List of dependency names (lowercase)
+            Set of dependency names (lowercase)
         """
-        deps = []
-
-        # Parse pyproject.toml
-        pyproject_path = repo_path / "pyproject.toml"
-        if pyproject_path.exists() and tomllib is not None:
-            try:
-                with open(pyproject_path, "rb") as f:
-                    data = tomllib.load(f)
-                    project_deps = data.get("project", {}).get("dependencies", [])
-                    for dep in project_deps:
-                        # Extract package name from dependency spec
-                        # Examples: "fastapi>=0.100.0" -> "fastapi"
-                        #           "django[extra]" -> "django"
-                        name = dep.split("[")[0].split(">=")[0].split("==")[0].strip().lower()
-                        deps.append(name)
-            except Exception:
-                pass
-
-        # Parse requirements.txt
-        req_path = repo_path / "requirements.txt"
-        if req_path.exists():
-            try:
-                for line in req_path.read_text().splitlines():
-                    line = line.strip()
-                    # Skip comments and empty lines
-                    if not line or line.startswith("#"):
-                        continue
-                    # Extract package name
-                    name = line.split("[")[0].split(">=")[0].split("==")[0].strip().lower()
-                    deps.append(name)
-            except Exception:
-                pass
+        deps: Set[str] = set()
+
+        if "pyproject.toml" in files:
+            data = cache.get(_join(directory, "pyproject.toml")) or {}
+            project_deps = data.get("project", {}).get("dependencies", [])
+            deps.update(_requirement_name(dep) for dep in project_deps if isinstance(dep, str))
+            poetry_deps = data.get("tool", {}).get("poetry", {}).get("dependencies", {})
+            if isinstance(poetry_deps, dict):
+                deps.update(name.lower() for name in poetry_deps)
+
+        if "requirements.txt" in files:
+            deps.update(cache.get(_join(directory, "requirements.txt")) or [])
 
         return deps
@@ -4,9 +4,10 @@ Responsibility: Orchestrates generation of complete CRUD vertical slices for ent
 Invariants: Validates before generation, checks conflicts, applies templates idempotently
 """
 
+import ast
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List
+from typing import Any, Dict, List, Set
 
 import yaml
 
@@ -277,6 +278,18 @@ class EntityGeneratorService:
             )
         )
 
+        # Full-text search index migration (authorized entities with searchable fields)
+        if entity_spec.authorized and entity_spec.search_fields:
+            plan.append(
+                FileOperation(
+                    path=Path("alembic")
+                    / "versions"
+                    / f"{entity_spec.table_name}_search_index.py",
+                    template_name=f"{template_prefix}/search_migration.py.j2",
+                    description=f"Migration: full-text search index on {entity_spec.table_name}",
+                )
+            )
+
         # Domain events (conditional)
         if entity_spec.with_events:
             plan.append(
@@ -352,7 +365,11 @@ class EntityGeneratorService:
                         "entity": entity_spec,
                         # For backwards compatibility with old templates
                         "entity_spec": entity_spec,
-                        "config": config
+                        "config": config,
+                        "down_revisions": alembic_heads(
+                            target_dir / "alembic" / "versions",
+                            exclude=f"{entity_spec.table_name}_search_index",
+                        ),
                     },
                 )
 
@@ -373,3 +390,60 @@ class EntityGeneratorService:
                 f"for entity {entity_spec.name}"
             ),
         )
+
+
+# ============================================================================
+# ALEMBIC HELPERS
+# ============================================================================
+
+
+def alembic_heads(versions_dir: Path, exclude: str = "") -> List[str]:
+    """
+    Find the head revisions of the Alembic migrations in versions_dir.
+
+    A head is a revision no other revision names as its down_revision.
+    Revision ids are read statically from module-level assignments, so
+    the migrations are never imported.
+
+    Args:
+        versions_dir: Alembic versions directory (may not exist)
+        exclude: Revision to ignore, e.g. the migration being regenerated
+
+    Returns:
+        Sorted head revision ids; empty when there are no migrations
+    """
+    revisions: Set[str] = set()
+    parents: Set[str] = set()
+    if not versions_dir.is_dir():
+        return []
+
+    for path in sorted(versions_dir.glob("*.py")):
+        try:
+            tree = ast.parse(path.read_text(encoding="utf-8"))
+        except (OSError, SyntaxError, UnicodeDecodeError):
+            continue
+        values: Dict[str, Any] = {}
+        for node in tree.body:
+            if isinstance(node, ast.Assign) and len(node.targets) == 1:
+                target, value = node.targets[0], node.value
+            elif isinstance(node, ast.AnnAssign) and node.value is not None:
+                target, value = node.target, node.value
+            else:
+                continue
+            if isinstance(target, ast.Name) and target.id in ("revision", "down_revision"):
+                try:
+                    values[target.id] = ast.literal_eval(value)
+                except ValueError:
+                    continue
+
+        revision = values.get("revision")
+        if not isinstance(revision, str) or revision == exclude:
+            continue
+        revisions.add(revision)
+        down = values.get("down_revision")
+        if isinstance(down, str):
+            parents.add(down)
+        elif isinstance(down, (tuple, list)):
+            parents.update(item for item in down if isinstance(item, str))
+
+    return sorted(revisions - parents)
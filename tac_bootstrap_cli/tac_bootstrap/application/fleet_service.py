@@ -0,0 +1,407 @@
+"""
+IDK: fleet-mode, multi-repo, process-pool, template-precompile, jsonl-log
+Responsibility: Runs render, upgrade or doctor across many repositories in one invocation,
+                sharing precompiled templates and one toolchain probe between them
+Invariants: Templates are compiled and the toolchain probed once in the parent before
+            workers start; a failing repository never stops the others; every repository
+            gets exactly one result, streamed to the JSONL log as soon as it finishes
+
+Example usage:
+    from tac_bootstrap.application.fleet_service import FleetService, read_repo_list
+
+    service = FleetService(concurrency=8)
+    repos = read_repo_list(Path("repos.txt"))
+    summary = service.run("render", repos, log_path=Path("fleet.jsonl"))
+    print(summary.ok, summary.failed, summary.p95_ms)
+"""
+
+import io
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import redirect_stdout
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import yaml
+
+from tac_bootstrap.application.doctor_service import DoctorService, Severity
+from tac_bootstrap.application.scaffold_service import ScaffoldService
+from tac_bootstrap.application.upgrade_service import UpgradeService
+from tac_bootstrap.application.validation_service import ValidationService
+from tac_bootstrap.domain.models import TACConfig
+from tac_bootstrap.infrastructure.template_repo import TemplateRepository
+from tac_bootstrap.infrastructure.toolchain_probe import ToolchainProbe
+
+FLEET_COMMANDS = ("render", "upgrade", "doctor")
+
+# Every tool ValidationService may ask for, probed once before any repository runs
+FLEET_TOOLS = ["git", "python", "uv", "npm", "yarn", "pnpm", "bun", "gh"]
+
+# Commands that render templates (doctor only inspects files)
+RENDERING_COMMANDS = {"render", "upgrade"}
+
+
+@dataclass
+class FleetOptions:
+    """
+    IDK: fleet-options
+    Responsibility: Per-repository options shared by every repository in a fleet run
+    Invariants: Options a command does not use are ignored (e.g. backup for render)
+    """
+
+    force: bool = False
+    dry_run: bool = False
+    backup: bool = True
+
+
+@dataclass
+class RepoResult:
+    """
+    IDK: repo-result, jsonl-record
+    Responsibility: Outcome of one command on one repository, one line of the JSONL log
+    Invariants: status is "ok", "skipped" or "failed"; error is set iff status is "failed"
+    """
+
+    repo: str
+    command: str
+    status: str
+    duration_ms: float
+    details: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+
+
+@dataclass
+class FleetSummary:
+    """
+    IDK: fleet-summary, aggregate-timings
+    Responsibility: Aggregate counts and timings of a fleet run
+    Invariants: ok + skipped + failed == total; results are in repository list order
+    """
+
+    command: str
+    workers: int
+    setup_ms: float
+    wall_ms: float
+    results: List[RepoResult] = field(default_factory=list)
+
+    @property
+    def total(self) -> int:
+        return len(self.results)
+
+    @property
+    def ok(self) -> int:
+        return sum(1 for result in self.results if result.status == "ok")
+
+    @property
+    def skipped(self) -> int:
+        return sum(1 for result in self.results if result.status == "skipped")
+
+    @property
+    def failed(self) -> int:
+        return sum(1 for result in self.results if result.status == "failed")
+
+    @property
+    def p50_ms(self) -> float:
+        return self._percentile(50)
+
+    @property
+    def p95_ms(self) -> float:
+        return self._percentile(95)
+
+    @property
+    def max_ms(self) -> float:
+        return max((result.duration_ms for result in self.results), default=0.0)
+
+    def slowest(self, count: int = 5) -> List[RepoResult]:
+        """Return the count slowest repositories, slowest first."""
+        return sorted(self.results, key=lambda result: result.duration_ms, reverse=True)[:count]
+
+    def _percentile(self, percent: float) -> float:
+        """Nearest-rank percentile of per-repository durations."""
+        durations = sorted(result.duration_ms for result in self.results)
+        if not durations:
+            return 0.0
+        rank = max(1, -(-len(durations) * percent // 100))
+        return durations[int(rank) - 1]
+
+
+def read_repo_list(path: Path) -> List[Path]:
+    """
+    Read a repository list file: one path per line, blank lines and # comments ignored.
+
+    Relative paths are resolved against the list file's directory. Duplicates are
+    dropped, keeping the first occurrence.
+
+    Args:
+        path: Path to the list file
+
+    Returns:
+        Absolute repository paths in file order
+    """
+    base = path.resolve().parent
+    repos: Dict[Path, None] = {}
+    for line in path.read_text(encoding="utf-8").splitlines():
+        entry = line.split("#", 1)[0].strip()
+        if not entry:
+            continue
+        repo = Path(entry).expanduser()
+        repos[(repo if repo.is_absolute() else base / repo).resolve()] = None
+    return list(repos)
+
+
+# ============================================================================
+# WORKER SIDE
+# ============================================================================
+
+
+@dataclass
+class _FleetServices:
+    """Services shared by every repository handled in one process."""
+
+    templates_dir: Path
+    scaffold: ScaffoldService
+    doctor: DoctorService
+
+
+# Set in the parent before the pool starts; forked workers inherit it with every
+# template already compiled. Spawned workers rebuild it in _init_worker.
+_services: Optional[_FleetServices] = None
+
+
+def _build_services(
+    templates_dir: Path, toolchain: ToolchainProbe, precompile: bool
+) -> _FleetServices:
+    template_repo = TemplateRepository(templates_dir)
+    if precompile:
+        template_repo.precompile()
+    validation = ValidationService(template_repo, toolchain=toolchain)
+    return _FleetServices(
+        templates_dir=template_repo.templates_dir,
+        scaffold=ScaffoldService(template_repo, validation),
+        doctor=DoctorService(),
+    )
+
+
+def _init_worker(templates_dir: Path, toolchain: ToolchainProbe, precompile: bool) -> None:
+    global _services
+    if _services is None or _services.templates_dir != templates_dir:
+        _services = _build_services(templates_dir, toolchain, precompile)
+
+
+def _load_config(repo: Path) -> TACConfig:
+    config_file = repo / "config.yml"
+    if not config_file.exists():
+        raise FileNotFoundError(f"No config.yml found in {repo}")
+    with open(config_file, "r") as f:
+        return TACConfig(**yaml.safe_load(f))
+
+
+def _render_repo(repo: Path, options: FleetOptions) -> Tuple[str, Dict[str, Any]]:
+    assert _services is not None
+    config = _load_config(repo)
+    plan = _services.scaffold.build_plan(config, existing_repo=True)
+    if options.dry_run:
+        return "ok", {
+            "directories_planned": len(plan.directories),
+            "files_planned": len(plan.files),
+        }
+
+    result = _services.scaffold.apply_plan(plan, repo, config, force=options.force)
+    if not result.success:
+        raise RuntimeError(result.error or "; ".join(result.errors) or "Scaffold apply failed")
+    return "ok", {
+        "files_created": result.files_created,
+        "files_overwritten": result.files_overwritten,
+        "files_skipped": result.files_skipped,
+    }
+
+
+def _upgrade_repo(repo: Path, options: FleetOptions) -> Tuple[str, Dict[str, Any]]:
+    assert _services is not None
+    if not (repo / "config.yml").exists():
+        raise FileNotFoundError(f"No config.yml found in {repo}")
+
+    service = UpgradeService(repo, scaffold_service=_services.scaffold)
+    needs_upgrade, current_version, target_version = service.needs_upgrade()
+    details: Dict[str, Any] = {"from_version": current_version, "to_version": target_version}
+    if not needs_upgrade and not options.force:
+        return "skipped", details
+    if options.dry_run:
+        details["changes"] = service.get_changes_preview()
+        return "ok", details
+
+    success, message = service.perform_upgrade(backup=options.backup)
+    if not success:
+        raise RuntimeError(message)
+    if service.last_backup is not None:
+        details["backup"] = {
+            "path": service.last_backup.path.name,
+            "copied": service.last_backup.copied,
+            "reflinked": service.last_backup.reflinked,
+            "linked": service.last_backup.linked,
+        }
+    return "ok", details
+
+
+def _doctor_repo(repo: Path, options: FleetOptions) -> Tuple[str, Dict[str, Any]]:
+    assert _services is not None
+    report = _services.doctor.diagnose(repo)
+    details: Dict[str, Any] = {
+        severity.value: sum(1 for issue in report.issues if issue.severity == severity)
+        for severity in Severity
+    }
+    details["issues"] = [f"[{issue.severity.value}] {issue.message}" for issue in report.issues]
+    return ("ok" if report.healthy else "failed"), details
+
+
+_RUNNERS: Dict[str, Callable[[Path, FleetOptions], Tuple[str, Dict[str, Any]]]] = {
+    "render": _render_repo,
+    "upgrade": _upgrade_repo,
+    "doctor": _doctor_repo,
+}
+
+
+def _run_repo(command: str, repo: str, options: FleetOptions) -> RepoResult:
+    """Run command on one repository; never raises."""
+    start = time.perf_counter()
+    # Services print progress and warnings for a single interactive repository;
+    # with many repositories in flight that output would interleave, so drop it.
+    try:
+        with redirect_stdout(io.StringIO()):
+            status, details = _RUNNERS[command](Path(repo), options)
+        error = "Unhealthy" if status == "failed" else None
+    except Exception as e:
+        status, details, error = "failed", {}, str(e) or type(e).__name__
+    duration_ms = (time.perf_counter() - start) * 1000
+    return RepoResult(repo, command, status, round(duration_ms, 1), details, error)
+
+
+# ============================================================================
+# PARENT SIDE
+# ============================================================================
+
+
+class FleetService:
+    """
+    IDK: fleet-orchestration, process-pool, shared-templates
+    Responsibility: Fans a command out over repositories with bounded concurrency and
+                    collects per-repository results and aggregate timings
+    Invariants: At most `concurrency` repositories run at once; with concurrency 1 (or a
+                single repository) everything runs in this process without a pool
+    """
+
+    def __init__(
+        self,
+        templates_dir: Optional[Path] = None,
+        toolchain: Optional[ToolchainProbe] = None,
+        concurrency: Optional[int] = None,
+    ) -> None:
+        """Initialize the FleetService.
+
+        Args:
+            templates_dir: Templates directory (defaults to the package templates)
+            toolchain: Toolchain probe shared by all repositories (created if not provided)
+            concurrency: Maximum worker processes (defaults to the CPU count)
+        """
+        self.templates_dir = templates_dir or TemplateRepository().templates_dir
+        self.toolchain = toolchain or ToolchainProbe()
+        self.concurrency = max(1, concurrency or os.cpu_count() or 1)
+
+    def run(
+        self,
+        command: str,
+        repos: List[Path],
+        options: Optional[FleetOptions] = None,
+        log_path: Optional[Path] = None,
+        on_result: Optional[Callable[[RepoResult], None]] = None,
+    ) -> FleetSummary:
+        """
+        Run command on every repository.
+
+        Args:
+            command: One of FLEET_COMMANDS
+            repos: Repository root directories
+            options: Options applied to every repository
+            log_path: JSONL file receiving one line per repository as it finishes
+            on_result: Called with each result as it finishes (e.g. for progress output)
+
+        Returns:
+            FleetSummary with results in repository order
+
+        Raises:
+            ValueError: If command is not a fleet command
+        """
+        global _services
+        if command not in _RUNNERS:
+            raise ValueError(
+                f"Unknown fleet command '{command}'. Use one of: {', '.join(FLEET_COMMANDS)}"
+            )
+        options = options or FleetOptions()
+        start = time.perf_counter()
+
+        renders = command in RENDERING_COMMANDS
+        if renders:
+            self.toolchain.probe(FLEET_TOOLS)
+        _services = _build_services(self.templates_dir, self.toolchain, precompile=renders)
+        setup_ms = (time.perf_counter() - start) * 1000
+
+        workers = min(self.concurrency, len(repos)) or 1
+        by_repo: Dict[str, RepoResult] = {}
+        log = None
+        if log_path is not None:
+            log_path.parent.mkdir(parents=True, exist_ok=True)
+            log = open(log_path, "w", encoding="utf-8")
+
+        def record(result: RepoResult) -> None:
+            by_repo[result.repo] = result
+            if log is not None:
+                log.write(json.dumps(asdict(result), default=str) + "\n")
+                log.flush()
+            if on_result is not None:
+                on_result(result)
+
+        try:
+            if workers == 1:
+                for repo in repos:
+                    record(_run_repo(command, str(repo), options))
+            else:
+                with ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=self._mp_context(),
+                    initializer=_init_worker,
+                    initargs=(_services.templates_dir, self.toolchain, renders),
+                ) as pool:
+                    futures = {
+                        pool.submit(_run_repo, command, str(repo), options): str(repo)
+                        for repo in repos
+                    }
+                    for future in as_completed(futures):
+                        try:
+                            result = future.result()
+                        except Exception as e:  # worker died (e.g. killed or out of memory)
+                            result = RepoResult(
+                                futures[future], command, "failed", 0.0, error=f"Worker failed: {e}"
+                            )
+                        record(result)
+        finally:
+            if log is not None:
+                log.close()
+
+        return FleetSummary(
+            command=command,
+            workers=workers,
+            setup_ms=round(setup_ms, 1),
+            wall_ms=round((time.perf_counter() - start) * 1000, 1),
+            results=[by_repo[str(repo)] for repo in repos if str(repo) in by_repo],
+        )
+
+    @staticmethod
+    def _mp_context() -> Any:
+        """Prefer fork so workers inherit the compiled templates instead of recompiling."""
+        if "fork" in multiprocessing.get_all_start_methods():
+            return multiprocessing.get_context("fork")
+        return None
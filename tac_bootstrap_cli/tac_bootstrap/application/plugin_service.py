@@ -2,11 +2,17 @@
 IDK: plugin-orchestration, hook-execution, plugin-lifecycle, plugin-registry
 Responsibility: Orchestrates plugin loading, registration, hook execution, and lifecycle management
 Invariants: Hooks execute in registration order, errors in one plugin don't block others,
-            disabled plugins are skipped, hook results are always returned
+            disabled plugins are skipped, hook results are always returned, a hook that
+            exceeds its timeout yields a failed result instead of blocking the caller
 """
 
+import json
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence
 
 from tac_bootstrap.domain.plugin import (
     HookType,
@@ -15,6 +21,112 @@ from tac_bootstrap.domain.plugin import (
 )
 from tac_bootstrap.infrastructure.plugin_loader import PluginLoader
 
+DEFAULT_STATS_PATH = Path.home() / ".tac-bootstrap" / "plugin_stats.json"
+STATS_SCHEMA_VERSION = 1
+
+# ============================================================================
+# HOOK STATISTICS
+# ============================================================================
+
+
+@dataclass
+class HookStats:
+    """
+    IDK: hook-latency, hook-counters
+    Responsibility: Call, failure and timeout counters and latency totals for one
+                    plugin's implementation of one hook
+    Invariants: failures include timeouts; total_ms and max_ms cover every call
+    """
+
+    calls: int = 0
+    failures: int = 0
+    timeouts: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+    @property
+    def avg_ms(self) -> float:
+        return self.total_ms / self.calls if self.calls else 0.0
+
+    def record(self, duration_ms: float, success: bool, timed_out: bool = False) -> None:
+        self.calls += 1
+        self.failures += 0 if success else 1
+        self.timeouts += 1 if timed_out else 0
+        self.total_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+
+    def merge(self, other: "HookStats") -> None:
+        self.calls += other.calls
+        self.failures += other.failures
+        self.timeouts += other.timeouts
+        self.total_ms += other.total_ms
+        self.max_ms = max(self.max_ms, other.max_ms)
+
+
+# hook name -> plugin name -> stats
+StatsTable = Dict[str, Dict[str, HookStats]]
+
+
+class _HookCall:
+    """One plugin hook invocation, run inline or on a daemon thread with a deadline."""
+
+    def __init__(
+        self,
+        plugin: Plugin,
+        hook_name: str,
+        args: Sequence[Any],
+        kwargs: Dict[str, Any],
+        timeout: Optional[float],
+    ) -> None:
+        self.plugin = plugin
+        self.hook_name = hook_name
+        self.args = args
+        self.kwargs = kwargs
+        self.timeout = timeout
+        self.result: Optional[PluginHookResult] = None
+        self.duration_ms = 0.0
+        self._started = 0.0
+        self._thread: Optional[threading.Thread] = None
+
+    def run(self) -> None:
+        start = time.perf_counter()
+        self.result = self.plugin.execute_hook(self.hook_name, *self.args, **self.kwargs)
+        self.duration_ms = (time.perf_counter() - start) * 1000
+
+    def start(self) -> None:
+        # Daemon thread: a hook that never returns cannot keep the CLI from exiting
+        self._started = time.perf_counter()
+        self._thread = threading.Thread(target=self.run, daemon=True)
+        self._thread.start()
+
+    def join(self) -> None:
+        if self._thread is None:
+            return
+        if self.timeout is None:
+            self._thread.join()
+        else:
+            self._thread.join(max(0.0, self._started + self.timeout - time.perf_counter()))
+
+    @property
+    def timed_out(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def outcome(self) -> PluginHookResult:
+        if self.timed_out:
+            self.duration_ms = (time.perf_counter() - self._started) * 1000
+            message = f"Hook timed out after {self.timeout:g}s"
+        elif self.result is None:  # the thread died before producing a result
+            message = "Hook execution failed"
+        else:
+            return self.result
+        return PluginHookResult(
+            plugin_name=self.plugin.name,
+            hook_name=self.hook_name,
+            success=False,
+            message=message,
+        )
+
+
 # ============================================================================
 # PLUGIN SERVICE
 # ============================================================================
@@ -25,19 +137,30 @@ class PluginService:
     IDK: plugin-lifecycle-manager, hook-registry, hook-dispatcher
     Responsibility: Manages plugin loading, registration, hook execution, and plugin queries
     Invariants: Hooks execute in registration order, one plugin's error never blocks others,
-                disabled plugins are always skipped, all results are collected and returned
+                disabled plugins are always skipped, all results are collected and returned;
+                dispatch goes through a hook -> plugins table rebuilt only when the
+                registry changes, so plugins without the hook are never touched
     """
 
-    def __init__(self, loader: Optional[PluginLoader] = None) -> None:
+    def __init__(
+        self,
+        loader: Optional[PluginLoader] = None,
+        default_timeout: Optional[float] = None,
+    ) -> None:
         """
         Initialize PluginService.
 
         Args:
             loader: Optional PluginLoader instance (created if not provided)
+            default_timeout: Time limit in seconds for hooks of plugins whose manifest
+                sets no timeout; None means wait indefinitely
         """
         self.loader = loader or PluginLoader()
+        self.default_timeout = default_timeout
         self._plugins: List[Plugin] = []
         self._custom_hooks: Dict[str, List[Callable[..., Any]]] = {}
+        self._dispatch: Optional[Dict[str, List[Plugin]]] = None
+        self._stats: StatsTable = {}
 
     # ========================================================================
     # PLUGIN LOADING
@@ -72,6 +195,7 @@ class PluginService:
                         unmet_deps.add(plugin.name)
 
         self._plugins.extend(loaded)
+        self._dispatch = None
         return loaded
 
     def register_plugin(self, plugin: Plugin) -> None:
@@ -88,6 +212,7 @@ class PluginService:
             self._plugins = [p for p in self._plugins if p.name != plugin.name]
 
         self._plugins.append(plugin)
+        self._dispatch = None
 
     def unregister_plugin(self, plugin_name: str) -> bool:
         """
@@ -101,6 +226,7 @@ class PluginService:
         """
         original_count = len(self._plugins)
         self._plugins = [p for p in self._plugins if p.name != plugin_name]
+        self._dispatch = None
         return len(self._plugins) < original_count
 
     # ========================================================================
@@ -144,7 +270,10 @@ class PluginService:
         Execute a hook across all registered plugins and custom callbacks.
 
         Executes hooks in registration order. Errors in one plugin do not
-        prevent execution in subsequent plugins.
+        prevent execution in subsequent plugins. A plugin's hooks.py is imported
+        on the first dispatch of a hook it declares. Plugin hooks are bounded by
+        the manifest's timeout (or default_timeout); a hook still running at its
+        deadline is reported as failed and left to finish in the background.
 
         Args:
             hook_name: Name of the hook to execute
@@ -154,43 +283,193 @@ class PluginService:
         Returns:
             List of PluginHookResult from each plugin that handled the hook
         """
-        results: List[PluginHookResult] = []
+        return self._execute(hook_name, args, kwargs, concurrent=False)
 
-        # Execute plugin hooks first
-        for plugin in self._plugins:
+    def execute_hook_concurrent(
+        self,
+        hook_name: str,
+        *args: Any,
+        **kwargs: Any,
+    ) -> List[PluginHookResult]:
+        """
+        Execute a hook across all plugins at once, for hooks that are independent.
+
+        Same as execute_hook, but every plugin's implementation runs on its own
+        thread, so the call takes as long as the slowest plugin (or its timeout)
+        rather than the sum. Results are still returned in registration order.
+        Only use for hooks whose implementations do not depend on each other's
+        side effects.
+
+        Args:
+            hook_name: Name of the hook to execute
+            *args: Positional arguments to pass to hook implementations
+            **kwargs: Keyword arguments to pass to hook implementations
+
+        Returns:
+            List of PluginHookResult from each plugin that handled the hook
+        """
+        return self._execute(hook_name, args, kwargs, concurrent=True)
+
+    def _execute(
+        self,
+        hook_name: str,
+        args: Sequence[Any],
+        kwargs: Dict[str, Any],
+        concurrent: bool,
+    ) -> List[PluginHookResult]:
+        calls: List[_HookCall] = []
+        for plugin in self._dispatch_table().get(hook_name, []):
             if not plugin.enabled:
                 continue
-            if plugin.has_hook(hook_name):
-                result = plugin.execute_hook(hook_name, *args, **kwargs)
-                results.append(result)
+            plugin.ensure_hooks_loaded()
+            # Declared in the manifest but missing from hooks.py: nothing to run.
+            # A failed import disabled the plugin; execute_hook reports that once.
+            if plugin.enabled and not plugin.has_hook(hook_name):
+                continue
+            timeout = plugin.manifest.timeout or self.default_timeout
+            calls.append(_HookCall(plugin, hook_name, args, kwargs, timeout))
+
+        if concurrent:
+            for call in calls:
+                call.start()
+        for call in calls:
+            if concurrent:
+                call.join()
+            elif call.timeout is None:
+                call.run()
+            else:
+                call.start()
+                call.join()
+
+        results: List[PluginHookResult] = []
+        for call in calls:
+            result = call.outcome()
+            self._record(hook_name, call.plugin.name, call.duration_ms, result, call.timed_out)
+            results.append(result)
 
         # Execute custom (standalone) hooks
-        if hook_name in self._custom_hooks:
-            for callback in self._custom_hooks[hook_name]:
-                try:
-                    cb_result = callback(*args, **kwargs)
-                    data = cb_result if isinstance(cb_result, dict) else {}
-                    results.append(
-                        PluginHookResult(
-                            plugin_name="custom",
-                            hook_name=hook_name,
-                            success=True,
-                            message="Custom hook executed successfully",
-                            data=data,
-                        )
-                    )
-                except Exception as e:
-                    results.append(
-                        PluginHookResult(
-                            plugin_name="custom",
-                            hook_name=hook_name,
-                            success=False,
-                            message=f"Custom hook failed: {str(e)}",
-                        )
-                    )
+        for callback in self._custom_hooks.get(hook_name, []):
+            start = time.perf_counter()
+            try:
+                cb_result = callback(*args, **kwargs)
+                data = cb_result if isinstance(cb_result, dict) else {}
+                result = PluginHookResult(
+                    plugin_name="custom",
+                    hook_name=hook_name,
+                    success=True,
+                    message="Custom hook executed successfully",
+                    data=data,
+                )
+            except Exception as e:
+                result = PluginHookResult(
+                    plugin_name="custom",
+                    hook_name=hook_name,
+                    success=False,
+                    message=f"Custom hook failed: {str(e)}",
+                )
+            self._record(hook_name, "custom", (time.perf_counter() - start) * 1000, result)
+            results.append(result)
 
         return results
 
+    def _dispatch_table(self) -> Dict[str, List[Plugin]]:
+        """Hook name -> plugins implementing or declaring it, in registration order."""
+        if self._dispatch is None:
+            table: Dict[str, List[Plugin]] = {}
+            for plugin in self._plugins:
+                for hook_name in plugin.hook_names:
+                    table.setdefault(hook_name, []).append(plugin)
+            self._dispatch = table
+        return self._dispatch
+
+    # ========================================================================
+    # HOOK STATISTICS
+    # ========================================================================
+
+    def _record(
+        self,
+        hook_name: str,
+        plugin_name: str,
+        duration_ms: float,
+        result: PluginHookResult,
+        timed_out: bool = False,
+    ) -> None:
+        stats = self._stats.setdefault(hook_name, {}).setdefault(plugin_name, HookStats())
+        stats.record(duration_ms, result.success, timed_out)
+
+    def hook_stats(self) -> StatsTable:
+        """
+        Latency counters recorded since creation (or the last save_stats/reset_stats).
+
+        Returns:
+            Mapping of hook name to plugin name ("custom" for standalone hooks) to HookStats
+        """
+        return {
+            hook_name: {name: HookStats(**asdict(stats)) for name, stats in plugins.items()}
+            for hook_name, plugins in self._stats.items()
+        }
+
+    def reset_stats(self) -> None:
+        """Discard recorded hook statistics."""
+        self._stats.clear()
+
+    def save_stats(self, path: Path = DEFAULT_STATS_PATH) -> None:
+        """
+        Add recorded statistics to the counters in a JSON file, then reset them.
+
+        Counters accumulate across CLI invocations so `plugin stats` can report them.
+        Write failures are ignored; statistics are best-effort.
+
+        Args:
+            path: Statistics file (merged with its current contents)
+        """
+        if not self._stats:
+            return
+        merged = self.load_stats(path)
+        for hook_name, plugins in self._stats.items():
+            for plugin_name, stats in plugins.items():
+                merged.setdefault(hook_name, {}).setdefault(plugin_name, HookStats()).merge(stats)
+
+        payload = {
+            "schema_version": STATS_SCHEMA_VERSION,
+            "hooks": {
+                hook_name: {name: asdict(stats) for name, stats in plugins.items()}
+                for hook_name, plugins in merged.items()
+            },
+        }
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+            os.replace(tmp_path, path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+            return
+        self._stats.clear()
+
+    @staticmethod
+    def load_stats(path: Path = DEFAULT_STATS_PATH) -> StatsTable:
+        """
+        Read statistics saved by save_stats.
+
+        Args:
+            path: Statistics file
+
+        Returns:
+            Mapping of hook name to plugin name to HookStats; empty when the file is
+            missing, unreadable or from another schema version
+        """
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            if data.get("schema_version") != STATS_SCHEMA_VERSION:
+                return {}
+            return {
+                hook_name: {name: HookStats(**stats) for name, stats in plugins.items()}
+                for hook_name, plugins in data["hooks"].items()
+            }
+        except (OSError, ValueError, TypeError, KeyError, AttributeError):
+            return {}
+
     # ========================================================================
     # PLUGIN QUERIES
     # ========================================================================
@@ -277,11 +556,12 @@ class PluginService:
             hook_name: Hook type to query
 
         Returns:
-            List of plugin names that implement the hook
+            List of plugin names that implement (or, before their hooks.py is
+            imported, declare) the hook
         """
         return [
             p.name
-            for p in self._plugins
+            for p in self._dispatch_table().get(hook_name, [])
             if p.enabled and p.has_hook(hook_name)
         ]
 
@@ -289,6 +569,7 @@ class PluginService:
         """Remove all registered plugins and custom hooks."""
         self._plugins.clear()
         self._custom_hooks.clear()
+        self._dispatch = None
 
     @property
     def plugin_count(self) -> int:
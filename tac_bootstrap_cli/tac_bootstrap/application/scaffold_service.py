@@ -373,6 +373,54 @@ class ScaffoldService:
             template="shared/base_repository_async.py.j2",
             reason="Base repository (asynchronous)",
         )
+        plan.add_file(
+            "src/shared/infrastructure/pagination.py",
+            action=action,
+            template="shared/pagination.py.j2",
+            reason="Keyset pagination cursors",
+        )
+        plan.add_file(
+            "src/shared/infrastructure/counting.py",
+            action=action,
+            template="shared/counting.py.j2",
+            reason="Count strategies for paginated lists",
+        )
+        plan.add_file(
+            "src/shared/infrastructure/bulk.py",
+            action=action,
+            template="shared/bulk.py.j2",
+            reason="Bulk insert, update and upsert statements",
+        )
+        plan.add_file(
+            "src/shared/infrastructure/entity_cache.py",
+            action=action,
+            template="shared/entity_cache.py.j2",
+            reason="Read-through entity cache",
+        )
+        plan.add_file(
+            "src/shared/infrastructure/export.py",
+            action=action,
+            template="shared/export.py.j2",
+            reason="Column projections and streaming export",
+        )
+        plan.add_file(
+            "src/shared/infrastructure/serialization.py",
+            action=action,
+            template="shared/serialization.py.j2",
+            reason="Batch response validation and fast JSON responses",
+        )
+        plan.add_file(
+            "src/shared/infrastructure/search.py",
+            action=action,
+            template="shared/search.py.j2",
+            reason="Full-text search indexes, ranking and keyset pagination",
+        )
+        plan.add_file(
+            "src/shared/infrastructure/db_metrics.py",
+            action=action,
+            template="shared/db_metrics.py.j2",
+            reason="Query latency, slow-query, pool and N+1 metrics",
+        )
         plan.add_file(
             "src/shared/infrastructure/database.py",
             action=action,
@@ -406,6 +454,15 @@ class ScaffoldService:
             reason="Health check endpoint",
         )
 
+        # Add benchmark for the fast list-endpoint path
+        plan.add_file(
+            f"{config.paths.scripts_dir}/bench_list_endpoint.py",
+            action=action,
+            template="scripts/bench_list_endpoint.py.j2",
+            reason="List endpoint serialization benchmark",
+            executable=True,
+        )
+
     def _add_claude_files(self, plan: ScaffoldPlan, config: TACConfig, existing_repo: bool) -> None:
         """Add .claude/ configuration files.
 
@@ -1922,6 +1979,43 @@ class ScaffoldService:
             executable=True,
         )
 
+    def stamp_metadata(self, config: TACConfig) -> None:
+        """Set config.metadata for the generation about to be rendered.
+
+        Initial generation records generated_at; an upgrade (metadata already
+        present) keeps the original generated_at and records last_upgrade.
+
+        Args:
+            config: Configuration to update in place
+        """
+        from datetime import datetime, timezone
+
+        try:
+            from tac_bootstrap import __version__
+        except ImportError:
+            __version__ = "unknown"
+
+        from tac_bootstrap.domain.models import BootstrapMetadata
+
+        # Handle metadata for initial generation vs upgrade
+        if config.metadata is not None:
+            # This is an upgrade - preserve original generated_at and update last_upgrade
+            original_generated_at = config.metadata.generated_at
+            config.metadata = BootstrapMetadata(
+                generated_at=original_generated_at,
+                generated_by=f"tac-bootstrap v{__version__}",
+                schema_version=2,
+                last_upgrade=datetime.now(timezone.utc).isoformat(),
+            )
+        else:
+            # This is initial generation
+            config.metadata = BootstrapMetadata(
+                generated_at=datetime.now(timezone.utc).isoformat(),
+                generated_by=f"tac-bootstrap v{__version__}",
+                schema_version=2,
+                last_upgrade=None,  # Not set on initial generation, only on upgrade
+            )
+
     def apply_plan(
         self,
         plan: ScaffoldPlan,
@@ -1941,7 +2035,6 @@ class ScaffoldService:
             ApplyResult with statistics and any errors
         """
         import time
-        from datetime import datetime, timezone
 
         from rich.console import Console
 
@@ -1963,31 +2056,7 @@ class ScaffoldService:
 
         # Register bootstrap metadata before rendering templates
         # This enables audit trail for when/how the project was generated
-        try:
-            from tac_bootstrap import __version__
-        except ImportError:
-            __version__ = "unknown"
-
-        from tac_bootstrap.domain.models import BootstrapMetadata
-
-        # Handle metadata for initial generation vs upgrade
-        if config.metadata is not None:
-            # This is an upgrade - preserve original generated_at and update last_upgrade
-            original_generated_at = config.metadata.generated_at
-            config.metadata = BootstrapMetadata(
-                generated_at=original_generated_at,
-                generated_by=f"tac-bootstrap v{__version__}",
-                schema_version=2,
-                last_upgrade=datetime.now(timezone.utc).isoformat(),
-            )
-        else:
-            # This is initial generation
-            config.metadata = BootstrapMetadata(
-                generated_at=datetime.now(timezone.utc).isoformat(),
-                generated_by=f"tac-bootstrap v{__version__}",
-                schema_version=2,
-                last_upgrade=None,  # Not set on initial generation, only on upgrade
-            )
+        self.stamp_metadata(config)
 
         result = ApplyResult()
         fs = FileSystem()
@@ -14,11 +14,12 @@ Example usage:
     results = service.search_features(query="performance", tier="critical")
 """
 
-import re
 from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
+from tac_bootstrap.infrastructure.search_index import IndexDocument, SearchIndex
+
 
 class SearchResult(BaseModel):
     """A single search result entry."""
@@ -277,88 +278,64 @@ class SearchService:
     """
     IDK: search-core, full-text-search, metadata-filter, result-ranking
     Responsibility: Searches across commands, templates, and features with filtering and ranking
-    Invariants: Case-insensitive, returns results sorted by relevance, supports multiple filters
+    Invariants: Case-insensitive, returns results sorted by relevance, supports multiple filters,
+                catalogs are tokenized once into a SearchIndex when the service is created
     """
 
+    FIELD_WEIGHTS = {"name": 3.0, "tags": 2.0, "description": 1.0}
+
     def __init__(self) -> None:
         """Initialize search service with built-in catalogs."""
         self._commands = COMMAND_CATALOG
         self._templates = TEMPLATE_CATALOG
         self._features = FEATURE_CATALOG
         self._all_items = self._commands + self._templates + self._features
+        self._index = SearchIndex(field_weights=self.FIELD_WEIGHTS)
+        for position, item in enumerate(self._all_items):
+            self._index.add(str(position), self._index_document(item))
+
+    @staticmethod
+    def _index_document(item: Dict[str, Any]) -> IndexDocument:
+        """Index name, description and tags; category, tags and metadata become facets."""
+        facets: Dict[str, List[Any]] = {
+            "category": [item.get("category", "unknown")],
+            "tag": item.get("tags", []),
+        }
+        for key, value in item.get("metadata", {}).items():
+            facets.setdefault(key, [value])
+        return IndexDocument(
+            fields={
+                "name": item.get("name", "").replace("_", " "),
+                "description": item.get("description", ""),
+                "tags": item.get("tags", []),
+            },
+            facets=facets,
+        )
 
-    def _compute_relevance(self, item: Dict[str, Any], query: str) -> float:
-        """Compute relevance score for an item against a query.
+    def _facet_filters(self, **filters: Optional[str]) -> Dict[str, List[str]]:
+        """Translate filter arguments into facet filters.
 
-        Args:
-            item: Catalog item
-            query: Search query
-
-        Returns:
-            Relevance score between 0 and 1
-        """
-        if not query:
-            return 0.5  # Default score when no query
-
-        query_lower = query.lower()
-        score = 0.0
-
-        # Name match (highest weight)
-        name = item.get("name", "").lower()
-        if query_lower == name:
-            score += 1.0
-        elif query_lower in name:
-            score += 0.8
-        elif any(q in name for q in query_lower.split()):
-            score += 0.6
-
-        # Description match
-        desc = item.get("description", "").lower()
-        if query_lower in desc:
-            score += 0.4
-        elif any(q in desc for q in query_lower.split()):
-            score += 0.2
-
-        # Tag match
-        tags = [t.lower() for t in item.get("tags", [])]
-        for tag in tags:
-            if query_lower == tag:
-                score += 0.6
-            elif query_lower in tag:
-                score += 0.3
-
-        # Normalize to 0-1
-        return min(score, 1.0)
-
-    def _matches_filters(self, item: Dict[str, Any], **filters: Optional[str]) -> bool:
-        """Check if item matches all provided filters.
+        Tag filters match any tag containing the value; every other filter is an
+        exact, case-insensitive match on the category or a metadata key.
 
         Args:
-            item: Catalog item
             **filters: Key-value filter pairs
 
         Returns:
-            True if item matches all filters
+            Facet name to accepted values
         """
-        metadata = item.get("metadata", {})
-        tags = [t.lower() for t in item.get("tags", [])]
-
+        facet_filters: Dict[str, List[str]] = {}
         for key, value in filters.items():
             if value is None:
                 continue
             value_lower = value.lower()
-
             if key == "tag":
-                if not any(value_lower in t for t in tags):
-                    return False
-            elif key == "category":
-                if item.get("category", "").lower() != value_lower:
-                    return False
-            elif key in metadata:
-                if str(metadata[key]).lower() != value_lower:
-                    return False
-
-        return True
+                facet_filters["tag"] = [
+                    tag for tag in self._index.facet_values("tag") if value_lower in tag
+                ]
+            else:
+                facet_filters[key] = [value_lower]
+        return facet_filters
 
     def search(
         self,
@@ -370,6 +347,9 @@ class SearchService:
     ) -> SearchResults:
         """Search across all catalogs with optional filters.
 
+        Results are ranked with BM25 over name, tags and description; the best
+        match has a relevance of 1.0 and the others are scaled relative to it.
+
         Args:
             query: Search query string
             category: Filter by category (command, template, feature, workflow)
@@ -383,30 +363,25 @@ class SearchService:
         all_filters = {"category": category, "tag": tag, **filters}
         applied_filters = {k: v for k, v in all_filters.items() if v is not None}
 
-        results: List[SearchResult] = []
-
-        for item in self._all_items:
-            if not self._matches_filters(item, **all_filters):
-                continue
+        hits = self._index.search(query, self._facet_filters(**all_filters))
+        if not query.strip():
+            hits.sort(key=lambda hit: int(hit[0]))
+        top_score = hits[0][1] if hits and hits[0][1] > 0 else 0.0
 
-            relevance = self._compute_relevance(item, query) if query else 0.5
-
-            if relevance > 0 or not query:
-                results.append(
-                    SearchResult(
-                        name=item["name"],
-                        category=item.get("category", "unknown"),
-                        description=item.get("description", ""),
-                        tags=item.get("tags", []),
-                        relevance_score=relevance,
-                        metadata=item.get("metadata", {}),
-                        path=item.get("path"),
-                    )
+        results: List[SearchResult] = []
+        for doc_id, score in hits[:limit]:
+            item = self._all_items[int(doc_id)]
+            results.append(
+                SearchResult(
+                    name=item["name"],
+                    category=item.get("category", "unknown"),
+                    description=item.get("description", ""),
+                    tags=item.get("tags", []),
+                    relevance_score=round(score / top_score, 3) if top_score else 0.5,
+                    metadata=item.get("metadata", {}),
+                    path=item.get("path"),
                 )
-
-        # Sort by relevance
-        results.sort(key=lambda r: r.relevance_score, reverse=True)
-        results = results[:limit]
+            )
 
         return SearchResults(
             query=query,
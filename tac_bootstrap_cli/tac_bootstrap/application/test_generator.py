@@ -6,8 +6,10 @@ Invariants: Generated tests use appropriate framework per language (pytest for P
             jest for JS/TS), output is valid code, files are not overwritten without force
 """
 
+import ast
+import json
 from pathlib import Path
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 # ============================================================================
 # TEST TEMPLATES
@@ -287,117 +289,684 @@ class TestUserWorkflow:
 '''
 
 
-def _load_test_template(project_name: str) -> str:
-    """Generate a load test template using Locust."""
-    return f'''"""Load tests for {project_name} using Locust.
+_ROUTE_SCAN_SKIP_DIRS = {".venv", "venv", "node_modules", "tests", ".git", "build", "dist"}
+
+
+def _router_prefix(tree: ast.Module) -> str:
+    """Return the prefix of the module's `router = APIRouter(prefix=...)`, or ""."""
+    for node in tree.body:
+        if not (isinstance(node, ast.Assign) and isinstance(node.value, ast.Call)):
+            continue
+        func = node.value.func
+        name = func.id if isinstance(func, ast.Name) else getattr(func, "attr", "")
+        if name != "APIRouter":
+            continue
+        for keyword in node.value.keywords:
+            if keyword.arg == "prefix" and isinstance(keyword.value, ast.Constant):
+                return str(keyword.value.value)
+    return ""
+
+
+def _call_name(node: ast.AST) -> str:
+    """Name of the called function for `Query(...)` / `fastapi.Query(...)` nodes."""
+    if not isinstance(node, ast.Call):
+        return ""
+    func = node.func
+    return func.id if isinstance(func, ast.Name) else getattr(func, "attr", "")
+
+
+def _scenario_from_route(
+    func: Union[ast.FunctionDef, ast.AsyncFunctionDef], path: str
+) -> Optional[Dict[str, Any]]:
+    """Build a load scenario for a GET route, or None when it needs path parameters."""
+    if "{" in path or path.rstrip("/").endswith("/export"):
+        return None
+
+    args = func.args.args + func.args.kwonlyargs
+    defaults: List[Optional[ast.expr]] = [None] * (
+        len(func.args.args) - len(func.args.defaults)
+    ) + list(func.args.defaults)
+    defaults += list(func.args.kw_defaults)
+
+    query: Dict[str, Any] = {}
+    authorized = False
+    for arg, default in zip(args, defaults):
+        call = default if isinstance(default, ast.Call) else None
+        kind = _call_name(call) if call is not None else ""
+        if call is not None and kind == "Depends":
+            dependency = call.args[0] if call.args else None
+            authorized = authorized or getattr(dependency, "id", "") == "get_current_user"
+            continue
+        required = default is None or (
+            call is not None
+            and kind == "Query"
+            and bool(call.args)
+            and isinstance(call.args[0], ast.Constant)
+            and call.args[0].value is Ellipsis
+        )
+        if required and arg.arg not in ("self", "request"):
+            numeric = isinstance(arg.annotation, ast.Name) and arg.annotation.id in ("int", "float")
+            query[arg.arg] = "1" if numeric else "test"
+
+    return {
+        "name": func.name,
+        "method": "GET",
+        "path": path,
+        "query": query,
+        "weight": 3 if func.name.startswith("list_") else 1,
+        "authorized": authorized,
+    }
+
+
+def discover_load_scenarios(project_path: Path) -> List[Dict[str, Any]]:
+    """
+    Discover load-test scenarios from the generated entity routes of a project.
+
+    Parses every `*_routes.py` (without importing it) and turns each GET route
+    that needs no path parameters into a scenario. Required query parameters get
+    placeholder values; list endpoints are weighted higher than the rest. The
+    health endpoint is always included.
+
+    Args:
+        project_path: Project root path
+
+    Returns:
+        List of scenario dicts (name, method, path, query, weight, authorized)
+    """
+    scenarios: List[Dict[str, Any]] = [
+        {
+            "name": "health",
+            "method": "GET",
+            "path": "/health",
+            "query": {},
+            "weight": 1,
+            "authorized": False,
+        }
+    ]
+    for routes_file in sorted(project_path.rglob("*_routes.py")):
+        relative_parts = routes_file.relative_to(project_path).parts
+        if any(part in _ROUTE_SCAN_SKIP_DIRS for part in relative_parts):
+            continue
+        try:
+            tree = ast.parse(routes_file.read_text(encoding="utf-8"))
+        except (OSError, SyntaxError, UnicodeDecodeError):
+            continue
+
+        prefix = _router_prefix(tree)
+        for node in tree.body:
+            if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                continue
+            for decorator in node.decorator_list:
+                if not (
+                    isinstance(decorator, ast.Call)
+                    and isinstance(decorator.func, ast.Attribute)
+                    and decorator.func.attr == "get"
+                    and decorator.args
+                    and isinstance(decorator.args[0], ast.Constant)
+                    and isinstance(decorator.args[0].value, str)
+                ):
+                    continue
+                scenario = _scenario_from_route(node, prefix + decorator.args[0].value)
+                if scenario is not None:
+                    scenarios.append(scenario)
+    return scenarios
+
+
+def _format_scenarios(scenarios: List[Dict[str, Any]]) -> str:
+    """Render scenarios as a Python list literal (JSON scalars, Python booleans)."""
+    lines = ["SCENARIOS = ["]
+    for scenario in scenarios:
+        query = ", ".join(
+            f"{json.dumps(key)}: {json.dumps(value)}" for key, value in scenario["query"].items()
+        )
+        lines += [
+            "    {",
+            f'        "name": {json.dumps(scenario["name"])},',
+            f'        "method": {json.dumps(scenario["method"])},',
+            f'        "path": {json.dumps(scenario["path"])},',
+            f'        "query": {{{query}}},',
+            f'        "weight": {scenario["weight"]},',
+            f'        "authorized": {scenario["authorized"]},',
+            "    },",
+        ]
+    lines.append("]")
+    return "\n".join(lines)
+
+
+def _load_test_template(
+    project_name: str, scenarios: Optional[List[Dict[str, Any]]] = None
+) -> str:
+    """Generate an asyncio load-testing harness (open/closed loop, HDR-style histograms)."""
+    if scenarios is None:
+        scenarios = [
+            {
+                "name": "health",
+                "method": "GET",
+                "path": "/health",
+                "query": {},
+                "weight": 1,
+                "authorized": False,
+            }
+        ]
+    header = f'''"""Load tests for {project_name}: asyncio load generator with latency histograms.
+
+Scenarios below were discovered from the generated entity routes (GET routes
+without path parameters). Regenerate them with
+`tac-bootstrap test-generate load --force` or edit SCENARIOS by hand.
+
+Modes:
+  closed  --concurrency workers send requests back to back; measures capacity.
+  open    requests start at a constant --rate whether or not earlier ones
+          finished; latency is measured from the scheduled start time, so
+          queueing delay is included (no coordinated omission).
 
 Usage:
-    pip install locust
-    locust -f tests/load/test_load.py --host=http://localhost:8000
+  python tests/load/test_load.py                                   # closed loop, 30s
+  python tests/load/test_load.py --mode open --rate 200 --duration 60
+  python tests/load/test_load.py --start "uv run uvicorn src.main:app --port 8000"
+  python tests/load/test_load.py --output current.json --compare baseline.json
+
+Results are printed per scenario (throughput, p50/p95/p99/p99.9, max) and, with
+--output, written as JSON. --compare exits 1 when p99 latency, throughput or
+error rate regress by more than --max-regression percent against a previous run.
 """
 
-# Uncomment when Locust is installed:
-# from locust import HttpUser, between, task
-
-
-# class WebsiteUser(HttpUser):
-#     """Simulated user for load testing."""
-#
-#     wait_time = between(1, 5)
-#
-#     @task(3)
-#     def health_check(self):
-#         """Test health endpoint under load."""
-#         self.client.get("/api/v1/health")
-#
-#     @task(2)
-#     def list_resources(self):
-#         """Test listing resources under load."""
-#         self.client.get("/api/v1/resources")
-#
-#     @task(1)
-#     def create_resource(self):
-#         """Test creating resources under load."""
-#         self.client.post(
-#             "/api/v1/resources",
-#             json={{"name": "load-test-item", "value": 42}},
-#         )
-
-
-# Simple standalone load test (no Locust dependency)
+{_format_scenarios(scenarios)}
+
+PROJECT = {json.dumps(project_name)}
+'''
+    return header + _LOAD_TEST_HARNESS
+
+
+_LOAD_TEST_HARNESS = '''
+import argparse
+import asyncio
+import json
+import math
+import random
+import shlex
+import ssl
+import subprocess
+import sys
 import time
-from typing import Dict, List
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+from urllib.parse import urlencode, urlsplit
+
+
+# ============================================================================
+# LATENCY HISTOGRAM
+# ============================================================================
+
 
+class LatencyHistogram:
+    """Latency counts bucketed to 3 significant digits (HdrHistogram-style).
 
-def run_simple_load_test(
-    base_url: str = "http://localhost:8000",
-    num_requests: int = 100,
-    concurrent: int = 10,
-) -> Dict[str, float]:
+    Memory is bounded by the number of distinct buckets (a few thousand for
+    microsecond-to-minute latencies), not by the number of requests, and every
+    reported percentile is within 0.1% of the recorded value.
     """
-    Run a simple load test without external dependencies.
 
-    Args:
-        base_url: Target URL
-        num_requests: Total number of requests
-        concurrent: Number of concurrent requests
+    SIGNIFICANT_DIGITS = 3
+
+    def __init__(self) -> None:
+        self.counts: Counter = Counter()
+        self.total = 0
+        self.sum_us = 0
+        self.max_us = 0
+
+    def bucket(self, micros: int) -> int:
+        """Round micros up to its bucket's highest value (123456 -> 123500)."""
+        scale = 10 ** max(0, len(str(micros)) - self.SIGNIFICANT_DIGITS)
+        return -(-micros // scale) * scale
+
+    def record(self, seconds: float) -> None:
+        micros = max(1, int(seconds * 1_000_000))
+        self.counts[self.bucket(micros)] += 1
+        self.total += 1
+        self.sum_us += micros
+        self.max_us = max(self.max_us, micros)
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        self.counts.update(other.counts)
+        self.total += other.total
+        self.sum_us += other.sum_us
+        self.max_us = max(self.max_us, other.max_us)
+
+    def percentile(self, percent: float) -> float:
+        """Latency in milliseconds below which percent of requests completed."""
+        if not self.total:
+            return 0.0
+        rank = max(1, math.ceil(round(percent * self.total / 100, 6)))
+        seen = 0
+        for value in sorted(self.counts):
+            seen += self.counts[value]
+            if seen >= rank:
+                return min(value, self.max_us) / 1000
+        return self.max_us / 1000
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "mean": round(self.sum_us / self.total / 1000, 3) if self.total else 0.0,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "p99_9": self.percentile(99.9),
+            "max": self.max_us / 1000,
+        }
+
+
+class ScenarioStats:
+    """Counters for one scenario: successful latencies, status codes, errors."""
+
+    def __init__(self) -> None:
+        self.histogram = LatencyHistogram()
+        self.status_codes: Counter = Counter()
+        self.errors: Counter = Counter()
+
+    @property
+    def requests(self) -> int:
+        return sum(self.status_codes.values()) + sum(self.errors.values())
+
+    @property
+    def failed(self) -> int:
+        return sum(self.errors.values()) + sum(
+            count for status, count in self.status_codes.items() if status >= 400
+        )
 
-    Returns:
-        Dict with test results (avg_time, min_time, max_time, errors)
+
+# ============================================================================
+# HTTP/1.1 KEEP-ALIVE CLIENT
+# ============================================================================
+
+
+class Connection:
+    """One persistent HTTP/1.1 connection (stdlib asyncio streams only)."""
+
+    def __init__(self, host: str, port: int, use_ssl: bool, timeout: float) -> None:
+        self.host = host
+        self.port = port
+        self.ssl = ssl.create_default_context() if use_ssl else None
+        self.timeout = timeout
+        self.reader: Optional[asyncio.StreamReader] = None
+        self.writer: Optional[asyncio.StreamWriter] = None
+
+    async def close(self) -> None:
+        if self.writer is not None:
+            self.writer.close()
+            try:
+                await self.writer.wait_closed()
+            except (ConnectionError, OSError):
+                pass
+        self.reader = self.writer = None
+
+    async def request(self, head: bytes) -> int:
+        """Send a request and read the full response; returns the status code."""
+        reused = self.writer is not None
+        try:
+            return await asyncio.wait_for(self._exchange(head), self.timeout)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            await self.close()
+            if not reused:
+                raise
+        # The server closed an idle keep-alive connection: retry once on a new one
+        return await asyncio.wait_for(self._exchange(head), self.timeout)
+
+    async def _exchange(self, head: bytes) -> int:
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(
+                self.host, self.port, ssl=self.ssl
+            )
+        reader = self.reader
+        self.writer.write(head)
+        await self.writer.drain()
+
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionResetError("connection closed before response")
+        status = int(status_line.split()[1])
+
+        length = 0
+        chunked = False
+        keep_alive = True
+        while True:
+            line = await reader.readline()
+            if line in (b"\\r\\n", b"\\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            name = name.strip().lower()
+            value = value.strip().lower()
+            if name == "content-length":
+                length = int(value)
+            elif name == "transfer-encoding":
+                chunked = "chunked" in value
+            elif name == "connection":
+                keep_alive = value != "close"
+
+        if chunked:
+            while True:
+                size = int((await reader.readline()).split(b";")[0], 16)
+                await reader.readexactly(size + 2)
+                if size == 0:
+                    break
+        elif length:
+            await reader.readexactly(length)
+
+        if not keep_alive:
+            await self.close()
+        return status
+
+
+class Client:
+    """Fixed-size pool of keep-alive connections to one host."""
+
+    def __init__(self, base_url: str, connections: int, headers: List[str], timeout: float):
+        parts = urlsplit(base_url)
+        use_ssl = parts.scheme == "https"
+        self.host = parts.hostname or "127.0.0.1"
+        self.port = parts.port or (443 if use_ssl else 80)
+        self.base_path = parts.path.rstrip("/")
+        self.host_header = parts.netloc
+        self.extra_headers = "".join(f"{header}\\r\\n" for header in headers)
+        self.pool: asyncio.Queue = asyncio.Queue()
+        for _ in range(connections):
+            self.pool.put_nowait(Connection(self.host, self.port, use_ssl, timeout))
+
+    def build_request(self, scenario: dict, base_path: str) -> bytes:
+        target = self.base_path + base_path + scenario["path"]
+        if scenario.get("query"):
+            target += "?" + urlencode(scenario["query"])
+        return (
+            f"{scenario['method']} {target} HTTP/1.1\\r\\n"
+            f"Host: {self.host_header}\\r\\n"
+            "User-Agent: load-test/1.0\\r\\n"
+            "Accept: */*\\r\\n"
+            f"{self.extra_headers}"
+            "\\r\\n"
+        ).encode("latin-1")
+
+    async def send(self, head: bytes) -> int:
+        connection = await self.pool.get()
+        try:
+            return await connection.request(head)
+        except BaseException:
+            await connection.close()
+            raise
+        finally:
+            self.pool.put_nowait(connection)
+
+    async def close(self) -> None:
+        while not self.pool.empty():
+            await self.pool.get_nowait().close()
+
+
+# ============================================================================
+# LOAD GENERATION
+# ============================================================================
+
+
+class Run:
+    """One load run: scenario selection, request execution and statistics."""
+
+    def __init__(self, client: Client, scenarios: List[dict], base_path: str, seed: int):
+        self.client = client
+        self.scenarios = scenarios
+        self.requests = [client.build_request(scenario, base_path) for scenario in scenarios]
+        self.weights = [scenario.get("weight", 1) for scenario in scenarios]
+        self.random = random.Random(seed)
+        self.stats = {scenario["name"]: ScenarioStats() for scenario in scenarios}
+        self.finished_at = 0.0
+
+    def pick(self) -> int:
+        return self.random.choices(range(len(self.scenarios)), self.weights)[0]
+
+    async def execute(self, index: int, started: float) -> None:
+        """Send one request; latency is measured from started (intended start time)."""
+        stats = self.stats[self.scenarios[index]["name"]]
+        try:
+            status = await self.client.send(self.requests[index])
+        except asyncio.TimeoutError:
+            stats.errors["timeout"] += 1
+        except (OSError, ValueError, IndexError, asyncio.IncompleteReadError) as exc:
+            stats.errors[type(exc).__name__] += 1
+        else:
+            stats.status_codes[status] += 1
+            if status < 400:
+                stats.histogram.record(time.perf_counter() - started)
+        self.finished_at = time.perf_counter()
+
+    async def closed_loop(self, concurrency: int, duration: float) -> None:
+        deadline = time.perf_counter() + duration
+
+        async def worker() -> None:
+            while time.perf_counter() < deadline:
+                await self.execute(self.pick(), time.perf_counter())
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+    async def open_loop(self, rate: float, duration: float) -> None:
+        interval = 1.0 / rate
+        start = time.perf_counter()
+        in_flight: set = set()
+        sent = 0
+        while sent * interval < duration:
+            scheduled = start + sent * interval
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            # Fire even when behind schedule: late starts count as latency
+            task = asyncio.ensure_future(self.execute(self.pick(), scheduled))
+            in_flight.add(task)
+            task.add_done_callback(in_flight.discard)
+            sent += 1
+        if in_flight:
+            await asyncio.gather(*in_flight)
+
+
+def build_report(run: Run, args: argparse.Namespace, started: float, wall_start: str) -> dict:
+    """Summarize a run as a JSON-serializable document."""
+    elapsed = max(run.finished_at - started, 1e-9)
+    total = LatencyHistogram()
+    scenarios = {}
+    for scenario in run.scenarios:
+        stats = run.stats[scenario["name"]]
+        total.merge(stats.histogram)
+        scenarios[scenario["name"]] = {
+            "method": scenario["method"],
+            "path": scenario["path"],
+            "requests": stats.requests,
+            "failed": stats.failed,
+            "status_codes": {str(code): n for code, n in sorted(stats.status_codes.items())},
+            "errors": dict(stats.errors),
+            "throughput_rps": round(stats.requests / elapsed, 2),
+            "latency_ms": stats.histogram.summary(),
+        }
+    requests = sum(entry["requests"] for entry in scenarios.values())
+    failed = sum(entry["failed"] for entry in scenarios.values())
+    return {
+        "schema_version": 1,
+        "project": PROJECT,
+        "started_at": wall_start,
+        "config": {
+            "base_url": args.base_url,
+            "base_path": args.base_path,
+            "mode": args.mode,
+            "duration_s": args.duration,
+            "concurrency": args.concurrency,
+            "rate": args.rate if args.mode == "open" else None,
+        },
+        "elapsed_s": round(elapsed, 3),
+        "total": {
+            "requests": requests,
+            "failed": failed,
+            "throughput_rps": round(requests / elapsed, 2),
+            "latency_ms": total.summary(),
+        },
+        "scenarios": scenarios,
+    }
+
+
+def print_report(report: dict) -> None:
+    print(
+        f"{'scenario':<28} {'reqs':>8} {'fail':>6} {'rps':>9} {'p50':>8} {'p95':>8} "
+        f"{'p99':>8} {'p99.9':>8} {'max':>8}"
+    )
+    rows = list(report["scenarios"].items()) + [("TOTAL", report["total"])]
+    for name, entry in rows:
+        latency = entry["latency_ms"]
+        print(
+            f"{name:<28} {entry['requests']:>8} {entry['failed']:>6} "
+            f"{entry['throughput_rps']:>9.1f} {latency['p50']:>8.2f} {latency['p95']:>8.2f} "
+            f"{latency['p99']:>8.2f} {latency['p99_9']:>8.2f} {latency['max']:>8.2f}"
+        )
+    print("(latencies in ms, successful requests only)")
+
+
+def compare_reports(baseline: dict, current: dict, max_regression: float) -> List[str]:
+    """Return one message per scenario metric that regressed past max_regression percent.
+
+    Throughput is only compared between closed-loop runs; in open-loop mode it
+    is set by --rate rather than measured capacity.
     """
-    import urllib.request
-    import urllib.error
-    import concurrent.futures
+    regressions = []
+    limit = max_regression / 100
+    closed = baseline["config"]["mode"] == current["config"]["mode"] == "closed"
+    entries = dict(current["scenarios"], TOTAL=current["total"])
+    base_entries = dict(baseline["scenarios"], TOTAL=baseline["total"])
+    for name, entry in entries.items():
+        base = base_entries.get(name)
+        if not base or not base["requests"] or not entry["requests"]:
+            continue
+        base_p99 = base["latency_ms"]["p99"]
+        p99 = entry["latency_ms"]["p99"]
+        if base_p99 and p99 > base_p99 * (1 + limit):
+            regressions.append(f"{name}: p99 {base_p99:.2f}ms -> {p99:.2f}ms")
+        base_rps = base["throughput_rps"]
+        rps = entry["throughput_rps"]
+        if closed and base_rps and rps < base_rps * (1 - limit):
+            regressions.append(f"{name}: throughput {base_rps:.1f} -> {rps:.1f} req/s")
+        base_errors = base["failed"] / base["requests"]
+        errors = entry["failed"] / entry["requests"]
+        if errors > base_errors + limit:
+            regressions.append(f"{name}: error rate {base_errors:.1%} -> {errors:.1%}")
+    return regressions
 
-    results: List[float] = []
-    errors = 0
 
-    def make_request(url: str) -> float:
-        start = time.time()
+# ============================================================================
+# LOCAL APP AND ENTRY POINT
+# ============================================================================
+
+
+async def wait_until_ready(client: Client, path: str, timeout: float) -> bool:
+    """Poll path until the app answers with any HTTP response."""
+    head = client.build_request({"method": "GET", "path": path}, "")
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
         try:
-            req = urllib.request.Request(url)
-            with urllib.request.urlopen(req, timeout=10) as response:
-                response.read()
-            return time.time() - start
-        except Exception:
-            return -1.0
-
-    url = f"{{base_url}}/api/v1/health"
-
-    with concurrent.futures.ThreadPoolExecutor(max_workers=concurrent) as executor:
-        futures = [executor.submit(make_request, url) for _ in range(num_requests)]
-        for future in concurrent.futures.as_completed(futures):
-            result = future.result()
-            if result < 0:
-                errors += 1
-            else:
-                results.append(result)
-
-    if results:
-        return {{
-            "avg_time": sum(results) / len(results),
-            "min_time": min(results),
-            "max_time": max(results),
-            "total_requests": num_requests,
-            "successful": len(results),
-            "errors": errors,
-            "requests_per_second": len(results) / sum(results) if sum(results) > 0 else 0,
-        }}
-    return {{
-        "avg_time": 0,
-        "min_time": 0,
-        "max_time": 0,
-        "total_requests": num_requests,
-        "successful": 0,
-        "errors": errors,
-        "requests_per_second": 0,
-    }}
+            await client.send(head)
+            return True
+        except (OSError, ValueError, IndexError, asyncio.TimeoutError, asyncio.IncompleteReadError):
+            await asyncio.sleep(0.2)
+    return False
+
+
+async def run(args: argparse.Namespace) -> int:
+    scenarios = [s for s in SCENARIOS if not args.scenario or s["name"] in args.scenario]
+    if not scenarios:
+        print("No scenarios selected", file=sys.stderr)
+        return 2
+    if any(s.get("authorized") for s in scenarios) and not any(
+        h.lower().startswith("authorization:") for h in args.header
+    ):
+        print("warning: authorized scenarios without --header 'Authorization: Bearer ...'")
+
+    client = Client(args.base_url, args.connections or args.concurrency, args.header, args.timeout)
+    try:
+        if not await wait_until_ready(client, args.base_path + args.ready_path, args.ready_timeout):
+            print(f"App at {args.base_url} is not responding", file=sys.stderr)
+            return 2
+
+        if args.warmup > 0:
+            warmup = Run(client, scenarios, args.base_path, args.seed)
+            await warmup.closed_loop(args.concurrency, args.warmup)
+
+        load = Run(client, scenarios, args.base_path, args.seed)
+        wall_start = datetime.now(timezone.utc).isoformat()
+        started = time.perf_counter()
+        if args.mode == "open":
+            await load.open_loop(args.rate, args.duration)
+        else:
+            await load.closed_loop(args.concurrency, args.duration)
+    finally:
+        await client.close()
+
+    report = build_report(load, args, started, wall_start)
+    print_report(report)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2, sort_keys=True)
+        print(f"Results written to {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as handle:
+            regressions = compare_reports(json.load(handle), report, args.max_regression)
+        if regressions:
+            print(f"Regressions against {args.compare} (> {args.max_regression}%):")
+            for message in regressions:
+                print(f"  {message}")
+            return 1
+        print(f"No regressions against {args.compare}")
+    return 0
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=f"Load test {PROJECT}")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--base-path", default="", help="prefix for every path, e.g. /api/v1")
+    parser.add_argument("--mode", choices=("closed", "open"), default="closed")
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds of measured load")
+    parser.add_argument("--warmup", type=float, default=3.0, help="unmeasured seconds first")
+    parser.add_argument("--concurrency", type=int, default=10, help="closed-loop workers")
+    parser.add_argument("--rate", type=float, default=100.0, help="open-loop requests/second")
+    parser.add_argument(
+        "--connections", type=int, default=0, help="pool size (default: concurrency)"
+    )
+    parser.add_argument("--timeout", type=float, default=10.0, help="per-request timeout (s)")
+    parser.add_argument("--header", action="append", default=[], help="'Name: value', repeatable")
+    parser.add_argument("--scenario", action="append", default=[], help="run only these names")
+    parser.add_argument("--seed", type=int, default=1, help="scenario mix random seed")
+    parser.add_argument("--output", help="write JSON results to this file")
+    parser.add_argument("--compare", help="baseline JSON results to compare against")
+    parser.add_argument("--max-regression", type=float, default=10.0, help="allowed change (%%)")
+    parser.add_argument("--start", help="command that starts the app locally for the run")
+    parser.add_argument("--ready-path", default="/health", help="path polled until the app is up")
+    parser.add_argument("--ready-timeout", type=float, default=30.0)
+    args = parser.parse_args(argv)
+    if args.mode == "open" and args.rate <= 0:
+        parser.error("--rate must be positive")
+    if args.mode == "open" and not args.connections:
+        # Enough connections that the pool is not the bottleneck at the target rate
+        args.connections = max(args.concurrency, int(args.rate))
+    return args
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    app = subprocess.Popen(shlex.split(args.start)) if args.start else None
+    try:
+        return asyncio.run(run(args))
+    finally:
+        if app is not None:
+            app.terminate()
+            try:
+                app.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                app.kill()
 
 
 if __name__ == "__main__":
-    print(f"Running load test for {project_name}...")
-    results = run_simple_load_test()
-    print(f"Results: {{results}}")
+    sys.exit(main())
 '''
 
 
@@ -634,7 +1203,11 @@ class TestGenerator:
         force: bool = False,
     ) -> str:
         """
-        Generate load test file using Locust.
+        Generate the asyncio load-testing harness.
+
+        Scenarios are discovered from the project's generated entity routes
+        (see discover_load_scenarios); without a project path only the health
+        endpoint is included.
 
         Args:
             project_path: Project root path
@@ -644,7 +1217,8 @@ class TestGenerator:
         Returns:
             Generated test code as string
         """
-        content = _load_test_template(self.project_name)
+        scenarios = discover_load_scenarios(project_path) if project_path else None
+        content = _load_test_template(self.project_name, scenarios)
 
         if project_path:
             tests_dir = project_path / "tests" / "load"
@@ -6,10 +6,16 @@ Invariants: Only updates framework files, never touches user code, preserves con
 
 from __future__ import annotations
 
+import difflib
+import hashlib
+import os
 import shutil
-from datetime import datetime
+import stat
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Any, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import yaml
 from packaging import version as pkg_version
@@ -18,10 +24,77 @@ from rich.console import Console
 from tac_bootstrap import __version__
 from tac_bootstrap.application.scaffold_service import ScaffoldService
 from tac_bootstrap.domain.models import OrchestratorConfig, TACConfig
+from tac_bootstrap.domain.plan import FileAction, FileOperation
+from tac_bootstrap.infrastructure.backup_store import BackupResult, BackupStore
 
 console = Console()
 
 
+@dataclass
+class FileChange:
+    """
+    IDK: planned-change, file-diff
+    Responsibility: Describes how one file would change if the upgrade were applied
+    Invariants: status is created, modified or deleted; diff is set only for modified
+                text files whose content differs
+    """
+
+    path: str
+    status: str
+    size: int = 0
+    sha256: Optional[str] = None
+    previous_sha256: Optional[str] = None
+    executable: bool = False
+    binary: bool = False
+    diff: Optional[str] = None
+
+
+@dataclass
+class UpgradePlan:
+    """
+    IDK: upgrade-plan, dry-run, ci-gate
+    Responsibility: Result of rendering an upgrade in memory and comparing it to disk
+    Invariants: changes are sorted by path and exclude unchanged files (counted in
+                unchanged); nothing on disk is modified to produce it
+    """
+
+    project: str
+    from_version: str
+    to_version: str
+    needs_upgrade: bool
+    changes: List[FileChange] = field(default_factory=list)
+    unchanged: int = 0
+    render_ms: float = 0.0
+    compare_ms: float = 0.0
+
+    def count(self, status: str) -> int:
+        return sum(1 for change in self.changes if change.status == status)
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.changes)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize for JSON output."""
+        return {
+            "project": self.project,
+            "from_version": self.from_version,
+            "to_version": self.to_version,
+            "needs_upgrade": self.needs_upgrade,
+            "summary": {
+                "created": self.count("created"),
+                "modified": self.count("modified"),
+                "deleted": self.count("deleted"),
+                "unchanged": self.unchanged,
+            },
+            "timings_ms": {
+                "render": round(self.render_ms, 1),
+                "compare": round(self.compare_ms, 1),
+            },
+            "changes": [asdict(change) for change in self.changes],
+        }
+
+
 class UpgradeService:
     """
     IDK: project-upgrade, version-migration, safe-update, config-preservation
@@ -35,15 +108,21 @@ class UpgradeService:
     # Archivos que se actualizan en root
     UPGRADEABLE_FILES = ["config.yml"]
 
-    def __init__(self, project_path: Path) -> Any:
+    def __init__(
+        self, project_path: Path, scaffold_service: Optional[ScaffoldService] = None
+    ) -> Any:
         """Initialize upgrade service.
 
         Args:
             project_path: Path to the project to upgrade
+            scaffold_service: Scaffold service to regenerate with (created if not
+                provided); fleet upgrades share one with precompiled templates
         """
         self.project_path = project_path
         self.config_path = project_path / "config.yml"
-        self.scaffold_service = ScaffoldService()
+        self.scaffold_service = scaffold_service or ScaffoldService()
+        self.backup_store = BackupStore(project_path)
+        self.last_backup: Optional[BackupResult] = None
 
     def get_current_version(self) -> Optional[str]:
         """Get current project version from config.yml.
@@ -177,7 +256,7 @@ class UpgradeService:
         except Exception as e:
             console.print(f"[yellow]Warning: Could not ensure config fields: {e}[/yellow]")
 
-    def _migrate_schema(self, config_data: dict) -> dict:
+    def _migrate_schema(self, config_data: Dict[str, Any]) -> Dict[str, Any]:
         """Migrate configuration schema to latest version.
 
         Args:
@@ -209,33 +288,44 @@ class UpgradeService:
 
         return config_data
 
-    def create_backup(self) -> Path:
-        """Create backup of upgradeable directories.
+    def create_backup(self, keep_count: Optional[int] = None) -> Path:
+        """Create an incremental backup of upgradeable directories and config.yml.
+
+        Files unchanged since the previous backup are hardlinked to it, changed
+        files are reflinked or copied (see BackupStore). The result, including
+        per-strategy counts, is kept in last_backup.
+
+        Args:
+            keep_count: Number of backups to keep (default: bootstrap.backup_retention
+                from config.yml, or 3)
 
         Returns:
             Path to backup directory
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        backup_dir = self.project_path / f".tac-backup-{timestamp}"
-        backup_dir.mkdir(exist_ok=True)
-
-        for dir_name in self.UPGRADEABLE_DIRS:
-            source = self.project_path / dir_name
-            if source.exists():
-                shutil.copytree(source, backup_dir / dir_name)
-
-        # Backup config.yml
-        if self.config_path.exists():
-            shutil.copy2(self.config_path, backup_dir / "config.yml")
+        self.last_backup = self.backup_store.create(
+            self.UPGRADEABLE_DIRS + self.UPGRADEABLE_FILES
+        )
 
         # Clean up old backups (keep based on config setting)
-        keep_count = 3  # Default value
-        config = self.load_existing_config()
-        if config and config.bootstrap and hasattr(config.bootstrap, 'backup_retention'):
-            keep_count = config.bootstrap.backup_retention
+        if keep_count is None:
+            keep_count = self._read_backup_retention()
         self._cleanup_old_backups(keep_count=keep_count)
 
-        return backup_dir
+        return self.last_backup.path
+
+    def _read_backup_retention(self) -> int:
+        """Read bootstrap.backup_retention from config.yml without a full config load.
+
+        Returns:
+            Configured retention, or 3 when missing or unreadable
+        """
+        try:
+            with open(self.config_path) as f:
+                config_data = yaml.safe_load(f)
+            retention = config_data["bootstrap"]["backup_retention"]
+            return retention if isinstance(retention, int) and retention > 0 else 3
+        except Exception:
+            return 3
 
     def _cleanup_old_backups(self, keep_count: int = 3) -> None:
         """Remove old backup directories, keeping only the most recent ones.
@@ -293,22 +383,18 @@ class UpgradeService:
 
         return changes
 
-    def perform_upgrade(
-        self, backup: bool = True, with_orchestrator: bool = False
-    ) -> Tuple[bool, str]:
-        """Perform the upgrade.
+    def _prepare_config(self, with_orchestrator: bool = False) -> Optional[TACConfig]:
+        """Load the existing config with the settings an upgrade applies to it.
 
         Args:
-            backup: Whether to create backup before upgrading
             with_orchestrator: Whether to enable orchestrator in config
 
         Returns:
-            Tuple of (success, message)
+            TACConfig ready to render, or None if the config could not be loaded
         """
-        # Load existing config
         config = self.load_existing_config()
         if config is None:
-            return False, "Could not load existing configuration"
+            return None
 
         # Ensure bootstrap config has backup_retention field
         if not config.bootstrap:
@@ -321,11 +407,206 @@ class UpgradeService:
         if with_orchestrator:
             config.orchestrator = OrchestratorConfig(enabled=True)
 
+        return config
+
+    def plan_upgrade(
+        self,
+        with_orchestrator: bool = False,
+        include_diffs: bool = True,
+        workers: Optional[int] = None,
+    ) -> UpgradePlan:
+        """Render the upgrade in memory and compare it with the working tree.
+
+        Mirrors perform_upgrade without touching disk: upgradeable directories
+        are treated as removed, then the scaffold plan is applied to an
+        in-memory file map (existing files outside those directories are
+        skipped, patched or overwritten exactly as apply_plan would). Templates
+        are rendered and files compared on a thread pool; unified diffs are
+        computed only for files whose hashes differ.
+
+        Args:
+            with_orchestrator: Whether orchestrator will be enabled
+            include_diffs: Whether to compute unified diffs for modified files
+            workers: Thread pool size (default: ThreadPoolExecutor's default)
+
+        Returns:
+            UpgradePlan listing created, modified and deleted files
+
+        Raises:
+            ValueError: If the existing configuration cannot be loaded
+        """
+        needs, current, target = self.needs_upgrade()
+        config = self._prepare_config(with_orchestrator)
+        if config is None:
+            raise ValueError("Could not load existing configuration")
+        previous = config.metadata
+        self.scaffold_service.stamp_metadata(config)
+        if previous is not None and config.metadata is not None:
+            # A real upgrade always bumps last_upgrade; keep the recorded value so
+            # an up-to-date repo plans no changes to config.yml
+            config.metadata.last_upgrade = previous.last_upgrade
+        scaffold_plan = self.scaffold_service.build_plan(config, existing_repo=True)
+
+        # Decide each operation's action as apply_plan would (force=False)
+        operations: List[Tuple[str, FileOperation]] = []
+        planned: Set[str] = set()
+        for file_op in scaffold_plan.files:
+            rel = Path(file_op.path).as_posix()
+            exists = rel in planned or self._survives_upgrade(rel)
+            if file_op.action == FileAction.SKIP:
+                continue
+            if exists and file_op.action == FileAction.CREATE:
+                continue
+            operations.append((rel, file_op))
+            planned.add(rel)
+
+        plan = UpgradePlan(
+            project=str(self.project_path),
+            from_version=current,
+            to_version=target,
+            needs_upgrade=needs,
+        )
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            start = time.perf_counter()
+            rendered = list(
+                pool.map(lambda op: self._render_operation(op[1], config), operations)
+            )
+            virtual = self._apply_in_memory(operations, rendered)
+            plan.render_ms = (time.perf_counter() - start) * 1000
+
+            start = time.perf_counter()
+            results = pool.map(
+                lambda item: self._compare_file(item[0], item[1][0], item[1][1], include_diffs),
+                virtual.items(),
+            )
+            for change in results:
+                if change is None:
+                    plan.unchanged += 1
+                else:
+                    plan.changes.append(change)
+            plan.changes.extend(self._deleted_files(virtual))
+            plan.compare_ms = (time.perf_counter() - start) * 1000
+
+        plan.changes.sort(key=lambda change: change.path)
+        return plan
+
+    def _survives_upgrade(self, rel: str) -> bool:
+        """Whether rel exists on disk and is outside the directories an upgrade removes."""
+        return (
+            Path(rel).parts[0] not in self.UPGRADEABLE_DIRS
+            and (self.project_path / rel).exists()
+        )
+
+    def _render_operation(self, file_op: FileOperation, config: TACConfig) -> str:
+        if file_op.template:
+            return self.scaffold_service.template_repo.render(file_op.template, config)
+        return file_op.content or ""
+
+    def _apply_in_memory(
+        self, operations: List[Tuple[str, FileOperation]], rendered: List[str]
+    ) -> Dict[str, Tuple[str, bool]]:
+        """Build the post-upgrade content and executable bit of every written file."""
+        virtual: Dict[str, Tuple[str, bool]] = {}
+        for (rel, file_op), content in zip(operations, rendered):
+            base: Optional[str] = None
+            if rel in virtual:
+                base, executable = virtual[rel]
+            elif self._survives_upgrade(rel):
+                disk_path = self.project_path / rel
+                executable = bool(disk_path.stat().st_mode & stat.S_IXUSR)
+                if file_op.action == FileAction.PATCH:
+                    # Undecodable bytes round-trip unchanged, as in _compare_file
+                    base = disk_path.read_bytes().decode("utf-8", errors="surrogateescape")
+            else:
+                executable = False
+
+            # Same idempotent append as FileSystem.append_file
+            if file_op.action == FileAction.PATCH and base is not None:
+                if content.strip() not in base:
+                    content = base + "\n\n" + content
+                else:
+                    content = base
+            virtual[rel] = (content, executable or file_op.executable)
+        return virtual
+
+    def _compare_file(
+        self, rel: str, content: str, executable: bool, include_diffs: bool
+    ) -> Optional[FileChange]:
+        """Compare planned content with the file on disk; None when unchanged."""
+        data = content.encode("utf-8", errors="surrogateescape")
+        change = FileChange(
+            path=rel,
+            status="created",
+            size=len(data),
+            sha256=hashlib.sha256(data).hexdigest(),
+            executable=executable,
+        )
+        path = self.project_path / rel
+        if not path.is_file():
+            return change
+
+        old_data = path.read_bytes()
+        change.previous_sha256 = hashlib.sha256(old_data).hexdigest()
+        was_executable = bool(path.stat().st_mode & stat.S_IXUSR)
+        if change.previous_sha256 == change.sha256 and was_executable == executable:
+            return None
+
+        change.status = "modified"
+        if include_diffs and change.previous_sha256 != change.sha256:
+            try:
+                old_text = old_data.decode("utf-8")
+            except UnicodeDecodeError:
+                change.binary = True
+                return change
+            lines = difflib.unified_diff(
+                old_text.splitlines(keepends=True),
+                content.splitlines(keepends=True),
+                fromfile=f"a/{rel}",
+                tofile=f"b/{rel}",
+            )
+            change.diff = "".join(
+                line if line.endswith("\n") else f"{line}\n\\ No newline at end of file\n"
+                for line in lines
+            )
+        return change
+
+    def _deleted_files(self, virtual: Dict[str, Tuple[str, bool]]) -> List[FileChange]:
+        """Files in upgradeable directories that the upgrade would not recreate."""
+        deleted: List[FileChange] = []
+        for dir_name in self.UPGRADEABLE_DIRS:
+            for dirpath, _, filenames in os.walk(self.project_path / dir_name):
+                for filename in filenames:
+                    path = Path(dirpath) / filename
+                    rel = path.relative_to(self.project_path).as_posix()
+                    if rel not in virtual:
+                        size = path.lstat().st_size
+                        deleted.append(FileChange(path=rel, status="deleted", size=size))
+        return deleted
+
+    def perform_upgrade(
+        self, backup: bool = True, with_orchestrator: bool = False
+    ) -> Tuple[bool, str]:
+        """Perform the upgrade.
+
+        Args:
+            backup: Whether to create backup before upgrading
+            with_orchestrator: Whether to enable orchestrator in config
+
+        Returns:
+            Tuple of (success, message)
+        """
+        # Load existing config
+        config = self._prepare_config(with_orchestrator)
+        if config is None:
+            return False, "Could not load existing configuration"
+
         # Create backup if requested
         backup_path = None
         if backup:
-            backup_path = self.create_backup()
+            backup_path = self.create_backup(keep_count=config.bootstrap.backup_retention)
             console.print(f"[green]Created backup at: {backup_path}[/green]")
+            if self.last_backup is not None and self.last_backup.path == backup_path:
+                console.print(f"[dim]Backup files: {self.last_backup.summary()}[/dim]")
 
         try:
             # Remove old directories
@@ -350,13 +631,7 @@ class UpgradeService:
             # Restore from backup if available
             if backup_path and backup_path.exists():
                 console.print("[yellow]Restoring from backup...[/yellow]")
-                for dir_name in self.UPGRADEABLE_DIRS:
-                    backup_source = backup_path / dir_name
-                    if backup_source.exists():
-                        target = self.project_path / dir_name
-                        if target.exists():
-                            shutil.rmtree(target)
-                        shutil.copytree(backup_source, target)
+                self.backup_store.restore(backup_path, self.UPGRADEABLE_DIRS)
 
             return False, f"Upgrade failed: {e}"
 
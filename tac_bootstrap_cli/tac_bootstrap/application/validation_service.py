@@ -24,6 +24,7 @@ from tac_bootstrap.domain.models import (
 )
 from tac_bootstrap.infrastructure.git_adapter import GitAdapter
 from tac_bootstrap.infrastructure.template_repo import TemplateRepository
+from tac_bootstrap.infrastructure.toolchain_probe import ToolchainProbe
 
 # ============================================================================
 # ENUMS AND MODELS
@@ -183,14 +184,21 @@ class ValidationService:
         PackageManager.BUN,
     }
 
-    def __init__(self, template_repo: TemplateRepository) -> None:
+    def __init__(
+        self,
+        template_repo: TemplateRepository,
+        toolchain: ToolchainProbe | None = None,
+    ) -> None:
         """
         Initialize the ValidationService.
 
         Args:
             template_repo: TemplateRepository instance for template existence checks
+            toolchain: Probes tools concurrently with an on-disk cache. Without it,
+                each tool is checked with a blocking subprocess call in turn.
         """
         self.template_repo = template_repo
+        self.toolchain = toolchain
 
     # ========================================================================
     # PUBLIC METHODS - Core Validation
@@ -437,6 +445,9 @@ class ValidationService:
         - npm/yarn/pnpm/bun (if package_manager is a JS package manager)
         - gh CLI (if orchestrator.enabled is true)
 
+        With a toolchain probe the tools are probed concurrently and cached
+        versions are reused (see _detect_tools).
+
         Args:
             config: TACConfig instance containing project configuration
 
@@ -446,8 +457,18 @@ class ValidationService:
         issues: list[ValidationIssue] = []
         requirements: list[SystemRequirement] = []
 
+        tools = ["git", "python"]
+        if config.project.package_manager == PackageManager.UV:
+            tools.append("uv")
+        if config.project.package_manager in self.JS_PACKAGE_MANAGERS:
+            tools.append(config.project.package_manager.value)
+        if config.orchestrator.enabled:
+            tools.append("gh")
+        detected = self._detect_tools(tools)
+
         # Always required: git >= 2.30
-        git_ok, git_version = self._check_git_version("2.30")
+        git_version = detected["git"][1]
+        git_ok = git_version is not None and self._compare_versions(git_version, "2.30")
         git_req = SystemRequirement(
             name="git",
             min_version="2.30",
@@ -479,7 +500,8 @@ class ValidationService:
             )
 
         # Always required: python >= 3.10
-        python_ok, python_version = self._check_python_version("3.10")
+        python_version = detected["python"][1]
+        python_ok = python_version is not None and self._compare_versions(python_version, "3.10")
         python_req = SystemRequirement(
             name="python",
             min_version="3.10",
@@ -512,7 +534,7 @@ class ValidationService:
 
         # Conditional: uv (if package_manager is uv)
         if config.project.package_manager == PackageManager.UV:
-            uv_installed, uv_version = self._check_command_exists("uv")
+            uv_installed, uv_version = detected["uv"]
             uv_req = SystemRequirement(
                 name="uv",
                 min_version=None,
@@ -538,7 +560,7 @@ class ValidationService:
         # Conditional: JS package managers (npm, yarn, pnpm, bun)
         if config.project.package_manager in self.JS_PACKAGE_MANAGERS:
             pm_name = config.project.package_manager.value
-            pm_installed, pm_version = self._check_command_exists(pm_name)
+            pm_installed, pm_version = detected[pm_name]
             pm_req = SystemRequirement(
                 name=pm_name,
                 min_version=None,
@@ -562,7 +584,7 @@ class ValidationService:
 
         # Conditional: gh CLI (if orchestrator.enabled is true)
         if config.orchestrator.enabled:
-            gh_installed, gh_version = self._check_command_exists("gh")
+            gh_installed, gh_version = detected["gh"]
             gh_req = SystemRequirement(
                 name="gh",
                 min_version=None,
@@ -1028,6 +1050,36 @@ class ValidationService:
     # PRIVATE METHODS - System Requirement Helpers
     # ========================================================================
 
+    def _detect_tools(self, tools: list[str]) -> dict[str, tuple[bool, str | None]]:
+        """
+        Detect which tools are installed and their versions.
+
+        With a toolchain probe, all tools are probed concurrently and cached results
+        are reused. Otherwise git and python are checked with _check_git_version /
+        _check_python_version and other tools with _check_command_exists, in order.
+
+        Args:
+            tools: Tool names ("git", "python", package managers, "gh")
+
+        Returns:
+            Mapping of tool name to (is_installed, version_string_or_none)
+        """
+        if self.toolchain is not None:
+            probes = self.toolchain.probe(tools)
+            return {tool: (probe.installed, probe.version) for tool, probe in probes.items()}
+
+        detected: dict[str, tuple[bool, str | None]] = {}
+        for tool in tools:
+            if tool == "git":
+                version = self._check_git_version()[1]
+                detected[tool] = (version is not None, version)
+            elif tool == "python":
+                version = self._check_python_version()[1]
+                detected[tool] = (version is not None, version)
+            else:
+                detected[tool] = self._check_command_exists(tool)
+        return detected
+
     def _check_git_version(self, min_version: str = "2.30") -> tuple[bool, str | None]:
         """
         Check if git is installed and meets minimum version requirement.
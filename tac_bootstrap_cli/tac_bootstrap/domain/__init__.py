@@ -1,6 +1,6 @@
 """TAC Bootstrap Domain Models"""
 
-from tac_bootstrap.domain.entity_config import EntitySpec, FieldSpec, FieldType
+from tac_bootstrap.domain.entity_config import CountMode, EntitySpec, FieldSpec, FieldType
 from tac_bootstrap.domain.models import (
     AgenticProvider,
     AgenticSpec,
@@ -49,6 +49,7 @@ from tac_bootstrap.domain.validators import (
 
 __all__ = [
     # Entity configuration models
+    "CountMode",
     "EntitySpec",
     "FieldSpec",
     "FieldType",
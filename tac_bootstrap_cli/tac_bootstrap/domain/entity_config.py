@@ -44,7 +44,7 @@ import re
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, field_validator, model_validator
 
 # ============================================================================
 # CONSTANTS - Reserved Names and Validation Patterns
@@ -59,6 +59,28 @@ RESERVED_FIELD_NAMES = (
     "updated_at",
 )
 
+# Columns every generated ORM model has besides the entity fields
+MODEL_BASE_COLUMNS = (
+    "id",
+    "code",
+    "name",
+    "description",
+    "type",
+    "created_at",
+    "created_by",
+    "updated_at",
+    "updated_by",
+    "state",
+    "status",
+    "version",
+    "organization_id",
+    "project_id",
+    "owner",
+)
+
+# Partial-index predicate matching the repositories' soft-delete filter
+ACTIVE_ROWS = "state != 2"
+
 # Field names that conflict with SQLAlchemy attributes
 SQLALCHEMY_CONFLICTS = (
     "query",
@@ -105,6 +127,23 @@ class FieldType(str, Enum):
     JSON = "json"
 
 
+class CountMode(str, Enum):
+    """
+    Strategies generated list endpoints use to compute their total.
+
+    Modes:
+        EXACT: SELECT count(*) over the filtered query
+        ESTIMATED: PostgreSQL planner estimate (pg_class.reltuples / EXPLAIN)
+        CACHED: Exact count cached with a TTL, invalidated on create/delete
+        NONE: No total; pages report has_more via LIMIT n + 1
+    """
+
+    EXACT = "exact"
+    ESTIMATED = "estimated"
+    CACHED = "cached"
+    NONE = "none"
+
+
 # ============================================================================
 # FIELD SPECIFICATION MODEL
 # ============================================================================
@@ -127,6 +166,7 @@ class FieldSpec(BaseModel):
         default: Default value (not type-validated at this level)
         description: Human-readable field documentation
         max_length: Maximum string length (for STRING/TEXT types)
+        searchable: Include in the full-text search index (STRING/TEXT types)
 
     Example:
         field = FieldSpec(
@@ -148,6 +188,7 @@ class FieldSpec(BaseModel):
     default: Any = None
     description: str = ""
     max_length: int | None = None
+    searchable: bool = False
 
     @field_validator("name")
     @classmethod
@@ -192,6 +233,88 @@ class FieldSpec(BaseModel):
 
         return v
 
+    @model_validator(mode="after")
+    def validate_searchable(self) -> "FieldSpec":
+        """
+        Only text fields can be part of the full-text search index.
+
+        Raises:
+            ValueError: If searchable is set on a non STRING/TEXT field
+        """
+        if self.searchable and self.field_type not in (FieldType.STRING, FieldType.TEXT):
+            raise ValueError(
+                f"Field '{self.name}' is {self.field_type.value}; only str and text "
+                "fields can be searchable"
+            )
+        return self
+
+
+# ============================================================================
+# INDEX SPECIFICATION MODEL
+# ============================================================================
+
+
+class IndexSpec(BaseModel):
+    """
+    Specification for a (possibly composite, unique or partial) table index.
+
+    Declared on EntitySpec.indexes for access patterns the generator does
+    not know about; the generator also derives IndexSpecs from the queries
+    it generates (see EntitySpec.table_indexes).
+
+    Attributes:
+        columns: Indexed columns in order (entity fields or base model columns)
+        name: Index name (derived from table and columns when omitted)
+        unique: Enforce uniqueness over the columns
+        where: SQL predicate for a partial index (PostgreSQL and SQLite),
+            e.g. ACTIVE_ROWS to skip soft-deleted rows
+        serves: Queries this index is meant to serve (for --explain-indexes)
+
+    Example:
+        IndexSpec(columns=["status", "created_at"], where=ACTIVE_ROWS)
+    """
+
+    columns: list[str]
+    name: str | None = None
+    unique: bool = False
+    where: str | None = None
+    serves: list[str] = []
+
+    @field_validator("columns")
+    @classmethod
+    def validate_columns(cls, v: list[str]) -> list[str]:
+        """
+        Validate the column list is non-empty, snake_case and duplicate-free.
+
+        Raises:
+            ValueError: If validation fails
+        """
+        if not v:
+            raise ValueError("Index must have at least one column")
+        for column in v:
+            if not SNAKECASE_PATTERN.match(column):
+                raise ValueError(f"Index column '{column}' must be snake_case")
+        if len(set(v)) != len(v):
+            raise ValueError(f"Index columns must be unique: {', '.join(v)}")
+        return v
+
+    @field_validator("where")
+    @classmethod
+    def validate_where(cls, v: str | None) -> str | None:
+        """
+        Keep predicates renderable as a plain Python string literal.
+
+        Raises:
+            ValueError: If the predicate contains double quotes or backslashes
+        """
+        if v is not None and ('"' in v or "\\" in v):
+            raise ValueError("Index predicate cannot contain double quotes or backslashes")
+        return v
+
+    def key(self) -> tuple[tuple[str, ...], bool, str | None]:
+        """Identity of the index ignoring its name (used to drop duplicates)."""
+        return tuple(self.columns), self.unique, self.where
+
 
 # ============================================================================
 # ENTITY SPECIFICATION MODEL
@@ -213,11 +336,17 @@ class EntitySpec(BaseModel):
         authorized: Generate with authentication templates
         async_mode: Use async repository pattern
         with_events: Generate domain event support
+        count_mode: How list endpoints compute totals (exact, estimated, cached, none)
+        cache: Serve get_by_id/exists from the read-through entity cache
+        indexes: Extra composite / unique / partial indexes (prefixed with
+            organization_id on authorized entities)
 
     Properties:
         snake_name: Entity name in snake_case (e.g., "product", "user_profile")
         plural_name: Pluralized snake_case name (e.g., "products", "user_profiles")
         table_name: Database table name (same as plural_name)
+        search_fields: Fields indexed for full-text search
+        table_indexes: Derived plus declared indexes of the ORM model
 
     Example:
         entity = EntitySpec(
@@ -244,6 +373,9 @@ class EntitySpec(BaseModel):
     authorized: bool = False
     async_mode: bool = False
     with_events: bool = False
+    count_mode: CountMode = CountMode.EXACT
+    cache: bool = False
+    indexes: list[IndexSpec] = []
 
     @field_validator("name")
     @classmethod
@@ -406,3 +538,131 @@ class EntitySpec(BaseModel):
             UserProfile -> user_profiles
         """
         return self.plural_name
+
+    @property
+    def search_fields(self) -> list[FieldSpec]:
+        """
+        Fields covered by the generated full-text search index.
+
+        Fields flagged searchable=True when any are; otherwise every STRING
+        and TEXT field, so entities defined before the flag existed keep
+        their search endpoint.
+
+        Returns:
+            Searchable fields in declaration order (empty if none qualify)
+
+        Example:
+            name:str:searchable, sku:str -> [name]
+            name:str, sku:str            -> [name, sku]
+        """
+        flagged = [field for field in self.fields if field.searchable]
+        if flagged:
+            return flagged
+        return [
+            field
+            for field in self.fields
+            if field.field_type in (FieldType.STRING, FieldType.TEXT)
+        ]
+
+    @model_validator(mode="after")
+    def validate_index_columns(self) -> "EntitySpec":
+        """
+        Declared indexes may only use entity fields and base model columns.
+
+        Raises:
+            ValueError: If an index references an unknown column
+        """
+        known = set(MODEL_BASE_COLUMNS) | {field.name for field in self.fields}
+        for index in self.indexes:
+            unknown = [column for column in index.columns if column not in known]
+            if unknown:
+                raise ValueError(
+                    f"Index on {', '.join(index.columns)} references unknown "
+                    f"column(s): {', '.join(unknown)}"
+                )
+        return self
+
+    @property
+    def table_indexes(self) -> list[IndexSpec]:
+        """
+        Indexes of the generated ORM model, each with the queries it serves.
+
+        Derived from the access patterns of the generated repositories:
+        - List endpoint: state != 2 ORDER BY created_at (organization_id
+          first on authorized entities) -> partial index on the sort key
+        - unique fields: unique index (per organization when authorized)
+        - indexed fields: get_by_<field> lookup index (per organization
+          when authorized)
+
+        Declared indexes follow; on authorized entities they are prefixed
+        with organization_id, since every query is tenant-scoped. Declared
+        indexes identical to a derived one are dropped.
+
+        Returns:
+            Named IndexSpecs in declaration order
+        """
+        table = self.table_name
+        repository = f"{self.name}Repository"
+        tenant = ["organization_id"] if self.authorized else []
+        tenant_name = "org_" if self.authorized else ""
+        tenant_filter = "organization_id = ? AND " if self.authorized else ""
+
+        # Authorized get_all() breaks created_at ties by id; the basic
+        # repository sorts by the requested column only
+        sort_key = ["created_at", "id"] if self.authorized else ["created_at"]
+        list_serves = [
+            f"{repository}.get_all(): {tenant_filter}{ACTIVE_ROWS} "
+            f"ORDER BY {' DESC, '.join(sort_key)} DESC"
+        ]
+        if self.authorized and self.search_fields:
+            list_serves.append(
+                f"{repository}.search(): {tenant_filter}{ACTIVE_ROWS} "
+                "(combined with the full-text index)"
+            )
+        indexes = [
+            IndexSpec(
+                name=f"ix_{table}_{tenant_name or 'active_'}created_at",
+                columns=[*tenant, *sort_key],
+                where=ACTIVE_ROWS,
+                serves=list_serves,
+            )
+        ]
+
+        for field in self.fields:
+            lookup = f"{repository}.get_by_{field.name}(): {tenant_filter}{field.name} = ?"
+            if field.unique:
+                scope = " per organization" if self.authorized else ""
+                indexes.append(
+                    IndexSpec(
+                        name=f"uq_{table}_{tenant_name}{field.name}",
+                        columns=[*tenant, field.name],
+                        unique=True,
+                        serves=[f"unique {field.name}{scope}"]
+                        + ([lookup] if field.indexed else []),
+                    )
+                )
+            elif field.indexed:
+                indexes.append(
+                    IndexSpec(
+                        name=f"ix_{table}_{tenant_name}{field.name}",
+                        columns=[*tenant, field.name],
+                        serves=[lookup],
+                    )
+                )
+
+        seen = {index.key() for index in indexes}
+        for declared in self.indexes:
+            columns = [*tenant, *(c for c in declared.columns if c not in tenant)]
+            prefix = "uq" if declared.unique else "ix"
+            suffix = "_".join("org" if c == "organization_id" else c for c in columns)
+            index = declared.model_copy(
+                update={
+                    "columns": columns,
+                    "name": declared.name or f"{prefix}_{table}_{suffix}",
+                    "serves": declared.serves or ["declared in EntitySpec.indexes"],
+                }
+            )
+            if index.key() not in seen:
+                seen.add(index.key())
+                indexes.append(index)
+        return indexes
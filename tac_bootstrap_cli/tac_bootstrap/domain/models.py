@@ -142,6 +142,14 @@ class DefaultWorkflow(str, Enum):
     PLAN_IMPLEMENT = "plan_implement"
 
 
+class DatabaseProfile(str, Enum):
+    """Engine tuning profiles for generated database.py."""
+
+    DEV = "dev"
+    PROD = "prod"
+    SERVERLESS = "serverless"
+
+
 # ============================================================================
 # SUB-MODELS - Configuration Section Models
 # ============================================================================
@@ -623,6 +631,39 @@ class SystemRequirement(BaseModel):
 # ============================================================================
 
 
+class DatabaseConfig(BaseModel):
+    """
+    Database engine settings for generated FastAPI projects.
+
+    Selects the engine profile rendered into src/shared/infrastructure/database.py
+    and the thresholds used by the query metrics listeners.
+
+    Attributes:
+        profile: dev (SQLite WAL pragmas), prod (sized pool, pre-ping, recycle)
+            or serverless (NullPool, one connection per checkout)
+        pool_size: Persistent connections kept by the prod profile
+        max_overflow: Extra connections allowed above pool_size under load
+        pool_timeout: Seconds to wait for a pooled connection before failing
+        pool_recycle: Seconds after which pooled connections are replaced
+        slow_query_ms: Statements slower than this are kept in the slow-query log
+        n_plus_one_threshold: Repeats of one statement per request reported as N+1
+    """
+
+    profile: DatabaseProfile = Field(
+        default=DatabaseProfile.DEV, description="Engine tuning profile"
+    )
+    pool_size: int = Field(default=10, description="Pool size (prod profile)", ge=1)
+    max_overflow: int = Field(default=20, description="Pool overflow (prod profile)", ge=0)
+    pool_timeout: int = Field(default=30, description="Pool checkout timeout in seconds", ge=1)
+    pool_recycle: int = Field(default=1800, description="Connection recycle age in seconds", ge=-1)
+    slow_query_ms: int = Field(default=200, description="Slow-query log threshold (ms)", ge=1)
+    n_plus_one_threshold: int = Field(
+        default=10, description="Repeats of one statement per request flagged as N+1", ge=2
+    )
+
+    model_config = {"extra": "ignore"}
+
+
 class DbtTargetConfig(BaseModel):
     """Configuration for a single dbt target (BigQuery or PostgreSQL)."""
 
@@ -775,6 +816,9 @@ class TACConfig(BaseModel):
     orchestrator: OrchestratorConfig = Field(
         default=OrchestratorConfig(), description="Orchestrator frontend configuration"
     )
+    database: DatabaseConfig = Field(
+        default=DatabaseConfig(), description="Database engine profile and query metrics"
+    )
     metadata: BootstrapMetadata | None = Field(
         default=None, description="Bootstrap generation metadata for audit trail"
     )
@@ -2,9 +2,11 @@
 IDK: plugin-contract, plugin-interface, hook-definition, plugin-metadata
 Responsibility: Defines the plugin interface/contract and hook types for third-party extensibility
 Invariants: Plugins must have name/version/author, hooks map to valid hook names,
-            plugin state is immutable after initialization
+            plugin state is immutable after initialization (except the one-time deferred
+            import of hook implementations)
 """
 
+import time
 from enum import Enum
 from typing import Any, Callable, Dict, List, Optional
 
@@ -46,9 +48,11 @@ class PluginManifest(BaseModel):
         version: Semantic version string (e.g., "1.0.0")
         author: Plugin author name or organization
         description: Short description of what the plugin does
-        hooks: List of hook types this plugin implements
+        hooks: List of hook types this plugin implements. Declared hooks let the
+            loader defer importing hooks.py until one of them is first dispatched.
         dependencies: List of other plugin names this plugin depends on
         config: Optional plugin-specific configuration dictionary
+        timeout: Optional per-hook time limit in seconds
     """
 
     name: str = Field(..., description="Unique plugin name (lowercase-hyphen format)")
@@ -62,6 +66,9 @@ class PluginManifest(BaseModel):
     config: Dict[str, Any] = Field(
         default_factory=dict, description="Plugin-specific configuration"
     )
+    timeout: Optional[float] = Field(
+        default=None, gt=0, description="Per-hook time limit in seconds"
+    )
 
     @field_validator("name")
     @classmethod
@@ -129,13 +136,16 @@ class Plugin:
     Runtime representation of a loaded plugin.
 
     Combines manifest metadata with callable hook implementations discovered
-    during plugin loading.
+    during plugin loading. Implementations may be deferred: with a hooks_loader,
+    the manifest's declared hooks stand in for them until ensure_hooks_loaded()
+    imports the module.
 
     Attributes:
         manifest: Plugin manifest metadata from plugin.yaml
         hooks: Dictionary mapping hook names to callable implementations
         enabled: Whether the plugin is currently active
         load_error: Error message if plugin failed to load
+        import_ms: Time spent importing deferred hooks, once imported
     """
 
     def __init__(
@@ -144,6 +154,7 @@ class Plugin:
         hooks: Optional[Dict[str, Callable[..., Any]]] = None,
         enabled: bool = True,
         load_error: Optional[str] = None,
+        hooks_loader: Optional[Callable[[], Dict[str, Callable[..., Any]]]] = None,
     ) -> None:
         """
         Initialize a Plugin instance.
@@ -153,11 +164,15 @@ class Plugin:
             hooks: Dictionary of hook name to callable
             enabled: Whether plugin is active
             load_error: Error message if loading failed
+            hooks_loader: Imports and returns the hook implementations on first use;
+                ignored when hooks are given
         """
         self.manifest = manifest
         self.hooks: Dict[str, Callable[..., Any]] = hooks or {}
         self.enabled = enabled
         self.load_error = load_error
+        self.import_ms: Optional[float] = None
+        self._hooks_loader = hooks_loader if hooks is None else None
 
     @property
     def name(self) -> str:
@@ -179,16 +194,51 @@ class Plugin:
         """Plugin description from manifest."""
         return self.manifest.description
 
+    @property
+    def hooks_loaded(self) -> bool:
+        """Whether hook implementations have been imported (or were given directly)."""
+        return self._hooks_loader is None
+
+    @property
+    def hook_names(self) -> List[str]:
+        """Implemented hooks, or the manifest's declared hooks while deferred."""
+        if not self.hooks_loaded:
+            return list(self.manifest.hooks)
+        return [name for name, hook in self.hooks.items() if callable(hook)]
+
+    def ensure_hooks_loaded(self) -> None:
+        """
+        Import deferred hook implementations, once.
+
+        An import failure disables the plugin and records load_error.
+        """
+        loader = self._hooks_loader
+        if loader is None:
+            return
+        self._hooks_loader = None
+        start = time.perf_counter()
+        try:
+            self.hooks = loader()
+        except Exception as e:
+            self.enabled = False
+            self.load_error = str(e)
+        finally:
+            self.import_ms = (time.perf_counter() - start) * 1000
+
     def has_hook(self, hook_name: str) -> bool:
         """
         Check if this plugin implements a specific hook.
 
+        While hooks are deferred, declared hooks are assumed to be implemented.
+
         Args:
             hook_name: Name of the hook to check
 
         Returns:
             True if the plugin has a callable for this hook
         """
+        if not self.hooks_loaded:
+            return hook_name in self.manifest.hooks
         return hook_name in self.hooks and callable(self.hooks[hook_name])
 
     def execute_hook(self, hook_name: str, *args: Any, **kwargs: Any) -> PluginHookResult:
@@ -203,12 +253,18 @@ class Plugin:
         Returns:
             PluginHookResult with execution outcome
         """
+        if self.enabled:
+            self.ensure_hooks_loaded()
         if not self.enabled:
             return PluginHookResult(
                 plugin_name=self.name,
                 hook_name=hook_name,
                 success=False,
-                message="Plugin is disabled",
+                message=(
+                    f"Plugin failed to load: {self.load_error}"
+                    if self.load_error
+                    else "Plugin is disabled"
+                ),
             )
 
         if not self.has_hook(hook_name):
@@ -0,0 +1,407 @@
+"""
+IDK: backup-store, incremental-backup, hardlink, reflink, backup-manifest, restore
+Responsibility: Creates timestamped .tac-backup-* snapshots of project paths incrementally,
+                records a manifest per snapshot, and verifies and restores from it
+Invariants: Files unchanged since the previous snapshot (same size, mtime and mode) are
+            hardlinked to it; changed files are reflinked (copy-on-write clone) when the
+            filesystem supports it and copied otherwise; nothing in a snapshot is ever
+            linked to a project file, and restores never link back into the project
+"""
+
+import ctypes
+import ctypes.util
+import errno
+import hashlib
+import json
+import os
+import shutil
+import stat
+import sys
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+BACKUP_PREFIX = ".tac-backup-"
+MANIFEST_NAME = "manifest.json"
+MANIFEST_SCHEMA_VERSION = 1
+
+# ioctl request number for FICLONE (_IOW(0x94, 9, int)) on Linux
+FICLONE = 0x40049409
+
+# Errors meaning "this filesystem cannot do that", as opposed to a real I/O failure
+_UNSUPPORTED_ERRNOS = {
+    errno.EXDEV,
+    errno.EINVAL,
+    errno.ENOTTY,
+    errno.EOPNOTSUPP,
+    errno.EPERM,
+    errno.ENOSYS,
+}
+
+_CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass
+class BackupResult:
+    """
+    IDK: backup-result, backup-stats
+    Responsibility: Describes one snapshot and how its files were stored
+    Invariants: files == linked + reflinked + copied; bytes_copied counts copied files only
+    """
+
+    path: Path
+    previous: Optional[Path] = None
+    files: int = 0
+    linked: int = 0
+    reflinked: int = 0
+    copied: int = 0
+    bytes_copied: int = 0
+
+    def summary(self) -> str:
+        return f"{self.copied} copied, {self.reflinked} reflinked, {self.linked} linked"
+
+
+class BackupStore:
+    """
+    IDK: backup-engine, link-dest, copy-on-write, manifest-verification
+    Responsibility: Manages .tac-backup-<timestamp> snapshots inside a project directory
+    Invariants: Each snapshot has a manifest.json listing every directory, file (size,
+                mtime_ns, mode, sha256) and symlink it holds; the most recent snapshot
+                with a manifest is the link source for the next one; snapshots without
+                a manifest (older backups) can still be restored
+    """
+
+    def __init__(self, root: Path) -> None:
+        """Initialize backup store.
+
+        Args:
+            root: Project directory holding both the backed-up paths and the snapshots
+        """
+        self.root = root
+        self._reflink_supported = True
+        self._hardlink_supported = True
+
+    def list_backups(self) -> List[Path]:
+        """List snapshot directories, newest first."""
+        return sorted(
+            (d for d in self.root.glob(f"{BACKUP_PREFIX}*") if d.is_dir()),
+            key=lambda p: p.name,
+            reverse=True,
+        )
+
+    def read_manifest(self, backup_dir: Path) -> Optional[Dict[str, Any]]:
+        """Read a snapshot's manifest, or None when it is missing or unreadable."""
+        try:
+            manifest = json.loads((backup_dir / MANIFEST_NAME).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(manifest, dict):
+            return None
+        if manifest.get("schema_version") != MANIFEST_SCHEMA_VERSION:
+            return None
+        return manifest
+
+    def create(self, names: Sequence[str]) -> BackupResult:
+        """Snapshot the given top-level paths of root.
+
+        Paths that do not exist are skipped. The manifest is written last, so a
+        snapshot interrupted mid-way is never used as a link source.
+
+        Args:
+            names: File or directory names relative to root
+
+        Returns:
+            BackupResult with the snapshot path and per-strategy file counts
+        """
+        previous, previous_entries = self._link_source()
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        backup_dir = self.root / f"{BACKUP_PREFIX}{timestamp}"
+        suffix = 1
+        while backup_dir.exists():
+            backup_dir = self.root / f"{BACKUP_PREFIX}{timestamp}_{suffix}"
+            suffix += 1
+        backup_dir.mkdir()
+
+        result = BackupResult(path=backup_dir, previous=previous)
+        entries: Dict[str, Dict[str, Any]] = {}
+        for name in names:
+            source = self.root / name
+            if source.is_symlink() or source.exists():
+                self._backup_tree(
+                    source, backup_dir, name, entries, previous, previous_entries, result
+                )
+
+        manifest = {
+            "schema_version": MANIFEST_SCHEMA_VERSION,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "roots": [name for name in names if name in entries],
+            "previous": previous.name if previous else None,
+            "entries": entries,
+        }
+        tmp = backup_dir / f".{MANIFEST_NAME}.tmp"
+        tmp.write_text(json.dumps(manifest, sort_keys=True), encoding="utf-8")
+        os.replace(tmp, backup_dir / MANIFEST_NAME)
+        return result
+
+    def verify(self, backup_dir: Path, deep: bool = False) -> List[str]:
+        """Check a snapshot against its manifest.
+
+        The default check compares entry types and file sizes; deep=True also
+        re-hashes every file.
+
+        Args:
+            backup_dir: Snapshot to check
+            deep: Whether to compare SHA-256 digests
+
+        Returns:
+            List of problems; empty when the snapshot is intact
+        """
+        manifest = self.read_manifest(backup_dir)
+        if manifest is None:
+            return [f"{backup_dir.name}: missing or unreadable {MANIFEST_NAME}"]
+
+        problems: List[str] = []
+        for rel, entry in sorted(manifest["entries"].items()):
+            path = backup_dir / rel
+            kind = entry["type"]
+            if kind == "symlink":
+                if not path.is_symlink():
+                    problems.append(f"{rel}: symlink missing")
+                elif os.readlink(path) != entry["target"]:
+                    problems.append(f"{rel}: symlink target changed")
+            elif kind == "dir":
+                if not path.is_dir():
+                    problems.append(f"{rel}: directory missing")
+            elif not path.is_file():
+                problems.append(f"{rel}: file missing")
+            elif path.stat().st_size != entry["size"]:
+                problems.append(f"{rel}: size {path.stat().st_size} != {entry['size']}")
+            elif deep and _sha256(path) != entry["sha256"]:
+                problems.append(f"{rel}: content changed")
+        return problems
+
+    def restore(self, backup_dir: Path, names: Optional[Sequence[str]] = None) -> int:
+        """Replace top-level paths of root with their copies from a snapshot.
+
+        Files are reflinked when possible and copied otherwise, never hardlinked,
+        so later edits to the project cannot alter the snapshot. Snapshots without
+        a manifest are restored with a plain recursive copy.
+
+        Args:
+            backup_dir: Snapshot to restore from
+            names: Top-level names to restore (default: every root in the snapshot)
+
+        Returns:
+            Number of files restored
+        """
+        manifest = self.read_manifest(backup_dir)
+        if manifest is None:
+            return self._restore_legacy(backup_dir, names)
+
+        roots = [n for n in manifest["roots"] if names is None or n in names]
+        restored = 0
+        for name in roots:
+            _remove(self.root / name)
+            for rel, entry in sorted(manifest["entries"].items()):
+                if rel != name and not rel.startswith(f"{name}/"):
+                    continue
+                source, target = backup_dir / rel, self.root / rel
+                if entry["type"] == "dir":
+                    target.mkdir(parents=True, exist_ok=True)
+                elif entry["type"] == "symlink":
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    os.symlink(entry["target"], target)
+                else:
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    if not self._reflink(source, target):
+                        shutil.copyfile(source, target)
+                    shutil.copystat(source, target)
+                    restored += 1
+            # Directory mtimes are restored after their contents were written
+            for rel, entry in manifest["entries"].items():
+                if entry["type"] == "dir" and (rel == name or rel.startswith(f"{name}/")):
+                    os.utime(self.root / rel, ns=(entry["mtime_ns"], entry["mtime_ns"]))
+        return restored
+
+    # =========================================================================
+    # PRIVATE METHODS
+    # =========================================================================
+
+    def _link_source(self) -> Tuple[Optional[Path], Dict[str, Dict[str, Any]]]:
+        """Return (snapshot, manifest entries) of the newest snapshot with a manifest."""
+        for backup_dir in self.list_backups():
+            manifest = self.read_manifest(backup_dir)
+            if manifest is not None:
+                return backup_dir, manifest["entries"]
+        return None, {}
+
+    def _backup_tree(
+        self,
+        source: Path,
+        backup_dir: Path,
+        rel: str,
+        entries: Dict[str, Dict[str, Any]],
+        previous: Optional[Path],
+        previous_entries: Dict[str, Dict[str, Any]],
+        result: BackupResult,
+    ) -> None:
+        """Back up source (file, symlink or directory tree) as backup_dir/rel."""
+        target = backup_dir / rel
+        st = source.lstat()
+
+        if stat.S_ISLNK(st.st_mode):
+            target.parent.mkdir(parents=True, exist_ok=True)
+            link_target = os.readlink(source)
+            os.symlink(link_target, target)
+            entries[rel] = {"type": "symlink", "target": link_target}
+            return
+
+        if stat.S_ISDIR(st.st_mode):
+            target.mkdir(parents=True, exist_ok=True)
+            entries[rel] = {"type": "dir", "mtime_ns": st.st_mtime_ns}
+            with os.scandir(source) as it:
+                children = sorted(entry.name for entry in it)
+            for child in children:
+                self._backup_tree(
+                    source / child,
+                    backup_dir,
+                    f"{rel}/{child}",
+                    entries,
+                    previous,
+                    previous_entries,
+                    result,
+                )
+            shutil.copystat(source, target)
+            return
+
+        if not stat.S_ISREG(st.st_mode):
+            return  # sockets, fifos and devices are not backed up
+
+        entry = {
+            "type": "file",
+            "size": st.st_size,
+            "mtime_ns": st.st_mtime_ns,
+            "mode": stat.S_IMODE(st.st_mode),
+        }
+        target.parent.mkdir(parents=True, exist_ok=True)
+        result.files += 1
+
+        prior = previous_entries.get(rel)
+        if (
+            previous is not None
+            and prior is not None
+            and prior.get("type") == "file"
+            and all(prior.get(key) == value for key, value in entry.items())
+            and self._hardlink(previous / rel, target)
+        ):
+            entry["sha256"] = prior["sha256"]
+            result.linked += 1
+        elif self._reflink(source, target):
+            shutil.copystat(source, target)
+            entry["sha256"] = _sha256(target)
+            result.reflinked += 1
+        else:
+            entry["sha256"] = _copy_and_hash(source, target)
+            shutil.copystat(source, target)
+            result.copied += 1
+            result.bytes_copied += st.st_size
+        entries[rel] = entry
+
+    def _hardlink(self, source: Path, target: Path) -> bool:
+        """Hardlink target to source; False when unsupported or source is gone."""
+        if not self._hardlink_supported:
+            return False
+        try:
+            os.link(source, target)
+            return True
+        except FileNotFoundError:
+            return False
+        except OSError as e:
+            if e.errno == errno.EMLINK:
+                return False  # this inode is at its link limit; copy instead
+            if e.errno in _UNSUPPORTED_ERRNOS:
+                self._hardlink_supported = False
+                return False
+            raise
+
+    def _reflink(self, source: Path, target: Path) -> bool:
+        """Clone source into a new target file sharing its data blocks.
+
+        Returns False (leaving no target behind) when the platform or filesystem
+        does not support reflinks; support is probed once per store.
+        """
+        if not self._reflink_supported:
+            return False
+        try:
+            if sys.platform.startswith("linux"):
+                import fcntl
+
+                with open(source, "rb") as src, open(target, "wb") as dst:
+                    fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+                return True
+            if sys.platform == "darwin" and _clonefile is not None:
+                if _clonefile(os.fsencode(source), os.fsencode(target), 0) == 0:
+                    return True
+                raise OSError(ctypes.get_errno(), "clonefile failed")
+        except OSError as e:
+            if os.path.lexists(target):
+                os.unlink(target)
+            if e.errno not in _UNSUPPORTED_ERRNOS:
+                raise
+        self._reflink_supported = False
+        return False
+
+    def _restore_legacy(self, backup_dir: Path, names: Optional[Sequence[str]]) -> int:
+        """Restore a snapshot written before manifests existed."""
+        restored = 0
+        for source in sorted(backup_dir.iterdir()):
+            if names is not None and source.name not in names:
+                continue
+            target = self.root / source.name
+            _remove(target)
+            if source.is_dir():
+                shutil.copytree(source, target, symlinks=True)
+                restored += sum(1 for p in target.rglob("*") if p.is_file() and not p.is_symlink())
+            else:
+                shutil.copy2(source, target)
+                restored += 1
+        return restored
+
+
+def _sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _copy_and_hash(source: Path, target: Path) -> str:
+    """Copy source to target, hashing the data as it is read."""
+    digest = hashlib.sha256()
+    with open(source, "rb") as src, open(target, "wb") as dst:
+        for chunk in iter(lambda: src.read(_CHUNK_SIZE), b""):
+            digest.update(chunk)
+            dst.write(chunk)
+    return digest.hexdigest()
+
+
+def _remove(path: Path) -> None:
+    if path.is_symlink() or path.is_file():
+        path.unlink()
+    elif path.is_dir():
+        shutil.rmtree(path)
+
+
+def _load_clonefile() -> Any:
+    if sys.platform != "darwin":
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        return libc.clonefile
+    except (OSError, AttributeError):
+        return None
+
+
+_clonefile = _load_clonefile()
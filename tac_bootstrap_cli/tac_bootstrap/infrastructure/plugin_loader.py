@@ -3,11 +3,13 @@ IDK: plugin-discovery, plugin-loading, dynamic-import, yaml-manifest-parsing
 Responsibility: Discovers and loads plugins from filesystem directories, parses manifests,
                 and dynamically imports hook implementations
 Invariants: Plugin directories must contain plugin.yaml, hooks.py is optional,
-            loading errors are captured gracefully without crashing
+            loading errors are captured gracefully without crashing, hooks.py of a
+            plugin that declares its hooks is not imported until first dispatch
 """
 
 import importlib.util
 import sys
+from functools import partial
 from pathlib import Path
 from typing import Any, Callable, Dict, List
 
@@ -53,7 +55,9 @@ class PluginLoader:
     Responsibility: Discovers plugin directories, parses plugin.yaml manifests,
                     dynamically loads hooks.py modules, and creates Plugin instances
     Invariants: Each plugin directory must have plugin.yaml, loading failures are
-                captured as load_error on Plugin, no exceptions propagate on bad plugins
+                captured as load_error on Plugin, no exceptions propagate on bad plugins;
+                manifests declaring hooks get a deferred hooks.py import, manifests
+                without declared hooks are imported eagerly to discover them
     """
 
     # Valid hook function names that map to HookType values
@@ -175,7 +179,9 @@ class PluginLoader:
         """
         Load a single plugin from a directory.
 
-        Loads the manifest and optionally the hooks module. If loading fails,
+        Loads the manifest and optionally the hooks module. When the manifest declares
+        its hooks, importing hooks.py is deferred to the first dispatch of one of them
+        (import errors then disable the plugin at that point). If loading fails,
         returns a Plugin with enabled=False and the error captured in load_error.
 
         Args:
@@ -199,6 +205,13 @@ class PluginLoader:
                 load_error=str(e),
             )
 
+        if manifest.hooks and (plugin_dir / "hooks.py").is_file():
+            return Plugin(
+                manifest=manifest,
+                enabled=True,
+                hooks_loader=partial(self.load_hooks, plugin_dir),
+            )
+
         try:
             hooks = self.load_hooks(plugin_dir)
         except (PluginLoadError, Exception) as e:
@@ -0,0 +1,223 @@
+"""
+IDK: registry-database, sqlite, wal-mode, schema-migrations, transactions, legacy-import
+Responsibility: Small embedded SQLite layer shared by the local registries (template store,
+                community items and profile)
+Invariants: The journal is in WAL mode, writers serialize through BEGIN IMMEDIATE so
+            read-modify-write updates are never lost, the schema is versioned with
+            PRAGMA user_version, every change to a tracked table bumps the revision counter
+"""
+
+import json
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Iterator, List, Optional, Sequence
+
+# Created before any store schema: key/value counters and one-time flags
+_BASE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO meta (key, value) VALUES ('revision', 0);
+"""
+
+
+def revision_triggers(table: str, key: str) -> str:
+    """
+    DDL for triggers that bump the database revision on every change to a table.
+
+    Inserted and updated rows are stamped with the new revision in their `rev`
+    column, so readers can fetch only the rows changed since a revision they saw.
+    The update trigger skips writes that change `rev`, i.e. the stamping itself.
+
+    Args:
+        table: Table name; it must have an INTEGER `rev` column
+        key: Primary key column used to stamp the changed row
+    """
+    bump = "UPDATE meta SET value = value + 1 WHERE key = 'revision';"
+    stamp = (
+        f"UPDATE {table} SET rev = (SELECT value FROM meta WHERE key = 'revision') "
+        f"WHERE {key} = NEW.{key};"
+    )
+    return f"""
+CREATE TRIGGER {table}_revision_insert AFTER INSERT ON {table} BEGIN
+    {bump}
+    {stamp}
+END;
+CREATE TRIGGER {table}_revision_update AFTER UPDATE ON {table}
+WHEN NEW.rev = OLD.rev BEGIN
+    {bump}
+    {stamp}
+END;
+CREATE TRIGGER {table}_revision_delete AFTER DELETE ON {table} BEGIN
+    {bump}
+END;
+"""
+
+
+def _statements(script: str) -> Iterator[str]:
+    """Split a SQL script into complete statements (trigger bodies stay whole)."""
+    statement = ""
+    for line in script.splitlines(keepends=True):
+        statement += line
+        if sqlite3.complete_statement(statement):
+            if statement.strip():
+                yield statement.strip()
+            statement = ""
+    if statement.strip():
+        yield statement.strip()
+
+
+class RegistryDatabase:
+    """
+    IDK: sqlite-connection, wal-journal, immediate-transaction, user-version-migration
+    Responsibility: Opens the database lazily (one connection per thread), applies schema
+                    migrations and runs writes in transactions
+    Invariants: Connections run in autocommit mode outside transaction(), nested
+                transaction() calls join the outer one, migrations are applied at most once
+    """
+
+    BUSY_TIMEOUT_SECONDS = 30.0
+
+    def __init__(self, path: Path, migrations: Sequence[str]) -> None:
+        """
+        Args:
+            path: Database file, created on first use
+            migrations: Schema scripts; script N upgrades user_version N to N+1
+        """
+        self.path = path
+        self.migrations = list(migrations)
+        self._local = threading.local()
+
+    def exists(self) -> bool:
+        """True if the database file has been created."""
+        return self.path.is_file()
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """This thread's connection, opened and migrated on first use."""
+        connection: Optional[sqlite3.Connection] = getattr(self._local, "connection", None)
+        if connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(
+                str(self.path),
+                timeout=self.BUSY_TIMEOUT_SECONDS,
+                isolation_level=None,
+            )
+            connection.row_factory = sqlite3.Row
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute("PRAGMA foreign_keys=ON")
+            self._migrate(connection)
+            self._local.connection = connection
+        return connection
+
+    def close(self) -> None:
+        """Close this thread's connection, if open."""
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Run statements in one write transaction.
+
+        BEGIN IMMEDIATE takes the write lock up front, so concurrent processes
+        queue (up to BUSY_TIMEOUT_SECONDS) instead of overwriting each other.
+        """
+        connection = self.connection
+        if connection.in_transaction:
+            yield connection
+            return
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield connection
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+    def execute(self, sql: str, params: Sequence[Any] = ()) -> int:
+        """Run one statement in autocommit mode and return the number of changed rows."""
+        return self.connection.execute(sql, params).rowcount
+
+    def query(self, sql: str, params: Sequence[Any] = ()) -> List[sqlite3.Row]:
+        """Run a query and return all rows."""
+        return self.connection.execute(sql, params).fetchall()
+
+    def query_one(self, sql: str, params: Sequence[Any] = ()) -> Optional[sqlite3.Row]:
+        """Run a query and return the first row, if any."""
+        row: Optional[sqlite3.Row] = self.connection.execute(sql, params).fetchone()
+        return row
+
+    def revision(self) -> int:
+        """Counter bumped by every change to a table with revision triggers."""
+        row = self.query_one("SELECT value FROM meta WHERE key = 'revision'")
+        return int(row[0]) if row else 0
+
+    def import_legacy_json(
+        self, legacy_file: Path, load: Callable[[sqlite3.Connection, Any], None]
+    ) -> bool:
+        """
+        Import a JSON file written by an earlier version, exactly once.
+
+        The import runs in one transaction guarded by a flag in the meta table, so
+        concurrent first runs import the data once. The file is then renamed to
+        `<name>.migrated` and kept as a backup. Unreadable files are renamed too,
+        without importing anything.
+
+        Args:
+            legacy_file: JSON file to import
+            load: Callback inserting the parsed JSON through the given connection
+
+        Returns:
+            True if this call imported the file
+        """
+        if not legacy_file.is_file():
+            return False
+
+        flag = f"imported:{legacy_file.name}"
+        with self.transaction() as connection:
+            if connection.execute("SELECT 1 FROM meta WHERE key = ?", (flag,)).fetchone():
+                imported = False
+            else:
+                try:
+                    data = json.loads(legacy_file.read_text(encoding="utf-8"))
+                except (OSError, ValueError):
+                    data = None
+                if data is not None:
+                    load(connection, data)
+                connection.execute("INSERT INTO meta (key, value) VALUES (?, 1)", (flag,))
+                imported = True
+
+        try:
+            legacy_file.replace(legacy_file.with_name(f"{legacy_file.name}.migrated"))
+        except OSError:
+            pass  # The flag already prevents a second import
+        return imported
+
+    def _migrate(self, connection: sqlite3.Connection) -> None:
+        """Apply pending schema scripts in one immediate transaction."""
+        version = connection.execute("PRAGMA user_version").fetchone()[0]
+        if version >= len(self.migrations) and version > 0:
+            return
+
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            # Re-read under the write lock: another process may have migrated meanwhile
+            version = connection.execute("PRAGMA user_version").fetchone()[0]
+            if version == 0:
+                for statement in _statements(_BASE_SCHEMA):
+                    connection.execute(statement)
+            for number in range(version, len(self.migrations)):
+                for statement in _statements(self.migrations[number]):
+                    connection.execute(statement)
+            connection.execute(f"PRAGMA user_version = {max(len(self.migrations), 1)}")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
@@ -0,0 +1,363 @@
+"""
+IDK: search-index, inverted-index, bm25, trigram-fuzzy, facet-postings, incremental-index
+Responsibility: Pre-tokenized full-text index with BM25 ranking, trigram substring and
+                fuzzy term matching, and facet filters answered from posting lists
+Invariants: Documents are indexed once and re-indexed only when their content changes,
+            the on-disk copy is a cache that is rebuilt when missing or corrupt,
+            search never mutates the index
+"""
+
+import hashlib
+import json
+import math
+import os
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+INDEX_SCHEMA_VERSION = 1
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase text and split it into alphanumeric tokens."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+def _trigrams(term: str) -> Set[str]:
+    """Trigrams of a term padded with word boundaries: "api" -> {"  a", " ap", "api", "pi "}."""
+    padded = f"  {term} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+@dataclass
+class IndexDocument:
+    """
+    A document to index.
+
+    Attributes:
+        fields: Field name to text (lists are joined); fields are weighted by the index
+        facets: Facet name to exact values used for filtering
+    """
+
+    fields: Dict[str, Any]
+    facets: Mapping[str, Iterable[Any]] = field(default_factory=dict)
+
+
+class SearchIndex:
+    """
+    IDK: inverted-index, bm25-ranking, trigram-matching, facet-filter, index-persistence
+    Responsibility: Indexes documents incrementally and answers ranked, filtered queries
+    Invariants: Postings always mirror the stored term vectors, facet values are lowercase,
+                save() is atomic and only writes after a change
+    """
+
+    K1 = 1.2
+    B = 0.75
+    SUBSTRING_WEIGHT = 0.75
+    FUZZY_WEIGHT = 0.5
+    FUZZY_THRESHOLD = 0.5
+
+    def __init__(
+        self, path: Optional[Path] = None, field_weights: Optional[Dict[str, float]] = None
+    ) -> None:
+        """
+        Args:
+            path: JSON file the index is persisted to (None keeps it in memory only)
+            field_weights: Weight per field name; unlisted fields weigh 1.0
+        """
+        self.path = path
+        self.field_weights = field_weights or {}
+        self._docs: Dict[str, Dict[str, Any]] = {}
+        self._postings: Dict[str, Dict[str, float]] = {}
+        self._facets: Dict[str, Dict[str, Set[str]]] = {}
+        self._total_length = 0.0
+        self._trigram_index: Optional[Dict[str, Set[str]]] = None
+        self._revision: Optional[int] = None
+        self._dirty = False
+        if path is not None:
+            self._load()
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def __contains__(self, doc_id: object) -> bool:
+        return doc_id in self._docs
+
+    @property
+    def revision(self) -> Optional[int]:
+        """Revision of the source the index was last brought up to date with, if tracked."""
+        return self._revision
+
+    @revision.setter
+    def revision(self, value: Optional[int]) -> None:
+        if value != self._revision:
+            self._revision = value
+            self._dirty = True
+
+    def doc_ids(self) -> Set[str]:
+        """Ids of all indexed documents."""
+        return set(self._docs)
+
+    # ========================================================================
+    # INDEXING
+    # ========================================================================
+
+    def add(self, doc_id: str, document: IndexDocument) -> bool:
+        """
+        Index a document, replacing any previous version with the same id.
+
+        Returns:
+            True if the index changed, False if the document was already up to date
+        """
+        facets = {
+            name: sorted({str(value).lower() for value in values})
+            for name, values in document.facets.items()
+        }
+        fingerprint = self._fingerprint(document.fields, facets)
+        existing = self._docs.get(doc_id)
+        if existing is not None and existing["fingerprint"] == fingerprint:
+            return False
+
+        terms: Dict[str, float] = {}
+        length = 0.0
+        for name, value in document.fields.items():
+            text = " ".join(map(str, value)) if isinstance(value, (list, tuple)) else str(value)
+            weight = self.field_weights.get(name, 1.0)
+            for token in tokenize(text):
+                terms[token] = terms.get(token, 0.0) + weight
+                length += weight
+
+        self.remove(doc_id)
+        self._insert(
+            doc_id,
+            {"fingerprint": fingerprint, "length": length, "terms": terms, "facets": facets},
+        )
+        self._dirty = True
+        return True
+
+    def remove(self, doc_id: str) -> bool:
+        """Remove a document. Returns True if it was indexed."""
+        entry = self._docs.pop(doc_id, None)
+        if entry is None:
+            return False
+
+        self._total_length -= entry["length"]
+        for term in entry["terms"]:
+            postings = self._postings.get(term)
+            if postings is None:
+                continue
+            postings.pop(doc_id, None)
+            if not postings:
+                del self._postings[term]
+                self._untrack_term(term)
+        for name, values in entry["facets"].items():
+            for value in values:
+                members = self._facets.get(name, {}).get(value)
+                if members is not None:
+                    members.discard(doc_id)
+                    if not members:
+                        del self._facets[name][value]
+        self._dirty = True
+        return True
+
+    def sync(self, documents: Dict[str, IndexDocument]) -> bool:
+        """
+        Make the index hold exactly the given documents.
+
+        Unchanged documents are skipped by fingerprint, so syncing an index loaded
+        from disk against the current source only re-tokenizes what changed.
+
+        Returns:
+            True if anything was added, re-indexed or removed
+        """
+        changed = False
+        for doc_id in set(self._docs) - set(documents):
+            changed |= self.remove(doc_id)
+        for doc_id, document in documents.items():
+            changed |= self.add(doc_id, document)
+        return changed
+
+    # ========================================================================
+    # QUERYING
+    # ========================================================================
+
+    def search(
+        self,
+        query: str = "",
+        filters: Optional[Mapping[str, Iterable[Any]]] = None,
+        match_all: bool = False,
+    ) -> List[Tuple[str, float]]:
+        """
+        Rank documents against a query, restricted by facet filters.
+
+        Each query token matches the exact term, terms containing it (trigram
+        lookup) and, when neither exists, similarly spelled terms. Substring and
+        fuzzy matches score less than exact ones.
+
+        Args:
+            query: Free-text query; empty returns every document passing the filters
+            filters: Facet name to accepted values; values of one facet are OR-ed,
+                     facets are AND-ed
+            match_all: Require every query token to match
+
+        Returns:
+            (doc_id, score) pairs, best first; scores are 0.0 for an empty query
+        """
+        candidates = self._filter(filters or {})
+        tokens = list(dict.fromkeys(tokenize(query)))
+        if not tokens:
+            ids = self._docs.keys() if candidates is None else candidates
+            return [(doc_id, 0.0) for doc_id in sorted(ids)]
+
+        scores: Dict[str, float] = {}
+        matched: Counter[str] = Counter()
+        for token in tokens:
+            token_scores: Dict[str, float] = {}
+            for term, weight in self._expand(token).items():
+                for doc_id, score in self._bm25(term, candidates).items():
+                    token_scores[doc_id] = max(token_scores.get(doc_id, 0.0), weight * score)
+            for doc_id, score in token_scores.items():
+                scores[doc_id] = scores.get(doc_id, 0.0) + score
+                matched[doc_id] += 1
+
+        if match_all:
+            scores = {doc_id: s for doc_id, s in scores.items() if matched[doc_id] == len(tokens)}
+        return sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+
+    def facet_values(self, facet: str) -> List[str]:
+        """All indexed values of a facet, sorted."""
+        return sorted(self._facets.get(facet, {}))
+
+    def _filter(self, filters: Mapping[str, Iterable[Any]]) -> Optional[Set[str]]:
+        """Intersect facet posting lists; None means no filter was given."""
+        result: Optional[Set[str]] = None
+        for name, values in filters.items():
+            postings = self._facets.get(name, {})
+            members: Set[str] = set()
+            for value in values:
+                members |= postings.get(str(value).lower(), set())
+            result = members if result is None else result & members
+        return result
+
+    def _expand(self, token: str) -> Dict[str, float]:
+        """Map a query token to matching vocabulary terms and their weights."""
+        expansions: Dict[str, float] = {}
+        if token in self._postings:
+            expansions[token] = 1.0
+
+        trigram_index = self._trigrams_by_term()
+        if len(token) >= 3:
+            inner = [token[i : i + 3] for i in range(len(token) - 2)]
+            candidates = set.intersection(*(trigram_index.get(t, set()) for t in inner))
+        else:
+            candidates = set(self._postings)
+        for term in candidates:
+            if term != token and token in term:
+                expansions[term] = self.SUBSTRING_WEIGHT
+
+        if expansions:
+            return expansions
+
+        # No exact or substring match: fall back to similarly spelled terms
+        query_trigrams = _trigrams(token)
+        overlap: Counter[str] = Counter()
+        for trigram in query_trigrams:
+            overlap.update(trigram_index.get(trigram, ()))
+        size = len(query_trigrams) + 1
+        for term, shared in overlap.items():
+            similarity = 2 * shared / (size + len(term))
+            if similarity >= self.FUZZY_THRESHOLD:
+                expansions[term] = self.FUZZY_WEIGHT * similarity
+        return expansions
+
+    def _bm25(self, term: str, candidates: Optional[Set[str]]) -> Dict[str, float]:
+        """BM25 score of one term for every document containing it."""
+        postings = self._postings.get(term, {})
+        count = len(self._docs)
+        idf = math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+        average = self._total_length / count if count else 1.0
+        scores = {}
+        for doc_id, tf in postings.items():
+            if candidates is not None and doc_id not in candidates:
+                continue
+            norm = self.K1 * (1 - self.B + self.B * self._docs[doc_id]["length"] / average)
+            scores[doc_id] = idf * tf * (self.K1 + 1) / (tf + norm)
+        return scores
+
+    def _trigrams_by_term(self) -> Dict[str, Set[str]]:
+        """Trigram to vocabulary terms, built on first use and kept up to date after."""
+        if self._trigram_index is None:
+            self._trigram_index = {}
+            for term in self._postings:
+                for trigram in _trigrams(term):
+                    self._trigram_index.setdefault(trigram, set()).add(term)
+        return self._trigram_index
+
+    def _untrack_term(self, term: str) -> None:
+        if self._trigram_index is None:
+            return
+        for trigram in _trigrams(term):
+            terms = self._trigram_index.get(trigram)
+            if terms is not None:
+                terms.discard(term)
+
+    # ========================================================================
+    # STORAGE
+    # ========================================================================
+
+    def save(self) -> None:
+        """Atomically write the index if it changed; write failures are ignored."""
+        if self.path is None or not self._dirty:
+            return
+        data = {
+            "schema_version": INDEX_SCHEMA_VERSION,
+            "revision": self._revision,
+            "documents": self._docs,
+        }
+        tmp = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+            os.replace(tmp, self.path)
+            self._dirty = False
+        except OSError:
+            tmp.unlink(missing_ok=True)
+
+    def _load(self) -> None:
+        """Load term vectors from disk and rebuild the postings; ignore bad files."""
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))  # type: ignore[union-attr]
+            if data.get("schema_version") != INDEX_SCHEMA_VERSION:
+                return
+            revision = data.get("revision")
+            self._revision = revision if isinstance(revision, int) else None
+            for doc_id, entry in data["documents"].items():
+                if not isinstance(entry.get("fingerprint"), str):
+                    raise ValueError(f"Invalid index entry: {doc_id}")
+                self._insert(doc_id, entry)
+        except (OSError, ValueError, TypeError, KeyError, AttributeError):
+            self._docs, self._postings, self._facets = {}, {}, {}
+            self._total_length = 0.0
+            self._revision = None
+
+    def _insert(self, doc_id: str, entry: Dict[str, Any]) -> None:
+        self._docs[doc_id] = entry
+        self._total_length += entry["length"]
+        for term, tf in entry["terms"].items():
+            postings = self._postings.setdefault(term, {})
+            if not postings and self._trigram_index is not None:
+                for trigram in _trigrams(term):
+                    self._trigram_index.setdefault(trigram, set()).add(term)
+            postings[doc_id] = tf
+        for name, values in entry["facets"].items():
+            for value in values:
+                self._facets.setdefault(name, {}).setdefault(value, set()).add(doc_id)
+
+    @staticmethod
+    def _fingerprint(fields: Dict[str, Any], facets: Dict[str, List[str]]) -> str:
+        payload = json.dumps([fields, facets], sort_keys=True, default=str)
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()
@@ -2,14 +2,162 @@
 IDK: telemetry-service, usage-tracking, privacy-first, event-logging, performance-metrics
 Responsibility: Provides opt-in anonymous usage tracking with local file-based storage
 Invariants: Disabled by default, never logs sensitive data (paths, credentials, secrets),
-            daily log rotation, all operations are no-ops when disabled
+            daily log rotation, all operations are no-ops when disabled,
+            buffered events are flushed before any read, when their service is
+            collected and at interpreter exit, rollup updates hold an exclusive lock
 """
 
+import gzip
 import json
+import math
+import os
 import shutil
+import sys
+import threading
+import weakref
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+ROLLUP_FILE = "rollup.json"
+ROLLUP_LOCK_FILE = ".rollup.lock"
+ERRORS_FILE = "errors.jsonl"
+ROLLUP_SCHEMA_VERSION = 1
+DEFAULT_BUFFER_SIZE = 100
+
+
+class DurationSketch:
+    """
+    IDK: duration-sketch, log-buckets, quantile-estimate, mergeable-summary
+    Responsibility: Summarizes durations in logarithmic buckets for approximate quantiles
+    Invariants: count/sum/min/max are exact, quantiles are within ~1% relative error,
+                merging two sketches equals sketching the combined values
+    """
+
+    GAMMA = 1.02
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.min = 0.0
+        self.max = 0.0
+        self.zeros = 0
+        self.buckets: Dict[int, int] = {}
+
+    def add(self, value: float) -> None:
+        """Record one duration in milliseconds."""
+        self.min = value if self.count == 0 else min(self.min, value)
+        self.max = value if self.count == 0 else max(self.max, value)
+        self.count += 1
+        self.total += value
+        if value <= 0:
+            self.zeros += 1
+            return
+        index = math.ceil(math.log(value, self.GAMMA))
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+
+    def merge(self, other: "DurationSketch") -> None:
+        """Fold another sketch into this one."""
+        if other.count == 0:
+            return
+        self.min = other.min if self.count == 0 else min(self.min, other.min)
+        self.max = other.max if self.count == 0 else max(self.max, other.max)
+        self.count += other.count
+        self.total += other.total
+        self.zeros += other.zeros
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """Estimate the q-quantile (0..1), clamped to the observed min/max."""
+        if self.count == 0:
+            return 0.0
+        if q >= 1:
+            return self.max
+        rank = q * (self.count - 1)
+        seen = self.zeros
+        if rank < seen:
+            return self.min
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if rank < seen:
+                estimate = 2 * self.GAMMA**index / (self.GAMMA + 1)
+                return min(max(estimate, self.min), self.max)
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "min": self.min,
+            "max": self.max,
+            "zeros": self.zeros,
+            "buckets": {str(index): count for index, count in self.buckets.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "DurationSketch":
+        sketch = cls()
+        sketch.count = int(data.get("count", 0))
+        sketch.total = float(data.get("sum", 0.0))
+        sketch.min = float(data.get("min", 0.0))
+        sketch.max = float(data.get("max", 0.0))
+        sketch.zeros = int(data.get("zeros", 0))
+        sketch.buckets = {int(k): int(v) for k, v in data.get("buckets", {}).items()}
+        return sketch
+
+
+class _EventBuffer:
+    """
+    IDK: event-buffer, pending-lines, thread-safe
+    Responsibility: Holds serialized events per log file until they are written
+    Invariants: Never references its service, so it can be flushed by the
+                service's finalizer after the service is collected
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._lines: Dict[str, List[str]] = {}
+        self._count = 0
+
+    def add(self, file_name: str, line: str, limit: int) -> bool:
+        """Buffer one line; returns True when the buffer holds limit or more lines."""
+        with self._lock:
+            self._lines.setdefault(file_name, []).append(line)
+            self._count += 1
+            return self._count >= limit
+
+    def clear(self) -> None:
+        with self._lock:
+            self._lines, self._count = {}, 0
+
+    def write_to(self, storage_dir: Path) -> None:
+        """Append the buffered lines to their files in storage_dir.
+
+        Each target file is opened once. Write failures are ignored -
+        telemetry should never break the CLI.
+        """
+        with self._lock:
+            pending, self._lines, self._count = self._lines, {}, 0
+        if not pending:
+            return
+
+        try:
+            storage_dir.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            return
+        for file_name, lines in pending.items():
+            try:
+                with open(storage_dir / file_name, "a", encoding="utf-8") as f:
+                    f.write("".join(lines))
+            except OSError:
+                # Silently fail - telemetry should never break the CLI
+                pass
 
 
 class TelemetryService:
@@ -17,19 +165,28 @@ class TelemetryService:
     IDK: telemetry-core, event-tracking, error-tracking, performance-tracking
     Responsibility: Opt-in usage tracking service with privacy-first design
     Invariants: All tracking methods are no-ops when disabled, no sensitive data is logged,
-                storage uses daily-rotated JSONL files in ~/.tac-bootstrap/telemetry/
+                storage uses daily-rotated JSONL files in ~/.tac-bootstrap/telemetry/,
+                statistics are served from rollup.json plus the not-yet-rolled-up log tails
     """
 
-    def __init__(self, enabled: Optional[bool] = None) -> None:
+    def __init__(
+        self, enabled: Optional[bool] = None, buffer_size: int = DEFAULT_BUFFER_SIZE
+    ) -> None:
         """Initialize telemetry service.
 
         Args:
             enabled: Explicit override for telemetry state.
                      None = auto-detect from config file.
                      True/False = explicit override (ignores config).
+            buffer_size: Number of buffered events that triggers a flush to disk.
+                         Remaining events are flushed when the service is
+                         collected or at interpreter exit.
         """
         self.storage_dir = Path.home() / ".tac-bootstrap" / "telemetry"
         self._config_file = Path.home() / ".tac-bootstrap" / ".telemetry_config"
+        self.buffer_size = max(1, buffer_size)
+        self._buffer = _EventBuffer()
+        self._finalizer = weakref.finalize(self, self._buffer.write_to, self.storage_dir)
 
         # Determine if enabled (create storage dir only if enabled)
         self.enabled = self._is_telemetry_enabled(enabled)
@@ -66,8 +223,8 @@ class TelemetryService:
     def track_event(self, event_name: str, properties: Optional[Dict[str, Any]] = None) -> None:
         """Track a CLI event (only if enabled).
 
-        Events are appended to a daily JSONL log file. Each event includes
-        a UTC timestamp and the event name.
+        Events are buffered in memory and appended to a daily JSONL log file
+        on flush. Each event includes a UTC timestamp and the event name.
 
         SAFE to log: event names, durations, counts, settings (architecture, framework)
         NEVER logs: file paths, project names, credentials, exception messages
@@ -145,8 +302,9 @@ class TelemetryService:
     def get_statistics(self) -> Dict[str, Any]:
         """Get aggregated statistics (safe to share).
 
-        Scans all daily log files and the errors log to produce
-        aggregate statistics about telemetry events.
+        Flushes buffered events, folds any new log lines into the rollup and
+        aggregates the per-day rollups, so the cost grows with the number of
+        days rather than the number of events.
 
         Returns:
             Dict with keys:
@@ -155,12 +313,15 @@ class TelemetryService:
                 events_today: int
                 commands: dict mapping command name to count
                 errors: dict mapping error type to count
-                avg_duration_ms: float (average of all performance events)
-                log_files: int (number of daily log files)
+                avg_duration_ms: float (average of all events with a duration)
+                p50_duration_ms: float (approximate median duration)
+                p95_duration_ms: float (approximate 95th percentile duration)
+                log_files: int (number of days with logged events)
         """
         if not self.enabled:
             return {"enabled": False, "message": "Telemetry disabled"}
 
+        self.flush()
         stats = self._load_statistics()
         return {
             "enabled": True,
@@ -182,21 +343,55 @@ class TelemetryService:
         """Disable telemetry tracking.
 
         Writes "disabled" to the config file and sets the internal state.
-        Does NOT delete existing data; use clear_data() for that.
+        Buffered events are flushed first. Does NOT delete existing data;
+        use clear_data() for that.
         """
+        self.flush()
         self._config_file.parent.mkdir(parents=True, exist_ok=True)
         self._config_file.write_text("disabled")
         self.enabled = False
 
+    def flush(self) -> None:
+        """Write buffered events to their log files.
+
+        Each target file is opened once per flush. Write failures are
+        ignored - telemetry should never break the CLI.
+        """
+        self._buffer.write_to(self.storage_dir)
+
+    def compact(self, compress: bool = True) -> Dict[str, int]:
+        """Fold new log lines into the rollup and compress old daily logs.
+
+        Daily logs from before today whose contents are fully rolled up are
+        gzipped to YYYY-MM-DD.jsonl.gz and no longer read by statistics.
+
+        Args:
+            compress: Whether to gzip fully rolled-up daily logs
+
+        Returns:
+            Dict with events_rolled_up and files_compressed counts
+        """
+        if not self.enabled:
+            return {"events_rolled_up": 0, "files_compressed": 0}
+
+        self.flush()
+        with self._rollup_lock():
+            rollup, rolled_up = self._update_rollup()
+            compressed = self._compress_logs(rollup) if compress else 0
+            if compressed:
+                self._save_rollup(rollup)
+        return {"events_rolled_up": rolled_up, "files_compressed": compressed}
+
     def clear_data(self) -> int:
         """Delete all collected telemetry data.
 
-        Removes and recreates the storage directory. The config file
-        is preserved (telemetry stays enabled/disabled).
+        Discards buffered events, then removes and recreates the storage
+        directory. The config file is preserved (telemetry stays enabled/disabled).
 
         Returns:
             Number of files deleted
         """
+        self._buffer.clear()
         files_deleted = 0
 
         if self.storage_dir.exists():
@@ -214,62 +409,39 @@ class TelemetryService:
     # =========================================================================
 
     def _append_to_log(self, event: Dict[str, Any]) -> None:
-        """Append event to daily log file (JSONL format).
+        """Buffer event for the daily log file (JSONL format).
 
         File naming convention: YYYY-MM-DD.jsonl (UTC date).
 
         Args:
             event: Event dict to serialize and append
         """
-        self.storage_dir.mkdir(parents=True, exist_ok=True)
-
         today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-        log_file = self.storage_dir / f"{today}.jsonl"
-
-        try:
-            with open(log_file, "a", encoding="utf-8") as f:
-                json.dump(event, f, ensure_ascii=False)
-                f.write("\n")
-        except OSError:
-            # Silently fail - telemetry should never break the CLI
-            pass
+        self._enqueue(f"{today}.jsonl", event)
 
     def _append_to_error_log(self, event: Dict[str, Any]) -> None:
-        """Append error event to errors.jsonl (separate from daily logs).
+        """Buffer error event for errors.jsonl (separate from daily logs).
 
         Args:
             event: Error event dict to serialize and append
         """
-        self.storage_dir.mkdir(parents=True, exist_ok=True)
+        self._enqueue(ERRORS_FILE, event)
 
-        error_file = self.storage_dir / "errors.jsonl"
-
-        try:
-            with open(error_file, "a", encoding="utf-8") as f:
-                json.dump(event, f, ensure_ascii=False)
-                f.write("\n")
-        except OSError:
-            # Silently fail - telemetry should never break the CLI
-            pass
+    def _enqueue(self, file_name: str, event: Dict[str, Any]) -> None:
+        """Add a serialized event to the buffer, flushing when it is full."""
+        line = json.dumps(event, ensure_ascii=False) + "\n"
+        if self._buffer.add(file_name, line, self.buffer_size):
+            self.flush()
 
     def _load_statistics(self) -> Dict[str, Any]:
-        """Load and aggregate statistics from all log files.
+        """Aggregate statistics from the per-day rollups.
 
-        Scans all .jsonl files in the storage directory (except errors.jsonl)
-        and aggregates event counts, command usage, error types, and durations.
+        New log lines are folded into the rollup first, so only log tails
+        written since the last query are parsed.
 
         Returns:
             Dict with aggregated statistics
         """
-        total_events = 0
-        events_today = 0
-        commands: Dict[str, int] = {}
-        errors: Dict[str, int] = {}
-        durations: list[float] = []
-        log_file_count = 0
-
-        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-
         if not self.storage_dir.exists():
             return {
                 "total_events": 0,
@@ -277,81 +449,233 @@ class TelemetryService:
                 "commands": {},
                 "errors": {},
                 "avg_duration_ms": 0.0,
+                "p50_duration_ms": 0.0,
+                "p95_duration_ms": 0.0,
                 "log_files": 0,
             }
 
-        for log_file in sorted(self.storage_dir.glob("*.jsonl")):
-            if log_file.name == "errors.jsonl":
-                # Process errors separately
-                self._count_errors_from_file(log_file, errors)
-                continue
+        with self._rollup_lock():
+            rollup, _ = self._update_rollup()
+        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
 
-            log_file_count += 1
-            is_today = log_file.stem == today
+        total_events = 0
+        commands: Dict[str, int] = {}
+        errors: Dict[str, int] = {}
+        durations = DurationSketch()
+        log_file_count = 0
 
-            try:
-                for line in log_file.read_text(encoding="utf-8").splitlines():
-                    line = line.strip()
-                    if not line:
-                        continue
-
-                    try:
-                        event = json.loads(line)
-                        total_events += 1
-
-                        if is_today:
-                            events_today += 1
-
-                        # Count commands
-                        if event.get("event") == "command_executed":
-                            cmd = event.get("command", "unknown")
-                            commands[cmd] = commands.get(cmd, 0) + 1
-
-                        # Track durations
-                        if "duration_ms" in event:
-                            try:
-                                durations.append(float(event["duration_ms"]))
-                            except (ValueError, TypeError):
-                                pass
-
-                    except json.JSONDecodeError:
-                        # Skip malformed lines
-                        pass
-            except OSError:
-                # Skip unreadable files
-                pass
+        for day_name, day in rollup["days"].items():
+            total_events += day["events"]
+            if day["events"]:
+                log_file_count += 1
+            _add_counts(commands, day["commands"])
+            _add_counts(errors, day["errors"])
+            durations.merge(DurationSketch.from_dict(day["durations"]))
 
-        avg_duration = sum(durations) / len(durations) if durations else 0.0
+        events_today = rollup["days"].get(today, {}).get("events", 0)
 
         return {
             "total_events": total_events,
             "events_today": events_today,
             "commands": commands,
             "errors": errors,
-            "avg_duration_ms": round(avg_duration, 2),
+            "avg_duration_ms": round(durations.mean, 2),
+            "p50_duration_ms": round(durations.quantile(0.5), 2),
+            "p95_duration_ms": round(durations.quantile(0.95), 2),
             "log_files": log_file_count,
         }
 
-    def _count_errors_from_file(
-        self, error_file: Path, errors: Dict[str, int]
-    ) -> None:
-        """Count error types from the errors.jsonl file.
+    # =========================================================================
+    # ROLLUP
+    # =========================================================================
 
-        Args:
-            error_file: Path to errors.jsonl
-            errors: Dict to accumulate error type counts into
+    @contextmanager
+    def _rollup_lock(self) -> Iterator[None]:
+        """Hold an exclusive lock on the rollup for a read-modify-write cycle.
+
+        Concurrent CLI processes would otherwise fold the same log bytes
+        twice or drop each other's updates. Where the lock file cannot be
+        opened (or flock is unavailable) the update proceeds unlocked.
         """
         try:
-            for line in error_file.read_text(encoding="utf-8").splitlines():
-                line = line.strip()
-                if not line:
-                    continue
+            lock_file = open(self.storage_dir / ROLLUP_LOCK_FILE, "ab")
+        except OSError:
+            yield
+            return
+        with lock_file:
+            if sys.platform != "win32":
+                import fcntl
+
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            yield
+
+    def _update_rollup(self) -> Tuple[Dict[str, Any], int]:
+        """Fold log lines written since the last update into rollup.json.
+
+        The rollup records a byte offset per raw log file; only the bytes
+        after that offset (up to the last complete line) are parsed.
+        Callers must hold _rollup_lock().
 
+        Returns:
+            Tuple of (rollup dict, number of events folded in)
+        """
+        rollup, rebuilt = self._load_rollup()
+        offsets: Dict[str, int] = rollup["offsets"]
+        folded = 0
+
+        if rebuilt:
+            # Compressed logs are only read when the rollup has to be rebuilt
+            for archive in sorted(self.storage_dir.glob("*.jsonl.gz")):
                 try:
-                    event = json.loads(line)
-                    err_type = event.get("error_type", "Unknown")
-                    errors[err_type] = errors.get(err_type, 0) + 1
-                except json.JSONDecodeError:
+                    with gzip.open(archive, "rb") as f:
+                        folded += self._fold(rollup, archive.name, f.read())
+                except (OSError, EOFError):
                     pass
-        except OSError:
+
+        for log_file in sorted(self.storage_dir.glob("*.jsonl")):
+            offset = offsets.get(log_file.name, 0)
+            try:
+                if log_file.stat().st_size < offset:
+                    offset = 0  # file was replaced since the last update
+                with open(log_file, "rb") as f:
+                    f.seek(offset)
+                    data = f.read()
+            except OSError:
+                continue
+
+            complete = data[: data.rfind(b"\n") + 1]
+            if complete:
+                folded += self._fold(rollup, log_file.name, complete)
+            offsets[log_file.name] = offset + len(complete)
+
+        if folded:
+            self._save_rollup(rollup)
+        return rollup, folded
+
+    def _fold(self, rollup: Dict[str, Any], file_name: str, data: bytes) -> int:
+        """Add the events in data (JSONL bytes) to the per-day rollups.
+
+        Daily log events are attributed to the file's day; error events to
+        the day of their timestamp.
+
+        Returns:
+            Number of events folded in
+        """
+        is_errors = file_name == ERRORS_FILE
+        folded = 0
+        sketches: Dict[str, DurationSketch] = {}
+
+        for line in data.decode("utf-8", errors="replace").splitlines():
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                event = json.loads(line)
+            except json.JSONDecodeError:
+                # Skip malformed lines
+                continue
+            if not isinstance(event, dict):
+                continue
+            folded += 1
+
+            if is_errors:
+                day_name = str(event.get("timestamp", ""))[:10] or "unknown"
+                day = _rollup_day(rollup, day_name)
+                err_type = event.get("error_type", "Unknown")
+                day["errors"][err_type] = day["errors"].get(err_type, 0) + 1
+                continue
+
+            day_name = file_name[:10]
+            day = _rollup_day(rollup, day_name)
+            day["events"] += 1
+
+            if event.get("event") == "command_executed":
+                cmd = event.get("command", "unknown")
+                day["commands"][cmd] = day["commands"].get(cmd, 0) + 1
+
+            if "duration_ms" in event:
+                try:
+                    duration = float(event["duration_ms"])
+                except (ValueError, TypeError):
+                    continue
+                if day_name not in sketches:
+                    sketches[day_name] = DurationSketch.from_dict(day["durations"])
+                sketches[day_name].add(duration)
+
+        for day_name, sketch in sketches.items():
+            rollup["days"][day_name]["durations"] = sketch.to_dict()
+        return folded
+
+    def _compress_logs(self, rollup: Dict[str, Any]) -> int:
+        """Gzip daily logs before today that are fully rolled up.
+
+        A log that already has an archive (late events for a past day) is
+        appended to it as an additional gzip member.
+
+        Returns:
+            Number of log files compressed
+        """
+        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        offsets: Dict[str, int] = rollup["offsets"]
+        compressed = 0
+
+        for log_file in sorted(self.storage_dir.glob("*.jsonl")):
+            if log_file.name == ERRORS_FILE or log_file.name[:10] >= today:
+                continue
+            try:
+                if log_file.stat().st_size != offsets.get(log_file.name, -1):
+                    continue
+                archive = log_file.with_name(log_file.name + ".gz")
+                with open(log_file, "rb") as src, gzip.open(archive, "ab") as dst:
+                    shutil.copyfileobj(src, dst)
+                log_file.unlink()
+            except OSError:
+                continue
+            offsets.pop(log_file.name, None)
+            compressed += 1
+
+        return compressed
+
+    def _load_rollup(self) -> Tuple[Dict[str, Any], bool]:
+        """Read rollup.json.
+
+        Returns:
+            Tuple of (rollup dict, whether it was missing or unreadable and
+            must be rebuilt from scratch)
+        """
+        try:
+            rollup = json.loads((self.storage_dir / ROLLUP_FILE).read_text(encoding="utf-8"))
+            if rollup.get("schema_version") == ROLLUP_SCHEMA_VERSION:
+                return rollup, False
+        except (OSError, ValueError, AttributeError):
             pass
+        return {"schema_version": ROLLUP_SCHEMA_VERSION, "offsets": {}, "days": {}}, True
+
+    def _save_rollup(self, rollup: Dict[str, Any]) -> None:
+        """Atomically replace rollup.json."""
+        path = self.storage_dir / ROLLUP_FILE
+        tmp = path.with_name(f".{ROLLUP_FILE}.{os.getpid()}.tmp")
+        try:
+            tmp.write_text(json.dumps(rollup, sort_keys=True), encoding="utf-8")
+            os.replace(tmp, path)
+        except OSError:
+            # Silently fail - telemetry should never break the CLI
+            tmp.unlink(missing_ok=True)
+
+
+def _rollup_day(rollup: Dict[str, Any], day_name: str) -> Dict[str, Any]:
+    """Return the rollup entry for day_name, creating it if needed."""
+    days: Dict[str, Dict[str, Any]] = rollup["days"]
+    if day_name not in days:
+        days[day_name] = {
+            "events": 0,
+            "commands": {},
+            "errors": {},
+            "durations": DurationSketch().to_dict(),
+        }
+    return days[day_name]
+
+
+def _add_counts(target: Dict[str, int], counts: Dict[str, int]) -> None:
+    for key, count in counts.items():
+        target[key] = target.get(key, 0) + count
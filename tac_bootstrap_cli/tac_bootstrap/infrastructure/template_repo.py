@@ -158,13 +158,16 @@ class TemplateRepository:
         # Create templates directory if it doesn't exist
         self.templates_dir.mkdir(parents=True, exist_ok=True)
 
-        # Initialize Jinja2 environment
+        # Initialize Jinja2 environment. The compiled-template cache is unbounded:
+        # a full render uses more templates than Jinja's default 400-entry LRU, which
+        # made every repeated render recompile most of them.
         self.env = Environment(
             loader=FileSystemLoader(str(self.templates_dir)),
             autoescape=self._select_autoescape,
             trim_blocks=True,
             lstrip_blocks=True,
             keep_trailing_newline=True,
+            cache_size=-1,
         )
 
         # Register custom filters
@@ -237,6 +240,28 @@ class TemplateRepository:
         except (TemplateSyntaxError, Exception) as e:
             raise TemplateRenderError(template_name, e) from e
 
+    def precompile(self) -> int:
+        """
+        Compile every .j2 template into the environment cache.
+
+        Used before rendering many projects in one process (or before forking
+        workers) so each template is compiled only once. Templates that fail to
+        compile are skipped; render() reports their errors when they are used.
+
+        Returns:
+            Number of templates compiled
+        """
+        compiled = 0
+        for template_name in self.list_templates():
+            if not template_name.endswith(".j2"):
+                continue
+            try:
+                self.env.get_template(Path(template_name).as_posix())
+            except Exception:
+                continue
+            compiled += 1
+        return compiled
+
     def render_string(self, template_str: str, context: Any) -> str:
         """
         Render a template string with the given context.
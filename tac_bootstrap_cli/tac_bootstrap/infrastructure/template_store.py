@@ -2,18 +2,23 @@
 IDK: template-registry, template-search, template-metadata, local-store
 Responsibility: Manages a local registry of reusable project templates with search,
                 install, rating, and metadata capabilities
-Invariants: Registry is stored as JSON, operations are idempotent, template IDs are unique,
-            ratings are 1-5, all IO errors are handled gracefully
+Invariants: Registry is stored in SQLite (WAL mode) with row-level updates, operations are
+            idempotent, template IDs are unique, ratings are 1-5, an existing registry.json
+            is imported once, the search index catches up from the registry revision
 """
 
 import json
 import shutil
+import sqlite3
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Sequence
 
 from pydantic import BaseModel, Field, field_validator
 
+from tac_bootstrap.infrastructure.registry_db import RegistryDatabase, revision_triggers
+from tac_bootstrap.infrastructure.search_index import IndexDocument, SearchIndex
+
 # ============================================================================
 # TEMPLATE MODEL
 # ============================================================================
@@ -77,16 +82,80 @@ class TemplateMetadata(BaseModel):
 # ============================================================================
 
 
+# Schema versions of registry.db; append new scripts, never edit shipped ones
+TEMPLATE_SCHEMA = [
+    """
+    CREATE TABLE templates (
+        id TEXT PRIMARY KEY,
+        name TEXT NOT NULL,
+        description TEXT NOT NULL DEFAULT '',
+        version TEXT NOT NULL,
+        author TEXT NOT NULL DEFAULT '',
+        downloads INTEGER NOT NULL DEFAULT 0,
+        rating REAL NOT NULL DEFAULT 0,
+        rating_count INTEGER NOT NULL DEFAULT 0,
+        tags TEXT NOT NULL DEFAULT '[]',
+        dependencies TEXT NOT NULL DEFAULT '[]',
+        created_at TEXT NOT NULL,
+        updated_at TEXT NOT NULL,
+        source_url TEXT,
+        installed INTEGER NOT NULL DEFAULT 0,
+        install_path TEXT,
+        rev INTEGER NOT NULL DEFAULT 0
+    );
+    CREATE TABLE template_tags (
+        tag TEXT NOT NULL,
+        template_id TEXT NOT NULL REFERENCES templates(id) ON DELETE CASCADE,
+        PRIMARY KEY (tag, template_id)
+    ) WITHOUT ROWID;
+    CREATE INDEX idx_template_tags_template ON template_tags(template_id);
+    CREATE INDEX idx_templates_author ON templates(author COLLATE NOCASE);
+    CREATE INDEX idx_templates_rating ON templates(rating);
+    CREATE INDEX idx_templates_downloads ON templates(downloads);
+    CREATE INDEX idx_templates_installed ON templates(installed);
+    CREATE INDEX idx_templates_rev ON templates(rev);
+    """
+    + revision_triggers("templates", "id"),
+]
+
+_COLUMNS = (
+    "id",
+    "name",
+    "description",
+    "version",
+    "author",
+    "downloads",
+    "rating",
+    "rating_count",
+    "tags",
+    "dependencies",
+    "created_at",
+    "updated_at",
+    "source_url",
+    "installed",
+    "install_path",
+)
+_INSERT = f"INSERT INTO templates ({', '.join(_COLUMNS)}) VALUES ({', '.join('?' * len(_COLUMNS))})"
+_UPSERT = _INSERT + " ON CONFLICT(id) DO UPDATE SET " + ", ".join(
+    f"{column} = excluded.{column}" for column in _COLUMNS[1:]
+)
+
+# SQLite limits bound parameters per statement; fetch id lists in chunks
+_CHUNK = 500
+
+
 class TemplateStore:
     """
-    IDK: template-registry-manager, local-json-storage, search-engine
-    Responsibility: Manages a local JSON-based template registry with CRUD operations,
+    IDK: template-registry-manager, sqlite-storage, search-engine
+    Responsibility: Manages a local SQLite template registry with CRUD operations,
                     search, filtering, rating, and installation tracking
-    Invariants: Registry is persisted to disk after mutations, template IDs are unique,
-                search is case-insensitive, ratings are bounded 1-5
+    Invariants: Every mutation is one row-level transaction, so concurrent invocations never
+                lose updates; models are hydrated only for the rows a call returns,
+                template IDs are unique, search is case-insensitive, ratings are bounded 1-5
     """
 
     DEFAULT_STORE_DIR = Path.home() / ".tac-bootstrap" / "template-store"
+    SEARCH_FIELD_WEIGHTS = {"name": 3.0, "tags": 2.0, "id": 1.5, "description": 1.0, "author": 1.0}
 
     def __init__(self, store_dir: Optional[Path] = None) -> None:
         """
@@ -96,48 +165,107 @@ class TemplateStore:
             store_dir: Directory for template storage (default: ~/.tac-bootstrap/template-store/)
         """
         self.store_dir = store_dir or self.DEFAULT_STORE_DIR
-        self.registry_file = self.store_dir / "registry.json"
+        self.db_file = self.store_dir / "registry.db"
+        self.legacy_registry_file = self.store_dir / "registry.json"
         self.templates_dir = self.store_dir / "templates"
-        self._registry: Dict[str, TemplateMetadata] = {}
+        self.index_file = self.store_dir / "search-index.json"
+        self._index: Optional[SearchIndex] = None
 
         # Ensure storage directories exist
         self.store_dir.mkdir(parents=True, exist_ok=True)
         self.templates_dir.mkdir(parents=True, exist_ok=True)
 
-        # Load existing registry
-        self._load_registry()
+        self._db = RegistryDatabase(self.db_file, TEMPLATE_SCHEMA)
+        self._db.import_legacy_json(self.legacy_registry_file, self._import_registry)
 
-    def _load_registry(self) -> None:
-        """Load the template registry from disk."""
-        if not self.registry_file.is_file():
-            self._registry = {}
+    # ========================================================================
+    # STORAGE
+    # ========================================================================
+
+    @staticmethod
+    def _import_registry(connection: sqlite3.Connection, data: Any) -> None:
+        """Insert the templates of a legacy registry.json, skipping invalid entries."""
+        if not isinstance(data, dict):
             return
+        for template_data in data.values():
+            try:
+                template = TemplateMetadata(**template_data)
+            except Exception:
+                # Skip invalid entries
+                continue
+            _write_template(connection, template, upsert=True)
+
+    def _hydrate(self, row: sqlite3.Row) -> TemplateMetadata:
+        """Build the model for one registry row."""
+        data = {column: row[column] for column in _COLUMNS}
+        data["tags"] = json.loads(data["tags"])
+        data["dependencies"] = json.loads(data["dependencies"])
+        data["installed"] = bool(data["installed"])
+        return TemplateMetadata.model_validate(data)
+
+    def _get(self, template_id: str) -> Optional[TemplateMetadata]:
+        """Load one template by primary key."""
+        row = self._db.query_one("SELECT * FROM templates WHERE id = ?", (template_id,))
+        return self._hydrate(row) if row is not None else None
+
+    def _fetch(self, template_ids: Sequence[str], min_rating: float = 0.0) -> Dict[str, Any]:
+        """Load the rows for template_ids (rated at least min_rating) keyed by id."""
+        rows: Dict[str, Any] = {}
+        for start in range(0, len(template_ids), _CHUNK):
+            chunk = list(template_ids[start : start + _CHUNK])
+            placeholders = ", ".join("?" * len(chunk))
+            for row in self._db.query(
+                f"SELECT * FROM templates WHERE id IN ({placeholders}) AND rating >= ?",
+                (*chunk, min_rating),
+            ):
+                rows[row["id"]] = row
+        return rows
+
+    @staticmethod
+    def _index_document(row: sqlite3.Row) -> IndexDocument:
+        """Searchable text and filter facets of a registry row."""
+        tags = json.loads(row["tags"])
+        return IndexDocument(
+            fields={
+                "name": row["name"],
+                "description": row["description"],
+                "author": row["author"],
+                "tags": tags,
+                "id": row["id"],
+            },
+            facets={
+                "tags": tags,
+                "author": [row["author"]],
+                "installed": [bool(row["installed"])],
+            },
+        )
+
+    def _search_index(self) -> SearchIndex:
+        """
+        Return the search index, caught up with the registry.
 
-        try:
-            with open(self.registry_file, "r", encoding="utf-8") as f:
-                raw_data = json.load(f)
-
-            self._registry = {}
-            for template_id, template_data in raw_data.items():
-                try:
-                    self._registry[template_id] = TemplateMetadata(**template_data)
-                except Exception:
-                    # Skip invalid entries
-                    continue
-        except (json.JSONDecodeError, OSError):
-            self._registry = {}
-
-    def _save_registry(self) -> None:
-        """Save the template registry to disk."""
-        try:
-            data = {
-                tid: tmpl.model_dump()
-                for tid, tmpl in self._registry.items()
-            }
-            with open(self.registry_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, default=str)
-        except OSError:
-            pass  # Gracefully handle write failures
+        Only rows stamped with a revision newer than the index are re-indexed, so
+        writes by this or any other process cost one row each to pick up.
+        """
+        if self._index is None:
+            self._index = SearchIndex(self.index_file, self.SEARCH_FIELD_WEIGHTS)
+        index = self._index
+        revision = self._db.revision()
+        if index.revision == revision:
+            return index
+
+        if index.revision is None or index.revision > revision:
+            rows = self._db.query("SELECT * FROM templates")
+            index.sync({row["id"]: self._index_document(row) for row in rows})
+        else:
+            for row in self._db.query("SELECT * FROM templates WHERE rev > ?", (index.revision,)):
+                index.add(row["id"], self._index_document(row))
+            existing = {row[0] for row in self._db.query("SELECT id FROM templates")}
+            for template_id in index.doc_ids() - existing:
+                index.remove(template_id)
+        index.revision = revision
+        index.save()
+        return index
 
     # ========================================================================
     # SEARCH AND QUERY
@@ -151,8 +279,10 @@ class TemplateStore:
         """
         Search templates by query string and optional filters.
 
-        Searches across template name, description, tags, and author.
-        Search is case-insensitive.
+        Searches across template name, description, tags, author and ID using the
+        search index: every query word must match a word of the template exactly,
+        as a substring, or (for typos) by trigram similarity. Without a query the
+        filters run as one SQL query over the tag, author, installed and rating indexes.
 
         Args:
             query: Search query string (matched against name, description, tags, author)
@@ -163,49 +293,50 @@ class TemplateStore:
                 - installed: bool - filter by installation status
 
         Returns:
-            List of matching TemplateMetadata, sorted by relevance (downloads)
+            List of matching TemplateMetadata, best match first (ties and queryless
+            searches by downloads)
         """
-        results: List[TemplateMetadata] = []
-        query_lower = query.lower().strip()
         filters = filters or {}
-
-        for template in self._registry.values():
-            # Text search
-            if query_lower:
-                searchable = " ".join([
-                    template.name.lower(),
-                    template.description.lower(),
-                    template.author.lower(),
-                    " ".join(t.lower() for t in template.tags),
-                    template.id.lower(),
-                ])
-                if query_lower not in searchable:
-                    continue
-
-            # Apply filters
-            if "tags" in filters:
-                filter_tags = {t.lower() for t in filters["tags"]}
-                template_tags = {t.lower() for t in template.tags}
-                if not filter_tags.intersection(template_tags):
-                    continue
-
-            if "author" in filters:
-                if template.author.lower() != filters["author"].lower():
-                    continue
-
-            if "min_rating" in filters:
-                if template.rating < filters["min_rating"]:
-                    continue
-
-            if "installed" in filters:
-                if template.installed != filters["installed"]:
-                    continue
-
-            results.append(template)
-
-        # Sort by downloads (most popular first)
-        results.sort(key=lambda t: t.downloads, reverse=True)
-        return results
+        min_rating = float(filters.get("min_rating", 0.0))
+
+        if not query.strip():
+            return [self._hydrate(row) for row in self._query_filtered(filters, min_rating)]
+
+        facet_filters: Dict[str, List[Any]] = {}
+        if "tags" in filters:
+            facet_filters["tags"] = list(filters["tags"])
+        if "author" in filters:
+            facet_filters["author"] = [filters["author"]]
+        if "installed" in filters:
+            facet_filters["installed"] = [filters["installed"]]
+
+        scores = dict(self._search_index().search(query, facet_filters, match_all=True))
+        rows = self._fetch(list(scores), min_rating)
+        ranked = sorted(rows.values(), key=lambda row: (-scores[row["id"]], -row["downloads"]))
+        return [self._hydrate(row) for row in ranked]
+
+    def _query_filtered(self, filters: Dict[str, Any], min_rating: float) -> List[sqlite3.Row]:
+        """Select templates matching the filters, most downloaded first."""
+        clauses = ["rating >= ?"]
+        params: List[Any] = [min_rating]
+        if "tags" in filters:
+            tags = [str(tag).lower() for tag in filters["tags"]]
+            clauses.append(
+                "id IN (SELECT template_id FROM template_tags "
+                f"WHERE tag IN ({', '.join('?' * len(tags))}))"
+            )
+            params.extend(tags)
+        if "author" in filters:
+            clauses.append("author = ? COLLATE NOCASE")
+            params.append(filters["author"])
+        if "installed" in filters:
+            clauses.append("installed = ?")
+            params.append(int(bool(filters["installed"])))
+        return self._db.query(
+            f"SELECT * FROM templates WHERE {' AND '.join(clauses)} "
+            "ORDER BY downloads DESC, rowid",
+            params,
+        )
 
     def install(self, template_id: str, version: Optional[str] = None) -> bool:
         """
@@ -220,25 +351,19 @@ class TemplateStore:
         Returns:
             True if installation succeeded, False if template not found
         """
-        template = self._registry.get(template_id)
-        if template is None:
+        if not self.template_exists(template_id):
             return False
 
         # Create installation directory
         install_dir = self.templates_dir / template_id.replace("/", "_")
         install_dir.mkdir(parents=True, exist_ok=True)
 
-        # Update metadata
-        template.installed = True
-        template.install_path = str(install_dir)
-        template.downloads += 1
-        template.updated_at = datetime.now(timezone.utc).isoformat()
-
-        if version:
-            template.version = version
-
-        self._save_registry()
-        return True
+        changed = self._db.execute(
+            "UPDATE templates SET installed = 1, install_path = ?, downloads = downloads + 1, "
+            "updated_at = ?, version = COALESCE(?, version) WHERE id = ?",
+            (str(install_dir), _now(), version, template_id),
+        )
+        return changed > 0
 
     def uninstall(self, template_id: str) -> bool:
         """
@@ -252,19 +377,19 @@ class TemplateStore:
         Returns:
             True if uninstallation succeeded, False if template not found
         """
-        template = self._registry.get(template_id)
-        if template is None:
+        row = self._db.query_one(
+            "SELECT install_path FROM templates WHERE id = ?", (template_id,)
+        )
+        if row is None:
             return False
 
         # Remove installation directory if it exists
-        if template.install_path:
-            install_dir = Path(template.install_path)
-            if install_dir.is_dir():
-                shutil.rmtree(install_dir, ignore_errors=True)
-
-        template.installed = False
-        template.install_path = None
-        self._save_registry()
+        _remove_install_dir(row["install_path"])
+
+        self._db.execute(
+            "UPDATE templates SET installed = 0, install_path = NULL WHERE id = ?",
+            (template_id,),
+        )
         return True
 
     def list_installed(self) -> List[TemplateMetadata]:
@@ -274,7 +399,8 @@ class TemplateStore:
         Returns:
             List of installed TemplateMetadata instances
         """
-        return [t for t in self._registry.values() if t.installed]
+        rows = self._db.query("SELECT * FROM templates WHERE installed = 1 ORDER BY rowid")
+        return [self._hydrate(row) for row in rows]
 
     def list_all(self) -> List[TemplateMetadata]:
         """
@@ -283,13 +409,15 @@ class TemplateStore:
         Returns:
             List of all TemplateMetadata instances, sorted by name
         """
-        return sorted(self._registry.values(), key=lambda t: t.name)
+        rows = self._db.query("SELECT * FROM templates ORDER BY name, rowid")
+        return [self._hydrate(row) for row in rows]
 
     def rate(self, template_id: str, rating: int) -> bool:
         """
         Rate a template (1-5 stars).
 
-        Updates the template's average rating using incremental averaging.
+        Updates the template's average rating using incremental averaging, in a
+        single UPDATE so concurrent ratings are all counted.
 
         Args:
             template_id: Template identifier to rate
@@ -304,18 +432,13 @@ class TemplateStore:
         if not 1 <= rating <= 5:
             raise ValueError(f"Rating must be between 1 and 5, got {rating}")
 
-        template = self._registry.get(template_id)
-        if template is None:
-            return False
-
-        # Incremental average calculation
-        total_rating = template.rating * template.rating_count
-        template.rating_count += 1
-        template.rating = round((total_rating + rating) / template.rating_count, 2)
-        template.updated_at = datetime.now(timezone.utc).isoformat()
-
-        self._save_registry()
-        return True
+        changed = self._db.execute(
+            "UPDATE templates SET "
+            "rating = ROUND((rating * rating_count + ?) / (rating_count + 1), 2), "
+            "rating_count = rating_count + 1, updated_at = ? WHERE id = ?",
+            (rating, _now(), template_id),
+        )
+        return changed > 0
 
     def get_metadata(self, template_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -327,7 +450,7 @@ class TemplateStore:
         Returns:
             Template metadata as dictionary, or None if not found
         """
-        template = self._registry.get(template_id)
+        template = self._get(template_id)
         if template is None:
             return None
         return template.model_dump()
@@ -343,8 +466,8 @@ class TemplateStore:
         Args:
             template: TemplateMetadata instance to add
         """
-        self._registry[template.id] = template
-        self._save_registry()
+        with self._db.transaction() as connection:
+            _write_template(connection, template, upsert=True)
 
     def remove_template(self, template_id: str) -> bool:
         """
@@ -356,18 +479,17 @@ class TemplateStore:
         Returns:
             True if template was found and removed, False otherwise
         """
-        if template_id not in self._registry:
-            return False
-
-        # Uninstall first if installed
-        template = self._registry[template_id]
-        if template.installed and template.install_path:
-            install_dir = Path(template.install_path)
-            if install_dir.is_dir():
-                shutil.rmtree(install_dir, ignore_errors=True)
-
-        del self._registry[template_id]
-        self._save_registry()
+        with self._db.transaction() as connection:
+            row = connection.execute(
+                "SELECT installed, install_path FROM templates WHERE id = ?", (template_id,)
+            ).fetchone()
+            if row is None:
+                return False
+            connection.execute("DELETE FROM templates WHERE id = ?", (template_id,))
+
+        # Uninstall as well if installed
+        if row["installed"]:
+            _remove_install_dir(row["install_path"])
         return True
 
     def template_exists(self, template_id: str) -> bool:
@@ -380,17 +502,20 @@ class TemplateStore:
         Returns:
             True if template exists
         """
-        return template_id in self._registry
+        row = self._db.query_one("SELECT 1 FROM templates WHERE id = ?", (template_id,))
+        return row is not None
 
     @property
     def template_count(self) -> int:
         """Total number of templates in the registry."""
-        return len(self._registry)
+        row = self._db.query_one("SELECT COUNT(*) FROM templates")
+        return int(row[0]) if row else 0
 
     @property
     def installed_count(self) -> int:
         """Number of installed templates."""
-        return sum(1 for t in self._registry.values() if t.installed)
+        row = self._db.query_one("SELECT COUNT(*) FROM templates WHERE installed = 1")
+        return int(row[0]) if row else 0
 
     def seed_defaults(self) -> None:
         """
@@ -442,8 +567,43 @@ class TemplateStore:
             ),
         ]
 
-        for template in defaults:
-            if template.id not in self._registry:
-                self._registry[template.id] = template
+        with self._db.transaction() as connection:
+            for template in defaults:
+                _write_template(connection, template, upsert=False)
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _write_template(
+    connection: sqlite3.Connection, template: TemplateMetadata, upsert: bool
+) -> None:
+    """Insert (or, with upsert, replace) a template row and its tag rows."""
+    data = template.model_dump()
+    values = [data[column] for column in _COLUMNS]
+    values[_COLUMNS.index("tags")] = json.dumps(data["tags"])
+    values[_COLUMNS.index("dependencies")] = json.dumps(data["dependencies"])
+    values[_COLUMNS.index("installed")] = int(data["installed"])
+
+    if upsert:
+        connection.execute(_UPSERT, values)
+    elif connection.execute(_INSERT.replace("INSERT", "INSERT OR IGNORE", 1), values).rowcount == 0:
+        return
+
+    connection.execute("DELETE FROM template_tags WHERE template_id = ?", (template.id,))
+    connection.executemany(
+        "INSERT OR IGNORE INTO template_tags (tag, template_id) VALUES (?, ?)",
+        [(tag, template.id) for tag in _tag_keys(template.tags)],
+    )
+
+
+def _tag_keys(tags: Iterable[str]) -> List[str]:
+    return sorted({tag.lower() for tag in tags})
+
 
-        self._save_registry()
+def _remove_install_dir(install_path: Optional[str]) -> None:
+    if install_path:
+        install_dir = Path(install_path)
+        if install_dir.is_dir():
+            shutil.rmtree(install_dir, ignore_errors=True)
@@ -0,0 +1,246 @@
+"""
+IDK: toolchain-probe, version-detection, probe-cache, concurrent-subprocess
+Responsibility: Detects installed CLI tools and their versions, running `<tool> --version`
+                probes concurrently and caching results on disk between invocations
+Invariants: Never raises for missing tools, unreadable cache or failing probes; a cached
+            result is reused only for the same resolved binary (path, mtime, size) and
+            within the TTL; cache writes are atomic; an instance reports the same result
+            for a tool until refreshed, so it can be probed once and shared (or pickled)
+"""
+
+import json
+import os
+import re
+import shutil
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+DEFAULT_CACHE_PATH = Path.home() / ".tac-bootstrap" / "cache" / "toolchain.json"
+DEFAULT_TTL_SECONDS = 24 * 60 * 60
+CACHE_SCHEMA_VERSION = 1
+
+# Executables tried in order for a tool name; the first one whose probe succeeds wins
+TOOL_EXECUTABLES: Dict[str, Sequence[str]] = {
+    "python": ("python3", "python"),
+}
+
+VERSION_PATTERN = re.compile(r"(\d+\.\d+(?:\.\d+)*)")
+
+# A resolved executable: real path and its stat stamp (mtime_ns, size)
+Candidate = Tuple[str, Dict[str, int]]
+
+
+@dataclass
+class ToolProbe:
+    """
+    IDK: probe-result, tool-version
+    Responsibility: Result of probing one tool
+    Invariants: installed is True iff an executable was found on PATH; version is the
+                first dotted number in the `--version` output, or None when unparseable
+    """
+
+    tool: str
+    installed: bool
+    path: Optional[str] = None
+    version: Optional[str] = None
+    cached: bool = False
+
+
+class ToolchainProbe:
+    """
+    IDK: toolchain-probe, probe-cache, thread-pool
+    Responsibility: Resolves tools on PATH and reports their versions, probing cache
+                    misses in parallel and persisting results to a JSON cache
+    Invariants: Tools with cache misses are probed concurrently, trying their candidate
+                executables in order until one reports a version; cache entries are
+                keyed by resolved binary path and invalidated when the binary's mtime
+                or size changes or the entry is older than ttl_seconds; results are
+                memoized per instance until probe(refresh=True) or clear()
+    """
+
+    def __init__(
+        self,
+        cache_path: Optional[Path] = DEFAULT_CACHE_PATH,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        timeout: float = 10.0,
+    ) -> None:
+        """Initialize the ToolchainProbe.
+
+        Args:
+            cache_path: JSON cache file shared by all commands; None disables caching
+            ttl_seconds: Maximum age of a cached result
+            timeout: Per-probe subprocess timeout in seconds
+        """
+        self.cache_path = cache_path
+        self.ttl_seconds = ttl_seconds
+        self.timeout = timeout
+        self._memo: Dict[str, ToolProbe] = {}
+
+    def probe(self, tools: List[str], refresh: bool = False) -> Dict[str, ToolProbe]:
+        """Detect tools and their versions.
+
+        Args:
+            tools: Tool names (e.g. "git", "python", "uv"); see TOOL_EXECUTABLES
+            refresh: Ignore cached results and probe every tool again
+
+        Returns:
+            Mapping of tool name to ToolProbe, for every requested tool
+        """
+        if refresh:
+            self._memo.clear()
+        results: Dict[str, ToolProbe] = {
+            tool: self._memo[tool] for tool in tools if tool in self._memo
+        }
+        candidates: Dict[str, List[Candidate]] = {}
+        for tool in dict.fromkeys(tools):
+            if tool in results:
+                continue
+            resolved = self._resolve(tool)
+            if not resolved:
+                results[tool] = ToolProbe(tool=tool, installed=False)
+            else:
+                candidates[tool] = resolved
+
+        entries = {} if refresh else self._load_cache()
+        now = time.time()
+        misses: List[str] = []
+        for tool, tool_candidates in candidates.items():
+            cached = self._select(tool_candidates, entries, now, run=False)
+            if cached is None:
+                misses.append(tool)
+            else:
+                path, version, _ = cached
+                results[tool] = ToolProbe(
+                    tool=tool, installed=True, path=path, version=version, cached=True
+                )
+
+        if misses:
+            with ThreadPoolExecutor(max_workers=len(misses)) as pool:
+                selections = pool.map(
+                    lambda tool: self._select(candidates[tool], entries, now, run=True), misses
+                )
+                for tool, selection in zip(misses, selections):
+                    assert selection is not None  # run=True always selects a candidate
+                    path, version, probed = selection
+                    results[tool] = ToolProbe(tool=tool, installed=True, path=path, version=version)
+                    entries.update(probed)
+            self._save_cache(entries)
+
+        self._memo.update(results)
+        return {tool: results[tool] for tool in tools}
+
+    def clear(self) -> None:
+        """Forget memoized results and delete the cache file, if any."""
+        self._memo.clear()
+        if self.cache_path is not None:
+            try:
+                self.cache_path.unlink()
+            except OSError:
+                pass
+
+    def _resolve(self, tool: str) -> List[Candidate]:
+        """Return the real path and stat stamp of each of the tool's executables on PATH."""
+        candidates: Dict[str, Dict[str, int]] = {}
+        for executable in TOOL_EXECUTABLES.get(tool, (tool,)):
+            found = shutil.which(executable)
+            if not found:
+                continue
+            try:
+                path = os.path.realpath(found)
+                stat = os.stat(path)
+            except OSError:
+                continue
+            candidates.setdefault(path, {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size})
+        return list(candidates.items())
+
+    def _select(
+        self,
+        candidates: List[Candidate],
+        entries: Dict[str, Dict[str, Any]],
+        now: float,
+        run: bool,
+    ) -> Optional[Tuple[str, Optional[str], Dict[str, Dict[str, Any]]]]:
+        """Pick the first candidate whose probe yields a version.
+
+        Fresh cache entries stand in for probes. Without run, a candidate that would
+        need probing makes the result None; with run, it is probed and its entry is
+        returned for the cache. When no candidate yields a version, the first one is
+        reported without a version.
+
+        Returns:
+            Tuple of (path, version, new cache entries), or None if a probe is needed
+        """
+        probed: Dict[str, Dict[str, Any]] = {}
+        for path, stamp in candidates:
+            entry = entries.get(path)
+            if (
+                entry is not None
+                and entry.get("mtime_ns") == stamp["mtime_ns"]
+                and entry.get("size") == stamp["size"]
+                and now - entry.get("probed_at", 0) <= self.ttl_seconds
+            ):
+                version = entry.get("version")
+            elif run:
+                version = self._run_version(path)
+                probed[path] = {**stamp, "version": version, "probed_at": now}
+            else:
+                return None
+            if version is not None:
+                return path, version, probed
+        return candidates[0][0], None, probed
+
+    def _run_version(self, path: str) -> Optional[str]:
+        """Run `<path> --version` and parse the version number from stdout or stderr."""
+        try:
+            result = subprocess.run(
+                [path, "--version"],
+                capture_output=True,
+                text=True,
+                timeout=self.timeout,
+            )
+        except (subprocess.TimeoutExpired, OSError):
+            return None
+        if result.returncode != 0:
+            return None
+        # Some tools print their version on stderr
+        match = VERSION_PATTERN.search(result.stdout.strip() or result.stderr.strip())
+        return match.group(1) if match else None
+
+    def _load_cache(self) -> Dict[str, Dict[str, Any]]:
+        if self.cache_path is None:
+            return {}
+        try:
+            data = json.loads(self.cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("schema_version") != CACHE_SCHEMA_VERSION:
+            return {}
+        binaries = data.get("binaries")
+        if not isinstance(binaries, dict):
+            return {}
+        return {path: entry for path, entry in binaries.items() if isinstance(entry, dict)}
+
+    def _save_cache(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        if self.cache_path is None:
+            return
+        now = time.time()
+        fresh = {
+            path: entry
+            for path, entry in entries.items()
+            if now - entry.get("probed_at", 0) <= self.ttl_seconds
+        }
+        payload = {"schema_version": CACHE_SCHEMA_VERSION, "binaries": fresh}
+        tmp_path = self.cache_path.with_name(f"{self.cache_path.name}.{os.getpid()}.tmp")
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+            os.replace(tmp_path, self.cache_path)
+        except OSError:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
@@ -0,0 +1,135 @@
+"""
+IDK: cli-command-registry, lazy-loading, startup-time
+Responsibility: Maps every top-level CLI command to the module that implements it and
+                imports that module only when the command is actually resolved
+Invariants: Importing this module imports nothing beyond typer; `--help` lists commands
+            from the registry without importing any command module; each command
+            module exposes a module-level `app` Typer that registers its commands
+"""
+
+from difflib import get_close_matches
+from importlib import import_module
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import typer
+from typer.core import TyperCommand, TyperGroup
+
+try:  # typer >= 0.22 vendors click; TyperGroup then takes the vendored types
+    from typer import _click as click
+    from typer._click.exceptions import UsageError
+except ImportError:
+    import click  # type: ignore[no-redef]
+    from click.exceptions import UsageError  # type: ignore[assignment]
+
+COMMANDS_PACKAGE = "tac_bootstrap.interfaces.commands"
+
+
+class CommandEntry(NamedTuple):
+    """Registry entry: implementing module (relative to COMMANDS_PACKAGE) and short help."""
+
+    module: str
+    help: str
+
+
+# Listing order of `tac-bootstrap --help`. `help` must match the first line of the
+# command's docstring (or its Typer group help); tests keep the two in sync.
+COMMANDS: Dict[str, CommandEntry] = {
+    "init": CommandEntry("project", "Create a new project with Agentic Layer."),
+    "add-agentic": CommandEntry("project", "Inject Agentic Layer into an existing repository."),
+    "doctor": CommandEntry("project", "Validate existing Agentic Layer setup."),
+    "render": CommandEntry("project", "Regenerate Agentic Layer from config.yml."),
+    "generate": CommandEntry("generate", "Generate code artifacts from specifications."),
+    "upgrade": CommandEntry("upgrade", "Upgrade agentic layer to latest TAC Bootstrap version."),
+    "migrate": CommandEntry("upgrade", "Migrate config.yml to a specific schema version."),
+    "rollback": CommandEntry("upgrade", "Rollback previous schema migration(s)."),
+    "fleet": CommandEntry("fleet", "Render, upgrade or diagnose many repositories in one run."),
+    "health-check": CommandEntry("validate", "Check system health and requirements."),
+    "validate": CommandEntry("validate", "Validate project configuration and requirements."),
+    "telemetry": CommandEntry("telemetry", "Manage CLI telemetry settings."),
+    "plugin": CommandEntry("plugin", "Manage TAC Bootstrap plugins."),
+    "template": CommandEntry(
+        "template", "Manage the template store (search, install, rate templates)."
+    ),
+    "security": CommandEntry("security", "Security scanning and auditing tools."),
+    "docs": CommandEntry("docs", "Generate and manage project documentation."),
+    "test-generate": CommandEntry("testing", "Generate test scaffolding for your project."),
+    "config": CommandEntry("config", "Manage CLI configuration settings"),
+    "dashboard": CommandEntry("dashboard", "Web dashboard for project management"),
+    "search": CommandEntry("search", "Search commands, templates, and features"),
+    "snapshot": CommandEntry("snapshot", "Manage project snapshots"),
+    "ai": CommandEntry("ai", "AI-assisted code generation"),
+    "learn": CommandEntry("learn", "Interactive learning mode."),
+    "tutorial": CommandEntry("learn", "Run an interactive tutorial."),
+    "recommend": CommandEntry("learn", "Get smart recommendations for project improvements."),
+    "team": CommandEntry("team", "Team collaboration features"),
+    "metrics": CommandEntry("metrics", "Project analytics and metrics"),
+    "community": CommandEntry("community", "Community plugins, templates, and achievements"),
+}
+
+_loaded_groups: Dict[str, TyperGroup] = {}
+
+
+def load_command(name: str) -> Optional[click.Command]:
+    """
+    Import the module registered for name and return its click command.
+
+    Args:
+        name: Top-level command name as typed on the command line
+
+    Returns:
+        The command, or None when name is not registered
+    """
+    entry = COMMANDS.get(name)
+    if entry is None:
+        return None
+    group = _loaded_groups.get(entry.module)
+    if group is None:
+        module = import_module(f"{COMMANDS_PACKAGE}.{entry.module}")
+        group = typer.main.get_group(module.app)
+        _loaded_groups[entry.module] = group
+    return group.commands.get(name)
+
+
+class LazyCommandGroup(TyperGroup):
+    """
+    IDK: lazy-command-group, typer-group
+    Responsibility: Root command group that resolves registry commands on first use
+    Invariants: Commands registered directly on the root app (version) take precedence;
+                while rendering help, registry commands are shown through lightweight
+                placeholders built from their registered help text
+    """
+
+    _rendering_help = False
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        eager = super().list_commands(ctx)
+        return eager + [name for name in COMMANDS if name not in self.commands]
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        command = super().get_command(ctx, cmd_name)
+        if command is not None or cmd_name not in COMMANDS:
+            return command
+        if self._rendering_help:
+            return TyperCommand(cmd_name, help=COMMANDS[cmd_name].help)
+        return load_command(cmd_name)
+
+    def format_help(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        self._rendering_help = True
+        try:
+            super().format_help(ctx, formatter)
+        finally:
+            self._rendering_help = False
+
+    def resolve_command(
+        self, ctx: click.Context, args: List[str]
+    ) -> Tuple[Optional[str], Optional[click.Command], List[str]]:
+        try:
+            return super().resolve_command(ctx, args)
+        except UsageError as exc:
+            # TyperGroup only suggests eagerly registered commands; add the registry
+            if args and "Did you mean" not in exc.message:
+                matches = get_close_matches(args[0], self.list_commands(ctx))
+                if matches:
+                    suggestions = ", ".join(f"{match!r}" for match in matches)
+                    exc.message = f"{exc.message.rstrip('.')}. Did you mean {suggestions}?"
+            raise
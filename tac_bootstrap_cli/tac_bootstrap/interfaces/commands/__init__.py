@@ -0,0 +1 @@
+"""CLI command modules, imported on demand through interfaces.command_registry."""
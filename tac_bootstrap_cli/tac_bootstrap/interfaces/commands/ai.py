@@ -0,0 +1,203 @@
+"""AI-assisted generation commands: ai generate:*|suggest:*."""
+
+from pathlib import Path
+
+import typer
+from rich.console import Console
+from rich.panel import Panel
+
+console = Console()
+app = typer.Typer(rich_markup_mode="rich")
+
+
+ai_app = typer.Typer(
+    name="ai",
+    help="AI-assisted code generation",
+)
+app.add_typer(ai_app, name="ai")
+
+
+@ai_app.command("generate:endpoint")
+def ai_generate_endpoint(
+    path: str = typer.Option(..., "--path", help="URL path (e.g., /users)"),
+    method: str = typer.Option("GET", "--method", "-m", help="HTTP method"),
+    project_path: Path = typer.Option(
+        Path("."), "--project", "-p", help="Project path"
+    ),
+) -> None:
+    """
+    Generate an API endpoint using AI.
+
+    Examples:
+        $ tac-bootstrap ai generate:endpoint --path /users --method GET
+    """
+    from tac_bootstrap.application.ai_generator import AIGeneratorService
+
+    service = AIGeneratorService()
+    if not service.is_configured:
+        console.print(
+            "[red]Error:[/red] Claude API key not configured. "
+            "Set ANTHROPIC_API_KEY environment variable."
+        )
+        raise typer.Exit(1)
+
+    console.print(f"[cyan]Generating {method} endpoint for {path}...[/cyan]")
+    result = service.generate_endpoint(
+        path=path, method=method, project_path=project_path
+    )
+
+    if result.success:
+        console.print(
+            Panel(
+                f"[bold green]Endpoint generated[/bold green]\n\n"
+                f"[cyan]Path:[/cyan] {path}\n"
+                f"[cyan]Method:[/cyan] {method}\n"
+                f"[cyan]File:[/cyan] {result.file_path}\n\n"
+                f"[bold]Generated Code:[/bold]\n{result.code[:2000]}",
+                border_style="green",
+                title="AI Generation",
+            )
+        )
+    else:
+        console.print(f"[red]Error:[/red] {result.error}")
+        raise typer.Exit(1)
+
+
+@ai_app.command("generate:migration")
+def ai_generate_migration(
+    migration_type: str = typer.Option(
+        "add-column", "--type", help="Migration type"
+    ),
+    name: str = typer.Option(..., "--name", help="Column/table name"),
+    data_type: str = typer.Option("string", "--data-type", help="Data type"),
+    project_path: Path = typer.Option(
+        Path("."), "--project", "-p", help="Project path"
+    ),
+) -> None:
+    """
+    Generate a database migration using AI.
+
+    Examples:
+        $ tac-bootstrap ai generate:migration --type add-column --name email
+    """
+    from tac_bootstrap.application.ai_generator import AIGeneratorService
+
+    service = AIGeneratorService()
+    if not service.is_configured:
+        console.print(
+            "[red]Error:[/red] Claude API key not configured. "
+            "Set ANTHROPIC_API_KEY environment variable."
+        )
+        raise typer.Exit(1)
+
+    console.print(
+        f"[cyan]Generating {migration_type} migration for '{name}'...[/cyan]"
+    )
+    result = service.generate_migration(
+        migration_type=migration_type,
+        name=name,
+        data_type=data_type,
+        project_path=project_path,
+    )
+
+    if result.success:
+        console.print(
+            Panel(
+                f"[bold green]Migration generated[/bold green]\n\n"
+                f"[bold]Generated Code:[/bold]\n{result.code[:2000]}",
+                border_style="green",
+                title="AI Generation",
+            )
+        )
+    else:
+        console.print(f"[red]Error:[/red] {result.error}")
+        raise typer.Exit(1)
+
+
+@ai_app.command("suggest:refactor")
+def ai_suggest_refactor(
+    file: Path = typer.Option(..., "--file", "-f", help="File to analyze"),
+    project_path: Path = typer.Option(
+        Path("."), "--project", "-p", help="Project path"
+    ),
+) -> None:
+    """
+    Get AI-powered refactoring suggestions.
+
+    Examples:
+        $ tac-bootstrap ai suggest:refactor --file src/app.py
+    """
+    from tac_bootstrap.application.ai_generator import AIGeneratorService
+
+    service = AIGeneratorService()
+    if not service.is_configured:
+        console.print("[red]Error:[/red] Claude API key not configured.")
+        raise typer.Exit(1)
+
+    console.print(f"[cyan]Analyzing {file}...[/cyan]")
+    suggestions = service.suggest_refactor(
+        file_path=file, project_path=project_path
+    )
+
+    if not suggestions:
+        console.print("[green]No refactoring suggestions - code looks good![/green]")
+        return
+
+    for i, suggestion in enumerate(suggestions, 1):
+        color = (
+            "red"
+            if suggestion.severity == "critical"
+            else ("yellow" if suggestion.severity == "warning" else "blue")
+        )
+        console.print(
+            f"\n[{color}][{i}] [{suggestion.severity.upper()}] "
+            f"{suggestion.category}[/{color}]"
+        )
+        console.print(f"  {suggestion.description}")
+        if suggestion.reasoning:
+            console.print(f"  [dim]Reason: {suggestion.reasoning}[/dim]")
+
+
+@ai_app.command("suggest:tests")
+def ai_suggest_tests(
+    module: Path = typer.Option(
+        ..., "--module", "-m", help="Module to generate tests for"
+    ),
+    project_path: Path = typer.Option(
+        Path("."), "--project", "-p", help="Project path"
+    ),
+) -> None:
+    """
+    Get AI-generated test suggestions.
+
+    Examples:
+        $ tac-bootstrap ai suggest:tests --module src/domain/user.py
+    """
+    from tac_bootstrap.application.ai_generator import AIGeneratorService
+
+    service = AIGeneratorService()
+    if not service.is_configured:
+        console.print("[red]Error:[/red] Claude API key not configured.")
+        raise typer.Exit(1)
+
+    console.print(f"[cyan]Generating test suggestions for {module}...[/cyan]")
+    suggestions = service.suggest_tests(
+        module_path=module, project_path=project_path
+    )
+
+    if not suggestions:
+        console.print("[yellow]No test suggestions generated[/yellow]")
+        return
+
+    for i, test_suggestion in enumerate(suggestions, 1):
+        console.print(
+            Panel(
+                f"[bold]{test_suggestion.test_name}[/bold]\n"
+                f"[dim]{test_suggestion.description}[/dim]\n"
+                f"[cyan]Type:[/cyan] {test_suggestion.test_type} | "
+                f"[cyan]Priority:[/cyan] {test_suggestion.priority}\n\n"
+                f"```python\n{test_suggestion.test_code[:1000]}\n```",
+                border_style="cyan",
+                title=f"Test Suggestion {i}",
+            )
+        )
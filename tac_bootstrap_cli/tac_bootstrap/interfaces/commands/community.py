@@ -0,0 +1,178 @@
+"""Community commands: community share|publish|browse|awards."""
+
+from typing import Optional
+
+import typer
+from rich.console import Console
+from rich.panel import Panel
+from rich.table import Table
+
+console = Console()
+app = typer.Typer(rich_markup_mode="rich")
+
+
+community_app = typer.Typer(
+    name="community",
+    help="Community plugins, templates, and achievements",
+)
+app.add_typer(community_app, name="community")
+
+
+@community_app.command("share")
+def community_share(
+    plugin_name: str = typer.Option(
+        ..., "--plugin", help="Plugin name to share"
+    ),
+    description: str = typer.Option(
+        "", "--desc", "-d", help="Plugin description"
+    ),
+    category: str = typer.Option(
+        "general", "--category", "-c", help="Plugin category"
+    ),
+) -> None:
+    """
+    Share a plugin to the community registry.
+
+    Examples:
+        $ tac-bootstrap community share --plugin my-auth-plugin
+    """
+    try:
+        from tac_bootstrap.application.community_service import CommunityService
+
+        service = CommunityService()
+        item = service.share_plugin(
+            name=plugin_name, description=description, category=category
+        )
+
+        console.print(
+            Panel(
+                f"[bold green]Plugin '{item.name}' shared successfully[/bold green]\n"
+                f"[cyan]Category:[/cyan] {item.category}\n"
+                f"[cyan]Type:[/cyan] {item.item_type}",
+                border_style="green",
+                title="Community Share",
+            )
+        )
+    except ValueError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+
+@community_app.command("publish")
+def community_publish(
+    template_name: str = typer.Option(
+        ..., "--template", help="Template name to publish"
+    ),
+    description: str = typer.Option(
+        "", "--desc", "-d", help="Template description"
+    ),
+    category: str = typer.Option(
+        "general", "--category", "-c", help="Template category"
+    ),
+) -> None:
+    """
+    Publish a template to the community.
+
+    Examples:
+        $ tac-bootstrap community publish --template my-template
+    """
+    try:
+        from tac_bootstrap.application.community_service import CommunityService
+
+        service = CommunityService()
+        item = service.publish_template(
+            name=template_name, description=description, category=category
+        )
+
+        console.print(
+            Panel(
+                f"[bold green]Template '{item.name}' published[/bold green]\n"
+                f"[cyan]Category:[/cyan] {item.category}",
+                border_style="green",
+                title="Community Publish",
+            )
+        )
+    except ValueError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+
+@community_app.command("browse")
+def community_browse(
+    category: Optional[str] = typer.Option(
+        None, "--category", "-c", help="Filter by category"
+    ),
+    query: Optional[str] = typer.Option(
+        None, "--query", "-q", help="Search query"
+    ),
+) -> None:
+    """
+    Browse community templates and plugins.
+
+    Examples:
+        $ tac-bootstrap community browse --category authentication
+    """
+    from tac_bootstrap.application.community_service import CommunityService
+
+    service = CommunityService()
+    templates = service.browse_templates(category=category, query=query)
+    plugins = service.browse_plugins(category=category, query=query)
+
+    all_items = templates + plugins
+    if not all_items:
+        console.print("[yellow]No items found matching your criteria[/yellow]")
+        return
+
+    table = Table(title="Community Items", border_style="cyan")
+    table.add_column("Name", style="bold green")
+    table.add_column("Type")
+    table.add_column("Category")
+    table.add_column("Description")
+    table.add_column("Rating", style="yellow")
+
+    for item in all_items:
+        rating_str = f"{item.rating:.1f}/5" if item.rating > 0 else "-"
+        table.add_row(
+            item.name,
+            item.item_type,
+            item.category,
+            item.description[:50],
+            rating_str,
+        )
+
+    console.print(table)
+
+
+@community_app.command("awards")
+def community_awards() -> None:
+    """
+    View achievements and badges.
+
+    Examples:
+        $ tac-bootstrap community awards
+    """
+    from tac_bootstrap.application.community_service import CommunityService
+
+    service = CommunityService()
+    awards = service.get_awards()
+
+    table = Table(title="Achievements", border_style="cyan")
+    table.add_column("Badge", style="bold")
+    table.add_column("Name")
+    table.add_column("Description")
+    table.add_column("Points")
+    table.add_column("Status")
+
+    for award in awards:
+        status_str = (
+            "[green]Earned[/green]" if award.earned else "[dim]Locked[/dim]"
+        )
+        table.add_row(
+            award.icon, award.name, award.description, str(award.points), status_str
+        )
+
+    console.print(table)
+
+    # Show total points
+    total = sum(a.points for a in awards if a.earned)
+    console.print(f"\n[bold cyan]Total Points:[/bold cyan] {total}")
@@ -0,0 +1,106 @@
+"""CLI settings commands: config set|get|list."""
+
+import typer
+from rich.console import Console
+from rich.panel import Panel
+from rich.table import Table
+
+console = Console()
+app = typer.Typer(rich_markup_mode="rich")
+
+
+config_app = typer.Typer(
+    name="config",
+    help="Manage CLI configuration settings",
+)
+app.add_typer(config_app, name="config")
+
+
+@config_app.command("set")
+def config_set(
+    key: str = typer.Argument(..., help="Configuration key (e.g., language)"),
+    value: str = typer.Argument(..., help="Configuration value"),
+) -> None:
+    """
+    Set a CLI configuration value.
+
+    Examples:
+        $ tac-bootstrap config set language es
+        $ tac-bootstrap config set language zh
+    """
+    supported_keys = {"language"}
+    if key not in supported_keys:
+        console.print(
+            f"[red]Error:[/red] Unknown configuration key '{key}'. "
+            f"Supported keys: {', '.join(supported_keys)}"
+        )
+        raise typer.Exit(1)
+
+    if key == "language":
+        from tac_bootstrap.infrastructure.i18n import SUPPORTED_LANGUAGES, I18nService
+
+        i18n = I18nService()
+        if value not in SUPPORTED_LANGUAGES:
+            console.print(
+                f"[red]Error:[/red] Unsupported language '{value}'. "
+                f"Supported: {', '.join(SUPPORTED_LANGUAGES.keys())}"
+            )
+            raise typer.Exit(1)
+        i18n.set_language(value)
+        lang_name = SUPPORTED_LANGUAGES[value]
+        console.print(
+            Panel(
+                f"[bold green]Language set to {lang_name} ({value})[/bold green]",
+                border_style="green",
+                title="Configuration",
+            )
+        )
+
+
+@config_app.command("get")
+def config_get(
+    key: str = typer.Argument(..., help="Configuration key to retrieve"),
+) -> None:
+    """
+    Get a CLI configuration value.
+
+    Examples:
+        $ tac-bootstrap config get language
+    """
+    if key == "language":
+        from tac_bootstrap.infrastructure.i18n import I18nService
+
+        i18n = I18nService()
+        console.print(
+            f"[cyan]language[/cyan] = [green]{i18n.current_language}[/green] "
+            f"({i18n.current_language_name})"
+        )
+    else:
+        console.print(f"[red]Error:[/red] Unknown configuration key '{key}'")
+        raise typer.Exit(1)
+
+
+@config_app.command("list")
+def config_list() -> None:
+    """
+    List all CLI configuration values.
+
+    Examples:
+        $ tac-bootstrap config list
+    """
+    from tac_bootstrap.infrastructure.i18n import I18nService
+
+    i18n = I18nService()
+
+    table = Table(title="CLI Configuration", border_style="cyan")
+    table.add_column("Key", style="bold")
+    table.add_column("Value", style="green")
+    table.add_column("Description")
+
+    table.add_row(
+        "language",
+        f"{i18n.current_language} ({i18n.current_language_name})",
+        "CLI output language",
+    )
+
+    console.print(table)
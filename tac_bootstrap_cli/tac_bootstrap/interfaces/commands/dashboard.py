@@ -0,0 +1,129 @@
+"""Web dashboard commands: dashboard start|stop|status."""
+
+import typer
+from rich.console import Console
+from rich.panel import Panel
+
+console = Console()
+app = typer.Typer(rich_markup_mode="rich")
+
+
+dashboard_app = typer.Typer(
+    name="dashboard",
+    help="Web dashboard for project management",
+)
+app.add_typer(dashboard_app, name="dashboard")
+
+
+@dashboard_app.command("start")
+def dashboard_start(
+    port: int = typer.Option(3000, "--port", "-p", help="Dashboard port (default: 3000)"),
+    host: str = typer.Option(
+        "127.0.0.1", "--host", help="Dashboard host (default: 127.0.0.1)"
+    ),
+) -> None:
+    """
+    Start the web dashboard.
+
+    Examples:
+        $ tac-bootstrap dashboard start
+        $ tac-bootstrap dashboard start --port 8080
+    """
+    try:
+        from tac_bootstrap.infrastructure.web_server import DashboardServer
+
+        server = DashboardServer(host=host, port=port)
+        result = server.start()
+
+        if result["status"] == "already_running":
+            console.print(
+                Panel(
+                    f"[yellow]Dashboard is already running[/yellow]\n\n"
+                    f"[cyan]URL:[/cyan] {result['url']}\n"
+                    f"[cyan]PID:[/cyan] {result['pid']}",
+                    border_style="yellow",
+                    title="Dashboard",
+                )
+            )
+        else:
+            console.print(
+                Panel(
+                    f"[bold green]Dashboard started successfully[/bold green]\n\n"
+                    f"[cyan]URL:[/cyan] {result['url']}\n"
+                    f"[cyan]PID:[/cyan] {result['pid']}\n\n"
+                    f"Open [bold]{result['url']}[/bold] in your browser.",
+                    border_style="green",
+                    title="Dashboard",
+                )
+            )
+    except Exception as e:
+        console.print(f"[red]Error starting dashboard:[/red] {e}")
+        raise typer.Exit(1)
+
+
+@dashboard_app.command("stop")
+def dashboard_stop() -> None:
+    """
+    Stop the web dashboard.
+
+    Examples:
+        $ tac-bootstrap dashboard stop
+    """
+    try:
+        from tac_bootstrap.infrastructure.web_server import DashboardServer
+
+        server = DashboardServer()
+        result = server.stop()
+
+        if result["status"] == "not_running":
+            console.print("[yellow]Dashboard is not running[/yellow]")
+        elif result["status"] == "stopped":
+            console.print(
+                Panel(
+                    f"[bold green]Dashboard stopped[/bold green]\n"
+                    f"PID {result['pid']} terminated.",
+                    border_style="green",
+                    title="Dashboard",
+                )
+            )
+        else:
+            console.print(f"[red]Error:[/red] {result.get('message', 'Unknown error')}")
+            raise typer.Exit(1)
+    except Exception as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+
+@dashboard_app.command("status")
+def dashboard_status() -> None:
+    """
+    Show dashboard status.
+
+    Examples:
+        $ tac-bootstrap dashboard status
+    """
+    from tac_bootstrap.infrastructure.web_server import DashboardServer
+
+    server = DashboardServer()
+    status_info = server.get_status()
+
+    if status_info["running"]:
+        console.print(
+            Panel(
+                f"[bold green]Dashboard is running[/bold green]\n\n"
+                f"[cyan]URL:[/cyan] {status_info['url']}\n"
+                f"[cyan]PID:[/cyan] {status_info.get('pid', 'unknown')}\n"
+                f"[cyan]Port:[/cyan] {status_info['port']}",
+                border_style="green",
+                title="Dashboard Status",
+            )
+        )
+    else:
+        console.print(
+            Panel(
+                "[yellow]Dashboard is not running[/yellow]\n\n"
+                "Start with: [cyan]tac-bootstrap dashboard start[/cyan]",
+                border_style="yellow",
+                title="Dashboard Status",
+            )
+        )
@@ -0,0 +1,140 @@
+"""Documentation generation command: docs."""
+
+from pathlib import Path
+from typing import Optional
+
+import typer
+import yaml
+from rich.console import Console
+
+console = Console()
+app = typer.Typer(rich_markup_mode="rich")
+
+
+@app.command()
+def docs(
+    action: str = typer.Argument(
+        ...,
+        help="Action: generate, serve, new-adr",
+    ),
+    repo_path: Path = typer.Argument(
+        Path("."), help="Project path (default: current directory)"
+    ),
+    with_diagrams: bool = typer.Option(
+        True, "--with-diagrams/--no-diagrams", help="Include Mermaid diagrams"
+    ),
+    port: int = typer.Option(3000, "--port", "-p", help="Port for docs server"),
+    force: bool = typer.Option(False, "--force", "-f", help="Overwrite existing files"),
+    title: Optional[str] = typer.Option(None, "--title", "-t", help="ADR title"),
+) -> None:
+    """
+    Generate and manage project documentation.
+
+    Auto-generates API docs, architecture docs, ADRs, and Mermaid diagrams.
+
+    Examples:
+        $ tac-bootstrap docs generate
+        $ tac-bootstrap docs generate --with-diagrams
+        $ tac-bootstrap docs serve --port 3000
+        $ tac-bootstrap docs new-adr --title "Use PostgreSQL"
+    """
+    try:
+        from tac_bootstrap.application.docs_generator import DocsGenerator
+
+        target_path = repo_path.resolve()
+
+        # Try to load project config
+        config = None
+        config_file = target_path / "config.yml"
+        project_name = target_path.name
+        language = "python"
+        framework = "none"
+        architecture = "simple"
+
+        if config_file.exists():
+            try:
+                with open(config_file, "r") as f:
+                    raw_config = yaml.safe_load(f)
+                from tac_bootstrap.domain.models import TACConfig
+                config = TACConfig(**raw_config)
+                project_name = config.project.name
+                language = config.project.language.value
+                framework = config.project.framework.value
+                architecture = config.project.architecture.value
+            except Exception:
+                pass
+
+        generator = DocsGenerator(
+            project_name=project_name,
+            language=language,
+            framework=framework,
+            architecture=architecture,
+            config=config,
+        )
+
+        if action == "generate":
+            console.print(f"[cyan]Generating documentation for:[/cyan] {target_path}\n")
+
+            files = generator.generate_all(
+                target_path,
+                force=force,
+                with_diagrams=with_diagrams,
+            )
+
+            if not files:
+                console.print(
+                    "[yellow]No new files generated (all exist already). "
+                    "Use --force to overwrite.[/yellow]"
+                )
+                return
+
+            console.print(f"[green]Generated {len(files)} documentation file(s):[/green]")
+            for file_path in files:
+                console.print(f"  {file_path.relative_to(target_path)}")
+
+        elif action == "serve":
+            docs_dir = target_path / "docs"
+            if not docs_dir.is_dir():
+                console.print(
+                    "[yellow]No docs/ directory found. Run 'docs generate' first.[/yellow]"
+                )
+                raise typer.Exit(1)
+            generator.serve_docs(docs_dir, port=port)
+
+        elif action == "new-adr":
+            if not title:
+                console.print("[red]Error:[/red] --title is required for new-adr")
+                raise typer.Exit(1)
+
+            docs_dir = target_path / "docs"
+            adr_dir = docs_dir / "adr"
+            adr_dir.mkdir(parents=True, exist_ok=True)
+
+            number = generator.get_next_adr_number(docs_dir)
+            content = generator.generate_adr(
+                decision=title,
+                context="(Add context here)",
+                consequence="(Add consequences here)",
+                number=number,
+            )
+
+            # Generate filename from title
+            slug = title.lower().replace(" ", "-")[:50]
+            filename = f"{number:04d}-{slug}.md"
+            adr_path = adr_dir / filename
+            adr_path.write_text(content, encoding="utf-8")
+
+            console.print(f"[green]Created ADR:[/green] {adr_path.relative_to(target_path)}")
+
+        else:
+            console.print(
+                f"[red]Error:[/red] Unknown action '{action}'. "
+                "Use: generate, serve, or new-adr"
+            )
+            raise typer.Exit(1)
+
+    except SystemExit:
+        raise
+    except Exception as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
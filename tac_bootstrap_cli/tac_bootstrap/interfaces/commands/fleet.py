@@ -0,0 +1,166 @@
+"""Multi-repository commands: fleet render|upgrade|doctor."""
+
+from pathlib import Path
+from typing import Optional
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+console = Console()
+app = typer.Typer(rich_markup_mode="rich")
+
+
+fleet_app = typer.Typer(
+    name="fleet",
+    help="Render, upgrade or diagnose many repositories in one run.",
+)
+app.add_typer(fleet_app, name="fleet")
+
+
+REPOS_HELP = "File listing one repository path per line (# comments allowed)"
+CONCURRENCY_HELP = "Maximum repositories processed in parallel (default: CPU count)"
+LOG_HELP = "JSONL file receiving one result per repository (default: fleet-<command>.jsonl)"
+
+STATUS_STYLE = {"ok": "[green]✓[/green]", "skipped": "[dim]-[/dim]", "failed": "[red]✗[/red]"}
+
+
+def _run_fleet(
+    command: str,
+    repos_file: Path,
+    concurrency: Optional[int],
+    log: Optional[Path],
+    force: bool = False,
+    dry_run: bool = False,
+    backup: bool = True,
+) -> None:
+    """Run command across the repositories in repos_file and print a summary."""
+    from tac_bootstrap.application.fleet_service import (
+        FleetOptions,
+        FleetService,
+        RepoResult,
+        read_repo_list,
+    )
+
+    if not repos_file.is_file():
+        console.print(f"[red]Error:[/red] Repository list not found: {repos_file}")
+        raise typer.Exit(1)
+    repos = read_repo_list(repos_file)
+    if not repos:
+        console.print(f"[yellow]No repositories listed in {repos_file}[/yellow]")
+        raise typer.Exit(0)
+
+    log_path = log or Path(f"fleet-{command}.jsonl")
+    service = FleetService(concurrency=concurrency)
+    console.print(
+        f"[bold]Fleet {command}[/bold]: {len(repos)} repositories, "
+        f"up to {min(service.concurrency, len(repos))} in parallel\n"
+    )
+
+    def show(result: RepoResult) -> None:
+        status = STATUS_STYLE[result.status]
+        line = f"  {status} {result.repo} [dim]{result.duration_ms:.0f}ms[/dim]"
+        if result.error:
+            line += f"  [red]{result.error.splitlines()[0]}[/red]"
+        console.print(line)
+
+    summary = service.run(
+        command,
+        repos,
+        FleetOptions(force=force, dry_run=dry_run, backup=backup),
+        log_path=log_path,
+        on_result=show,
+    )
+
+    table = Table(title=f"Fleet {command} summary", border_style="cyan", show_header=False)
+    table.add_column("Metric", style="bold")
+    table.add_column("Value")
+    table.add_row("Repositories", str(summary.total))
+    table.add_row("OK", f"[green]{summary.ok}[/green]")
+    table.add_row("Skipped", str(summary.skipped))
+    table.add_row("Failed", f"[red]{summary.failed}[/red]" if summary.failed else "0")
+    table.add_row("Workers", str(summary.workers))
+    table.add_row("Setup (templates + toolchain)", f"{summary.setup_ms / 1000:.2f}s")
+    table.add_row("Wall time", f"{summary.wall_ms / 1000:.2f}s")
+    table.add_row(
+        "Per repo p50 / p95 / max",
+        f"{summary.p50_ms:.0f}ms / {summary.p95_ms:.0f}ms / {summary.max_ms:.0f}ms",
+    )
+    console.print()
+    console.print(table)
+    console.print(f"[dim]Results written to {log_path}[/dim]")
+
+    if summary.failed:
+        raise typer.Exit(1)
+
+
+@fleet_app.command("render")
+def fleet_render(
+    repos: Path = typer.Option(..., "--repos", "-r", help=REPOS_HELP),
+    concurrency: Optional[int] = typer.Option(
+        None, "--concurrency", "-j", min=1, help=CONCURRENCY_HELP
+    ),
+    log: Optional[Path] = typer.Option(None, "--log", help=LOG_HELP),
+    dry_run: bool = typer.Option(False, "--dry-run", help="Build plans without writing files"),
+    force: bool = typer.Option(False, "--force", "-f", help="Overwrite existing files"),
+) -> None:
+    """
+    Regenerate the Agentic Layer of every listed repository from its config.yml.
+
+    Templates are compiled and the toolchain probed once for the whole fleet.
+
+    Examples:
+        $ tac-bootstrap fleet render --repos repos.txt
+        $ tac-bootstrap fleet render --repos repos.txt -j 8 --force --log render.jsonl
+    """
+    _run_fleet("render", repos, concurrency, log, force=force, dry_run=dry_run)
+
+
+@fleet_app.command("upgrade")
+def fleet_upgrade(
+    repos: Path = typer.Option(..., "--repos", "-r", help=REPOS_HELP),
+    concurrency: Optional[int] = typer.Option(
+        None, "--concurrency", "-j", min=1, help=CONCURRENCY_HELP
+    ),
+    log: Optional[Path] = typer.Option(None, "--log", help=LOG_HELP),
+    dry_run: bool = typer.Option(
+        False, "--dry-run", "-n", help="Show what would be changed without making changes"
+    ),
+    backup: bool = typer.Option(
+        True, "--backup/--no-backup", help="Create backup before upgrading (default: enabled)"
+    ),
+    force: bool = typer.Option(
+        False, "--force", "-f", help="Force upgrade even if versions match"
+    ),
+) -> None:
+    """
+    Upgrade every listed repository to the latest TAC Bootstrap version.
+
+    Runs without confirmation prompts; repositories already up to date are skipped.
+
+    Examples:
+        $ tac-bootstrap fleet upgrade --repos repos.txt --dry-run
+        $ tac-bootstrap fleet upgrade --repos repos.txt -j 4
+    """
+    _run_fleet(
+        "upgrade", repos, concurrency, log, force=force, dry_run=dry_run, backup=backup
+    )
+
+
+@fleet_app.command("doctor")
+def fleet_doctor(
+    repos: Path = typer.Option(..., "--repos", "-r", help=REPOS_HELP),
+    concurrency: Optional[int] = typer.Option(
+        None, "--concurrency", "-j", min=1, help=CONCURRENCY_HELP
+    ),
+    log: Optional[Path] = typer.Option(None, "--log", help=LOG_HELP),
+) -> None:
+    """
+    Diagnose the Agentic Layer setup of every listed repository.
+
+    Unhealthy repositories are reported as failed; issues are listed in the log.
+
+    Examples:
+        $ tac-bootstrap fleet doctor --repos repos.txt --log doctor.jsonl
+    """
+    _run_fleet("doctor", repos, concurrency, log)
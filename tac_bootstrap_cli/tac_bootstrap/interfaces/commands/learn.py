@@ -0,0 +1,195 @@
+"""Learning commands: learn, tutorial, recommend."""
+
+from pathlib import Path
+from typing import Optional
+
+import typer
+from rich.console import Console
+from rich.panel import Panel
+from rich.table import Table
+
+console = Console()
+app = typer.Typer(rich_markup_mode="rich")
+
+
+@app.command()
+def learn(
+    topic: Optional[str] = typer.Option(
+        None, "--topic", "-t", help="Topic to learn about"
+    ),
+) -> None:
+    """
+    Interactive learning mode.
+
+    Examples:
+        $ tac-bootstrap learn --topic ddd
+        $ tac-bootstrap learn --topic architecture
+    """
+    from tac_bootstrap.application.learning_service import LearningService
+
+    service = LearningService()
+
+    if topic:
+        topic_content = service.get_topic(topic)
+        if topic_content is None:
+            console.print(f"[red]Topic '{topic}' not found[/red]")
+            console.print("\n[bold]Available topics:[/bold]")
+            for t in service.list_topics():
+                console.print(f"  [green]{t.id}[/green] - {t.title}")
+            raise typer.Exit(1)
+
+        console.print(
+            Panel(
+                f"[bold cyan]{topic_content.title}[/bold cyan]\n"
+                f"[dim]{topic_content.description}[/dim]\n"
+                f"[dim]Difficulty: {topic_content.difficulty}[/dim]",
+                border_style="cyan",
+            )
+        )
+
+        for section in topic_content.sections:
+            console.print(f"\n[bold]{section['title']}[/bold]")
+            console.print(section["content"])
+
+        if topic_content.examples:
+            console.print("\n[bold cyan]Examples:[/bold cyan]")
+            for example in topic_content.examples:
+                console.print(f"\n[bold]{example['title']}[/bold]")
+                console.print(f"[dim]{example['code']}[/dim]")
+
+        if topic_content.related_topics:
+            console.print(
+                f"\n[dim]Related topics: "
+                f"{', '.join(topic_content.related_topics)}[/dim]"
+            )
+    else:
+        # List all topics
+        topics = service.list_topics()
+        table = Table(title="Available Learning Topics", border_style="cyan")
+        table.add_column("Topic ID", style="bold green")
+        table.add_column("Title")
+        table.add_column("Difficulty")
+        table.add_column("Description", style="dim")
+
+        for t in topics:
+            table.add_row(t.id, t.title, t.difficulty, t.description[:60])
+
+        console.print(table)
+        console.print("\n[dim]Use: tac-bootstrap learn --topic <id>[/dim]")
+
+
+@app.command(name="tutorial")
+def tutorial_cmd(
+    tutorial_type: str = typer.Option(
+        "quick-start", "--type", "-t", help="Tutorial type"
+    ),
+) -> None:
+    """
+    Run an interactive tutorial.
+
+    Examples:
+        $ tac-bootstrap tutorial --type quick-start
+        $ tac-bootstrap tutorial --type advanced
+    """
+    from tac_bootstrap.application.learning_service import LearningService
+
+    service = LearningService()
+    tut = service.get_tutorial(tutorial_type)
+
+    if tut is None:
+        console.print(f"[red]Tutorial '{tutorial_type}' not found[/red]")
+        console.print("\n[bold]Available tutorials:[/bold]")
+        for t in service.list_tutorials():
+            console.print(
+                f"  [green]{t.id}[/green] - {t.title} ({t.estimated_minutes} min)"
+            )
+        raise typer.Exit(1)
+
+    console.print(
+        Panel(
+            f"[bold cyan]{tut.title}[/bold cyan]\n"
+            f"[dim]{tut.description}[/dim]\n"
+            f"Difficulty: {tut.difficulty} | Est. time: {tut.estimated_minutes} min",
+            border_style="cyan",
+            title="Tutorial",
+        )
+    )
+
+    if tut.prerequisites:
+        console.print("\n[bold]Prerequisites:[/bold]")
+        for prereq in tut.prerequisites:
+            console.print(f"  - {prereq}")
+
+    for i, step in enumerate(tut.steps, 1):
+        console.print(
+            f"\n[bold cyan]Step {i}/{len(tut.steps)}:[/bold cyan] {step['title']}"
+        )
+        console.print(f"  {step['instruction']}")
+        if step.get("command"):
+            console.print(f"  [dim]$ {step['command']}[/dim]")
+
+
+@app.command()
+def recommend(
+    project_path: Path = typer.Option(
+        Path("."), "--path", "-p", help="Project path"
+    ),
+) -> None:
+    """
+    Get smart recommendations for project improvements.
+
+    Analyzes security, structure, testing, performance, and dependencies.
+
+    Examples:
+        $ tac-bootstrap recommend
+        $ tac-bootstrap recommend --path /my/project
+    """
+    from tac_bootstrap.application.recommendation_service import RecommendationService
+
+    service = RecommendationService()
+    console.print("[cyan]Analyzing project for recommendations...[/cyan]\n")
+    report = service.analyze(project_path.resolve())
+
+    if report.total == 0:
+        console.print(
+            Panel(
+                "[bold green]No recommendations - your project looks great![/bold green]",
+                border_style="green",
+                title="Recommendations",
+            )
+        )
+        return
+
+    # Summary
+    console.print(
+        Panel(
+            f"[bold]Found {report.total} recommendation(s)[/bold]\n\n"
+            f"[red]Critical:[/red] {report.critical}\n"
+            f"[yellow]Warnings:[/yellow] {report.warnings}\n"
+            f"[blue]Info:[/blue] {report.info}",
+            border_style="cyan",
+            title="Recommendations",
+        )
+    )
+
+    # Details
+    for rec in report.recommendations:
+        if rec.severity == "critical":
+            color = "red"
+            icon = "[X]"
+        elif rec.severity == "warning":
+            color = "yellow"
+            icon = "[!]"
+        else:
+            color = "blue"
+            icon = "[i]"
+
+        console.print(
+            f"\n[{color}]{icon} [{rec.severity.upper()}] {rec.title}[/{color}]"
+        )
+        if rec.description:
+            console.print(f"  {rec.description}")
+        if rec.suggestion:
+            console.print(f"  [dim]Suggestion: {rec.suggestion}[/dim]")
+        if rec.file_path:
+            console.print(f"  [dim]File: {rec.file_path}[/dim]")
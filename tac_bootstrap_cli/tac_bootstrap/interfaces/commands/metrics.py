@@ -0,0 +1,181 @@
+"""Project metrics commands: metrics generate|show|history."""
+
+from pathlib import Path
+
+import typer
+from rich.console import Console
+from rich.panel import Panel
+from rich.table import Table
+
+console = Console()
+app = typer.Typer(rich_markup_mode="rich")
+
+
+metrics_app = typer.Typer(
+    name="metrics",
+    help="Project analytics and metrics",
+)
+app.add_typer(metrics_app, name="metrics")
+
+
+@metrics_app.command("generate")
+def metrics_generate(
+    project_path: Path = typer.Option(
+        Path("."), "--path", "-p", help="Project path"
+    ),
+) -> None:
+    """
+    Generate project metrics.
+
+    Examples:
+        $ tac-bootstrap metrics generate
+    """
+    from tac_bootstrap.application.metrics_service import MetricsService
+
+    service = MetricsService()
+    console.print("[cyan]Generating project metrics...[/cyan]")
+
+    metrics = service.generate_metrics(project_path.resolve())
+
+    # Health score panel
+    grade_color = (
+        "green"
+        if metrics.health_score >= 70
+        else ("yellow" if metrics.health_score >= 40 else "red")
+    )
+    console.print(
+        Panel(
+            f"[bold {grade_color}]{metrics.health_grade}[/bold {grade_color}] "
+            f"Health Score: [{grade_color}]{metrics.health_score}/100[/{grade_color}]",
+            border_style=grade_color,
+            title="Project Health",
+        )
+    )
+
+    # Complexity table
+    table = Table(title="Code Metrics", border_style="cyan")
+    table.add_column("Metric", style="bold")
+    table.add_column("Value", style="green")
+
+    table.add_row("Source Files", str(metrics.source_file_count))
+    table.add_row("Test Files", str(metrics.test_file_count))
+    table.add_row("Total Lines", str(metrics.complexity.total_lines))
+    table.add_row("Functions", str(metrics.complexity.total_functions))
+    table.add_row("Classes", str(metrics.complexity.total_classes))
+    table.add_row("Avg File Length", f"{metrics.complexity.average_file_length:.1f}")
+    table.add_row("Avg Complexity", f"{metrics.complexity.average_complexity:.2f}")
+    table.add_row("Dependencies", str(metrics.dependencies.total_dependencies))
+
+    console.print(table)
+
+    # Recommendations
+    if metrics.recommendations:
+        console.print("\n[bold]Recommendations:[/bold]")
+        for rec in metrics.recommendations:
+            console.print(f"  - {rec}")
+
+    # Save to history
+    service.save_metrics_history(project_path.resolve(), metrics)
+
+
+@metrics_app.command("show")
+def metrics_show(
+    metric: str = typer.Option(
+        "complexity", "--metric", "-m",
+        help="Metric to show (complexity, coverage)",
+    ),
+    project_path: Path = typer.Option(
+        Path("."), "--path", "-p", help="Project path"
+    ),
+) -> None:
+    """
+    Show specific project metrics.
+
+    Examples:
+        $ tac-bootstrap metrics show --metric complexity
+    """
+    from tac_bootstrap.application.metrics_service import MetricsService
+
+    service = MetricsService()
+
+    if metric == "complexity":
+        complexity = service.get_complexity_metrics(project_path.resolve())
+
+        console.print(
+            Panel(
+                f"[bold]Code Complexity Analysis[/bold]\n\n"
+                f"[cyan]Files:[/cyan] {complexity.total_files}\n"
+                f"[cyan]Total Lines:[/cyan] {complexity.total_lines}\n"
+                f"[cyan]Average Complexity:[/cyan] {complexity.average_complexity:.2f}",
+                border_style="cyan",
+                title="Complexity Metrics",
+            )
+        )
+
+        if complexity.most_complex_files:
+            table = Table(title="Most Complex Files", border_style="yellow")
+            table.add_column("File", style="bold")
+            table.add_column("Lines")
+            table.add_column("Functions")
+            table.add_column("Complexity", style="yellow")
+
+            for fm in complexity.most_complex_files[:10]:
+                table.add_row(
+                    fm.path,
+                    str(fm.total_lines),
+                    str(fm.functions),
+                    f"{fm.complexity_score:.1f}",
+                )
+            console.print(table)
+    else:
+        console.print(
+            f"[yellow]Metric '{metric}' display not yet implemented[/yellow]"
+        )
+
+
+@metrics_app.command("history")
+def metrics_history(
+    days: int = typer.Option(
+        30, "--days", "-d", help="Number of days of history"
+    ),
+    project_path: Path = typer.Option(
+        Path("."), "--path", "-p", help="Project path"
+    ),
+) -> None:
+    """
+    Show metrics history.
+
+    Examples:
+        $ tac-bootstrap metrics history --days 30
+    """
+    from tac_bootstrap.application.metrics_service import MetricsService
+
+    service = MetricsService()
+    history_data = service.get_metrics_history(project_path.resolve(), days=days)
+
+    if not history_data:
+        console.print(
+            "[yellow]No metrics history found. "
+            "Run 'tac-bootstrap metrics generate' first.[/yellow]"
+        )
+        return
+
+    table = Table(title=f"Metrics History (last {days} days)", border_style="cyan")
+    table.add_column("Date", style="bold")
+    table.add_column("Health")
+    table.add_column("Grade")
+    table.add_column("Files")
+    table.add_column("Lines")
+    table.add_column("Complexity")
+
+    for entry in history_data[-20:]:
+        table.add_row(
+            entry.get("timestamp", "")[:10],
+            str(entry.get("health_score", 0)),
+            entry.get("health_grade", ""),
+            str(entry.get("total_files", 0)),
+            str(entry.get("total_lines", 0)),
+            f"{entry.get('avg_complexity', 0):.2f}",
+        )
+
+    console.print(table)
@@ -0,0 +1,164 @@
+"""Plugin management command: plugin."""
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+import typer
+from rich.console import Console
+from rich.panel import Panel
+from rich.table import Table
+
+if TYPE_CHECKING:
+    from tac_bootstrap.application.plugin_service import StatsTable
+
+console = Console()
+app = typer.Typer(rich_markup_mode="rich")
+
+
+@app.command()
+def plugin(
+    action: str = typer.Argument(
+        ...,
+        help="Action: list, info <name>, enable <name>, disable <name>, stats [name]",
+    ),
+    name: Optional[str] = typer.Argument(
+        None, help="Plugin name (for info/enable/disable; filters stats)"
+    ),
+    plugins_dir: Optional[Path] = typer.Option(
+        None, "--plugins-dir", help="Custom plugins directory"
+    ),
+) -> None:
+    """
+    Manage TAC Bootstrap plugins.
+
+    Plugins extend TAC Bootstrap with custom hooks that execute
+    during project generation lifecycle events.
+
+    Examples:
+        $ tac-bootstrap plugin list
+        $ tac-bootstrap plugin info example-plugin
+        $ tac-bootstrap plugin enable example-plugin
+        $ tac-bootstrap plugin disable example-plugin
+        $ tac-bootstrap plugin stats
+    """
+    try:
+        from tac_bootstrap.application.plugin_service import DEFAULT_STATS_PATH, PluginService
+
+        if action == "stats":
+            _show_stats(PluginService.load_stats(DEFAULT_STATS_PATH), name)
+            return
+
+        service = PluginService()
+
+        # Determine plugins directory
+        pdir = plugins_dir or Path.cwd() / "plugins"
+        if pdir.is_dir():
+            service.load_plugins(pdir)
+
+        if action == "list":
+            plugins = service.list_plugins()
+            if not plugins:
+                console.print("[yellow]No plugins found.[/yellow]")
+                console.print(f"[dim]Looking in: {pdir}[/dim]")
+                return
+
+            table = Table(title="Installed Plugins", border_style="cyan")
+            table.add_column("Name", style="bold")
+            table.add_column("Version")
+            table.add_column("Author")
+            table.add_column("Status")
+            table.add_column("Hooks")
+
+            for p in plugins:
+                status = "[green]Enabled[/green]" if p.enabled else "[red]Disabled[/red]"
+                hooks_str = ", ".join(p.hook_names) or "-"
+                table.add_row(p.name, p.version, p.author, status, hooks_str)
+
+            console.print(table)
+            console.print(f"\n[dim]Total: {service.plugin_count} plugin(s), "
+                          f"{service.enabled_count} enabled[/dim]")
+
+        elif action == "info":
+            if not name:
+                console.print("[red]Error:[/red] Plugin name required for 'info'")
+                raise typer.Exit(1)
+            selected = service.get_plugin(name)
+            if selected is None:
+                console.print(f"[red]Plugin '{name}' not found[/red]")
+                raise typer.Exit(1)
+            timeout = selected.manifest.timeout
+            info = f"""[bold]{selected.name}[/bold] v{selected.version}
+[cyan]Author:[/cyan] {selected.author}
+[cyan]Description:[/cyan] {selected.description}
+[cyan]Status:[/cyan] {"Enabled" if selected.enabled else "Disabled"}
+[cyan]Hooks:[/cyan] {', '.join(selected.hook_names) or 'None'}
+[cyan]Timeout:[/cyan] {f"{timeout:g}s" if timeout else 'None'}"""
+            if selected.load_error:
+                info += f"\n[red]Error:[/red] {selected.load_error}"
+            console.print(Panel(info, border_style="cyan", title="Plugin Info"))
+
+        elif action == "enable":
+            if not name:
+                console.print("[red]Error:[/red] Plugin name required")
+                raise typer.Exit(1)
+            if service.enable_plugin(name):
+                console.print(f"[green]Plugin '{name}' enabled[/green]")
+            else:
+                console.print(f"[red]Plugin '{name}' not found[/red]")
+                raise typer.Exit(1)
+
+        elif action == "disable":
+            if not name:
+                console.print("[red]Error:[/red] Plugin name required")
+                raise typer.Exit(1)
+            if service.disable_plugin(name):
+                console.print(f"[yellow]Plugin '{name}' disabled[/yellow]")
+            else:
+                console.print(f"[red]Plugin '{name}' not found[/red]")
+                raise typer.Exit(1)
+
+        else:
+            console.print(
+                f"[red]Error:[/red] Unknown action '{action}'. "
+                "Use: list, info, enable, disable, or stats"
+            )
+            raise typer.Exit(1)
+
+    except SystemExit:
+        raise
+    except Exception as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+
+def _show_stats(stats: "StatsTable", plugin_name: Optional[str]) -> None:
+    """Print per-hook latency counters, optionally for one plugin."""
+    table = Table(title="Plugin Hook Latency", border_style="cyan")
+    table.add_column("Hook", style="bold")
+    table.add_column("Plugin")
+    table.add_column("Calls", justify="right")
+    table.add_column("Failed", justify="right")
+    table.add_column("Timeouts", justify="right")
+    table.add_column("Avg ms", justify="right")
+    table.add_column("Max ms", justify="right")
+    table.add_column("Total ms", justify="right")
+
+    for hook_name in sorted(stats):
+        for name, entry in sorted(stats[hook_name].items()):
+            if plugin_name and name != plugin_name:
+                continue
+            table.add_row(
+                hook_name,
+                name,
+                str(entry.calls),
+                f"[red]{entry.failures}[/red]" if entry.failures else "0",
+                f"[red]{entry.timeouts}[/red]" if entry.timeouts else "0",
+                f"{entry.avg_ms:.1f}",
+                f"{entry.max_ms:.1f}",
+                f"{entry.total_ms:.1f}",
+            )
+
+    if not table.row_count:
+        console.print("[yellow]No plugin hook statistics recorded yet.[/yellow]")
+        return
+    console.print(table)
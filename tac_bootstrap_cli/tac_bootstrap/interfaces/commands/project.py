@@ -0,0 +1,638 @@
+"""Project setup commands: init, add-agentic, doctor, render."""
+
+from pathlib import Path
+from typing import Optional
+
+import typer
+import yaml
+from rich.console import Console
+from rich.panel import Panel
+
+from tac_bootstrap.application.validation_service import ValidationService
+from tac_bootstrap.domain.models import (
+    Architecture,
+    ClaudeConfig,
+    ClaudeSettings,
+    CommandsSpec,
+    Framework,
+    Language,
+    OrchestratorConfig,
+    PackageManager,
+    PathsSpec,
+    ProjectSpec,
+    TACConfig,
+    get_default_commands,
+    get_package_managers_for_language,
+)
+from tac_bootstrap.infrastructure.template_repo import TemplateRepository
+from tac_bootstrap.infrastructure.toolchain_probe import ToolchainProbe
+from tac_bootstrap.infrastructure.ui_components import UIComponents
+
+console = Console()
+app = typer.Typer(rich_markup_mode="rich")
+
+
+@app.command()
+def init(
+    name: str = typer.Argument(..., help="Project name"),
+    output_dir: Optional[Path] = typer.Option(
+        None, "--output", "-o", help="Output directory (default: ./{name})"
+    ),
+    language: Optional[Language] = typer.Option(
+        None, "--language", "-l", help="Programming language (default: python)"
+    ),
+    framework: Optional[Framework] = typer.Option(
+        None, "--framework", "-f", help="Web framework or project type (default: none)"
+    ),
+    package_manager: Optional[PackageManager] = typer.Option(
+        None, "--package-manager", "-p", help="Package manager (auto-detected if not specified)"
+    ),
+    architecture: Optional[Architecture] = typer.Option(
+        None, "--architecture", "-a", help="Software architecture pattern (default: simple)"
+    ),
+    with_orchestrator: bool = typer.Option(
+        False, "--with-orchestrator", help="Include orchestrator backend and frontend (TAC-14)"
+    ),
+    interactive: bool = typer.Option(
+        True, "--interactive/--no-interactive", help="Use interactive wizard"
+    ),
+    enhanced: bool = typer.Option(
+        False, "--enhanced", "-e", help="Use enhanced wizard with Rich UI and previews"
+    ),
+    preview: bool = typer.Option(
+        False, "--preview", help="Show directory tree preview without creating files"
+    ),
+    dry_run: bool = typer.Option(False, "--dry-run", help="Preview without creating files"),
+) -> None:
+    """
+    Create a new project with Agentic Layer.
+
+    Scaffolds a new project directory with AI-powered development workflows,
+    slash commands, templates, and configuration files.
+
+    Examples:
+        # Interactive mode (default)
+        $ tac-bootstrap init my-app
+
+        # Enhanced wizard with Rich UI and tree preview
+        $ tac-bootstrap init my-app --enhanced
+
+        # Show directory structure preview only
+        $ tac-bootstrap init my-app --preview
+
+        # Non-interactive with options
+        $ tac-bootstrap init my-api --language python --framework fastapi \\
+          --package-manager uv --architecture ddd --no-interactive
+
+        # Preview without creating files
+        $ tac-bootstrap init my-app --dry-run
+    """
+    try:
+        # Determine target directory
+        target_dir = output_dir or Path.cwd() / name
+        target_dir = target_dir.resolve()
+
+        # Handle --preview: show directory tree without creating
+        if preview:
+            # Build a minimal config for preview
+            preview_lang = language or Language.PYTHON
+            preview_fw = framework or Framework.NONE
+            preview_arch = architecture or Architecture.SIMPLE
+            preview_pm = package_manager or PackageManager.UV
+            preview_config = TACConfig(
+                project=ProjectSpec(
+                    name=name,
+                    language=preview_lang,
+                    framework=preview_fw,
+                    architecture=preview_arch,
+                    package_manager=preview_pm,
+                ),
+                paths=PathsSpec(app_root="src"),
+                commands=CommandsSpec(start="", test=""),
+                claude=ClaudeConfig(settings=ClaudeSettings(project_name=name)),
+                orchestrator=OrchestratorConfig(enabled=with_orchestrator),
+            )
+            UIComponents.show_project_tree_preview(preview_config)
+            UIComponents.show_configuration_summary(preview_config)
+            return
+
+        if enhanced:
+            from tac_bootstrap.interfaces.wizard import run_enhanced_init_wizard
+
+            config = run_enhanced_init_wizard(
+                name=name,
+                language=language,
+                framework=framework,
+                package_manager=package_manager,
+                architecture=architecture,
+                with_orchestrator=with_orchestrator,
+            )
+            if config is None:
+                # User cancelled
+                raise typer.Exit(0)
+        elif interactive:
+            from tac_bootstrap.interfaces.wizard import run_init_wizard
+
+            config = run_init_wizard(
+                name=name,
+                language=language,
+                framework=framework,
+                package_manager=package_manager,
+                architecture=architecture,
+                with_orchestrator=with_orchestrator,
+            )
+        else:
+            # Non-interactive mode: build config from CLI arguments
+            # Use defaults for any unspecified options
+            if language is None:
+                language = Language.PYTHON
+            if framework is None:
+                framework = Framework.NONE
+            if architecture is None:
+                architecture = Architecture.SIMPLE
+
+            # Auto-detect package manager if not specified
+            if package_manager is None:
+                valid_pms = get_package_managers_for_language(language)
+                if not valid_pms:
+                    console.print(f"[red]No package managers available for {language.value}[/red]")
+                    raise typer.Exit(1)
+                package_manager = valid_pms[0]  # Use first as default
+                console.print(f"[dim]Auto-detected package manager: {package_manager.value}[/dim]")
+
+            # Build configuration
+            default_cmds = get_default_commands(language, package_manager)
+            config = TACConfig(
+                project=ProjectSpec(
+                    name=name,
+                    language=language,
+                    framework=framework,
+                    architecture=architecture,
+                    package_manager=package_manager,
+                ),
+                paths=PathsSpec(app_root="src"),
+                commands=CommandsSpec(
+                    start=default_cmds.get("start", ""),
+                    test=default_cmds.get("test", ""),
+                    lint=default_cmds.get("lint", ""),
+                    typecheck=default_cmds.get("typecheck", ""),
+                    format=default_cmds.get("format", ""),
+                    build=default_cmds.get("build", ""),
+                ),
+                claude=ClaudeConfig(settings=ClaudeSettings(project_name=name)),
+                orchestrator=OrchestratorConfig(enabled=with_orchestrator),
+            )
+
+        # Run preflight validation checks before scaffolding
+        template_repo = TemplateRepository()
+        vs = ValidationService(template_repo, toolchain=ToolchainProbe())
+        preflight_result = vs.run_preflight_checks(config, target_dir)
+
+        if not preflight_result.valid:
+            error_count = len(preflight_result.errors())
+            console.print(
+                f"\n[bold red]Preflight validation failed with {error_count} error(s):[/bold red]"
+            )
+            for issue in preflight_result.errors():
+                console.print(f"  [red][x][/red] {issue.message}")
+                if issue.suggestion:
+                    console.print(f"      [dim]{issue.suggestion}[/dim]")
+            for issue in preflight_result.warnings():
+                console.print(f"  [yellow][!][/yellow] {issue.message}")
+                if issue.suggestion:
+                    console.print(f"      [dim]{issue.suggestion}[/dim]")
+            console.print(
+                "\n[dim]Fix the errors above and try again. "
+                "Run 'tac-bootstrap validate' for detailed diagnostics.[/dim]"
+            )
+            raise typer.Exit(1)
+
+        # Show warnings if any
+        if preflight_result.warnings():
+            for issue in preflight_result.warnings():
+                console.print(f"  [yellow][!][/yellow] {issue.message}")
+
+        from tac_bootstrap.application.scaffold_service import ScaffoldService
+
+        service = ScaffoldService()
+        plan = service.build_plan(config, existing_repo=False)
+
+        if dry_run:
+            # Show preview (use values from config which are guaranteed to be set)
+            preview_text = f"""[bold]Dry Run - Preview[/bold]
+
+[cyan]Target Directory:[/cyan] {target_dir}
+[cyan]Project Name:[/cyan] {config.project.name}
+[cyan]Language:[/cyan] {config.project.language.value}
+[cyan]Framework:[/cyan] {config.project.framework.value}
+[cyan]Package Manager:[/cyan] {config.project.package_manager.value}
+[cyan]Architecture:[/cyan] {config.project.architecture.value}
+
+[bold]Would create:[/bold]
+"""
+            console.print(Panel(preview_text, border_style="yellow", title="Preview"))
+
+            # List directories and files from plan
+            console.print("[bold cyan]Directories:[/bold cyan]")
+            for dir_op in plan.directories:
+                console.print(f"  📁 {dir_op.path}")
+
+            console.print("\n[bold cyan]Files:[/bold cyan]")
+            for file_op in plan.files:
+                console.print(f"  📄 {file_op.path}")
+
+            console.print("\n[dim]Run without --dry-run to create the project[/dim]")
+            return
+
+        # Apply plan
+        result = service.apply_plan(plan, target_dir, config, force=False)
+
+        # Show success using UIComponents for enhanced mode, standard display otherwise
+        if enhanced:
+            UIComponents.show_success_message(name, target_dir)
+        else:
+            success_text = f"""[bold green]Project created successfully![/bold green]
+
+[cyan]Location:[/cyan] {target_dir}
+[cyan]Files Created:[/cyan] {result.files_created}
+[cyan]Directories Created:[/cyan] {result.directories_created}
+
+[bold]Next Steps:[/bold]
+  1. cd {name}
+  2. Review generated files
+  3. Initialize git: git init
+  4. Start development with Claude Code
+"""
+            console.print(Panel(success_text, border_style="green", title="Success"))
+
+    except Exception as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+
+@app.command()
+def add_agentic(
+    repo_path: Path = typer.Argument(
+        Path("."), help="Repository path (default: current directory)"
+    ),
+    with_orchestrator: bool = typer.Option(
+        False, "--with-orchestrator", help="Include orchestrator backend and frontend (TAC-14)"
+    ),
+    interactive: bool = typer.Option(
+        True, "--interactive/--no-interactive", help="Use interactive wizard"
+    ),
+    dry_run: bool = typer.Option(False, "--dry-run", help="Preview without modifying files"),
+    force: bool = typer.Option(False, "--force", "-f", help="Overwrite existing files"),
+) -> None:
+    """
+    Inject Agentic Layer into an existing repository.
+
+    Auto-detects project settings (language, framework, package manager) and
+    generates the Agentic Layer configuration files.
+
+    Examples:
+        # Add to current directory with auto-detection
+        $ tac-bootstrap add-agentic
+
+        # Add to specific repo
+        $ tac-bootstrap add-agentic /path/to/repo
+
+        # Preview changes without applying
+        $ tac-bootstrap add-agentic --dry-run
+
+        # Force overwrite existing files
+        $ tac-bootstrap add-agentic --force
+    """
+    try:
+        # Resolve to absolute path
+        repo_path = repo_path.resolve()
+
+        # Validate path exists
+        if not repo_path.exists():
+            console.print(f"[red]Error:[/red] Directory does not exist: {repo_path}")
+            raise typer.Exit(1)
+
+        if not repo_path.is_dir():
+            console.print(f"[red]Error:[/red] Not a directory: {repo_path}")
+            raise typer.Exit(1)
+
+        # Auto-detect project settings
+        from tac_bootstrap.application.detect_service import DetectService
+
+        detector = DetectService()
+        detected = detector.detect(repo_path)
+
+        # Show auto-detection results
+        framework_display = detected.framework.value if detected.framework else "None"
+        detection_text = f"""[bold]Auto-Detection Results[/bold]
+
+[cyan]Repository:[/cyan] {repo_path}
+[cyan]Language:[/cyan] {detected.language.value}
+[cyan]Framework:[/cyan] {framework_display}
+[cyan]Package Manager:[/cyan] {detected.package_manager.value}
+[cyan]App Root:[/cyan] {detected.app_root or "."}
+[cyan]Confidence:[/cyan] {detected.confidence:.0%}
+"""
+        if detected.is_monorepo:
+            detection_text += f"\n[bold]Packages ({len(detected.packages)})[/bold]\n"
+            for package in detected.packages:
+                stack = package.language.value
+                if package.framework and package.framework != Framework.NONE:
+                    stack += f"/{package.framework.value}"
+                detection_text += (
+                    f"  {package.path} [dim]{stack}, {package.package_manager.value}, "
+                    f"{package.confidence:.0%}[/dim]\n"
+                )
+        console.print(Panel(detection_text, border_style="cyan", title="Detection"))
+
+        if interactive:
+            from tac_bootstrap.interfaces.wizard import run_add_agentic_wizard
+
+            config = run_add_agentic_wizard(
+                repo_path, detected, with_orchestrator=with_orchestrator
+            )
+        else:
+            # Non-interactive mode: build config from detected settings
+            # Use repo directory name as project name
+            project_name = repo_path.name
+            default_cmds = get_default_commands(detected.language, detected.package_manager)
+            config = TACConfig(
+                project=ProjectSpec(
+                    name=project_name,
+                    language=detected.language,
+                    framework=detected.framework or Framework.NONE,
+                    package_manager=detected.package_manager,
+                ),
+                paths=PathsSpec(app_root=detected.app_root or "src"),
+                commands=CommandsSpec(
+                    start=default_cmds.get("start", ""),
+                    test=default_cmds.get("test", ""),
+                    lint=default_cmds.get("lint", ""),
+                    typecheck=default_cmds.get("typecheck", ""),
+                    format=default_cmds.get("format", ""),
+                    build=default_cmds.get("build", ""),
+                ),
+                claude=ClaudeConfig(settings=ClaudeSettings(project_name=project_name)),
+                orchestrator=OrchestratorConfig(enabled=with_orchestrator),
+            )
+
+        # Build and apply plan
+        from tac_bootstrap.application.scaffold_service import ScaffoldService
+
+        service = ScaffoldService()
+        plan = service.build_plan(config, existing_repo=True)
+
+        if dry_run:
+            # Show preview
+            preview_text = f"""[bold]Dry Run - Preview[/bold]
+
+[cyan]Target Repository:[/cyan] {repo_path}
+
+[bold]Would create/modify:[/bold]
+"""
+            console.print(Panel(preview_text, border_style="yellow", title="Preview"))
+
+            # Show directories
+            for dir_op in plan.directories:
+                console.print(f"  📁 Create {dir_op.path}")
+
+            # Show files
+            for file_op in plan.files:
+                action = (
+                    "📝 Modify"
+                    if file_op.action.value in ("overwrite", "patch")
+                    else "📄 Create"
+                )
+                console.print(f"  {action} {file_op.path}")
+
+            console.print("\n[dim]Run without --dry-run to apply changes[/dim]")
+            return
+
+        # Apply plan
+        result = service.apply_plan(plan, repo_path, config, force=force)
+
+        # Show success
+        success_text = f"""[bold green]✓ Agentic Layer added successfully![/bold green]
+
+[cyan]Location:[/cyan] {repo_path}
+[cyan]Files Created:[/cyan] {result.files_created}
+[cyan]Files Modified:[/cyan] {result.files_overwritten}
+
+[bold]Next Steps:[/bold]
+  1. Review generated files in .claude/, adws/, scripts/
+  2. Update config.yml with your specific commands
+  3. Start using slash commands in Claude Code
+"""
+        console.print(Panel(success_text, border_style="green", title="Success"))
+
+    except Exception as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+
+@app.command()
+def doctor(
+    repo_path: Path = typer.Argument(
+        Path("."), help="Repository path (default: current directory)"
+    ),
+    fix: bool = typer.Option(False, "--fix", help="Attempt to fix issues automatically"),
+) -> None:
+    """
+    Validate existing Agentic Layer setup.
+
+    Performs health checks on your Agentic Layer configuration and reports
+    any issues with severity levels (error, warning, info).
+
+    Examples:
+        # Check current directory
+        $ tac-bootstrap doctor
+
+        # Check specific repo
+        $ tac-bootstrap doctor /path/to/repo
+
+        # Check and auto-fix issues
+        $ tac-bootstrap doctor --fix
+    """
+    try:
+        # Resolve to absolute path
+        repo_path = repo_path.resolve()
+
+        console.print(f"[cyan]Diagnosing:[/cyan] {repo_path}\n")
+
+        # Run diagnostics
+        from tac_bootstrap.application.doctor_service import DoctorService
+
+        doctor_service = DoctorService()
+        report = doctor_service.diagnose(repo_path)
+
+        if report.healthy:
+            # Show success
+            success_text = """[bold green]✓ All checks passed![/bold green]
+
+Your Agentic Layer setup is healthy.
+"""
+            console.print(Panel(success_text, border_style="green", title="Healthy"))
+            return
+
+        # Show issues
+        error_count = sum(1 for issue in report.issues if issue.severity == "error")
+        warning_count = sum(1 for issue in report.issues if issue.severity == "warning")
+        info_count = sum(1 for issue in report.issues if issue.severity == "info")
+
+        status_text = f"""[bold red]✗ Issues detected[/bold red]
+
+[red]Errors:[/red] {error_count}
+[yellow]Warnings:[/yellow] {warning_count}
+[blue]Info:[/blue] {info_count}
+"""
+        console.print(Panel(status_text, border_style="red", title="Unhealthy"))
+
+        # List each issue
+        for issue in report.issues:
+            if issue.severity == "error":
+                color = "red"
+                icon = "✗"
+            elif issue.severity == "warning":
+                color = "yellow"
+                icon = "⚠"
+            else:  # info
+                color = "blue"
+                icon = "ℹ"
+
+            console.print(f"\n[{color}]{icon} [{issue.severity.upper()}][/{color}]")
+            console.print(f"  {issue.message}")
+            if issue.suggestion:
+                console.print(f"  [dim]Suggestion: {issue.suggestion}[/dim]")
+
+        # Auto-fix if requested
+        if fix:
+            console.print("\n[cyan]Attempting to fix issues...[/cyan]")
+            fix_result = doctor_service.fix(repo_path, report)
+            console.print(f"[green]Fixed {fix_result.fixed_count} issues[/green]")
+
+            if fix_result.failed_count > 0:
+                console.print(
+                    f"[yellow]Failed to fix {fix_result.failed_count} issues[/yellow]"
+                )
+
+        raise typer.Exit(1)
+
+    except Exception as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+
+@app.command()
+def render(
+    config_file: Path = typer.Argument(
+        Path("config.yml"), help="Configuration file path (default: config.yml)"
+    ),
+    output_dir: Optional[Path] = typer.Option(
+        None,
+        "--output",
+        "-o",
+        help="Output directory (default: same as config file location)",
+    ),
+    dry_run: bool = typer.Option(False, "--dry-run", help="Preview without modifying files"),
+    force: bool = typer.Option(False, "--force", "-f", help="Overwrite existing files"),
+) -> None:
+    """
+    Regenerate Agentic Layer from config.yml.
+
+    Reads an existing config.yml file and regenerates all Agentic Layer files
+    based on the configuration. Useful after manually editing config.yml.
+
+    Examples:
+        # Regenerate from default config.yml
+        $ tac-bootstrap render
+
+        # Regenerate from specific config file
+        $ tac-bootstrap render my-config.yml
+
+        # Preview changes without applying
+        $ tac-bootstrap render --dry-run
+
+        # Force overwrite existing files
+        $ tac-bootstrap render --force
+    """
+    try:
+        # Resolve to absolute path
+        config_file = config_file.resolve()
+
+        # Validate config file exists
+        if not config_file.exists():
+            console.print(f"[red]Error:[/red] Config file does not exist: {config_file}")
+            raise typer.Exit(1)
+
+        # Load and parse YAML
+        try:
+            with open(config_file, "r") as f:
+                raw_config = yaml.safe_load(f)
+
+            # Validate with Pydantic
+            config = TACConfig(**raw_config)
+
+            console.print(f"[green]✓[/green] Loaded config from {config_file}")
+
+        except yaml.YAMLError as e:
+            console.print(f"[red]YAML Parse Error:[/red] {e}")
+            raise typer.Exit(1)
+        except Exception as e:
+            console.print(f"[red]Config Validation Error:[/red] {e}")
+            raise typer.Exit(1)
+
+        # Determine target directory
+        target_dir = output_dir or config_file.parent
+        target_dir = target_dir.resolve()
+
+        # Build plan
+        from tac_bootstrap.application.scaffold_service import ScaffoldService
+
+        service = ScaffoldService()
+        plan = service.build_plan(config, existing_repo=True)
+
+        if dry_run:
+            # Show preview
+            preview_text = f"""[bold]Dry Run - Preview[/bold]
+
+[cyan]Config File:[/cyan] {config_file}
+[cyan]Target Directory:[/cyan] {target_dir}
+[cyan]Project:[/cyan] {config.project.name}
+
+[bold]Would create/modify:[/bold]
+"""
+            console.print(Panel(preview_text, border_style="yellow", title="Preview"))
+
+            # Show directories
+            for dir_op in plan.directories:
+                console.print(f"  📁 Create {dir_op.path}")
+
+            # Show files
+            for file_op in plan.files:
+                action = (
+                    "📝 Modify"
+                    if file_op.action.value in ("overwrite", "patch")
+                    else "📄 Create"
+                )
+                console.print(f"  {action} {file_op.path}")
+
+            console.print("\n[dim]Run without --dry-run to apply changes[/dim]")
+            return
+
+        # Apply plan
+        result = service.apply_plan(plan, target_dir, config, force=force)
+
+        # Show success
+        success_text = f"""[bold green]✓ Rendered successfully![/bold green]
+
+[cyan]Target:[/cyan] {target_dir}
+[cyan]Files Created:[/cyan] {result.files_created}
+[cyan]Files Modified:[/cyan] {result.files_overwritten}
+
+All files have been regenerated from {config_file.name}
+"""
+        console.print(Panel(success_text, border_style="green", title="Success"))
+
+    except Exception as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
@@ -0,0 +1,123 @@
+"""Search commands: search commands|templates|features."""
+
+from typing import Optional
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+console = Console()
+app = typer.Typer(rich_markup_mode="rich")
+
+
+search_app = typer.Typer(
+    name="search",
+    help="Search commands, templates, and features",
+)
+app.add_typer(search_app, name="search")
+
+
+@search_app.command("commands")
+def search_commands_cmd(
+    query: str = typer.Argument("", help="Search query"),
+    tag: Optional[str] = typer.Option(None, "--tag", "-t", help="Filter by tag"),
+    model: Optional[str] = typer.Option(None, "--model", "-m", help="Filter by model"),
+) -> None:
+    """
+    Search available commands and workflows.
+
+    Examples:
+        $ tac-bootstrap search commands "testing"
+        $ tac-bootstrap search commands --tag "testing" --model "opus"
+    """
+    from tac_bootstrap.application.search_service import SearchService
+
+    service = SearchService()
+    results = service.search_commands(query=query, tag=tag, model=model)
+
+    if results.total == 0:
+        console.print(f"[yellow]No results found for '{query}'[/yellow]")
+        return
+
+    table = Table(title=f"Search Results ({results.total})", border_style="cyan")
+    table.add_column("Name", style="bold green")
+    table.add_column("Type")
+    table.add_column("Description")
+    table.add_column("Tags", style="dim")
+
+    for r in results.results:
+        table.add_row(r.name, r.category, r.description, ", ".join(r.tags[:3]))
+
+    console.print(table)
+
+
+@search_app.command("templates")
+def search_templates_cmd(
+    query: str = typer.Argument("", help="Search query"),
+    framework: Optional[str] = typer.Option(
+        None, "--framework", "-f", help="Filter by framework"
+    ),
+    arch: Optional[str] = typer.Option(
+        None, "--arch", "-a", help="Filter by architecture"
+    ),
+) -> None:
+    """
+    Search available templates.
+
+    Examples:
+        $ tac-bootstrap search templates --framework fastapi --arch ddd
+    """
+    from tac_bootstrap.application.search_service import SearchService
+
+    service = SearchService()
+    results = service.search_templates(query=query, framework=framework, architecture=arch)
+
+    if results.total == 0:
+        console.print("[yellow]No matching templates found[/yellow]")
+        return
+
+    table = Table(title=f"Templates ({results.total})", border_style="cyan")
+    table.add_column("Name", style="bold green")
+    table.add_column("Description")
+    table.add_column("Tags", style="dim")
+
+    for r in results.results:
+        table.add_row(r.name, r.description, ", ".join(r.tags[:4]))
+
+    console.print(table)
+
+
+@search_app.command("features")
+def search_features_cmd(
+    query: str = typer.Argument("", help="Search query"),
+    tier: Optional[str] = typer.Option(
+        None, "--tier", help="Filter by tier (core, optional, premium)"
+    ),
+) -> None:
+    """
+    Search available features.
+
+    Examples:
+        $ tac-bootstrap search features "performance" --tier premium
+    """
+    from tac_bootstrap.application.search_service import SearchService
+
+    service = SearchService()
+    results = service.search_features(query=query, tier=tier)
+
+    if results.total == 0:
+        console.print("[yellow]No matching features found[/yellow]")
+        return
+
+    table = Table(title=f"Features ({results.total})", border_style="cyan")
+    table.add_column("Name", style="bold green")
+    table.add_column("Tier")
+    table.add_column("Description")
+    table.add_column("Status")
+
+    for r in results.results:
+        tier_val = r.metadata.get("tier", "")
+        status_val = r.metadata.get("status", "")
+        table.add_row(r.name, tier_val, r.description, status_val)
+
+    console.print(table)
@@ -0,0 +1,126 @@
+"""Security scanning command: security."""
+
+from pathlib import Path
+from typing import Optional
+
+import typer
+from rich.console import Console
+from rich.panel import Panel
+
+console = Console()
+app = typer.Typer(rich_markup_mode="rich")
+
+
+@app.command()
+def security(
+    action: str = typer.Argument(
+        ...,
+        help="Action: audit, scan-templates, report",
+    ),
+    repo_path: Path = typer.Argument(
+        Path("."), help="Project path (default: current directory)"
+    ),
+    output: Optional[Path] = typer.Option(
+        None, "--output", "-o", help="Output file for report"
+    ),
+) -> None:
+    """
+    Security scanning and auditing tools.
+
+    Scans project files for security issues including hardcoded secrets,
+    SQL injection, XSS vulnerabilities, and OWASP Top 10 compliance.
+
+    Examples:
+        $ tac-bootstrap security audit
+        $ tac-bootstrap security scan-templates
+        $ tac-bootstrap security report --output security-report.txt
+    """
+    try:
+        from tac_bootstrap.application.security_service import SecurityService
+
+        service = SecurityService()
+        target_path = repo_path.resolve()
+
+        if action == "audit":
+            console.print(f"[cyan]Running security audit on:[/cyan] {target_path}\n")
+
+            report = service.generate_security_report(target_path)
+
+            console.print(f"[dim]Files scanned: {report.total_files_scanned}[/dim]")
+
+            if not report.has_issues:
+                console.print(
+                    Panel(
+                        "[bold green]No security issues found![/bold green]",
+                        border_style="green",
+                        title="Security Audit",
+                    )
+                )
+                return
+
+            # Show issues
+            for issue in report.issues:
+                severity = issue.severity.value.upper()
+                if issue.severity.value in ("critical", "high"):
+                    color = "red"
+                elif issue.severity.value == "medium":
+                    color = "yellow"
+                else:
+                    color = "blue"
+
+                console.print(f"  [{color}][{severity}][/{color}] {issue.message}")
+                if issue.file_path:
+                    console.print(f"    [dim]File: {issue.file_path}:{issue.line_number}[/dim]")
+                if issue.suggestion:
+                    console.print(f"    [dim]Fix: {issue.suggestion}[/dim]")
+
+            report.compute_summary()
+            console.print(
+                f"\n[bold]Summary:[/bold] {report.total_issues} issue(s) found"
+            )
+            for sev, count in sorted(report.summary.items()):
+                console.print(f"  {sev.upper()}: {count}")
+
+        elif action == "scan-templates":
+            console.print(f"[cyan]Scanning templates for vulnerabilities:[/cyan] {target_path}\n")
+
+            issues = service.scan_templates(target_path)
+
+            if not issues:
+                console.print("[green]No template vulnerabilities found[/green]")
+                return
+
+            for issue in issues:
+                severity = issue.severity.value.upper()
+                console.print(f"  [{severity}] {issue.message}")
+                if issue.file_path:
+                    console.print(f"    File: {issue.file_path}:{issue.line_number}")
+                if issue.suggestion:
+                    console.print(f"    Fix: {issue.suggestion}")
+
+            console.print(f"\n[bold]Total: {len(issues)} vulnerability(ies) found[/bold]")
+
+        elif action == "report":
+            console.print(f"[cyan]Generating security report for:[/cyan] {target_path}\n")
+
+            report = service.generate_security_report(target_path)
+            text = service.format_report_text(report)
+
+            if output:
+                output.write_text(text, encoding="utf-8")
+                console.print(f"[green]Report written to {output}[/green]")
+            else:
+                console.print(text)
+
+        else:
+            console.print(
+                f"[red]Error:[/red] Unknown action '{action}'. "
+                "Use: audit, scan-templates, or report"
+            )
+            raise typer.Exit(1)
+
+    except SystemExit:
+        raise
+    except Exception as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
@@ -0,0 +1,215 @@
+"""Project snapshot commands: snapshot create|list|diff|restore|delete."""
+
+from pathlib import Path
+
+import typer
+from rich.console import Console
+from rich.panel import Panel
+from rich.table import Table
+
+console = Console()
+app = typer.Typer(rich_markup_mode="rich")
+
+
+snapshot_app = typer.Typer(
+    name="snapshot",
+    help="Manage project snapshots",
+)
+app.add_typer(snapshot_app, name="snapshot")
+
+
+@snapshot_app.command("create")
+def snapshot_create(
+    name: str = typer.Argument(..., help="Snapshot name"),
+    project_path: Path = typer.Option(
+        Path("."), "--path", "-p", help="Project path (default: current directory)"
+    ),
+    description: str = typer.Option("", "--desc", "-d", help="Snapshot description"),
+) -> None:
+    """
+    Create a named snapshot of the project.
+
+    Examples:
+        $ tac-bootstrap snapshot create "initial-setup"
+    """
+    try:
+        from tac_bootstrap.application.snapshot_service import SnapshotService
+
+        service = SnapshotService()
+        metadata = service.create_snapshot(project_path.resolve(), name, description)
+
+        console.print(
+            Panel(
+                f"[bold green]Snapshot '{name}' created successfully[/bold green]\n\n"
+                f"[cyan]Files:[/cyan] {metadata.file_count}\n"
+                f"[cyan]Size:[/cyan] {metadata.total_size_bytes:,} bytes\n"
+                f"[cyan]Created:[/cyan] {metadata.created_at}",
+                border_style="green",
+                title="Snapshot Created",
+            )
+        )
+    except ValueError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+    except Exception as e:
+        console.print(f"[red]Error creating snapshot:[/red] {e}")
+        raise typer.Exit(1)
+
+
+@snapshot_app.command("list")
+def snapshot_list(
+    project_path: Path = typer.Option(
+        Path("."), "--path", "-p", help="Project path (default: current directory)"
+    ),
+) -> None:
+    """
+    List all snapshots for a project.
+
+    Examples:
+        $ tac-bootstrap snapshot list
+    """
+    from tac_bootstrap.application.snapshot_service import SnapshotService
+
+    service = SnapshotService()
+    snapshots = service.list_snapshots(project_path.resolve())
+
+    if not snapshots:
+        console.print("[yellow]No snapshots found for this project[/yellow]")
+        return
+
+    table = Table(title=f"Project Snapshots ({len(snapshots)})", border_style="cyan")
+    table.add_column("Name", style="bold green")
+    table.add_column("Files")
+    table.add_column("Size")
+    table.add_column("Created")
+    table.add_column("Description", style="dim")
+
+    for snap in snapshots:
+        size_str = f"{snap.total_size_bytes:,} B"
+        if snap.total_size_bytes > 1_000_000:
+            size_str = f"{snap.total_size_bytes / 1_000_000:.1f} MB"
+        elif snap.total_size_bytes > 1_000:
+            size_str = f"{snap.total_size_bytes / 1_000:.1f} KB"
+
+        table.add_row(
+            snap.name,
+            str(snap.file_count),
+            size_str,
+            snap.created_at[:19],
+            snap.description[:40] if snap.description else "",
+        )
+
+    console.print(table)
+
+
+@snapshot_app.command("diff")
+def snapshot_diff(
+    name1: str = typer.Argument(..., help="First snapshot name (baseline)"),
+    name2: str = typer.Argument(..., help="Second snapshot name (comparison)"),
+    project_path: Path = typer.Option(
+        Path("."), "--path", "-p", help="Project path"
+    ),
+) -> None:
+    """
+    Show differences between two snapshots.
+
+    Examples:
+        $ tac-bootstrap snapshot diff initial-setup after-changes
+    """
+    try:
+        from tac_bootstrap.application.snapshot_service import SnapshotService
+
+        service = SnapshotService()
+        diff_result = service.diff_snapshots(name1, name2, project_path.resolve())
+
+        summary = (
+            f"[bold]Comparing:[/bold] {diff_result.snapshot1} -> {diff_result.snapshot2}\n\n"
+            f"[green]Added:[/green] {len(diff_result.added)}\n"
+            f"[red]Removed:[/red] {len(diff_result.removed)}\n"
+            f"[yellow]Modified:[/yellow] {len(diff_result.modified)}\n"
+            f"[dim]Unchanged:[/dim] {diff_result.unchanged}"
+        )
+        console.print(Panel(summary, border_style="cyan", title="Snapshot Diff"))
+
+        if diff_result.added:
+            console.print("\n[bold green]Added files:[/bold green]")
+            for f in diff_result.added:
+                console.print(f"  + {f}")
+
+        if diff_result.removed:
+            console.print("\n[bold red]Removed files:[/bold red]")
+            for f in diff_result.removed:
+                console.print(f"  - {f}")
+
+        if diff_result.modified:
+            console.print("\n[bold yellow]Modified files:[/bold yellow]")
+            for f in diff_result.modified:
+                console.print(f"  ~ {f}")
+
+    except ValueError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+
+@snapshot_app.command("restore")
+def snapshot_restore(
+    name: str = typer.Argument(..., help="Snapshot name to restore"),
+    project_path: Path = typer.Option(
+        Path("."), "--path", "-p", help="Project path"
+    ),
+) -> None:
+    """
+    Restore a project from a snapshot.
+
+    Examples:
+        $ tac-bootstrap snapshot restore initial-setup
+    """
+    try:
+        from tac_bootstrap.application.snapshot_service import SnapshotService
+
+        service = SnapshotService()
+
+        if not typer.confirm(
+            f"Restore snapshot '{name}'? A backup will be created first.", default=True
+        ):
+            console.print("[yellow]Restore cancelled[/yellow]")
+            raise typer.Exit(0)
+
+        result = service.restore_snapshot(name, project_path.resolve())
+
+        console.print(
+            Panel(
+                f"[bold green]Snapshot '{name}' restored successfully[/bold green]\n\n"
+                f"[cyan]Files Restored:[/cyan] {result['files_restored']}\n"
+                f"[cyan]Backup Created:[/cyan] {result['backup_name']}",
+                border_style="green",
+                title="Restored",
+            )
+        )
+    except ValueError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+
+@snapshot_app.command("delete")
+def snapshot_delete(
+    name: str = typer.Argument(..., help="Snapshot name to delete"),
+    project_path: Path = typer.Option(
+        Path("."), "--path", "-p", help="Project path"
+    ),
+) -> None:
+    """
+    Delete a snapshot.
+
+    Examples:
+        $ tac-bootstrap snapshot delete old-snapshot
+    """
+    from tac_bootstrap.application.snapshot_service import SnapshotService
+
+    service = SnapshotService()
+    deleted = service.delete_snapshot(name, project_path.resolve())
+
+    if deleted:
+        console.print(f"[green]Snapshot '{name}' deleted[/green]")
+    else:
+        console.print(f"[yellow]Snapshot '{name}' not found[/yellow]")
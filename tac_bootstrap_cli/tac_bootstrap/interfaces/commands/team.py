@@ -0,0 +1,149 @@
+"""Team collaboration commands: team share|list-shared|sync|notify."""
+
+from pathlib import Path
+
+import typer
+from rich.console import Console
+from rich.panel import Panel
+from rich.table import Table
+
+console = Console()
+app = typer.Typer(rich_markup_mode="rich")
+
+
+team_app = typer.Typer(
+    name="team",
+    help="Team collaboration features",
+)
+app.add_typer(team_app, name="team")
+
+
+@team_app.command("share")
+def team_share(
+    user: str = typer.Option(
+        ..., "--user", "-u", help="Email address to share with"
+    ),
+    role: str = typer.Option(
+        "contributor", "--role", "-r",
+        help="Role: owner, admin, contributor, viewer",
+    ),
+    project_path: Path = typer.Option(
+        Path("."), "--path", "-p", help="Project path"
+    ),
+) -> None:
+    """
+    Share project with a team member.
+
+    Examples:
+        $ tac-bootstrap team share --user alice@company.com
+    """
+    try:
+        from tac_bootstrap.application.team_service import TeamService
+
+        service = TeamService()
+        member = service.share_project(project_path.resolve(), user, role)
+
+        console.print(
+            Panel(
+                f"[bold green]Project shared with {user}[/bold green]\n"
+                f"[cyan]Role:[/cyan] {member.role}\n"
+                f"[cyan]Added:[/cyan] {member.added_at}",
+                border_style="green",
+                title="Shared",
+            )
+        )
+    except ValueError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+
+@team_app.command("list-shared")
+def team_list_shared(
+    project_path: Path = typer.Option(
+        Path("."), "--path", "-p", help="Project path"
+    ),
+) -> None:
+    """
+    List team members for a project.
+
+    Examples:
+        $ tac-bootstrap team list-shared
+    """
+    from tac_bootstrap.application.team_service import TeamService
+
+    service = TeamService()
+    members = service.list_shared(project_path.resolve())
+
+    if not members:
+        console.print("[yellow]No team members for this project[/yellow]")
+        return
+
+    table = Table(title="Team Members", border_style="cyan")
+    table.add_column("Email", style="bold")
+    table.add_column("Role")
+    table.add_column("Added")
+    table.add_column("Last Sync", style="dim")
+
+    for m in members:
+        table.add_row(
+            m.email,
+            m.role,
+            m.added_at[:19],
+            m.last_sync[:19] if m.last_sync else "Never",
+        )
+
+    console.print(table)
+
+
+@team_app.command("sync")
+def team_sync(
+    project_path: Path = typer.Option(
+        Path("."), "--path", "-p", help="Project path"
+    ),
+) -> None:
+    """
+    Sync changes with team.
+
+    Examples:
+        $ tac-bootstrap team sync
+    """
+    from tac_bootstrap.application.team_service import TeamService
+
+    service = TeamService()
+    result = service.sync_changes(project_path.resolve())
+
+    if result.success:
+        console.print(
+            Panel(
+                f"[bold green]Sync completed[/bold green]\n"
+                f"[dim]{result.message}[/dim]",
+                border_style="green",
+                title="Team Sync",
+            )
+        )
+    else:
+        console.print("[red]Sync failed[/red]")
+        raise typer.Exit(1)
+
+
+@team_app.command("notify")
+def team_notify(
+    message: str = typer.Option(
+        ..., "--message", "-m", help="Notification message"
+    ),
+    project_path: Path = typer.Option(
+        Path("."), "--path", "-p", help="Project path"
+    ),
+) -> None:
+    """
+    Send a notification to the team.
+
+    Examples:
+        $ tac-bootstrap team notify --message "Updated API schema"
+    """
+    from tac_bootstrap.application.team_service import TeamService
+
+    service = TeamService()
+    notif = service.notify_team(project_path.resolve(), message)
+
+    console.print(f"[green]Notification sent:[/green] {notif.message}")
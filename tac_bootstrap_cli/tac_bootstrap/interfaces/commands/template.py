@@ -0,0 +1,154 @@
+"""Template store command: template."""
+
+from typing import Optional
+
+import typer
+from rich.console import Console
+from rich.panel import Panel
+from rich.table import Table
+
+console = Console()
+app = typer.Typer(rich_markup_mode="rich")
+
+
+@app.command()
+def template(
+    action: str = typer.Argument(
+        ...,
+        help="Action: search, install, list, rate, info",
+    ),
+    query: Optional[str] = typer.Argument(None, help="Search query or template ID"),
+    rating: Optional[int] = typer.Option(None, "--rating", "-r", help="Rating (1-5)"),
+    installed_only: bool = typer.Option(
+        False, "--installed", help="Show only installed templates"
+    ),
+) -> None:
+    """
+    Manage the template store (search, install, rate templates).
+
+    The template store provides reusable project templates that can be
+    searched, installed, and rated.
+
+    Examples:
+        $ tac-bootstrap template search "fastapi auth"
+        $ tac-bootstrap template install tac/fastapi-starter
+        $ tac-bootstrap template list --installed
+        $ tac-bootstrap template rate tac/fastapi-starter --rating 5
+        $ tac-bootstrap template info tac/fastapi-starter
+    """
+    try:
+        from tac_bootstrap.application.template_store_service import TemplateStoreService
+
+        service = TemplateStoreService()
+
+        # Ensure defaults are seeded
+        if service.template_count == 0:
+            service.seed_defaults()
+
+        if action == "search":
+            search_query = query or ""
+            results = service.search_templates(search_query)
+
+            if not results:
+                console.print(f"[yellow]No templates found for '{search_query}'[/yellow]")
+                return
+
+            table = Table(title=f"Templates matching '{search_query}'", border_style="cyan")
+            table.add_column("ID", style="bold")
+            table.add_column("Name")
+            table.add_column("Version")
+            table.add_column("Rating")
+            table.add_column("Downloads")
+            table.add_column("Tags")
+
+            for t in results:
+                rating_str = f"{t['rating']:.1f}" if t['rating'] > 0 else "-"
+                tags_str = ", ".join(t.get("tags", [])[:3])
+                table.add_row(
+                    t["id"], t["name"], t["version"],
+                    rating_str, str(t["downloads"]), tags_str,
+                )
+
+            console.print(table)
+
+        elif action == "install":
+            if not query:
+                console.print("[red]Error:[/red] Template ID required")
+                raise typer.Exit(1)
+            result = service.install_template(query)
+            if result["success"]:
+                console.print(f"[green]{result['message']}[/green]")
+            else:
+                console.print(f"[red]{result['message']}[/red]")
+                raise typer.Exit(1)
+
+        elif action == "list":
+            if installed_only:
+                templates = service.list_installed_templates()
+                title = "Installed Templates"
+            else:
+                templates = service.list_all_templates()
+                title = "All Templates"
+
+            if not templates:
+                console.print("[yellow]No templates found[/yellow]")
+                return
+
+            table = Table(title=title, border_style="cyan")
+            table.add_column("ID", style="bold")
+            table.add_column("Name")
+            table.add_column("Version")
+            table.add_column("Installed")
+
+            for t in templates:
+                installed_str = "[green]Yes[/green]" if t["installed"] else "[dim]No[/dim]"
+                table.add_row(t["id"], t["name"], t["version"], installed_str)
+
+            console.print(table)
+            console.print(f"\n[dim]Total: {len(templates)} template(s)[/dim]")
+
+        elif action == "rate":
+            if not query:
+                console.print("[red]Error:[/red] Template ID required")
+                raise typer.Exit(1)
+            if rating is None:
+                console.print("[red]Error:[/red] --rating value required (1-5)")
+                raise typer.Exit(1)
+            result = service.rate_template(query, rating)
+            if result["success"]:
+                console.print(f"[green]{result['message']}[/green]")
+            else:
+                console.print(f"[red]{result['message']}[/red]")
+                raise typer.Exit(1)
+
+        elif action == "info":
+            if not query:
+                console.print("[red]Error:[/red] Template ID required")
+                raise typer.Exit(1)
+            info = service.get_template_info(query)
+            if info is None:
+                console.print(f"[red]Template '{query}' not found[/red]")
+                raise typer.Exit(1)
+            rating_str = f"{info['rating']:.1f}" if info['rating'] > 0 else "Not rated"
+            info_text = f"""[bold]{info['name']}[/bold] ({info['id']})
+[cyan]Version:[/cyan] {info['version']}
+[cyan]Author:[/cyan] {info['author']}
+[cyan]Description:[/cyan] {info['description']}
+[cyan]Rating:[/cyan] {rating_str} ({info['rating_count']} ratings)
+[cyan]Downloads:[/cyan] {info['downloads']}
+[cyan]Tags:[/cyan] {', '.join(info.get('tags', []))}
+[cyan]Installed:[/cyan] {'Yes' if info['installed'] else 'No'}"""
+            console.print(Panel(info_text, border_style="cyan", title="Template Info"))
+
+        else:
+            console.print(
+                f"[red]Error:[/red] Unknown action '{action}'. "
+                "Use: search, install, list, rate, or info"
+            )
+            raise typer.Exit(1)
+
+    except SystemExit:
+        raise
+    except Exception as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
@@ -0,0 +1,121 @@
+"""Test scaffolding command: test-generate."""
+
+from pathlib import Path
+
+import typer
+import yaml
+from rich.console import Console
+
+console = Console()
+app = typer.Typer(rich_markup_mode="rich")
+
+
+@app.command(name="test-generate")
+def test_generate(
+    test_type: str = typer.Argument(
+        ...,
+        help="Test type: unit, integration, e2e, load, coverage, all",
+    ),
+    repo_path: Path = typer.Argument(
+        Path("."), help="Project path (default: current directory)"
+    ),
+    force: bool = typer.Option(False, "--force", "-f", help="Overwrite existing files"),
+) -> None:
+    """
+    Generate test scaffolding for your project.
+
+    Creates test templates for various testing types including unit,
+    integration, E2E, load testing, and coverage configuration.
+
+    Examples:
+        $ tac-bootstrap test-generate unit
+        $ tac-bootstrap test-generate integration
+        $ tac-bootstrap test-generate e2e
+        $ tac-bootstrap test-generate load
+        $ tac-bootstrap test-generate coverage
+        $ tac-bootstrap test-generate all
+    """
+    try:
+        from tac_bootstrap.application.test_generator import TestGenerator
+
+        target_path = repo_path.resolve()
+
+        # Try to load project config
+        project_name = target_path.name
+        language = "python"
+        framework = "none"
+        config = None
+
+        config_file = target_path / "config.yml"
+        if config_file.exists():
+            try:
+                with open(config_file, "r") as f:
+                    raw_config = yaml.safe_load(f)
+                from tac_bootstrap.domain.models import TACConfig
+                config = TACConfig(**raw_config)
+                project_name = config.project.name
+                language = config.project.language.value
+                framework = config.project.framework.value
+            except Exception:
+                pass
+
+        generator = TestGenerator(
+            project_name=project_name,
+            language=language,
+            framework=framework,
+            config=config,
+        )
+
+        if test_type == "unit":
+            generator.generate_unit_tests(
+                module_path=Path("app"),
+                output_dir=target_path / "tests" / "unit",
+                force=force,
+            )
+            console.print("[green]Unit test template generated[/green]")
+            console.print("  tests/unit/test_app.py")
+
+        elif test_type == "integration":
+            generator.generate_integration_tests(
+                project_path=target_path, force=force
+            )
+            console.print("[green]Integration test template generated[/green]")
+
+        elif test_type == "e2e":
+            generator.generate_e2e_tests(
+                project_path=target_path, force=force
+            )
+            console.print("[green]E2E test template generated[/green]")
+
+        elif test_type == "load":
+            generator.generate_load_tests(
+                project_path=target_path, force=force
+            )
+            console.print("[green]Load test template generated[/green]")
+
+        elif test_type == "coverage":
+            generator.setup_coverage_config(target_path, force=force)
+            console.print("[green]Coverage configuration created[/green]")
+            console.print("  .coveragerc")
+
+        elif test_type == "all":
+            files = generator.generate_all(target_path, force=force)
+            console.print(f"[green]Generated {len(files)} test file(s):[/green]")
+            for file_path in files:
+                try:
+                    console.print(f"  {file_path.relative_to(target_path)}")
+                except ValueError:
+                    console.print(f"  {file_path}")
+
+        else:
+            console.print(
+                f"[red]Error:[/red] Unknown test type '{test_type}'. "
+                "Use: unit, integration, e2e, load, coverage, or all"
+            )
+            raise typer.Exit(1)
+
+    except SystemExit:
+        raise
+    except Exception as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
@@ -0,0 +1,279 @@
+"""Version management commands: upgrade, migrate, rollback."""
+
+import json
+import sys
+from contextlib import redirect_stdout
+from pathlib import Path
+
+import typer
+from rich.console import Console
+
+from tac_bootstrap.application.migration_service import MigrationService
+from tac_bootstrap.application.upgrade_service import UpgradeService
+
+console = Console()
+app = typer.Typer(rich_markup_mode="rich")
+
+
+@app.command()
+def upgrade(
+    path: Path = typer.Argument(
+        Path("."),
+        help="Path to project to upgrade",
+        exists=True,
+        file_okay=False,
+        dir_okay=True,
+    ),
+    dry_run: bool = typer.Option(
+        False,
+        "--dry-run",
+        "-n",
+        help="Show what would be changed without making changes",
+    ),
+    backup: bool = typer.Option(
+        True,
+        "--backup/--no-backup",
+        help="Create backup before upgrading (default: enabled)",
+    ),
+    force: bool = typer.Option(
+        False,
+        "--force",
+        "-f",
+        help="Force upgrade even if versions match",
+    ),
+    with_orchestrator: bool = typer.Option(
+        False,
+        "--with-orchestrator",
+        help="Enable orchestrator (adds apps/orchestrator_3_stream/ and apps/orchestrator_db/)",
+    ),
+    plan: bool = typer.Option(
+        False,
+        "--plan",
+        help="Render the upgrade in memory and print a JSON diff against the working tree",
+    ),
+) -> None:
+    """Upgrade agentic layer to latest TAC Bootstrap version.
+
+    This command updates the adws/, .claude/, and scripts/ directories
+    to the latest templates while preserving your project configuration.
+
+    Examples:
+        tac-bootstrap upgrade                          # Upgrade current directory
+        tac-bootstrap upgrade ./my-project             # Upgrade specific project
+        tac-bootstrap upgrade --dry-run                # Preview changes
+        tac-bootstrap upgrade --plan > plan.json       # File-level JSON diff, writes nothing
+        tac-bootstrap upgrade --no-backup              # Upgrade without backup
+        tac-bootstrap upgrade --with-orchestrator      # Add orchestrator to project
+    """
+    project_path = path.resolve()
+
+    # Verify it's a TAC project
+    config_file = project_path / "config.yml"
+    if not config_file.exists():
+        console.print("[red]Error: No config.yml found. Is this a TAC Bootstrap project?[/red]")
+        raise typer.Exit(1)
+
+    service = UpgradeService(project_path)
+
+    if plan:
+        _print_upgrade_plan(service, with_orchestrator)
+        raise typer.Exit(0)
+
+    # Check versions
+    needs_upgrade, current_ver, target_ver = service.needs_upgrade()
+
+    console.print("\n[bold]TAC Bootstrap Upgrade[/bold]")
+    console.print(f"  Current version: [yellow]{current_ver}[/yellow]")
+    console.print(f"  Target version:  [green]{target_ver}[/green]")
+
+    if not needs_upgrade and not force and not with_orchestrator:
+        console.print("\n[green]Project is already up to date![/green]")
+        raise typer.Exit(0)
+
+    # Show changes preview
+    console.print("\n[bold]Changes to be made:[/bold]")
+    for change in service.get_changes_preview(with_orchestrator=with_orchestrator):
+        console.print(f"  • {change}")
+
+    if dry_run:
+        console.print("\n[yellow]Dry run - no changes made[/yellow]")
+        raise typer.Exit(0)
+
+    # Confirm upgrade
+    if not typer.confirm("\nProceed with upgrade?", default=True):
+        console.print("[yellow]Upgrade cancelled[/yellow]")
+        raise typer.Exit(0)
+
+    # Perform upgrade
+    console.print("\n[bold]Upgrading...[/bold]")
+    success, message = service.perform_upgrade(
+        backup=backup, with_orchestrator=with_orchestrator
+    )
+
+    if success:
+        console.print(f"\n[green]✓ {message}[/green]")
+        if backup:
+            console.print("[dim]Backup preserved. Delete manually when confirmed working.[/dim]")
+    else:
+        console.print(f"\n[red]✗ {message}[/red]")
+        raise typer.Exit(1)
+
+
+def _print_upgrade_plan(service: UpgradeService, with_orchestrator: bool) -> None:
+    """Print the in-memory upgrade plan as JSON on stdout; diagnostics go to stderr."""
+    try:
+        with redirect_stdout(sys.stderr):
+            upgrade_plan = service.plan_upgrade(with_orchestrator=with_orchestrator)
+    except Exception as e:
+        typer.echo(f"Error planning upgrade: {e}", err=True)
+        raise typer.Exit(1)
+    typer.echo(json.dumps(upgrade_plan.to_dict(), indent=2))
+
+
+@app.command()
+def migrate(
+    repo_path: Path = typer.Argument(
+        Path("."),
+        help="Project root directory",
+        exists=True,
+        file_okay=False,
+        dir_okay=True,
+    ),
+    to_version: str = typer.Argument(..., help="Target schema version (e.g., 2)"),
+    dry_run: bool = typer.Option(
+        False,
+        "--dry-run",
+        "-n",
+        help="Preview changes without applying",
+    ),
+    backup: bool = typer.Option(
+        True,
+        "--backup/--no-backup",
+        help="Create backup before migrating (default: enabled)",
+    ),
+) -> None:
+    """
+    Migrate config.yml to a specific schema version.
+
+    Applies forward or backward schema migrations to transform config.yml
+    between schema versions. Supports multi-step migration paths.
+
+    Examples:
+        tac-bootstrap migrate . 2                   # Migrate to schema v2
+        tac-bootstrap migrate ./my-project 2        # Migrate specific project
+        tac-bootstrap migrate . 2 --dry-run         # Preview migration changes
+        tac-bootstrap migrate . 1 --no-backup       # Rollback to v1 without backup
+    """
+    project_path = repo_path.resolve()
+
+    # Verify config.yml exists
+    config_file = project_path / "config.yml"
+    if not config_file.exists():
+        console.print("[red]Error: No config.yml found. Is this a TAC Bootstrap project?[/red]")
+        raise typer.Exit(1)
+
+    service = MigrationService(project_path)
+    current_version = service.detect_current_version()
+    target = to_version
+
+    console.print("\n[bold]TAC Bootstrap Schema Migration[/bold]")
+    console.print(f"  Current schema version: [yellow]{current_version}[/yellow]")
+    console.print(f"  Target schema version:  [green]{target}[/green]")
+
+    # Check if already at target
+    if current_version == target:
+        console.print(
+            f"\n[green]Already at schema version {target}. No migration needed.[/green]"
+        )
+        raise typer.Exit(0)
+
+    # Check if migration path exists
+    if not service.can_migrate(current_version, target):
+        console.print(
+            f"\n[red]Error: No migration path from version {current_version} "
+            f"to {target}.[/red]"
+        )
+        raise typer.Exit(1)
+
+    # Dry-run mode
+    if dry_run:
+        changes = service.dry_run(target)
+        console.print("\n[bold]Preview of changes:[/bold]")
+        for change in changes:
+            console.print(f"  {change}")
+        console.print("\n[yellow]Dry run - no changes made[/yellow]")
+        raise typer.Exit(0)
+
+    # Apply migration
+    console.print("\n[bold]Applying migration...[/bold]")
+    success, message = service.apply_migration(target, backup=backup)
+
+    if success:
+        console.print(f"\n[green]✓ {message}[/green]")
+        if backup:
+            console.print(
+                "[dim]Config backup preserved. Delete manually when confirmed working.[/dim]"
+            )
+    else:
+        console.print(f"\n[red]✗ {message}[/red]")
+        raise typer.Exit(1)
+
+
+@app.command()
+def rollback(
+    repo_path: Path = typer.Argument(
+        Path("."),
+        help="Project root directory",
+        exists=True,
+        file_okay=False,
+        dir_okay=True,
+    ),
+    steps: int = typer.Option(
+        1,
+        "--steps",
+        "-s",
+        help="Number of schema versions to rollback",
+        min=1,
+    ),
+    from_backup: bool = typer.Option(
+        True,
+        "--from-backup/--no-backup",
+        help="Restore from backup if available (default: enabled)",
+    ),
+) -> None:
+    """
+    Rollback previous schema migration(s).
+
+    Restores config.yml from a backup (if available) or applies backward
+    migrations to undo schema changes.
+
+    Examples:
+        tac-bootstrap rollback                      # Rollback 1 step
+        tac-bootstrap rollback . --steps 2          # Rollback 2 steps
+        tac-bootstrap rollback . --no-backup        # Use backward migrations only
+    """
+    project_path = repo_path.resolve()
+
+    # Verify config.yml exists
+    config_file = project_path / "config.yml"
+    if not config_file.exists():
+        console.print("[red]Error: No config.yml found. Is this a TAC Bootstrap project?[/red]")
+        raise typer.Exit(1)
+
+    service = MigrationService(project_path)
+    current_version = service.detect_current_version()
+
+    console.print("\n[bold]TAC Bootstrap Schema Rollback[/bold]")
+    console.print(f"  Current schema version: [yellow]{current_version}[/yellow]")
+    console.print(f"  Steps to rollback: [cyan]{steps}[/cyan]")
+    console.print(f"  From backup: [cyan]{from_backup}[/cyan]")
+
+    # Perform rollback
+    console.print("\n[bold]Rolling back...[/bold]")
+    success, message = service.rollback_migration(steps=steps, from_backup=from_backup)
+
+    if success:
+        console.print(f"\n[green]✓ {message}[/green]")
+    else:
+        console.print(f"\n[red]✗ {message}[/red]")
+        raise typer.Exit(1)
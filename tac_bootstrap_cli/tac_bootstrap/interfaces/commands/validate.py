@@ -0,0 +1,290 @@
+"""Environment and configuration checks: health-check, validate."""
+
+from pathlib import Path
+
+import typer
+import yaml
+from rich.console import Console
+from rich.panel import Panel
+from rich.table import Table
+
+from tac_bootstrap.application.validation_service import ValidationLevel, ValidationService
+from tac_bootstrap.domain.models import (
+    ClaudeConfig,
+    ClaudeSettings,
+    CommandsSpec,
+    Language,
+    PackageManager,
+    ProjectSpec,
+    TACConfig,
+)
+from tac_bootstrap.infrastructure.template_repo import TemplateRepository
+from tac_bootstrap.infrastructure.toolchain_probe import ToolchainProbe
+
+console = Console()
+app = typer.Typer(rich_markup_mode="rich")
+
+
+@app.command()
+def health_check(
+    repo_path: Path = typer.Argument(
+        Path("."), help="Project root (default: current directory)"
+    ),
+    refresh: bool = typer.Option(
+        False, "--refresh", help="Re-probe tools instead of using cached versions"
+    ),
+) -> None:
+    """
+    Check system health and requirements.
+
+    Validates that all required system dependencies are installed and meet
+    minimum version requirements for TAC Bootstrap project generation.
+
+    Checks:
+    - git >= 2.30
+    - python >= 3.10
+    - Package manager (uv, npm, yarn, pnpm, bun)
+    - gh CLI (if orchestrator is enabled)
+
+    Tool versions are cached in ~/.tac-bootstrap/cache/toolchain.json (shared with
+    validate, init and add-agentic) until the binary changes or the entry expires.
+
+    Examples:
+        # Check current directory
+        $ tac-bootstrap health-check
+
+        # Check specific project
+        $ tac-bootstrap health-check /path/to/repo
+    """
+    try:
+        repo_path = repo_path.resolve()
+        console.print(f"[cyan]Checking system health for:[/cyan] {repo_path}\n")
+
+        # Try to load config from repo if available
+        config_file = repo_path / "config.yml"
+        if config_file.exists():
+            try:
+                with open(config_file, "r") as f:
+                    raw_config = yaml.safe_load(f)
+                config = TACConfig(**raw_config)
+                console.print(f"[dim]Loaded config from {config_file}[/dim]\n")
+            except Exception:
+                # Fall back to minimal config for system checks
+                config = TACConfig(
+                    project=ProjectSpec(
+                        name="health-check",
+                        language=Language.PYTHON,
+                        package_manager=PackageManager.UV,
+                    ),
+                    commands=CommandsSpec(start="", test=""),
+                    claude=ClaudeConfig(settings=ClaudeSettings(project_name="health-check")),
+                )
+        else:
+            config = TACConfig(
+                project=ProjectSpec(
+                    name="health-check",
+                    language=Language.PYTHON,
+                    package_manager=PackageManager.UV,
+                ),
+                commands=CommandsSpec(start="", test=""),
+                claude=ClaudeConfig(settings=ClaudeSettings(project_name="health-check")),
+            )
+
+        toolchain = ToolchainProbe()
+        if refresh:
+            toolchain.clear()
+        vs = ValidationService(TemplateRepository(), toolchain=toolchain)
+        result = vs.validate_system_requirements(config)
+
+        # Build results table
+        table = Table(title="System Requirements", border_style="cyan")
+        table.add_column("Tool", style="bold")
+        table.add_column("Required")
+        table.add_column("Status")
+
+        checks_info = [("git", ">= 2.30"), ("python", ">= 3.10")]
+        if config.project.package_manager == PackageManager.UV:
+            checks_info.append(("uv", "any"))
+        if config.project.package_manager in ValidationService.JS_PACKAGE_MANAGERS:
+            checks_info.append((config.project.package_manager.value, "any"))
+        if config.orchestrator.enabled:
+            checks_info.append(("gh", "any"))
+
+        for tool_name, required_ver in checks_info:
+            tool_issues = [
+                i for i in result.issues if tool_name in i.message.lower()
+            ]
+            if tool_issues:
+                issue = tool_issues[0]
+                if issue.severity == "error":
+                    table.add_row(tool_name, required_ver, "[red]FAIL[/red]")
+                else:
+                    table.add_row(tool_name, required_ver, "[yellow]WARN[/yellow]")
+            else:
+                table.add_row(tool_name, required_ver, "[green]OK[/green]")
+
+        console.print(table)
+        console.print()
+
+        if result.valid:
+            console.print(
+                Panel(
+                    "[bold green]All system requirements met![/bold green]",
+                    border_style="green",
+                    title="Health Check",
+                )
+            )
+        else:
+            error_count = len(result.errors())
+            warning_count = len(result.warnings())
+            status_lines = "[bold red]Issues found[/bold red]\n\n"
+            status_lines += f"[red]Errors:[/red] {error_count}\n"
+            status_lines += f"[yellow]Warnings:[/yellow] {warning_count}\n"
+            for issue in result.issues:
+                color = "red" if issue.severity == "error" else "yellow"
+                status_lines += (
+                    f"\n[{color}][{issue.severity.upper()}][/{color}] {issue.message}"
+                )
+                if issue.suggestion:
+                    status_lines += f"\n  [dim]{issue.suggestion}[/dim]"
+
+            console.print(
+                Panel(status_lines, border_style="red", title="Health Check")
+            )
+            raise typer.Exit(1)
+
+    except SystemExit:
+        raise
+    except Exception as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+
+@app.command()
+def validate(
+    repo_path: Path = typer.Argument(
+        Path("."), help="Project root (default: current directory)"
+    ),
+    strict: bool = typer.Option(
+        False, "--strict", help="Run strict validation (all warnings become errors)"
+    ),
+) -> None:
+    """
+    Validate project configuration and requirements.
+
+    Runs comprehensive validation including system requirements, project name,
+    project path, config compatibility, filesystem, and git checks.
+
+    Examples:
+        # Validate current directory
+        $ tac-bootstrap validate
+
+        # Validate specific project
+        $ tac-bootstrap validate /path/to/repo
+
+        # Strict mode (warnings become errors)
+        $ tac-bootstrap validate --strict
+    """
+    try:
+        repo_path = repo_path.resolve()
+        console.print(f"[cyan]Validating:[/cyan] {repo_path}\n")
+
+        # Load config
+        config_file = repo_path / "config.yml"
+        if not config_file.exists():
+            console.print(
+                f"[red]Error:[/red] No config.yml found at {repo_path}"
+            )
+            console.print(
+                "[dim]Run 'tac-bootstrap init' to create a new project "
+                "or 'tac-bootstrap add-agentic' to add to existing repo[/dim]"
+            )
+            raise typer.Exit(1)
+
+        try:
+            with open(config_file, "r") as f:
+                raw_config = yaml.safe_load(f)
+            config = TACConfig(**raw_config)
+        except yaml.YAMLError as e:
+            console.print(f"[red]YAML Parse Error:[/red] {e}")
+            raise typer.Exit(1)
+        except Exception as e:
+            console.print(f"[red]Config Validation Error:[/red] {e}")
+            raise typer.Exit(1)
+
+        if strict:
+            config = config.model_copy(update={"validation_mode": "strict"})
+
+        template_repo = TemplateRepository()
+        vs = ValidationService(template_repo, toolchain=ToolchainProbe())
+        result = vs.run_preflight_checks(config, repo_path)
+
+        level_order = [
+            ValidationLevel.SYSTEM,
+            ValidationLevel.DOMAIN,
+            ValidationLevel.TEMPLATE,
+            ValidationLevel.FILESYSTEM,
+            ValidationLevel.GIT,
+        ]
+
+        has_issues = False
+        for level in level_order:
+            level_issues = [i for i in result.issues if i.level == level]
+            if not level_issues:
+                continue
+            has_issues = True
+            console.print(f"\n[bold]{level.value.upper()} Checks:[/bold]")
+            for issue in level_issues:
+                if issue.severity == "error":
+                    color = "red"
+                    icon = "x"
+                else:
+                    color = "yellow"
+                    icon = "!"
+                console.print(f"  [{color}][{icon}][/{color}] {issue.message}")
+                if issue.suggestion:
+                    console.print(f"      [dim]{issue.suggestion}[/dim]")
+
+        console.print()
+
+        if result.valid and not has_issues:
+            console.print(
+                Panel(
+                    "[bold green]All validations passed![/bold green]\n\n"
+                    f"Project '{config.project.name}' is ready for scaffolding.",
+                    border_style="green",
+                    title="Validation Result",
+                )
+            )
+        elif result.valid:
+            warning_count = len(result.warnings())
+            console.print(
+                Panel(
+                    f"[bold green]Validation passed with {warning_count} "
+                    f"warning(s)[/bold green]\n\n"
+                    f"Project '{config.project.name}' can proceed, "
+                    "but consider addressing the warnings above.",
+                    border_style="yellow",
+                    title="Validation Result",
+                )
+            )
+        else:
+            error_count = len(result.errors())
+            warning_count = len(result.warnings())
+            console.print(
+                Panel(
+                    f"[bold red]Validation failed[/bold red]\n\n"
+                    f"[red]Errors:[/red] {error_count}\n"
+                    f"[yellow]Warnings:[/yellow] {warning_count}\n\n"
+                    "Fix the errors above before proceeding.",
+                    border_style="red",
+                    title="Validation Result",
+                )
+            )
+            raise typer.Exit(1)
+
+    except SystemExit:
+        raise
+    except Exception as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
@@ -971,9 +971,11 @@ def run_entity_wizard() -> EntitySpec | None:
         # Indexed
         indexed = Confirm.ask("    Indexed?", default=False)
 
-        # Max length (only for STRING and TEXT types)
+        # Max length and full-text search (only for STRING and TEXT types)
         max_length: int | None = None
+        searchable = False
         if field_type in (FieldType.STRING, FieldType.TEXT):
+            searchable = Confirm.ask("    Searchable (full-text index)?", default=False)
             if Confirm.ask("    Set max length?", default=False):
                 max_length = IntPrompt.ask(
                     "      Max length",
@@ -988,6 +990,7 @@ def run_entity_wizard() -> EntitySpec | None:
             unique=unique,
             indexed=indexed,
             max_length=max_length,
+            searchable=searchable,
         )
         fields.append(field_spec)
         console.print(f"    [green]✓[/green] Added field: {field_name}")
@@ -2,7 +2,7 @@ import json
 import time
 import uuid
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Union
 
 if TYPE_CHECKING:
     from .logger import OrchestratorLogger
@@ -26,11 +26,27 @@ from .autocomplete_models import (
     PreviousCompletionAutocomplete,
     PreviousCompletionNone,
 )
+from .completion_index import (
+    KIND_AGENT,
+    KIND_COMMAND,
+    KIND_FILE,
+    KIND_TEMPLATE,
+    CompletionIndex,
+)
 
 # Maximum number of codebase files to include in autocomplete context
-# Captures all files from git but only sends first N to keep prompt size manageable
+# The local completion index covers ALL files; only the LLM prompt is trimmed
 MAX_CODEBASE_FILES = 300
 
+# Local completions: minimum typed characters and minimum match score
+# (prefix matches score > 1.0, fuzzy trigram matches score < 1.0)
+LOCAL_COMPLETION_MIN_CHARS = 2
+LOCAL_COMPLETION_MIN_SCORE = 0.6
+LOCAL_COMPLETION_LIMIT = 3
+
+# Directory scan fallback (no git) is repeated at most this often (seconds)
+CODEBASE_RESCAN_INTERVAL = 30
+
 
 class AutocompleteAgent:
     """
@@ -88,8 +104,12 @@ class AutocompleteAgent:
         self._cache_timestamp: float = 0
         self._cache_ttl: int = 5  # seconds
 
-        # Cache for codebase structure (initialized once)
-        self._codebase_structure: Optional[list[Any]] = None
+        # Local completion index (files, slash commands, agents, templates)
+        # Files are re-listed only when .git/index changes; commands and
+        # templates share the agent cache TTL
+        self.completion_index = CompletionIndex()
+        self._codebase_signature: Optional[float] = None
+        self._definitions_timestamp: float = 0
 
         # Load expertise FIRST, then check if we need to reset
         self.expertise_data = self._load_or_init_expertise()
@@ -284,30 +304,34 @@ class AutocompleteAgent:
 
         return self._cached_agents
 
-    def _get_codebase_structure(self) -> List[str]:
+    def _get_codebase_signature(self) -> Optional[float]:
         """
-        Get codebase structure as flat list of file paths using git ls-files with caching.
+        Return a cheap freshness signature for the tracked file list.
 
-        Uses git ls-files to get ALL tracked files (no limit on git command).
-        Trims result to first MAX_CODEBASE_FILES (300) to keep prompt size manageable.
-        Returns a simple list of file paths.
+        Uses the mtime of .git/index, which git rewrites whenever files are
+        added, removed or committed. Outside a git checkout, returns a time
+        bucket so the directory scan repeats every CODEBASE_RESCAN_INTERVAL.
+        """
+        current = Path(self.working_dir).resolve()
+        while current != current.parent:
+            git_index = current / ".git" / "index"
+            if git_index.exists():
+                return git_index.stat().st_mtime
+            current = current.parent
 
-        Returns:
-            List of file paths (max 300), e.g. ["backend/main.py", ...]
+        return float(int(time.time() // CODEBASE_RESCAN_INTERVAL))
 
-        Fallback: If git is not available or not in a repo, uses directory scanning.
+    def _list_codebase_files(self) -> List[str]:
         """
-        if self._codebase_structure is not None:
-            self.logger.debug(
-                f"Using cached codebase structure ({len(self._codebase_structure)} files)"
-            )
-            return self._codebase_structure
+        List ALL codebase files as relative paths.
 
-        self.logger.info("Loading codebase structure...")
+        Uses git ls-files for tracked files.
+
+        Fallback: If git is not available or not in a repo, uses directory scanning.
+        """
         try:
             import subprocess
 
-            # Get ALL files from git ls-files (no limits on git command)
             result = subprocess.run(
                 ["git", "ls-files"],
                 cwd=self.working_dir,
@@ -317,28 +341,10 @@ class AutocompleteAgent:
             )
 
             if result.returncode == 0:
-                # Parse git ls-files output - get ALL files
-                all_files = [
+                return [
                     f.strip() for f in result.stdout.strip().split("\n") if f.strip()
                 ]
 
-                # Trim to first MAX_CODEBASE_FILES to keep prompt size manageable
-                files = all_files[:MAX_CODEBASE_FILES]
-
-                self._codebase_structure = files
-
-                if len(all_files) > MAX_CODEBASE_FILES:
-                    self.logger.info(
-                        f"Cached codebase structure via git: {len(files)} files "
-                        f"(trimmed from {len(all_files)} total)"
-                    )
-                else:
-                    self.logger.info(
-                        f"Cached codebase structure via git: {len(files)} files"
-                    )
-
-                return self._codebase_structure
-
         except (
             subprocess.TimeoutExpired,
             subprocess.SubprocessError,
@@ -369,27 +375,113 @@ class AutocompleteAgent:
                         scan_directory(item, base)
 
             scan_directory(working_path, working_path)
+            return all_files
 
-            # Trim to first MAX_CODEBASE_FILES to keep prompt size manageable
-            files = all_files[:MAX_CODEBASE_FILES]
+        except Exception as e:
+            self.logger.error(f"Failed to get codebase structure: {e}")
+            return []
 
-            self._codebase_structure = files
+    def _refresh_completion_index(self) -> None:
+        """
+        Bring the local completion index up to date (delta updates only).
 
-            if len(all_files) > MAX_CODEBASE_FILES:
-                self.logger.info(
-                    f"Cached codebase structure via scan: {len(files)} files "
-                    f"(trimmed from {len(all_files)} total)"
-                )
-            else:
-                self.logger.info(
-                    f"Cached codebase structure via scan: {len(files)} files"
-                )
+        - Files: re-listed when the codebase signature changes
+        - Slash commands / agent templates: re-discovered after the cache TTL
+        - Active agents: synced from the agent cache on every call
+        """
+        signature = self._get_codebase_signature()
+        if signature != self._codebase_signature:
+            added, removed = self.completion_index.sync(
+                KIND_FILE, self._list_codebase_files()
+            )
+            self._codebase_signature = signature
+            self.logger.info(
+                f"Completion index files updated (+{added} -{removed}, "
+                f"{len(self.completion_index.values(KIND_FILE))} total)"
+            )
 
-        except Exception as e:
-            self.logger.error(f"Failed to get codebase structure: {e}")
-            self._codebase_structure = []
+        current_time = time.time()
+        if (current_time - self._definitions_timestamp) >= self._cache_ttl:
+            from .slash_command_parser import discover_slash_commands
+            from .subagent_loader import SubagentRegistry
+
+            self.completion_index.sync(
+                KIND_COMMAND,
+                [cmd["name"] for cmd in discover_slash_commands(self.working_dir)],
+            )
+            self.completion_index.sync(
+                KIND_TEMPLATE,
+                [
+                    tmpl["name"]
+                    for tmpl in SubagentRegistry(
+                        self.working_dir, self.logger
+                    ).list_templates()
+                ],
+            )
+            self._definitions_timestamp = current_time
+
+        self.completion_index.sync(
+            KIND_AGENT, [agent["name"] for agent in self._cached_agents]
+        )
+
+    def _get_codebase_structure(self) -> List[str]:
+        """
+        Get codebase structure as flat list of file paths from the completion index.
+
+        The index holds ALL files and stays fresh via git ls-files deltas.
+        Trims result to first MAX_CODEBASE_FILES (300) to keep prompt size manageable.
+
+        Returns:
+            List of file paths (max 300), e.g. ["backend/main.py", ...]
+        """
+        self._refresh_completion_index()
+        return self.completion_index.values(KIND_FILE)[:MAX_CODEBASE_FILES]
+
+    def complete_locally(self, user_input: str) -> Optional[List[AutocompleteItem]]:
+        """
+        Answer a completion from the local index without a model call.
 
-        return self._codebase_structure
+        Completes the token currently being typed (the text after the last
+        whitespace): a leading "/name" token matches slash commands, anything
+        else matches files, active agents and agent templates.
+
+        Returns:
+            Suggestions that replace the typed token, or None when the input
+            needs semantic suggestions from generate_autocomplete's LLM path
+        """
+        if not user_input or user_input[-1].isspace():
+            return None
+
+        token = user_input.split()[-1]
+        render: Callable[[str], str]
+        if token.startswith("/") and user_input.lstrip() == token:
+            query, kinds, render = token[1:], [KIND_COMMAND], "/{}".format
+        elif len(token) >= LOCAL_COMPLETION_MIN_CHARS:
+            query, kinds, render = token, [KIND_FILE, KIND_AGENT, KIND_TEMPLATE], str
+        else:
+            return None
+
+        started = time.perf_counter()
+        self._refresh_completion_index()
+        matches = self.completion_index.search(
+            query, kinds=kinds, limit=LOCAL_COMPLETION_LIMIT + 1
+        )
+
+        items = [
+            AutocompleteItem(
+                completion=render(value),
+                reasoning=f"Matches {kind} '{value}'",
+                replace_length=len(token),
+            )
+            for kind, value, score in matches
+            if score >= LOCAL_COMPLETION_MIN_SCORE and render(value) != token
+        ][:LOCAL_COMPLETION_LIMIT]
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self.logger.debug(
+            f"Local completion for '{token}': {len(items)} items in {elapsed_ms:.2f}ms"
+        )
+        return items or None
 
     def _get_variable_values(self, user_input: str) -> Dict[str, str]:
         """
@@ -403,9 +495,6 @@ class AutocompleteAgent:
         """
         self.logger.debug("Building variable values for prompt replacement...")
 
-        from .slash_command_parser import discover_slash_commands
-        from .subagent_loader import SubagentRegistry
-
         # CRITICAL: Type-safe access to previous_completions via Pydantic model
         # Keep FULL structure - this is the only variable that needs complete detail
         previous_completions_data = [
@@ -413,19 +502,13 @@ class AutocompleteAgent:
             for comp in self.expertise_data.previous_completions
         ]
 
-        # Discover slash commands and agent templates (full objects)
-        slash_commands_full = discover_slash_commands(self.working_dir)
-        agent_templates_full = SubagentRegistry(
-            self.working_dir, self.logger
-        ).list_templates()
+        # Slash commands, agent templates and files come from the completion index
         codebase_structure = self._get_codebase_structure()
 
         # Simplify to names/strings only to reduce context usage
         agent_names = [agent["name"] for agent in self._cached_agents]
-        command_strings = [
-            cmd["name"] for cmd in slash_commands_full
-        ]  # Fixed: 'name' not 'command'
-        template_names = [tmpl["name"] for tmpl in agent_templates_full]
+        command_strings = self.completion_index.values(KIND_COMMAND)
+        template_names = self.completion_index.values(KIND_TEMPLATE)
 
         self.logger.debug(
             f"Variable counts: {len(previous_completions_data)} completions, "
@@ -472,6 +555,10 @@ class AutocompleteAgent:
         CRITICAL: Uses Claude Agent SDK's query() and receive_response() methods.
         After first interaction, captures and stores session_id in expertise.yaml.
         Implements request cancellation - interrupts any existing request before starting new one.
+
+        Completions of a partially typed file, command, agent or template name
+        are answered from the local index first; the LLM is only queried for
+        semantic suggestions.
         """
         self.logger.info("=" * 80)
         self.logger.info(
@@ -479,6 +566,16 @@ class AutocompleteAgent:
         )
         self.logger.info("=" * 80)
 
+        # Fetch active agents from database (with caching) so agent names are indexed
+        await self._fetch_active_agents()
+
+        local_items = self.complete_locally(user_input)
+        if local_items:
+            self.logger.success(
+                f"✓ Answered autocomplete locally ({len(local_items)} suggestions)"
+            )
+            return local_items
+
         # INTERRUPT CHECK - Cancel any existing autocomplete request
         if self.is_executing and self.active_client:
             try:
@@ -507,9 +604,6 @@ class AutocompleteAgent:
             self.logger.debug("📡 Broadcasted autocomplete_started event")
 
         try:
-            # Fetch active agents from database (with caching)
-            await self._fetch_active_agents()
-
             # Ensure client is initialized
             if self.client is None:
                 self.logger.error("Claude Agent SDK client not initialized")
@@ -11,6 +11,10 @@ class AutocompleteItem(BaseModel):
     """Single autocomplete suggestion"""
     completion: str
     reasoning: str
+    replace_length: int = Field(
+        0,
+        description="Trailing characters of the input replaced by completion (0 = append)"
+    )
 
 class AutocompleteGenerateRequest(BaseModel):
     """Request to generate autocomplete suggestions"""
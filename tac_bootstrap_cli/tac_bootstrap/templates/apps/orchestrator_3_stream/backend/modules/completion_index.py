@@ -0,0 +1,182 @@
+"""
+Completion Index Module
+
+In-memory index over codebase files, slash commands, agent names and agent
+templates. Lets AutocompleteAgent answer most completions locally instead of
+making a model call.
+
+- Prefix lookups use a sorted key list and bisect. Every value is indexed at
+  each segment boundary, so "file_tr" finds "backend/modules/file_tracker.py".
+- Fuzzy lookups use trigram postings, ranked by trigram overlap with a bonus
+  for in-order (subsequence) matches.
+- sync() applies set deltas, so a refresh only touches entries that changed.
+"""
+
+import bisect
+import re
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+# Entry kinds
+KIND_FILE = "file"
+KIND_COMMAND = "command"
+KIND_AGENT = "agent"
+KIND_TEMPLATE = "template"
+
+# Characters after which a new prefix anchor starts
+_ANCHOR_BOUNDARY = re.compile(r"[/:_\-\s]")
+
+# Upper bound on prefix keys scanned per lookup (very short queries)
+MAX_PREFIX_SCAN = 2000
+
+# Fuzzy matches need at least this fraction of the query trigrams
+MIN_FUZZY_OVERLAP = 0.5
+
+Entry = Tuple[str, str]  # (kind, value)
+Match = Tuple[str, str, float]  # (kind, value, score)
+
+
+def _anchors(value: str) -> List[str]:
+    """Return the lowercase suffixes of value that start at a segment boundary."""
+    lowered = value.lower()
+    anchors = [lowered]
+    for boundary in _ANCHOR_BOUNDARY.finditer(lowered):
+        start = boundary.end()
+        if start < len(lowered):
+            anchors.append(lowered[start:])
+    return anchors
+
+
+def _trigrams(text: str) -> Set[str]:
+    """Return the set of 3-character substrings of text."""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def _is_subsequence(query: str, text: str) -> bool:
+    """Check whether all characters of query appear in text in order."""
+    remaining = iter(text)
+    return all(char in remaining for char in query)
+
+
+class CompletionIndex:
+    """Prefix + trigram index over completion candidates, grouped by kind."""
+
+    def __init__(self) -> None:
+        self._values: Dict[str, Set[str]] = {}
+        # Sorted (anchor, kind, value) tuples for bisect prefix lookups
+        self._keys: List[Tuple[str, str, str]] = []
+        # Trigram -> entries whose lowercase value contains it
+        self._postings: Dict[str, Set[Entry]] = {}
+
+    def __len__(self) -> int:
+        return sum(len(values) for values in self._values.values())
+
+    def values(self, kind: str) -> List[str]:
+        """Return all indexed values of a kind, sorted."""
+        return sorted(self._values.get(kind, ()))
+
+    def sync(self, kind: str, values: Iterable[str]) -> Tuple[int, int]:
+        """
+        Make the entries of a kind match values, applying only the delta.
+
+        Args:
+            kind: Entry kind (KIND_FILE, KIND_COMMAND, ...)
+            values: Complete current set of values for that kind
+
+        Returns:
+            Tuple of (added, removed) entry counts
+        """
+        current = self._values.setdefault(kind, set())
+        wanted = {value for value in values if value}
+
+        added = wanted - current
+        removed = current - wanted
+
+        if removed:
+            self._remove(kind, removed)
+        if added:
+            self._add(kind, added)
+
+        return (len(added), len(removed))
+
+    def _add(self, kind: str, values: Set[str]) -> None:
+        new_keys: List[Tuple[str, str, str]] = []
+        for value in values:
+            self._values[kind].add(value)
+            new_keys.extend((anchor, kind, value) for anchor in _anchors(value))
+            for trigram in _trigrams(value.lower()):
+                self._postings.setdefault(trigram, set()).add((kind, value))
+
+        if len(new_keys) > len(self._keys) // 10:
+            self._keys.extend(new_keys)
+            self._keys.sort()
+        else:
+            for key in new_keys:
+                bisect.insort(self._keys, key)
+
+    def _remove(self, kind: str, values: Set[str]) -> None:
+        self._values[kind] -= values
+        self._keys = [key for key in self._keys if key[1] != kind or key[2] not in values]
+        for value in values:
+            for trigram in _trigrams(value.lower()):
+                entries = self._postings.get(trigram)
+                if entries is not None:
+                    entries.discard((kind, value))
+                    if not entries:
+                        del self._postings[trigram]
+
+    def search(
+        self,
+        query: str,
+        kinds: Optional[Sequence[str]] = None,
+        limit: int = 10,
+    ) -> List[Match]:
+        """
+        Rank entries matching query.
+
+        Prefix matches on any anchor score above 1.0. Matches that complete
+        more of the value score higher, and a match on the whole value gets
+        a bonus. Fuzzy trigram matches score between MIN_FUZZY_OVERLAP and
+        1.0 and are only looked up when there are too few prefix matches.
+
+        Args:
+            query: Text typed by the user (case-insensitive)
+            kinds: Restrict results to these kinds (default: all)
+            limit: Maximum number of matches to return
+
+        Returns:
+            List of (kind, value, score) sorted best first
+        """
+        q = query.lower()
+        scores: Dict[Entry, float] = {}
+
+        start = bisect.bisect_left(self._keys, (q,))
+        for anchor, kind, value in self._keys[start:start + MAX_PREFIX_SCAN]:
+            if not anchor.startswith(q):
+                break
+            if kinds is not None and kind not in kinds:
+                continue
+            score = 1.0 + len(q) / len(anchor)
+            if len(anchor) == len(value):
+                score += 0.25
+            entry = (kind, value)
+            if score > scores.get(entry, 0.0):
+                scores[entry] = score
+
+        query_trigrams = _trigrams(q)
+        if len(scores) < limit and query_trigrams:
+            hits: Counter[Entry] = Counter()
+            for trigram in query_trigrams:
+                hits.update(self._postings.get(trigram, ()))
+
+            for entry, count in hits.items():
+                if entry in scores or (kinds is not None and entry[0] not in kinds):
+                    continue
+                overlap = count / len(query_trigrams)
+                if overlap < MIN_FUZZY_OVERLAP:
+                    continue
+                bonus = 0.1 if _is_subsequence(q, entry[1].lower()) else 0.0
+                scores[entry] = min(overlap * 0.9 + bonus, 0.99)
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], len(item[0][1]), item[0][1]))
+        return [(kind, value, score) for (kind, value), score in ranked[:limit]]
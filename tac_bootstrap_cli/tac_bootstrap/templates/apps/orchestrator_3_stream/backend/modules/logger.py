@@ -2,18 +2,32 @@
 """
 Comprehensive Logging Module
 Logs to both console and hourly rotating log files for e2e debugging
+
+Log calls never touch the console or disk on the caller's thread: records are
+put on a bounded queue (QueueHandler) and a background LogWriterThread renders
+them to Rich and the hourly log file in batches, flushing on an interval.
 """
 
+import atexit
+import copy
+import itertools
 import logging
+import queue
+import reprlib
 import sys
+import threading
+import time
 from datetime import datetime
+from logging.handlers import QueueHandler
 from pathlib import Path
-from typing import Any, Dict, Optional, TextIO
+from typing import Any, Dict, List, Optional, TextIO
 
 from rich.console import Console
 from rich.logging import RichHandler
 from rich.panel import Panel
 
+from .config import LOG_BATCH_SIZE, LOG_DEBUG_SAMPLE_RATE, LOG_FLUSH_INTERVAL, LOG_QUEUE_SIZE
+
 # Create logs directory
 LOGS_DIR = Path(__file__).parent.parent / "logs"
 LOGS_DIR.mkdir(exist_ok=True)
@@ -21,9 +35,21 @@ LOGS_DIR.mkdir(exist_ok=True)
 # Rich console for formatted output
 console = Console()
 
+# Bounded repr for WebSocket payloads (large chat/stream payloads are truncated)
+_payload_repr = reprlib.Repr()
+_payload_repr.maxstring = 200
+_payload_repr.maxother = 200
+_payload_repr.maxdict = 20
+_payload_repr.maxlist = 20
+
 
 class HourlyRotatingFileHandler(logging.Handler):
-    """Custom handler that rotates log files every hour"""
+    """
+    Custom handler that rotates log files every hour
+
+    Writes are buffered by the file object; the background writer thread calls
+    flush() once per batch interval instead of after every record.
+    """
 
     def __init__(self, logs_dir: Path) -> None:
         super().__init__()
@@ -34,9 +60,9 @@ class HourlyRotatingFileHandler(logging.Handler):
     def emit(self, record: logging.LogRecord) -> None:
         """Emit a record to the appropriate hourly log file"""
         try:
-            # Get current hour timestamp
-            now = datetime.now()
-            hour_key = now.strftime("%Y-%m-%d_%H")
+            # Rotate on the record's own hour so queued records land in the right file
+            created = datetime.fromtimestamp(record.created)
+            hour_key = created.strftime("%Y-%m-%d_%H")
 
             # Rotate file if hour changed
             if hour_key != self.current_hour:
@@ -50,7 +76,7 @@ class HourlyRotatingFileHandler(logging.Handler):
                 # Write header for new file
                 self.current_file.write(f"\n{'='*80}\n")
                 self.current_file.write(
-                    f"Log Session Started: {now.strftime('%Y-%m-%d %H:%M:%S')}\n"
+                    f"Log Session Started: {created.strftime('%Y-%m-%d %H:%M:%S')}\n"
                 )
                 self.current_file.write(f"{'='*80}\n\n")
 
@@ -58,18 +84,187 @@ class HourlyRotatingFileHandler(logging.Handler):
             log_entry = self.format(record)
             if self.current_file is not None:
                 self.current_file.write(log_entry + "\n")
-                self.current_file.flush()
 
         except Exception as e:
             print(f"Error writing to log file: {e}", file=sys.stderr)
 
+    def flush(self) -> None:
+        """Flush buffered writes to disk"""
+        if self.current_file:
+            self.current_file.flush()
+
     def close(self) -> None:
         """Close current log file"""
         if self.current_file:
             self.current_file.close()
+            self.current_file = None
         super().close()
 
 
+class LevelSampler(logging.Filter):
+    """
+    Keep only a fraction of records at a given level (deterministic 1-in-N)
+
+    Used on hot debug paths (per-chunk streaming, per-broadcast traces) so that
+    enabling DEBUG does not flood the queue. Records above the level pass through.
+    """
+
+    def __init__(self, level: int, rate: float) -> None:
+        super().__init__()
+        self.level = level
+        self.every = max(1, round(1 / rate)) if rate > 0 else 0
+        self.seen = 0
+        self.sampled_out = 0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno != self.level or self.every == 1:
+            return True
+        self.seen += 1
+        if self.every and self.seen % self.every == 0:
+            return True
+        self.sampled_out += 1
+        return False
+
+
+class DroppingQueueHandler(QueueHandler):
+    """QueueHandler that never blocks: records are dropped and counted when the queue is full"""
+
+    def __init__(self, log_queue: "queue.Queue[Any]") -> None:
+        super().__init__(log_queue)
+        self.queued = 0
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Snapshot args without formatting them; keep exc_info for Rich tracebacks
+
+        Scalar args and WebSocket payloads are formatted later on the writer thread
+        (payloads are snapshotted first, since they may change after the call).
+        Any other args are merged now, as the stock QueueHandler does.
+        """
+        record = copy.copy(record)
+        args = record.args
+        if isinstance(args, tuple) and all(isinstance(arg, _DEFERRED_ARGS) for arg in args):
+            record.args = tuple(
+                arg.snapshot() if isinstance(arg, _PayloadRepr) else arg for arg in args
+            )
+        else:
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+            self.queued += 1
+        except queue.Full:
+            self.dropped += 1
+
+
+class LogWriterThread(threading.Thread):
+    """
+    Background thread that drains the log queue in batches
+
+    Each batch is dispatched to the console and file handlers; file handlers are
+    flushed at most every flush_interval seconds (and always on stop()).
+    """
+
+    _STOP = object()
+
+    def __init__(
+        self,
+        log_queue: "queue.Queue[Any]",
+        handlers: List[logging.Handler],
+        flush_interval: float = LOG_FLUSH_INTERVAL,
+        batch_size: int = LOG_BATCH_SIZE,
+    ) -> None:
+        super().__init__(name="orchestrator-log-writer", daemon=True)
+        self.queue = log_queue
+        self.handlers = handlers
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.written = 0
+        self.batches = 0
+
+    def run(self) -> None:
+        last_flush = time.monotonic()
+        stopping = False
+
+        while not stopping:
+            timeout = max(0.0, self.flush_interval - (time.monotonic() - last_flush))
+            batch: List[Any] = []
+            try:
+                batch.append(self.queue.get(timeout=timeout))
+                while len(batch) < self.batch_size:
+                    batch.append(self.queue.get_nowait())
+            except queue.Empty:
+                pass
+
+            for record in batch:
+                if record is self._STOP:
+                    stopping = True
+                    continue
+                self._dispatch(record)
+
+            if batch:
+                self.batches += 1
+
+            if stopping or time.monotonic() - last_flush >= self.flush_interval:
+                for handler in self.handlers:
+                    handler.flush()
+                last_flush = time.monotonic()
+
+    def _dispatch(self, record: logging.LogRecord) -> None:
+        # Format once for all handlers; payload reprs are built here, off the caller's thread
+        record.msg = record.getMessage()
+        record.args = None
+        panel = getattr(record, "rich_panel", None)
+        for handler in self.handlers:
+            if record.levelno < handler.level:
+                continue
+            if panel is not None and isinstance(handler, RichHandler):
+                message, title, style, expand = panel
+                handler.console.print(
+                    Panel(message, title=title, border_style=style, expand=expand)
+                )
+            else:
+                handler.handle(record)
+        self.written += 1
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Drain remaining records, flush and wait for the thread to exit"""
+        if not self.is_alive():
+            return
+        # Blocking put: the stop marker must not be dropped on a full queue
+        self.queue.put(self._STOP)
+        self.join(timeout)
+
+
+class _PayloadRepr:
+    """
+    Defers the (bounded) repr of a WebSocket payload to the writer thread
+
+    The queue handler keeps a snapshot() instead of the live dict: a shallow copy
+    of at most the keys the repr can show, so the caller never pays for the repr.
+    """
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: Dict[str, Any]) -> None:
+        self.data = data
+
+    def snapshot(self) -> "_PayloadRepr":
+        items = ((k, v) for k, v in self.data.items() if k != "type")
+        return _PayloadRepr(dict(itertools.islice(items, _payload_repr.maxdict + 1)))
+
+    def __str__(self) -> str:
+        return _payload_repr.repr({k: v for k, v in self.data.items() if k != "type"})
+
+
+# Record args that prepare() may leave unformatted for the writer thread
+_DEFERRED_ARGS = (str, int, float, bool, type(None), _PayloadRepr)
+
+
 class OrchestratorLogger:
     """
     Centralized logger for the orchestrator backend
@@ -85,7 +280,7 @@ class OrchestratorLogger:
         # Clear existing handlers
         self.logger.handlers.clear()
 
-        # Add Rich console handler
+        # Rich console handler (runs on the writer thread)
         console_handler = RichHandler(
             console=console,
             rich_tracebacks=True,
@@ -95,9 +290,8 @@ class OrchestratorLogger:
         console_handler.setLevel(logging.DEBUG)
         console_formatter = logging.Formatter("%(message)s")
         console_handler.setFormatter(console_formatter)
-        self.logger.addHandler(console_handler)
 
-        # Add hourly rotating file handler
+        # Hourly rotating file handler (runs on the writer thread)
         file_handler = HourlyRotatingFileHandler(LOGS_DIR)
         file_handler.setLevel(logging.DEBUG)
         file_formatter = logging.Formatter(
@@ -105,10 +299,37 @@ class OrchestratorLogger:
             datefmt="%Y-%m-%d %H:%M:%S",
         )
         file_handler.setFormatter(file_formatter)
-        self.logger.addHandler(file_handler)
+
+        # The only handler on the logger: enqueue and return immediately
+        log_queue: "queue.Queue[Any]" = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+        self.sampler = LevelSampler(logging.DEBUG, LOG_DEBUG_SAMPLE_RATE)
+        self.queue_handler = DroppingQueueHandler(log_queue)
+        self.queue_handler.addFilter(self.sampler)
+        self.logger.addHandler(self.queue_handler)
+
+        self.writer = LogWriterThread(log_queue, [console_handler, file_handler])
+        self.writer.start()
+        atexit.register(self.close)
+
+    def stats(self) -> Dict[str, int]:
+        """Logging pipeline counters (queued / written / dropped / sampled out)"""
+        return {
+            "queued": self.queue_handler.queued,
+            "written": self.writer.written,
+            "dropped": self.queue_handler.dropped,
+            "sampled_out": self.sampler.sampled_out,
+            "queue_depth": self.writer.queue.qsize(),
+            "batches": self.writer.batches,
+        }
+
+    def close(self) -> None:
+        """Drain the queue, flush and close log files"""
+        self.writer.stop()
+        for handler in self.writer.handlers:
+            handler.close()
 
     def debug(self, message: str, **kwargs: Any) -> None:
-        """Log debug message"""
+        """Log debug message (subject to LOG_DEBUG_SAMPLE_RATE)"""
         self.logger.debug(message, **kwargs)
 
     def info(self, message: str, **kwargs: Any) -> None:
@@ -138,13 +359,12 @@ class OrchestratorLogger:
         style: str = "cyan",
         expand: bool = True,
     ) -> None:
-        """Log a Rich panel (console only, file gets plain text)"""
-        # Log to console with Rich panel
-        console.print(Panel(message, title=title, border_style=style, expand=expand))
-
-        # Log to file as plain text
+        """Log a Rich panel (the writer thread prints it to the console, file gets plain text)"""
         plain_message = f"{title}: {message}" if title else message
-        self.logger.info(f"[PANEL] {plain_message}", extra={"markup": False})
+        self.logger.info(
+            f"[PANEL] {plain_message}",
+            extra={"markup": False, "rich_panel": (message, title, style, expand)},
+        )
 
     def section(self, title: str, style: str = "bold cyan") -> None:
         """Log a section header"""
@@ -153,8 +373,10 @@ class OrchestratorLogger:
         self.logger.info(f"\n{separator}\n{title}\n{separator}", extra={"markup": False})
 
     def websocket_event(self, event_type: str, data: Dict[str, Any]) -> None:
-        """Log WebSocket events"""
-        self.info(f"📡 WebSocket Event: {event_type} | Data: {data}")
+        """Log WebSocket events (payload repr is bounded and built lazily, without copying)"""
+        self.logger.info(
+            "[cyan]📡 WebSocket Event: %s | Data: %s[/cyan]", event_type, _PayloadRepr(data)
+        )
 
     def agent_event(self, agent_id: str, event_type: str, message: str) -> None:
         """Log agent-specific events"""
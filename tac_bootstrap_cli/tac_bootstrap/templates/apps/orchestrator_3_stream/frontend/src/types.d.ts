@@ -372,6 +372,7 @@ export type CompletionType = 'none' | 'autocomplete'
 export interface AutocompleteItem {
   completion: string
   reasoning: string
+  replace_length?: number  // Trailing input characters replaced (0/absent = append)
 }
 
 export interface AutocompleteResponse {
@@ -0,0 +1,361 @@
+#!/usr/bin/env -S uv run
+# /// script
+# requires-python = ">=3.12"
+# dependencies = [
+#     "python-dotenv",
+#     "rich",
+#     "click",
+# ]
+# ///
+
+"""
+Log Query Benchmark for Multi-Agent Orchestration Database
+
+Seeds synthetic agent_logs / system_logs rows and reports the query plan and
+latency of every hot log query issued by the orchestrator backend
+(apps/orchestrator_3_stream/backend/modules/database.py).
+
+Usage:
+    # Seed 1M agent_logs rows, benchmark, then remove the synthetic data
+    uv run apps/orchestrator_db/benchmark_logs.py --rows 1000000
+
+    # Re-run against data seeded earlier and save results for comparison
+    uv run apps/orchestrator_db/benchmark_logs.py --no-seed --keep --output bench.json
+
+Features:
+    - Seeds rows server-side with generate_series (no client round-trips)
+    - EXPLAIN (ANALYZE, BUFFERS) per query: index used, seq scans, latency
+    - Median / p95 execution time over repeated runs
+    - Synthetic rows live under a dedicated orchestrator and are removed on exit
+    - Loads DATABASE_URL from .env file
+
+Requirements:
+    - Migrations applied (run_migrations.py)
+    - psql command-line tool installed
+    - DATABASE_URL set in root .env file
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import click
+from dotenv import load_dotenv
+from rich.console import Console
+from rich.panel import Panel
+from rich.table import Table
+
+console = Console()
+
+# Fixed identifiers so seeded data can be found again with --no-seed
+BENCH_ORCHESTRATOR_ID = "00000000-0000-0000-0000-be0c00000000"
+BENCH_FILE_PATH = "benchmark_logs.py"
+BENCH_TASK = "bench-task-0"
+BENCH_ADW = "bench-adw-0"
+
+# Hot queries from modules/database.py with benchmark parameters inlined
+QUERIES = {
+    "get_agent_logs (agent, task)": """
+        SELECT * FROM agent_logs
+        WHERE agent_id = '{agent_id}' AND task_slug = '{task}'
+        ORDER BY entry_index ASC LIMIT 50 OFFSET 0
+    """,
+    "get_agent_logs (agent)": """
+        SELECT * FROM agent_logs
+        WHERE agent_id = '{agent_id}'
+        ORDER BY timestamp DESC LIMIT 50 OFFSET 0
+    """,
+    "get_tail_summaries": """
+        SELECT entry_index, event_category, event_type, summary, timestamp
+        FROM agent_logs
+        WHERE agent_id = '{agent_id}' AND task_slug = '{task}' AND summary IS NOT NULL
+        ORDER BY entry_index DESC LIMIT 10
+    """,
+    "get_tail_raw": """
+        SELECT entry_index, event_category, event_type, content, payload, timestamp
+        FROM agent_logs
+        WHERE agent_id = '{agent_id}' AND task_slug = '{task}'
+        ORDER BY entry_index DESC LIMIT 10
+    """,
+    "get_latest_task_slug": """
+        SELECT task_slug FROM agent_logs
+        WHERE agent_id = '{agent_id}'
+        GROUP BY task_slug ORDER BY MAX(timestamp) DESC LIMIT 1
+    """,
+    "get_adw_logs": """
+        SELECT * FROM agent_logs
+        WHERE adw_id = '{adw}'
+        ORDER BY timestamp DESC LIMIT 100
+    """,
+    "list_agent_logs (orchestrator)": """
+        SELECT al.*, a.name FROM agent_logs al
+        LEFT JOIN agents a ON al.agent_id = a.id
+        WHERE a.orchestrator_agent_id = '{orchestrator_id}'
+        ORDER BY al.timestamp DESC LIMIT 50
+    """,
+    "get_adw_system_logs": """
+        SELECT * FROM system_logs
+        WHERE adw_id = '{adw}'
+        ORDER BY timestamp DESC LIMIT 100
+    """,
+    "list_system_logs (level)": """
+        SELECT * FROM system_logs
+        WHERE level = 'ERROR'
+        ORDER BY timestamp DESC LIMIT 50
+    """,
+}
+
+SEED_SQL = """
+INSERT INTO orchestrator_agents (id, status, metadata)
+VALUES ('{orchestrator_id}', 'idle', '{{"source": "benchmark_logs"}}'::jsonb)
+ON CONFLICT (id) DO NOTHING;
+
+INSERT INTO agents (orchestrator_agent_id, name, model, status)
+SELECT '{orchestrator_id}', 'bench-agent-' || g, 'benchmark', 'idle'
+FROM generate_series(0, {agents} - 1) g
+ON CONFLICT (orchestrator_agent_id, name) DO NOTHING;
+
+INSERT INTO agent_logs (
+    agent_id, session_id, task_slug, adw_id, entry_index,
+    event_category, event_type, content, payload, summary, timestamp
+)
+SELECT a.id,
+       'bench-session',
+       'bench-task-' || (g % 20),
+       CASE WHEN g % 5 = 0 THEN 'bench-adw-' || (g % 50) END,
+       g,
+       CASE WHEN g % 2 = 0 THEN 'hook' ELSE 'response' END,
+       (ARRAY['PreToolUse', 'PostToolUse', 'text', 'thinking', 'tool_use'])[1 + g % 5],
+       repeat('x', 200),
+       jsonb_build_object('n', g),
+       CASE WHEN g % 3 = 0 THEN 'synthetic summary ' || g END,
+       NOW() - make_interval(secs => ({rows} - g) * {spread_seconds}::float / {rows})
+FROM generate_series(1, {rows}) g
+JOIN (
+    SELECT id, row_number() OVER (ORDER BY name) - 1 AS n
+    FROM agents WHERE orchestrator_agent_id = '{orchestrator_id}'
+) a ON a.n = g % {agents};
+
+INSERT INTO system_logs (file_path, adw_id, level, message, metadata, timestamp)
+SELECT '{file_path}',
+       CASE WHEN g % 5 = 0 THEN 'bench-adw-' || (g % 50) END,
+       (ARRAY['DEBUG', 'INFO', 'WARNING', 'ERROR'])[1 + g % 4],
+       'synthetic system log ' || g,
+       '{{}}'::jsonb,
+       NOW() - make_interval(secs => ({system_rows} - g) * {spread_seconds}::float / {system_rows})
+FROM generate_series(1, {system_rows}) g;
+
+ANALYZE agent_logs;
+ANALYZE system_logs;
+"""
+
+CLEANUP_SQL = """
+DELETE FROM orchestrator_agents WHERE id = '{orchestrator_id}';
+DELETE FROM system_logs WHERE file_path = '{file_path}';
+"""
+
+
+def load_database_url() -> str:
+    """Load DATABASE_URL from .env file"""
+    script_dir = Path(__file__).parent
+    project_root = script_dir.parent.parent
+    env_file = project_root / ".env"
+
+    if env_file.exists():
+        load_dotenv(env_file)
+
+    database_url = os.getenv("DATABASE_URL")
+    if not database_url:
+        console.print(
+            "[red]✗ Error:[/red] DATABASE_URL environment variable is required",
+            style="bold",
+        )
+        console.print(f"Add DATABASE_URL to {env_file}")
+        sys.exit(1)
+
+    return database_url
+
+
+def check_psql_installed() -> None:
+    """Verify psql command is available"""
+    try:
+        subprocess.run(["psql", "--version"], capture_output=True, check=True)
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        console.print("[red]✗ Error:[/red] psql command not found", style="bold")
+        console.print("Install PostgreSQL client tools to use this script")
+        sys.exit(1)
+
+
+def run_sql(database_url: str, sql: str) -> str:
+    """Run SQL through psql and return unaligned, tuples-only output"""
+    result = subprocess.run(
+        ["psql", database_url, "-At", "-v", "ON_ERROR_STOP=1"],
+        input=sql,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip())
+    return result.stdout
+
+
+def collect_plan_nodes(node: Dict[str, Any], nodes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Flatten an EXPLAIN JSON plan tree"""
+    nodes.append(node)
+    for child in node.get("Plans", []):
+        collect_plan_nodes(child, nodes)
+    return nodes
+
+
+def describe_plan(plan: Dict[str, Any]) -> str:
+    """Summarize scan strategy: indexes used and any sequential scans"""
+    parts = []
+    for node in collect_plan_nodes(plan["Plan"], []):
+        node_type = node["Node Type"]
+        if "Index Name" in node:
+            parts.append(f"{node_type} {node['Index Name']}")
+        elif node_type == "Seq Scan":
+            parts.append(f"Seq Scan {node.get('Relation Name', '')}")
+    return "\n".join(dict.fromkeys(parts)) or plan["Plan"]["Node Type"]
+
+
+def benchmark_query(database_url: str, sql: str, runs: int) -> Dict[str, Any]:
+    """Run EXPLAIN ANALYZE repeatedly and report the last plan with latency stats"""
+    timings = []
+    plan: Dict[str, Any] = {}
+    for _ in range(runs):
+        output = run_sql(database_url, f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {sql}")
+        plan = json.loads(output)[0]
+        timings.append(plan["Execution Time"])
+
+    timings.sort()
+    return {
+        "plan": describe_plan(plan),
+        "median_ms": statistics.median(timings),
+        "p95_ms": timings[min(len(timings) - 1, int(len(timings) * 0.95))],
+        "shared_hit_blocks": plan["Plan"].get("Shared Hit Blocks", 0),
+        "shared_read_blocks": plan["Plan"].get("Shared Read Blocks", 0),
+    }
+
+
+@click.command()
+@click.option(
+    "--rows", default=1_000_000, show_default=True, help="Synthetic agent_logs rows to seed"
+)
+@click.option(
+    "--system-rows", default=200_000, show_default=True, help="Synthetic system_logs rows to seed"
+)
+@click.option(
+    "--agents", default=20, show_default=True, help="Synthetic agents to spread rows over"
+)
+@click.option(
+    "--days", default=90, show_default=True, help="Spread seeded timestamps over this many days"
+)
+@click.option(
+    "--runs",
+    default=20,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="EXPLAIN ANALYZE runs per query",
+)
+@click.option("--seed/--no-seed", default=True, help="Seed synthetic rows before benchmarking")
+@click.option("--keep", is_flag=True, help="Keep synthetic rows after benchmarking")
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Write results as JSON (for comparing runs)",
+)
+def main(
+    rows: int,
+    system_rows: int,
+    agents: int,
+    days: int,
+    runs: int,
+    seed: bool,
+    keep: bool,
+    output: Optional[Path],
+) -> None:
+    """
+    Seed synthetic log rows and benchmark the orchestrator's hot log queries.
+    """
+    console.print(
+        Panel.fit(
+            "[bold cyan]Orchestrator Log Query Benchmark[/bold cyan]",
+            border_style="cyan",
+        )
+    )
+
+    database_url = load_database_url()
+    check_psql_installed()
+
+    params = {
+        "orchestrator_id": BENCH_ORCHESTRATOR_ID,
+        "file_path": BENCH_FILE_PATH,
+        "agents": agents,
+        "rows": rows,
+        "system_rows": system_rows,
+        "spread_seconds": days * 86400,
+    }
+
+    try:
+        if seed:
+            seeding = f"Seeding {rows:,} agent_logs and {system_rows:,} system_logs rows..."
+            with console.status(seeding):
+                run_sql(database_url, SEED_SQL.format(**params))
+            console.print("[green]✓[/green] Seeded synthetic rows")
+
+        agent_id = run_sql(
+            database_url,
+            f"SELECT id FROM agents WHERE orchestrator_agent_id = '{BENCH_ORCHESTRATOR_ID}' "
+            "ORDER BY name LIMIT 1;",
+        ).strip()
+        if not agent_id:
+            console.print("[red]✗ Error:[/red] No benchmark data found - run without --no-seed")
+            sys.exit(1)
+
+        query_params = {
+            "agent_id": agent_id,
+            "orchestrator_id": BENCH_ORCHESTRATOR_ID,
+            "task": BENCH_TASK,
+            "adw": BENCH_ADW,
+        }
+
+        results = {}
+        report = Table(title=f"Log Query Benchmark ({runs} runs each)", border_style="cyan")
+        report.add_column("Query", style="cyan")
+        report.add_column("Plan")
+        report.add_column("Median ms", justify="right")
+        report.add_column("p95 ms", justify="right")
+
+        for name, sql in QUERIES.items():
+            with console.status(f"Benchmarking {name}..."):
+                result = benchmark_query(database_url, sql.format(**query_params), runs)
+            results[name] = result
+            report.add_row(
+                name, result["plan"], f"{result['median_ms']:.2f}", f"{result['p95_ms']:.2f}"
+            )
+
+        console.print(report)
+
+        if output:
+            summary = {"rows": rows, "system_rows": system_rows, "results": results}
+            output.write_text(json.dumps(summary, indent=2))
+            console.print(f"\n[dim]Results written to {output}[/dim]")
+
+    except RuntimeError as e:
+        console.print(f"[red]✗ Error:[/red] {e}")
+        sys.exit(1)
+
+    finally:
+        if not keep:
+            run_sql(database_url, CLEANUP_SQL.format(**params))
+            console.print("[dim]Removed synthetic rows[/dim]")
+
+
+if __name__ == "__main__":
+    main()
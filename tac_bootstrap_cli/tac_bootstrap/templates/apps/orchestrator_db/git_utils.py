@@ -7,12 +7,13 @@ Provides utilities for:
 - Determining file status (created/modified/deleted)
 - Resolving absolute file paths
 - Counting file lines
+- Collecting status, stats and diffs for many files in one batched pass
 """
 
 import os
 import subprocess
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 
 class GitUtils:
@@ -31,15 +32,7 @@ class GitUtils:
         Returns:
             True if directory is inside a git repository, False otherwise
         """
-        current = Path(working_dir).resolve()
-
-        # Walk up the directory tree looking for .git
-        while current != current.parent:
-            if (current / '.git').exists():
-                return True
-            current = current.parent
-
-        return False
+        return GitUtils.find_repository_root(working_dir) is not None
 
     @staticmethod
     def get_file_diff(file_path: str, working_dir: str) -> Optional[str]:
@@ -192,29 +185,230 @@ class GitUtils:
             # Parse status codes (first 2 characters)
             # XY format: X=index status, Y=worktree status
             status_code = status_line[:2] if len(status_line) >= 2 else '  '
+            return GitUtils.status_from_porcelain(status_code)
 
-            # Untracked files (newly created, not in git yet)
-            if status_code == '??':
-                return 'created'
+        except (subprocess.TimeoutExpired, subprocess.SubprocessError):
+            # Default to modified if we can't determine status
+            return 'modified'
 
-            # Added to index (staged as new) - treat as created
-            if status_code[0] == 'A' or status_code[1] == 'A':
-                return 'created'
+    @staticmethod
+    def status_from_porcelain(status_code: str) -> str:
+        """
+        Map a two-character git status --porcelain code to a file status.
 
-            # Deleted
-            if 'D' in status_code:
-                return 'deleted'
+        Args:
+            status_code: XY code (X=index status, Y=worktree status)
 
-            # Modified (M in either position), Renamed (R), Copied (C), etc.
-            if 'M' in status_code or 'R' in status_code or 'C' in status_code:
-                return 'modified'
+        Returns:
+            'created', 'modified', or 'deleted'
+        """
+        # Untracked files (newly created, not in git yet)
+        if status_code == '??':
+            return 'created'
 
-            # Default to modified for any other tracked file status
-            return 'modified'
+        # Added to index (staged as new) - treat as created
+        if status_code[0] == 'A' or status_code[1] == 'A':
+            return 'created'
 
-        except (subprocess.TimeoutExpired, subprocess.SubprocessError):
-            # Default to modified if we can't determine status
-            return 'modified'
+        # Deleted
+        if 'D' in status_code:
+            return 'deleted'
+
+        # Modified (M in either position), Renamed (R), Copied (C), etc.
+        # Default to modified for any other tracked file status
+        return 'modified'
+
+    @staticmethod
+    def find_repository_root(working_dir: str) -> Optional[str]:
+        """
+        Return the top-level directory of the git repository containing working_dir.
+
+        Args:
+            working_dir: Directory inside the repository
+
+        Returns:
+            Absolute repository root, or None if not inside a git repository
+        """
+        current = Path(working_dir).resolve()
+
+        # Walk up the directory tree looking for .git
+        while current != current.parent:
+            if (current / '.git').exists():
+                return str(current)
+            current = current.parent
+
+        return None
+
+    @staticmethod
+    def get_changes_batch(
+        file_paths: Iterable[str], working_dir: str
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Collect status, line stats and diff for many files in one pass.
+
+        Runs a fixed number of git commands regardless of how many files are
+        requested: one ``git status --porcelain``, one ``git diff --numstat``
+        and one ``git diff`` whose output is split per file. Untracked files
+        get a synthesized "new file" diff read straight from disk.
+
+        Args:
+            file_paths: Relative or absolute paths to the files
+            working_dir: Working directory (inside a git repository)
+
+        Returns:
+            Dict keyed by the original file path with 'absolute_path', 'status',
+            'lines_added', 'lines_removed' and 'diff' (None if unavailable)
+
+        Raises:
+            ValueError: If working_dir is not a git repository
+        """
+        repo_root = GitUtils.find_repository_root(working_dir)
+        if repo_root is None:
+            raise ValueError(f"Directory is not a git repository: {working_dir}")
+
+        results: Dict[str, Dict[str, Any]] = {}
+        repo_paths: Dict[str, str] = {}  # repo-relative path -> original path
+
+        for file_path in file_paths:
+            abs_path = GitUtils.resolve_absolute_path(file_path, working_dir)
+            results[file_path] = {
+                "absolute_path": abs_path,
+                "status": 'modified' if os.path.exists(abs_path) else 'deleted',
+                "lines_added": 0,
+                "lines_removed": 0,
+                "diff": None,
+            }
+
+            # Resolve both paths to handle symlinks (e.g., /var -> /private/var on macOS)
+            rel_path = os.path.relpath(str(Path(abs_path).resolve()), repo_root)
+            if rel_path.startswith('..'):
+                # Outside the repository - git cannot diff it
+                continue
+            repo_paths[Path(rel_path).as_posix()] = file_path
+
+        if not repo_paths:
+            return results
+
+        pathspec = ["--", *repo_paths]
+        git = ["git", "-c", "core.quotePath=false"]
+
+        # Status for every requested path (covers untracked files)
+        untracked: List[str] = []
+        status_out = GitUtils._run_batch(
+            git + ["status", "--porcelain", "-z", "--untracked-files=all"] + pathspec,
+            repo_root,
+        )
+        if status_out is not None:
+            entries = status_out.split('\0')
+            i = 0
+            while i < len(entries):
+                entry = entries[i]
+                i += 1
+                if len(entry) < 4:
+                    continue
+                code, rel_path = entry[:2], entry[3:]
+                if code[0] in 'RC':
+                    i += 1  # Rename/copy source path follows as its own entry
+                original = repo_paths.get(rel_path)
+                if original is None:
+                    continue
+                if os.path.exists(results[original]["absolute_path"]):
+                    results[original]["status"] = GitUtils.status_from_porcelain(code)
+                if code == '??':
+                    untracked.append(rel_path)
+
+        # Line stats and patches against HEAD, in identical file order
+        diff_args = ["diff", "HEAD", "--no-renames", "--no-color", "--no-ext-diff"]
+        numstat_out = GitUtils._run_batch(
+            git + diff_args + ["--numstat", "-z"] + pathspec, repo_root
+        )
+        patch_out = GitUtils._run_batch(git + diff_args + pathspec, repo_root)
+
+        if numstat_out is not None and patch_out is not None:
+            stats = [entry for entry in numstat_out.split('\0') if entry]
+            patches = GitUtils.split_diff(patch_out)
+            for entry, patch in zip(stats, patches):
+                added, removed, rel_path = entry.split('\t', 2)
+                original = repo_paths.get(rel_path)
+                if original is None:
+                    continue
+                results[original].update(
+                    # Binary files report '-' for both counts
+                    lines_added=int(added) if added.isdigit() else 0,
+                    lines_removed=int(removed) if removed.isdigit() else 0,
+                    diff=patch,
+                )
+
+        for rel_path in untracked:
+            original = repo_paths[rel_path]
+            diff = GitUtils._new_file_diff(rel_path, results[original]["absolute_path"])
+            if diff is not None:
+                results[original].update(
+                    lines_added=GitUtils.parse_diff_stats(diff)[0],
+                    diff=diff,
+                )
+
+        return results
+
+    @staticmethod
+    def split_diff(diff: str) -> List[str]:
+        """
+        Split multi-file unified diff output into one chunk per file.
+
+        Args:
+            diff: Output of a single ``git diff`` covering several files
+
+        Returns:
+            Per-file diff strings in the order git emitted them
+        """
+        chunks: List[str] = []
+        current: List[str] = []
+
+        for line in diff.splitlines(keepends=True):
+            if line.startswith('diff --git ') and current:
+                chunks.append(''.join(current))
+                current = []
+            current.append(line)
+
+        if current:
+            chunks.append(''.join(current))
+
+        return chunks
+
+    @staticmethod
+    def _run_batch(args: List[str], cwd: str) -> Optional[str]:
+        """Run a batched git command, returning stdout or None on failure."""
+        try:
+            result = subprocess.run(args, cwd=cwd, capture_output=True, text=True, timeout=30)
+        except (subprocess.TimeoutExpired, subprocess.SubprocessError, FileNotFoundError):
+            return None
+
+        return result.stdout if result.returncode == 0 else None
+
+    @staticmethod
+    def _new_file_diff(rel_path: str, abs_path: str) -> Optional[str]:
+        """Build the unified diff git would show for an untracked file."""
+        try:
+            with open(abs_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+        except (OSError, UnicodeDecodeError):
+            return None
+
+        header = (
+            f"diff --git a/{rel_path} b/{rel_path}\n"
+            "new file mode 100644\n"
+            "--- /dev/null\n"
+            f"+++ b/{rel_path}\n"
+        )
+        lines = content.splitlines()
+        if not lines:
+            return header
+
+        body = ''.join(f"+{line}\n" for line in lines)
+        if not content.endswith('\n'):
+            body += "\\ No newline at end of file\n"
+
+        return f"{header}@@ -0,0 +1,{len(lines)} @@\n{body}"
 
     @staticmethod
     def resolve_absolute_path(file_path: str, working_dir: str) -> str:
@@ -11,9 +11,11 @@ from types import SimpleNamespace
 import pytest
 
 from tac_bootstrap.domain.entity_config import (
+    ACTIVE_ROWS,
     EntitySpec,
     FieldSpec,
     FieldType,
+    IndexSpec,
 )
 from tac_bootstrap.domain.models import (
     ClaudeConfig,
@@ -237,15 +239,89 @@ def test_repository_authorized_search_has_org_filter(
         {"entity": entity, "config": tac_config},
     )
 
-    # Should have search method with organization_id
-    assert "def search(self, query: str, skip: int, limit: int, organization_id: str)" in output
+    # Should have search method with organization_id and a keyset cursor
+    assert (
+        "def search(\n        self,\n        query: str,\n        organization_id: str," in output
+    )
+    assert "cursor: Optional[str] = None," in output
+    assert "-> SearchPage[ProductModel]:" in output
 
-    # Should filter by organization_id
+    # Should filter by organization_id inside the ranked index query
     assert "ProductModel.organization_id == organization_id" in output
+    assert "return ranked_search(" in output
+    assert "from .orm_model import ProductModel, SEARCH_INDEX" in output
+
+    # No unindexable substring scans
+    assert "ilike" not in output
 
     compile(output, "<string>", "exec")
 
 
+def test_repository_authorized_search_uses_searchable_fields(
+    template_repo: TemplateRepository, tac_config: TACConfig
+):
+    """Test that only fields flagged searchable are indexed when any are flagged."""
+    entity = EntitySpec(
+        name="Article",
+        capability="blog",
+        authorized=True,
+        fields=[
+            FieldSpec(name="title", field_type=FieldType.STRING, searchable=True),
+            FieldSpec(name="slug", field_type=FieldType.STRING),
+            FieldSpec(name="body", field_type=FieldType.TEXT, searchable=True),
+        ],
+    )
+    context = {"entity": entity, "config": tac_config}
+
+    model = template_repo.render("capabilities/crud_authorized/orm_model.py.j2", context)
+    assert 'SEARCH_INDEX = SearchIndex(\n    "articles",\n    ("title", "body"),\n)' in model
+    assert "SEARCH_INDEX.attach(ArticleModel.__table__)" in model
+    assert "from test_app.shared.infrastructure.search import SearchIndex" in model
+    compile(model, "<string>", "exec")
+
+    migration = template_repo.render(
+        "capabilities/crud_authorized/search_migration.py.j2", context
+    )
+    assert 'revision = "articles_search_index"' in migration
+    assert '("title", "body"),' in migration
+    assert "SEARCH_INDEX.create_statements(op.get_bind().dialect.name)" in migration
+    assert "SEARCH_INDEX.drop_statements(op.get_bind().dialect.name)" in migration
+    assert "down_revision = None" in migration
+    compile(migration, "<string>", "exec")
+
+    # Several current heads are merged by the search migration
+    merged = template_repo.render(
+        "capabilities/crud_authorized/search_migration.py.j2",
+        {**context, "down_revisions": ["b", "c"]},
+    )
+    assert 'down_revision = ("b", "c")' in merged
+    compile(merged, "<string>", "exec")
+
+
+def test_authorized_templates_without_text_fields_have_no_search(
+    template_repo: TemplateRepository, tac_config: TACConfig
+):
+    """Test that entities without text fields get no search index or endpoint."""
+    entity = EntitySpec(
+        name="Reading",
+        capability="metrics",
+        authorized=True,
+        fields=[FieldSpec(name="value", field_type=FieldType.FLOAT)],
+    )
+    context = {"entity": entity, "config": tac_config}
+
+    for template in (
+        "repository_authorized.py.j2",
+        "service_authorized.py.j2",
+        "routes_authorized.py.j2",
+        "orm_model.py.j2",
+        "schemas.py.j2",
+    ):
+        output = template_repo.render(f"capabilities/crud_authorized/{template}", context)
+        assert "search" not in output.lower(), template
+        compile(output, "<string>", "exec")
+
+
 # ============================================================================
 # TEST SERVICE_AUTHORIZED.PY.J2
 # ============================================================================
@@ -453,10 +529,13 @@ def test_routes_authorized_all_endpoints_have_current_user(
     assert "async def update_product(" in output
     assert "async def delete_product(" in output
 
-    # Count current_user dependency injections (should be 5 endpoints)
+    # Search endpoint exists because the entity has text fields
+    assert "async def search_products(" in output
+
+    # Count current_user dependency injections (should be 6 endpoints)
     current_user_count = output.count("current_user: CurrentUser = Depends(get_current_user)")
-    assert current_user_count == 5, (
-        f"Expected 5 endpoints with current_user, found {current_user_count}"
+    assert current_user_count == 6, (
+        f"Expected 6 endpoints with current_user, found {current_user_count}"
     )
 
     compile(output, "<string>", "exec")
@@ -501,6 +580,31 @@ def test_routes_authorized_endpoints_pass_organization_id(
     compile(output, "<string>", "exec")
 
 
+def test_routes_authorized_search_endpoint(
+    template_repo: TemplateRepository, entity_spec: EntitySpec, tac_config: TACConfig
+):
+    """Test that search is org-scoped, cursor-paged and declared before /{id}."""
+    output = template_repo.render(
+        "capabilities/crud_authorized/routes_authorized.py.j2",
+        {"entity": entity_spec, "config": tac_config},
+    )
+
+    assert output.index('    "/search",') < output.index('    "/{id}",')
+    assert "response_model=ProductSearchResponse" in output
+    assert "q, current_user.organization_id, limit=limit, cursor=cursor" in output
+    assert "next_cursor=page.next_cursor" in output
+    assert "status.HTTP_400_BAD_REQUEST" in output
+
+    schemas = template_repo.render(
+        "capabilities/crud_authorized/schemas.py.j2",
+        {"entity": entity_spec, "config": tac_config},
+    )
+    assert "class ProductSearchResponse(BaseModel):" in schemas
+    assert "next_cursor: str | None" in schemas
+
+    compile(output, "<string>", "exec")
+
+
 def test_routes_authorized_returns_404_not_403(
     template_repo: TemplateRepository, entity_spec: EntitySpec, tac_config: TACConfig
 ):
@@ -741,11 +845,13 @@ def test_orm_model_authorized_has_required_org_id(
         {"entity": entity_spec, "config": tac_config},
     )
 
-    # organization_id should be nullable=False (required) and indexed
-    assert "organization_id = Column(String(100), nullable=False, index=True)" in output
+    # organization_id should be nullable=False (required); the composite indexes
+    # in __table_args__ lead with it, so no single-column index is declared
+    assert "organization_id = Column(String(100), nullable=False)" in output
+    assert "Index('ix_products_org_created_at', 'organization_id'" in output
 
     # Should have comment about multi-tenancy
-    assert "REQUIRED for authorized entities" in output or "Required and indexed" in output
+    assert "REQUIRED for authorized entities" in output
 
     compile(output, "<string>", "exec")
 
@@ -777,13 +883,62 @@ def test_orm_model_authorized_has_org_indexes(
         {"entity": entity_spec, "config": tac_config},
     )
 
-    # Should have organization_id index
-    assert "ix_products_organization_id" in output
-
-    # Should have composite index for org + state
-    assert "ix_products_org_state" in output
+    # Tenant list index: org + sort key, partial over active rows (state != 2)
+    assert (
+        "Index('ix_products_org_created_at', 'organization_id', 'created_at', 'id', "
+        'postgresql_where=text("state != 2"), sqlite_where=text("state != 2")),'
+    ) in output
 
     # Should have composite indexes for org + indexed fields
-    assert "ix_products_org_sku" in output  # sku is indexed in entity_spec
+    assert "Index('ix_products_org_sku', 'organization_id', 'sku')," in output
+
+    # No standalone indexes that the tenant-prefixed ones already cover
+    assert "Index('ix_products_sku'" not in output
+    assert "index=True" not in output
+
+    compile(output, "<string>", "exec")
+
+
+def test_orm_model_authorized_unique_and_declared_indexes(
+    template_repo: TemplateRepository, tac_config: TACConfig
+):
+    """Test unique fields are unique per tenant and declared indexes lead with the tenant."""
+    entity = EntitySpec(
+        name="Product",
+        capability="catalog",
+        authorized=True,
+        fields=[
+            FieldSpec(name="sku", field_type=FieldType.STRING, unique=True, indexed=True),
+            FieldSpec(name="status", field_type=FieldType.STRING),
+        ],
+        indexes=[IndexSpec(columns=["status", "created_at"], where=ACTIVE_ROWS)],
+    )
+
+    output = template_repo.render(
+        "capabilities/crud_authorized/orm_model.py.j2",
+        {"entity": entity, "config": tac_config},
+    )
+
+    assert "Index('uq_products_org_sku', 'organization_id', 'sku', unique=True)," in output
+    assert "ix_products_org_sku" not in output  # the unique index serves get_by_sku
+    assert (
+        "Index('ix_products_org_status_created_at', 'organization_id', 'status', 'created_at', "
+        'postgresql_where=text("state != 2"), sqlite_where=text("state != 2")),'
+    ) in output
+
+    compile(output, "<string>", "exec")
+
+
+def test_repository_authorized_get_all_matches_tenant_index(
+    template_repo: TemplateRepository, entity_spec: EntitySpec, tac_config: TACConfig
+):
+    """Test get_all filters and sorts exactly as ix_<table>_org_created_at is built."""
+    output = template_repo.render(
+        "capabilities/crud_authorized/repository_authorized.py.j2",
+        {"entity": entity_spec, "config": tac_config},
+    )
+
+    assert "ProductModel.state != 2" in output
+    assert "ProductModel.created_at.desc(), ProductModel.id.desc()" in output
 
     compile(output, "<string>", "exec")
@@ -0,0 +1,221 @@
+"""
+Tests for BackupStore
+
+Covers incremental snapshots (hardlinks to the previous snapshot, reflink and copy
+fallbacks), the manifest, verification and restore, including snapshots written
+before manifests existed.
+"""
+
+import errno
+import json
+import os
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+from tac_bootstrap.infrastructure.backup_store import BackupStore
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="uses hardlinks and symlinks")
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    """Project with an agentic layer, a nested logs tree, a symlink and config.yml."""
+    (tmp_path / "adws" / "logs").mkdir(parents=True)
+    (tmp_path / "adws" / "workflow.py").write_text("print('v1')\n")
+    (tmp_path / "adws" / "logs" / "run.log").write_text("x" * 4096)
+    (tmp_path / "adws" / "empty").mkdir()
+    os.symlink("workflow.py", tmp_path / "adws" / "current.py")
+    (tmp_path / "config.yml").write_text("version: 0.1.0\n")
+    return tmp_path
+
+
+@pytest.fixture
+def store(project: Path) -> BackupStore:
+    """Store with reflinks disabled so results do not depend on the filesystem."""
+    store = BackupStore(project)
+    store._reflink_supported = False
+    return store
+
+
+NAMES = ["adws", ".claude", "config.yml"]
+
+
+# ============================================================================
+# TEST SNAPSHOTS
+# ============================================================================
+
+
+class TestCreate:
+    """Test full and incremental snapshots."""
+
+    def test_first_snapshot_copies_everything(self, project: Path, store: BackupStore):
+        result = store.create(NAMES)
+
+        assert result.path.name.startswith(".tac-backup-")
+        assert (result.files, result.copied, result.linked) == (3, 3, 0)
+        assert result.bytes_copied == len("print('v1')\n") + 4096 + len("version: 0.1.0\n")
+        assert (result.path / "adws" / "empty").is_dir()
+        assert os.readlink(result.path / "adws" / "current.py") == "workflow.py"
+
+        manifest = store.read_manifest(result.path)
+        assert manifest["roots"] == ["adws", "config.yml"]  # .claude does not exist
+        assert manifest["entries"]["adws/logs/run.log"]["size"] == 4096
+        assert manifest["entries"]["adws/current.py"] == {
+            "type": "symlink",
+            "target": "workflow.py",
+        }
+
+    def test_unchanged_files_are_hardlinked_to_previous(
+        self, project: Path, store: BackupStore
+    ):
+        first = store.create(NAMES)
+        (project / "adws" / "workflow.py").write_text("print('v2, longer')\n")
+
+        second = store.create(NAMES)
+
+        assert second.previous == first.path
+        assert (second.copied, second.linked) == (1, 2)
+        assert second.path != first.path
+        log = second.path / "adws" / "logs" / "run.log"
+        assert log.stat().st_ino == (first.path / "adws" / "logs" / "run.log").stat().st_ino
+        assert (second.path / "adws" / "workflow.py").read_text() == "print('v2, longer')\n"
+        assert (first.path / "adws" / "workflow.py").read_text() == "print('v1')\n"
+
+    def test_snapshot_never_links_to_project_files(self, project: Path, store: BackupStore):
+        result = store.create(NAMES)
+
+        project_ino = (project / "adws" / "workflow.py").stat().st_ino
+        assert (result.path / "adws" / "workflow.py").stat().st_ino != project_ino
+
+    def test_snapshot_without_manifest_is_not_a_link_source(
+        self, project: Path, store: BackupStore
+    ):
+        first = store.create(NAMES)
+        (first.path / "manifest.json").unlink()
+
+        second = store.create(NAMES)
+
+        assert second.previous is None
+        assert second.linked == 0
+
+    def test_unsupported_hardlinks_fall_back_to_copy(
+        self, project: Path, store: BackupStore, monkeypatch: pytest.MonkeyPatch
+    ):
+        store.create(NAMES)
+
+        def no_link(src, dst):
+            raise OSError(errno.EXDEV, "cross-device link")
+
+        monkeypatch.setattr(os, "link", no_link)
+        second = store.create(NAMES)
+
+        assert (second.copied, second.linked) == (3, 0)
+        assert store._hardlink_supported is False
+
+    def test_reflinks_are_used_when_supported(
+        self, project: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        store = BackupStore(project)
+
+        def fake_reflink(source: Path, target: Path) -> bool:
+            shutil.copyfile(source, target)
+            return True
+
+        monkeypatch.setattr(store, "_reflink", fake_reflink)
+        result = store.create(NAMES)
+
+        assert (result.reflinked, result.copied, result.bytes_copied) == (3, 0, 0)
+        assert store.verify(result.path, deep=True) == []
+
+    def test_reflink_probe_disables_itself_when_unsupported(self, project: Path):
+        store = BackupStore(project)
+        target = project / "clone.txt"
+
+        cloned = store._reflink(project / "config.yml", target)
+
+        # Whatever the filesystem supports, a failed clone leaves nothing behind
+        assert cloned or not target.exists()
+        assert cloned or store._reflink_supported is False
+
+
+# ============================================================================
+# TEST VERIFY AND RESTORE
+# ============================================================================
+
+
+class TestVerifyAndRestore:
+    """Test manifest verification and restoring snapshots."""
+
+    def test_verify_detects_damage(self, project: Path, store: BackupStore):
+        result = store.create(NAMES)
+        assert store.verify(result.path, deep=True) == []
+
+        (result.path / "adws" / "workflow.py").write_text("print('v9')\n")  # same size
+        (result.path / "adws" / "logs" / "run.log").write_text("short")
+        (result.path / "config.yml").unlink()
+
+        assert store.verify(result.path) == [
+            "adws/logs/run.log: size 5 != 4096",
+            "config.yml: file missing",
+        ]
+        assert "adws/workflow.py: content changed" in store.verify(result.path, deep=True)
+
+    def test_verify_without_manifest(self, tmp_path: Path, store: BackupStore):
+        legacy = tmp_path / ".tac-backup-20240101_000000"
+        legacy.mkdir()
+
+        assert store.verify(legacy) == [f"{legacy.name}: missing or unreadable manifest.json"]
+
+    def test_restore_replaces_selected_roots(self, project: Path, store: BackupStore):
+        original_mtime = (project / "adws" / "workflow.py").stat().st_mtime_ns
+        result = store.create(NAMES)
+        shutil.rmtree(project / "adws")
+        (project / "adws").mkdir()
+        (project / "adws" / "generated.py").write_text("new")
+        (project / "config.yml").write_text("version: 9.9.9\n")
+
+        restored = store.restore(result.path, ["adws"])
+
+        assert restored == 2
+        assert not (project / "adws" / "generated.py").exists()
+        assert (project / "adws" / "empty").is_dir()
+        assert os.readlink(project / "adws" / "current.py") == "workflow.py"
+        assert (project / "adws" / "workflow.py").stat().st_mtime_ns == original_mtime
+        assert (project / "config.yml").read_text() == "version: 9.9.9\n"
+
+    def test_restored_files_are_independent_of_snapshot(
+        self, project: Path, store: BackupStore
+    ):
+        store.create(NAMES)
+        result = store.create(NAMES)  # files hardlinked to the first snapshot
+
+        store.restore(result.path)
+        (project / "adws" / "logs" / "run.log").write_text("edited")
+
+        assert store.verify(result.path, deep=True) == []
+
+    def test_restore_legacy_snapshot(self, project: Path, store: BackupStore):
+        legacy = project / ".tac-backup-20240101_000000"
+        shutil.copytree(project / "adws", legacy / "adws", symlinks=True)
+        (project / "adws" / "workflow.py").write_text("changed")
+
+        restored = store.restore(legacy, ["adws"])
+
+        assert restored == 2
+        assert (project / "adws" / "workflow.py").read_text() == "print('v1')\n"
+
+    def test_manifest_is_json_with_hashes(self, project: Path, store: BackupStore):
+        result = store.create(["config.yml"])
+
+        manifest = json.loads((result.path / "manifest.json").read_text())
+        entry = manifest["entries"]["config.yml"]
+        assert entry["type"] == "file"
+        assert len(entry["sha256"]) == 64
@@ -6,6 +6,8 @@ Comprehensive unit tests for validating that the 10 templates in
 These tests act as documentation and regression prevention for template changes.
 """
 
+from typing import Any, Dict
+
 import pytest
 
 from tac_bootstrap.application.scaffold_service import ScaffoldService
@@ -14,6 +16,8 @@ from tac_bootstrap.domain.models import (
     ClaudeConfig,
     ClaudeSettings,
     CommandsSpec,
+    DatabaseConfig,
+    DatabaseProfile,
     Framework,
     Language,
     PackageManager,
@@ -94,6 +98,20 @@ def repo() -> TemplateRepository:
     return TemplateRepository()
 
 
+@pytest.fixture
+def orm_base() -> Any:
+    """Fresh SQLAlchemy declarative base for models defined inside a test."""
+    orm = pytest.importorskip("sqlalchemy.orm")
+    return orm.declarative_base()
+
+
+def exec_module(source: str) -> Dict[str, Any]:
+    """Execute rendered template source and return its module namespace."""
+    namespace: Dict[str, Any] = {}
+    exec(compile(source, "<string>", "exec"), namespace)
+    return namespace
+
+
 # ============================================================================
 # TEST BASE_ENTITY.PY.J2
 # ============================================================================
@@ -269,19 +287,263 @@ class TestDatabaseTemplate:
 
     def test_database_renders_sync(self, repo: TemplateRepository, ddd_config: TACConfig):
         """Template should render synchronous database configuration."""
-        # Note: database.py.j2 template references config.database.pool_size
-        # which doesn't exist in TACConfig, but uses default() filter
-        # We skip this test for now as it requires template fixes
-        pytest.skip("Template requires config.database attribute not in TACConfig model")
+        result = repo.render("shared/database.py.j2", ddd_config)
+
+        assert "engine = create_engine(" in result
+        assert "SessionLocal = sessionmaker(" in result
+        assert 'os.getenv("DATABASE_PROFILE") or "dev"' in result
+        assert "instrument_engine(engine)" in result
+        compile(result, "<string>", "exec")
 
     def test_database_renders_async(
         self, repo: TemplateRepository, async_config: TACConfig
     ):
         """Template should render asynchronous database configuration."""
-        # Note: database.py.j2 template references config.database attributes
-        # which don't exist in TACConfig model
-        # We skip this test for now as it requires template fixes
-        pytest.skip("Template requires config.database attribute not in TACConfig model")
+        result = repo.render("shared/database.py.j2", async_config)
+
+        assert "engine = create_async_engine(" in result
+        assert "async_sessionmaker(" in result
+        assert 'event.listen(engine.sync_engine, "connect", _apply_sqlite_pragmas)' in result
+        compile(result, "<string>", "exec")
+
+    def test_database_profiles_from_config(
+        self, repo: TemplateRepository, ddd_config: TACConfig
+    ):
+        """Profile and pool sizing should come from the database config section."""
+        ddd_config.database = DatabaseConfig(
+            profile=DatabaseProfile.PROD, pool_size=25, slow_query_ms=50
+        )
+        result = repo.render("shared/database.py.j2", ddd_config)
+
+        assert 'os.getenv("DATABASE_PROFILE") or "prod"' in result
+        assert '"pool_size": 25,' in result
+        assert '"pool_pre_ping": True,' in result
+        assert '"serverless": {"poolclass": NullPool},' in result
+        assert '"journal_mode": "WAL",' in result
+        assert "SLOW_QUERY_MS = 50" in result
+
+
+# ============================================================================
+# TEST SERIALIZATION.PY.J2
+# ============================================================================
+
+
+class TestSerializationTemplate:
+    """Tests for shared/serialization.py.j2 template."""
+
+    def test_serialization_renders(self, repo: TemplateRepository, ddd_config: TACConfig):
+        """Template should render the batch validator and response class."""
+        result = repo.render("shared/serialization.py.j2", ddd_config)
+
+        assert "def validate_many(" in result
+        assert "class FastJSONResponse(JSONResponse):" in result
+        assert "except ImportError:" in result
+        compile(result, "<string>", "exec")
+
+    def test_validate_many_and_dump_json(
+        self, repo: TemplateRepository, ddd_config: TACConfig
+    ):
+        """Batch validation should read attributes; both encoders should agree."""
+        pytest.importorskip("fastapi")
+        import json
+        from datetime import datetime, timezone
+        from decimal import Decimal
+
+        from pydantic import BaseModel
+
+        result = repo.render("shared/serialization.py.j2", ddd_config)
+        namespace = exec_module(result)
+
+        class ItemResponse(BaseModel):
+            id: str
+            price: Decimal
+            created_at: datetime
+
+        class Row:
+            def __init__(self, index: int):
+                self.id = f"item-{index}"
+                self.price = Decimal("9.50")
+                self.created_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+        items = namespace["validate_many"](ItemResponse, (Row(i) for i in range(3)))
+        assert [item.id for item in items] == ["item-0", "item-1", "item-2"]
+        assert namespace["list_adapter"](ItemResponse) is namespace["list_adapter"](ItemResponse)
+
+        expected = {"id": "item-0", "price": "9.50", "created_at": "2024-01-01T00:00:00Z"}
+        assert json.loads(namespace["dump_json"]({"items": items}))["items"][0] == expected
+        namespace["orjson"] = None
+        assert json.loads(namespace["dump_json"]({"items": items}))["items"][0] == expected
+
+        response = namespace["FastJSONResponse"](items[:1], status_code=201)
+        assert response.status_code == 201
+        assert json.loads(response.body) == [expected]
+
+    def test_base_service_uses_batch_validation(
+        self, repo: TemplateRepository, ddd_config: TACConfig
+    ):
+        """BaseService should build DTOs from response_schema via validate_many."""
+        result = repo.render("shared/base_service.py.j2", ddd_config)
+
+        assert "TResponse.model_validate" not in result
+        assert "return validate_many(self.response_schema, items)" in result
+        assert "response_schema: type[BaseModel] | None = None" in result
+
+
+# ============================================================================
+# TEST DB_METRICS.PY.J2
+# ============================================================================
+
+
+class TestDbMetricsTemplate:
+    """Tests for shared/db_metrics.py.j2 template."""
+
+    def test_db_metrics_renders(self, repo: TemplateRepository, ddd_config: TACConfig):
+        """Template should render the metrics collector and engine listeners."""
+        result = repo.render("shared/db_metrics.py.j2", ddd_config)
+
+        assert "class QueryMetrics:" in result
+        assert "def instrument_engine(" in result
+        assert "class QueryMetricsMiddleware:" in result
+        compile(result, "<string>", "exec")
+
+    def test_db_metrics_records_statements(
+        self, repo: TemplateRepository, ddd_config: TACConfig
+    ):
+        """Listeners should time statements, log slow ones and flag N+1 repeats."""
+        pytest.importorskip("sqlalchemy")
+        from sqlalchemy import create_engine, text
+
+        result = repo.render("shared/db_metrics.py.j2", ddd_config)
+        namespace = exec_module(result)
+
+        metrics = namespace["QueryMetrics"](slow_query_ms=0.0001, n_plus_one_threshold=3)
+        engine = create_engine("sqlite://")
+        namespace["instrument_engine"](engine, metrics)
+        namespace["instrument_engine"](engine, metrics)  # idempotent
+
+        with namespace["track_queries"]("GET /items", metrics) as queries:
+            with engine.connect() as connection:
+                for value in range(3):
+                    connection.execute(text("SELECT :value"), {"value": value})
+                connection.exec_driver_sql("SELECT 1 WHERE 1 IN (?, ?, ?)", (1, 2, 3))
+
+        snapshot = metrics.snapshot(engine.pool)
+        assert queries.total == 4
+        assert snapshot["statements"]["count"] == 4
+        assert snapshot["statements"]["buckets"]["+Inf"] == 4
+        assert snapshot["slow_queries"]["recent"]
+        assert snapshot["pool"]["checkout_wait"]["count"] == 1
+        assert snapshot["pool"]["class"] == "SingletonThreadPool"
+        assert "SELECT 1 WHERE 1 IN (...)" in [s["statement"] for s in snapshot["by_statement"]]
+        assert snapshot["n_plus_one"]["detected"] == 1
+        report = snapshot["n_plus_one"]["recent"][0]
+        assert (report["request"], report["statement"], report["count"]) == (
+            "GET /items", "SELECT ?", 3
+        )
+
+
+# ============================================================================
+# TEST SEARCH.PY.J2
+# ============================================================================
+
+
+class TestSearchTemplate:
+    """Tests for shared/search.py.j2 template."""
+
+    def test_search_renders(self, repo: TemplateRepository, ddd_config: TACConfig):
+        """Template should render the index description and ranked search."""
+        result = repo.render("shared/search.py.j2", ddd_config)
+
+        assert "class SearchIndex:" in result
+        assert "def ranked_search(" in result
+        assert "USING gin (search_vector)" in result
+        assert "USING fts5(" in result
+        compile(result, "<string>", "exec")
+
+    def test_postgres_ddl(self, repo: TemplateRepository, ddd_config: TACConfig):
+        """PostgreSQL gets a generated tsvector column with GIN and trigram indexes."""
+        pytest.importorskip("sqlalchemy")
+        result = repo.render("shared/search.py.j2", ddd_config)
+        namespace = exec_module(result)
+
+        index = namespace["SearchIndex"]("products", ("name", "description"))
+        statements = index.create_statements("postgresql")
+        document = "coalesce(name, '') || ' ' || coalesce(description, '')"
+        assert statements[0] == "CREATE EXTENSION IF NOT EXISTS pg_trgm"
+        assert f"GENERATED ALWAYS AS (to_tsvector('simple'::regconfig, {document})) STORED" in (
+            statements[1]
+        )
+        assert statements[3].endswith(f"USING gin (({document}) gin_trgm_ops)")
+        assert index.create_statements("mysql") == []
+
+    def test_sqlite_ranked_search_with_keyset_pages(
+        self, repo: TemplateRepository, ddd_config: TACConfig, orm_base: Any
+    ):
+        """FTS5 triggers keep the index in sync; cursors page without gaps or repeats."""
+        from sqlalchemy import Column, String, Text, create_engine
+        from sqlalchemy.orm import Session
+
+        result = repo.render("shared/search.py.j2", ddd_config)
+        namespace = exec_module(result)
+
+        class ItemModel(orm_base):
+            __tablename__ = "items"
+            id = Column(String(36), primary_key=True)
+            organization_id = Column(String(100), nullable=False)
+            name = Column(String(255), nullable=False)
+            description = Column(Text, nullable=True)
+
+        index = namespace["SearchIndex"]("items", ("name", "description"))
+        index.attach(ItemModel.__table__)
+        ranked_search = namespace["ranked_search"]
+
+        engine = create_engine("sqlite://")
+        orm_base.metadata.create_all(engine)
+        with Session(engine) as session:
+            for i in range(12):
+                session.add(
+                    ItemModel(
+                        id=f"item-{i:02d}",
+                        organization_id="org-a" if i % 2 == 0 else "org-b",
+                        name=f"red chair {i}",
+                        description="red red red" if i == 6 else None,
+                    )
+                )
+            session.add(ItemModel(id="item-99", organization_id="org-a", name='Crème "brûlée"'))
+            session.commit()
+
+            tenant = ItemModel.organization_id == "org-a"
+            seen, cursor = [], None
+            while True:
+                page = ranked_search(
+                    session, ItemModel, index, "red", tenant, limit=2, cursor=cursor
+                )
+                seen.extend(item.id for item in page.items)
+                cursor = page.next_cursor
+                if cursor is None:
+                    break
+            assert seen[0] == "item-06"  # most occurrences ranks first
+            assert sorted(seen) == [f"item-{i:02d}" for i in range(0, 12, 2)]
+
+            # Diacritics folded, quotes in user input are not FTS5 syntax
+            page = ranked_search(session, ItemModel, index, 'creme "brulee', tenant)
+            assert [item.id for item in page.items] == ["item-99"]
+
+            item = session.get(ItemModel, "item-00")
+            item.name = "blue sofa"
+            session.commit()
+            assert [i.id for i in ranked_search(session, ItemModel, index, "sofa").items] == [
+                "item-00"
+            ]
+            session.delete(item)
+            session.commit()
+            assert ranked_search(session, ItemModel, index, "sofa").items == []
+            assert ranked_search(session, ItemModel, index, "   ").items == []
+
+            with pytest.raises(ValueError, match="Invalid search cursor"):
+                ranked_search(session, ItemModel, index, "red", cursor="not-a-cursor")
+
+        orm_base.metadata.drop_all(engine)
 
 
 # ============================================================================
@@ -335,6 +597,275 @@ class TestResponsesTemplate:
         compile(result, "<string>", "exec")
 
 
+# ============================================================================
+# TEST PAGINATION.PY.J2
+# ============================================================================
+
+
+class TestPaginationTemplate:
+    """Tests for shared/pagination.py.j2 template."""
+
+    def test_pagination_renders(self, repo: TemplateRepository, ddd_config: TACConfig):
+        """Template should render cursor helpers and keyset conditions."""
+        result = repo.render("shared/pagination.py.j2", ddd_config)
+
+        assert "def encode_cursor(" in result
+        assert "def decode_cursor(" in result
+        assert "def seek_condition(" in result
+        assert "def page_cursors(" in result
+        assert "tuple_(sort_column, id_column)" in result
+
+        # Verify it's valid Python
+        compile(result, "<string>", "exec")
+
+    def test_cursor_round_trip(self, repo: TemplateRepository, ddd_config: TACConfig):
+        """Cursors should decode back to the same typed keyset position."""
+        pytest.importorskip("sqlalchemy")
+        from datetime import datetime
+
+        namespace = exec_module(repo.render("shared/pagination.py.j2", ddd_config))
+
+        created = datetime(2024, 5, 1, 12, 30)
+        cursor = namespace["encode_cursor"]("next", "created_at", "DESC", created, "abc")
+        position = namespace["decode_cursor"](cursor)
+
+        assert "=" not in cursor
+        assert position.sort_value == created
+        assert (position.direction, position.sort_order, position.id) == ("next", "desc", "abc")
+
+        with pytest.raises(ValueError):
+            namespace["decode_cursor"]("not-a-cursor")
+        with pytest.raises(ValueError):
+            namespace["check_cursor"](position, "price", "desc")
+
+    def test_repositories_expose_cursor_pagination(
+        self, repo: TemplateRepository, ddd_config: TACConfig, async_config: TACConfig
+    ):
+        """Both repositories and the service should support cursor pagination."""
+        sync_result = repo.render("shared/base_repository.py.j2", ddd_config)
+        async_result = repo.render("shared/base_repository_async.py.j2", async_config)
+        service_result = repo.render("shared/base_service.py.j2", ddd_config)
+
+        assert "def get_all_by_cursor(" in sync_result
+        assert "async def get_all_by_cursor(" in async_result
+        assert "limit(page_size + 1)" in sync_result
+        assert "cursor: str | None = None" in service_result
+        assert "next_cursor: str | None = None" in service_result
+
+
+# ============================================================================
+# TEST COUNTING.PY.J2
+# ============================================================================
+
+
+class TestCountingTemplate:
+    """Tests for shared/counting.py.j2 template."""
+
+    def test_counting_renders(self, repo: TemplateRepository, ddd_config: TACConfig):
+        """Template should render count modes, the TTL cache and EXPLAIN helpers."""
+        result = repo.render("shared/counting.py.j2", ddd_config)
+
+        assert "class CountMode(str, Enum):" in result
+        assert "class CountCache:" in result
+        assert "def plan_rows(" in result
+
+        namespace = exec_module(result)
+
+        cache = namespace["CountCache"]()
+        key = cache.key("products", {"category": "books"})
+        cache.set(key, 42, ttl=60)
+        assert cache.get(key) == 42
+        cache.invalidate("products")
+        assert cache.get(key) is None
+
+        cache.set(key, 7, ttl=-1)
+        assert cache.get(key) is None
+
+        explain = '[{"Plan": {"Node Type": "Seq Scan", "Plan Rows": 1250}}]'
+        assert namespace["plan_rows"](explain) == 1250
+
+    def test_service_exposes_count_mode(
+        self, repo: TemplateRepository, ddd_config: TACConfig
+    ):
+        """BaseService should pass count_mode through and report has_more."""
+        service_result = repo.render("shared/base_service.py.j2", ddd_config)
+        repository_result = repo.render("shared/base_repository.py.j2", ddd_config)
+
+        assert "count_mode=count_mode" in service_result
+        assert "has_more: bool | None = None" in service_result
+        assert "def get_page(" in repository_result
+        assert "count_cache.invalidate(" in repository_result
+
+
+class TestBulkTemplate:
+    """Tests for shared/bulk.py.j2 template."""
+
+    def test_bulk_renders(self, repo: TemplateRepository, ddd_config: TACConfig):
+        """Template should render chunking and statement builders."""
+        result = repo.render("shared/bulk.py.j2", ddd_config)
+
+        assert "MAX_BIND_PARAMS = " in result
+        assert "def upsert_statement(" in result
+        assert "def update_statement(" in result
+        compile(result, "<string>", "exec")
+
+    def test_bulk_helpers(
+        self, repo: TemplateRepository, ddd_config: TACConfig, orm_base: Any
+    ):
+        """Chunks should respect the bind limit and upserts should be dialect-aware."""
+        from sqlalchemy import Column, Integer, String
+
+        result = repo.render("shared/bulk.py.j2", ddd_config)
+        namespace = exec_module(result)
+
+        class Item(orm_base):
+            __tablename__ = "items"
+            id = Column(String, primary_key=True)
+            code = Column(String, unique=True)
+            state = Column(Integer, default=1)
+            version = Column(Integer, default=1)
+
+        rows = namespace["model_rows"](Item, [{"id": "1", "code": "A"}, Item(id="2", code="B")])
+        assert rows == [
+            {"id": "1", "code": "A", "state": 1, "version": 1},
+            {"id": "2", "code": "B", "state": 1, "version": 1},
+        ]
+
+        many = [{"id": str(i), "code": str(i)} for i in range(20000)]
+        chunks = list(namespace["chunked"](many, 100000))
+        assert all(len(chunk) * 2 <= namespace["MAX_BIND_PARAMS"] for chunk in chunks)
+        assert sum(len(chunk) for chunk in chunks) == len(many)
+
+        groups = namespace["update_rows"](Item, [{"id": "1", "code": "X"}, {"id": "2", "state": 0}])
+        assert groups == {("code",): [{"b_id": "1", "code": "X"}],
+                          ("state",): [{"b_id": "2", "state": 0}]}
+
+        namespace["upsert_statement"](Item, "sqlite", rows, ["code"])
+        with pytest.raises(ValueError):
+            namespace["upsert_statement"](Item, "mssql", rows, ["code"])
+
+    def test_repositories_use_bulk_statements(
+        self, repo: TemplateRepository, ddd_config: TACConfig
+    ):
+        """Repositories should issue INSERT ... RETURNING and executemany UPDATE."""
+        for template in ("shared/base_repository.py.j2", "shared/base_repository_async.py.j2"):
+            result = repo.render(template, ddd_config)
+            assert "def bulk_upsert(" in result
+            assert "sort_by_parameter_order=True" in result
+            assert "update_statement(self.model_class, keys)" in result
+
+
+class TestEntityCacheTemplate:
+    """Tests for shared/entity_cache.py.j2 template."""
+
+    def test_entity_cache_renders(self, repo: TemplateRepository, ddd_config: TACConfig):
+        """Template should render the backends and the shared cache."""
+        result = repo.render("shared/entity_cache.py.j2", ddd_config)
+
+        assert "class MemoryCacheBackend:" in result
+        assert "class RedisCacheBackend:" in result
+        assert "entity_cache = EntityCache()" in result
+        compile(result, "<string>", "exec")
+
+    def test_entity_cache_lru_ttl_and_stats(
+        self, repo: TemplateRepository, ddd_config: TACConfig
+    ):
+        """Memory backend should evict LRU/expired rows; stats should count lookups."""
+        pytest.importorskip("sqlalchemy")
+        result = repo.render("shared/entity_cache.py.j2", ddd_config)
+        namespace = exec_module(result)
+
+        backend = namespace["MemoryCacheBackend"](max_entries=2)
+        backend.set("a", 1, ttl=60)
+        backend.set("b", 2, ttl=60)
+        backend.get("a")
+        backend.set("c", 3, ttl=60)
+        assert backend.get("b") is None
+        assert backend.get("a") == 1
+        backend.set("d", 4, ttl=-1)
+        assert backend.get("d") is None
+
+        cache = namespace["EntityCache"]()
+        assert cache.get("products", "1") is None
+        cache.set("products", "1", {"id": "1"}, ttl=60)
+        assert cache.get("products", "1") == {"id": "1"}
+        cache.invalidate("products", "1")
+        assert cache.get("products", "1") is None
+
+        stats = cache.stats()["products"]
+        assert (stats.hits, stats.misses, stats.invalidations) == (1, 2, 1)
+        assert stats.hit_ratio == pytest.approx(1 / 3)
+
+    def test_repositories_read_through_cache(
+        self, repo: TemplateRepository, ddd_config: TACConfig
+    ):
+        """Repositories should consult the cache only when cache_entities is set."""
+        for template in ("shared/base_repository.py.j2", "shared/base_repository_async.py.j2"):
+            result = repo.render(template, ddd_config)
+            assert "cache_entities: bool = False" in result
+            assert "_get_cached(entity_id)" in result
+            assert "self._invalidate_cached(entity_id)" in result
+
+
+class TestExportTemplate:
+    """Tests for shared/export.py.j2 template."""
+
+    def test_export_renders(self, repo: TemplateRepository, ddd_config: TACConfig):
+        """Template should render projection and line serializers."""
+        result = repo.render("shared/export.py.j2", ddd_config)
+
+        assert "def projection_columns(" in result
+        assert "def export_lines(" in result
+        compile(result, "<string>", "exec")
+
+    def test_export_lines(
+        self, repo: TemplateRepository, ddd_config: TACConfig, orm_base: Any
+    ):
+        """Projections should be validated and rows serialized one line each."""
+        from datetime import datetime
+        from decimal import Decimal
+
+        from sqlalchemy import Column, Numeric, String
+
+        result = repo.render("shared/export.py.j2", ddd_config)
+        namespace = exec_module(result)
+
+        class Item(orm_base):
+            __tablename__ = "items"
+            id = Column(String, primary_key=True)
+            code = Column(String)
+            price = Column(Numeric)
+
+        projection_columns = namespace["projection_columns"]
+        assert projection_columns(Item) == ["id", "code", "price"]
+        assert projection_columns(Item, ["price"], "code") == ["id", "code", "price"]
+        with pytest.raises(ValueError):
+            projection_columns(Item, ["secret"])
+
+        rows = [{"id": "1", "code": "A", "price": Decimal("9.50"), "at": datetime(2024, 1, 1)}]
+        ndjson = list(namespace["export_lines"](iter(rows), "ndjson", ["id"]))
+        assert ndjson == ['{"id":"1","code":"A","price":"9.50","at":"2024-01-01T00:00:00"}\n']
+
+        csv_lines = list(namespace["export_lines"](iter(rows), "csv", ["id", "price"]))
+        assert csv_lines == ["id,price\r\n", "1,9.50\r\n"]
+
+        with pytest.raises(ValueError):
+            namespace["export_lines"](iter(rows), "xml", ["id"])
+
+    def test_repositories_stream_and_project(
+        self, repo: TemplateRepository, ddd_config: TACConfig
+    ):
+        """Repositories should expose stream_all() and fields= projections."""
+        for template in ("shared/base_repository.py.j2", "shared/base_repository_async.py.j2"):
+            result = repo.render(template, ddd_config)
+            assert "def stream_all(" in result
+            assert "yield_per=batch_size or self.stream_batch_size" in result
+            assert "load_only(" in result
+
+        service_result = repo.render("shared/base_service.py.j2", ddd_config)
+        assert "def export(" in service_result
+
+
 # ============================================================================
 # TEST HEALTH.PY.J2
 # ============================================================================
@@ -146,6 +146,15 @@ class TestGenerateCommand:
         assert result.exit_code == 1
         assert "Unknown subcommand 'invalid'" in result.stdout
 
+    def test_invalid_count_mode_is_rejected(self):
+        """Unknown --count-mode values should fail option parsing."""
+        result = runner.invoke(
+            app, ["generate", "entity", "Product", "--count-mode", "approximate"]
+        )
+
+        assert result.exit_code == 2
+        assert "exact" in result.output and "estimated" in result.output
+
     def test_non_interactive_with_fields(self):
         """
         Test non-interactive mode with --fields.
@@ -961,3 +970,86 @@ class TestGenerateCommand:
                 assert "class Product" in content
             finally:
                 os.chdir(original_cwd)
+
+    def test_explain_indexes(self):
+        """
+        Test --explain-indexes prints the index report without writing files.
+
+        Responsibility: Verify the report lists derived and declared indexes with the queries
+        each serves, and that --index declarations are tenant-prefixed on authorized entities
+
+        Tags: expert:backend, level:L2, topic:database, topic:api
+
+        Ownership: CLI index report, --index parsing
+
+        Invariants: Exit code 0; no files created; declared index leads with organization_id;
+        unknown --index flags are rejected
+
+        Side effects: Creates temporary project structure; modifies working directory; restores
+        original working directory
+
+        Inputs: Entity "Order" with status/ref fields; --index "status,created_at:active";
+        --index "ref:unique"; --authorized; --explain-indexes
+
+        Outputs: Report naming ix_orders_org_created_at, ix_orders_org_status_created_at and
+        uq_orders_org_ref
+
+        Failure modes: Files generated in report mode; declared index not tenant-prefixed
+
+        IDK: cli-testing, explain-indexes, composite-index, partial-index, multi-tenant
+        """
+        import os
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            project_dir = create_test_project(Path(tmpdir))
+            original_cwd = os.getcwd()
+
+            try:
+                os.chdir(project_dir)
+
+                result = runner.invoke(
+                    app,
+                    [
+                        "generate",
+                        "entity",
+                        "Order",
+                        "-c",
+                        "sales",
+                        "--no-interactive",
+                        "--fields",
+                        "status:str,ref:str",
+                        "--authorized",
+                        "--index",
+                        "status,created_at:active",
+                        "--index",
+                        "ref:unique",
+                        "--explain-indexes",
+                    ],
+                    env={"COLUMNS": "300"},
+                )
+
+                assert result.exit_code == 0
+                assert "ix_orders_org_created_at" in result.stdout
+                assert "ix_orders_org_status_created_at" in result.stdout
+                assert "uq_orders_org_ref" in result.stdout
+                assert "OrderRepository.get_all(): organization_id = ?" in result.stdout
+                assert not (project_dir / "domain").exists()
+
+                result = runner.invoke(
+                    app,
+                    [
+                        "generate",
+                        "entity",
+                        "Order",
+                        "--no-interactive",
+                        "--fields",
+                        "status:str",
+                        "--index",
+                        "status:sorted",
+                        "--explain-indexes",
+                    ],
+                )
+                assert result.exit_code == 1
+                assert "Unknown index flag" in result.stdout
+            finally:
+                os.chdir(original_cwd)
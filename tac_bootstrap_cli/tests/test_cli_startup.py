@@ -0,0 +1,108 @@
+"""Test CLI cold-start cost and the lazy command registry."""
+
+import subprocess
+import sys
+from typing import List, Set, Tuple
+
+import pytest
+from typer.main import get_group
+from typer.testing import CliRunner
+
+from tac_bootstrap.interfaces.cli import app
+from tac_bootstrap.interfaces.command_registry import COMMANDS, load_command
+
+runner = CliRunner()
+
+# Cumulative import time budgets (ms) for a cold interpreter, measured with
+# `python -X importtime`. Eager imports of every command pushed --version past 400ms.
+IMPORT_BUDGET_MS = {"--version": 200, "--help": 400}
+
+# Modules only command implementations may pull in
+HEAVY_MODULES = (
+    "jinja2",
+    "pydantic",
+    "yaml",
+    "tac_bootstrap.domain",
+    "tac_bootstrap.application",
+    "tac_bootstrap.infrastructure",
+    "tac_bootstrap.interfaces.commands.",
+)
+
+
+def cold_start(flag: str) -> Tuple[float, Set[str], int]:
+    """Run the CLI with flag in a fresh interpreter; return import ms, modules, exit code."""
+    code = (
+        f"import sys; sys.argv = ['tac-bootstrap', {flag!r}]\n"
+        "from tac_bootstrap.interfaces.cli import app\n"
+        "app()"
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    total_us = 0
+    modules: Set[str] = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or line.count("|") != 2:
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue  # header line
+        modules.add(name.strip())
+        if not name.startswith("  "):  # top-level import: cumulative covers its children
+            total_us += int(cumulative)
+    return total_us / 1000, modules, result.returncode
+
+
+@pytest.mark.parametrize("flag", sorted(IMPORT_BUDGET_MS))
+def test_cold_start_within_import_budget(flag: str):
+    """--version and --help import only the CLI shell, within the time budget."""
+    # Best of three runs, so one slow run on a busy machine does not fail the test
+    runs = [cold_start(flag) for _ in range(3)]
+    assert all(exit_code == 0 for _, _, exit_code in runs)
+
+    modules = runs[0][1]
+    heavy = sorted(m for m in modules if m.startswith(HEAVY_MODULES))
+    assert heavy == [], f"{flag} imported {heavy}"
+
+    best_ms = min(ms for ms, _, _ in runs)
+    assert best_ms <= IMPORT_BUDGET_MS[flag], (
+        f"{flag} cold start imports took {best_ms:.0f}ms "
+        f"(budget {IMPORT_BUDGET_MS[flag]}ms)"
+    )
+
+
+def test_help_lists_registered_commands():
+    """--help lists every registry command in registry order."""
+    result = runner.invoke(app, ["--help"], env={"COLUMNS": "200"})
+    assert result.exit_code == 0
+
+    positions: List[int] = [result.stdout.index(f" {name} ") for name in COMMANDS]
+    assert positions == sorted(positions)
+
+
+@pytest.mark.parametrize("name", list(COMMANDS))
+def test_registry_matches_command_modules(name: str):
+    """Each registered name resolves to a command whose help matches the registry."""
+    command = load_command(name)
+    assert command is not None
+    assert command.name == name
+    assert command.get_short_help_str(limit=200) == COMMANDS[name].help
+
+
+def test_command_modules_register_nothing_unlisted():
+    """Command modules do not define top-level commands missing from the registry."""
+    from importlib import import_module
+
+    for module in {entry.module for entry in COMMANDS.values()}:
+        group = get_group(import_module(f"tac_bootstrap.interfaces.commands.{module}").app)
+        assert set(group.commands) <= set(COMMANDS), module
+
+
+def test_unknown_command_suggests_registry_command():
+    """Typos of lazily registered commands still get a suggestion."""
+    result = runner.invoke(app, ["initt"])
+    assert result.exit_code != 0
+    assert "init" in result.output
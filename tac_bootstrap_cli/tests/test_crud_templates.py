@@ -429,6 +429,43 @@ def test_repository_no_search_without_string_fields(
     compile(output, "<string>", "exec")
 
 
+def test_repository_uses_entity_count_mode(
+    template_repo: TemplateRepository, entity_spec: EntitySpec, tac_config: TACConfig
+):
+    """Test that the entity's count_mode is set on the generated repository."""
+    entity = EntitySpec(**{**entity_spec.model_dump(), "count_mode": "estimated"})
+
+    output = template_repo.render(
+        "capabilities/crud_basic/repository.py.j2",
+        {"entity": entity,
+        'config': tac_config},
+    )
+
+    assert 'count_mode = "estimated"' in output
+
+    compile(output, "<string>", "exec")
+
+
+def test_repository_enables_entity_cache(
+    template_repo: TemplateRepository, entity_spec: EntitySpec, tac_config: TACConfig
+):
+    """Test that the entity cache is enabled only for entities that ask for it."""
+    output = template_repo.render(
+        "capabilities/crud_basic/repository.py.j2",
+        {"entity": entity_spec, "config": tac_config},
+    )
+    assert "cache_entities = False" in output
+
+    entity = EntitySpec(**{**entity_spec.model_dump(), "cache": True})
+    output = template_repo.render(
+        "capabilities/crud_basic/repository.py.j2",
+        {"entity": entity, "config": tac_config},
+    )
+    assert "cache_entities = True" in output
+
+    compile(output, "<string>", "exec")
+
+
 # ============================================================================
 # TEST SERVICE.PY.J2
 # ============================================================================
@@ -461,6 +498,9 @@ def test_service_renders(
     assert "entity.validate()" in output
     assert "entity.calculate_totals()" in output
 
+    # Response DTOs are built by BaseService from response_schema
+    assert "    response_schema = ProductResponse" in output
+
     # Verify Python syntax is valid
     compile(output, "<string>", "exec")
 
@@ -498,6 +538,9 @@ def test_routes_renders(
     assert "status_code=status.HTTP_201_CREATED" in output
     assert "status_code=status.HTTP_200_OK" in output
 
+    # Verify list pagination exposes the count strategy
+    assert 'count_mode: Literal["exact", "estimated", "cached", "none"] = Query("exact")' in output
+
     # Verify Python syntax is valid
     compile(output, "<string>", "exec")
 
@@ -527,9 +570,41 @@ def test_routes_has_correct_endpoints(
     # DELETE /products/{id}
     assert '@router.delete(\n    "/{id}",' in output
 
+    # POST/PUT/PATCH /products/bulk, declared before /{id}
+    assert '@router.post(\n    "/bulk",' in output
+    assert '@router.put(\n    "/bulk",' in output
+    assert '@router.patch(\n    "/bulk",' in output
+    assert output.index('"/bulk"') < output.index('"/{id}"')
+
+    # GET /products/export streams NDJSON/CSV, declared before /{id}
+    assert '@router.get(\n    "/export",' in output
+    assert output.index('"/export"') < output.index('"/{id}"')
+
     compile(output, "<string>", "exec")
 
 
+def test_routes_use_fast_json_response(
+    template_repo: TemplateRepository, entity_spec: EntitySpec, tac_config: TACConfig
+):
+    """List and bulk endpoints should return pre-validated data as FastJSONResponse."""
+    output = template_repo.render(
+        "capabilities/crud_basic/routes.py.j2",
+        {"entity": entity_spec,
+        'config': tac_config},
+    )
+
+    assert (
+        "from test_app.shared.infrastructure.serialization import FastJSONResponse" in output
+    )
+    assert "return FastJSONResponse(service.get_all(" in output
+    assert (
+        "return FastJSONResponse(service.bulk_create(data), "
+        "status_code=status.HTTP_201_CREATED)"
+    ) in output
+    # response_model still documents the list schema
+    assert "response_model=PaginatedResponse[ProductResponse]," in output
+
+
 def test_routes_has_dependency_injection(
     template_repo: TemplateRepository, entity_spec: EntitySpec, tac_config: TACConfig
 ):
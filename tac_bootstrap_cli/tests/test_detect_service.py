@@ -517,3 +517,144 @@ class TestDetectServiceFullScenarios:
             result = detector.detect(Path(tmp))
 
             assert 0.0 <= result.confidence <= 1.0
+
+
+# ============================================================================
+# TEST MONOREPO DETECTION
+# ============================================================================
+
+
+def write(root: Path, rel_path: str, content: str = "") -> None:
+    path = root / rel_path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+class TestDetectServiceMonorepo:
+    """Tests for workspace packages, the single tree scan and the manifest cache."""
+
+    def test_detects_each_workspace_package(self, tmp_path: Path):
+        write(tmp_path, "package.json", json.dumps({"name": "root", "private": True}))
+        write(tmp_path, "pnpm-lock.yaml")
+        write(
+            tmp_path,
+            "apps/web/package.json",
+            json.dumps({"name": "web", "dependencies": {"next": "14"}, "scripts": {"dev": "x"}}),
+        )
+        write(tmp_path, "apps/web/tsconfig.json", "{}")
+        write(
+            tmp_path,
+            "services/api/pyproject.toml",
+            "[project]\nname='api'\ndependencies=['fastapi>=0.100']\n",
+        )
+        write(tmp_path, "services/api/uv.lock")
+        (tmp_path / "services/api/src").mkdir()
+
+        result = DetectService().detect(tmp_path)
+
+        assert result.is_monorepo
+        assert [package.path for package in result.packages] == [
+            ".",
+            "apps/web",
+            "services/api",
+        ]
+        root, web, api = result.packages
+        assert result.language == Language.JAVASCRIPT
+        assert root.name == "root"
+        assert (web.language, web.framework, web.package_manager) == (
+            Language.TYPESCRIPT,
+            Framework.NEXTJS,
+            PackageManager.PNPM,  # lock file of the parent workspace
+        )
+        assert web.commands["start"] == "pnpm run dev"
+        assert "pnpm-lock.yaml" in web.evidence
+        assert (api.framework, api.package_manager, api.app_root) == (
+            Framework.FASTAPI,
+            PackageManager.UV,
+            "src",
+        )
+
+    def test_root_without_manifest_uses_most_confident_package(self, tmp_path: Path):
+        write(tmp_path, "docs/requirements.txt", "mkdocs\n")
+        write(tmp_path, "backend/pyproject.toml", "[project]\ndependencies=['django']\n")
+        write(tmp_path, "backend/poetry.lock")
+        (tmp_path / "backend/app").mkdir()
+
+        result = DetectService().detect(tmp_path)
+
+        assert result.path == "."
+        assert result.framework == Framework.DJANGO
+        assert result.package_manager == PackageManager.POETRY
+        assert result.app_root == "backend/app"
+        assert result.evidence[0] == "backend/pyproject.toml"
+        assert len(result.packages) == 2
+
+    def test_vendored_and_hidden_dirs_are_pruned(self, tmp_path: Path):
+        write(tmp_path, "pyproject.toml", "[project]\nname='app'\n")
+        write(tmp_path, "node_modules/left-pad/package.json", "{}")
+        write(tmp_path, ".venv/lib/site/pyproject.toml")
+        write(tmp_path, "pkg/build/setup.py")
+
+        result = DetectService().detect(tmp_path)
+
+        assert [package.path for package in result.packages] == ["."]
+        assert not result.is_monorepo
+
+    def test_max_depth_limits_package_search(self, tmp_path: Path):
+        write(tmp_path, "a/b/c/package.json", "{}")
+
+        assert len(DetectService(max_depth=3).detect(tmp_path).packages) == 1
+        assert DetectService(max_depth=2).detect(tmp_path).packages == []
+
+    def test_each_manifest_is_read_once(self, tmp_path: Path, monkeypatch):
+        write(tmp_path, "package.json", json.dumps({"devDependencies": {"typescript": "5"}}))
+        write(tmp_path, "packages/ui/package.json", json.dumps({"dependencies": {"react": "18"}}))
+        reads = []
+        original = Path.read_bytes
+
+        def counting_read_bytes(self):
+            reads.append(self.relative_to(tmp_path).as_posix())
+            return original(self)
+
+        monkeypatch.setattr(Path, "read_bytes", counting_read_bytes)
+        DetectService().detect(tmp_path)
+
+        assert sorted(reads) == ["package.json", "packages/ui/package.json"]
+
+
+class TestDetectServiceConfidence:
+    """Tests for evidence-based confidence scores."""
+
+    def test_more_evidence_scores_higher(self, tmp_path: Path):
+        detector = DetectService()
+        write(tmp_path, "bare/requirements.txt", "requests\n")
+        write(tmp_path, "manifest/pyproject.toml", "[project]\nname='m'\n")
+        write(tmp_path, "full/pyproject.toml", "[project]\ndependencies=['fastapi']\n")
+        write(tmp_path, "full/uv.lock")
+        (tmp_path / "full/src").mkdir()
+
+        scores = {
+            name: detector.detect(tmp_path / name).confidence
+            for name in ("bare", "manifest", "full")
+        }
+
+        assert scores["bare"] < scores["manifest"] < scores["full"]
+        assert scores["full"] == 0.95
+
+    def test_no_markers_is_low_confidence(self, tmp_path: Path):
+        result = DetectService().detect(tmp_path)
+
+        assert result.language == Language.PYTHON
+        assert result.confidence == 0.1
+        assert result.evidence == []
+
+    def test_invalid_and_ambiguous_manifests_lower_confidence(self, tmp_path: Path):
+        write(tmp_path, "clean/package.json", "{}")
+        write(tmp_path, "broken/package.json", "{not json")
+        write(tmp_path, "mixed/package.json", "{}")
+        write(tmp_path, "mixed/go.mod", "module x\n")
+        detector = DetectService()
+
+        clean = detector.detect(tmp_path / "clean").confidence
+        assert detector.detect(tmp_path / "broken").confidence < clean
+        assert detector.detect(tmp_path / "mixed").confidence < clean
@@ -7,7 +7,14 @@ validators, and property derivations.
 import pytest
 from pydantic import ValidationError
 
-from tac_bootstrap.domain.entity_config import EntitySpec, FieldSpec, FieldType
+from tac_bootstrap.domain.entity_config import (
+    ACTIVE_ROWS,
+    CountMode,
+    EntitySpec,
+    FieldSpec,
+    FieldType,
+    IndexSpec,
+)
 
 # ============================================================================
 # TEST FIELDTYPE ENUM
@@ -188,6 +195,17 @@ class TestFieldSpec:
         field = FieldSpec(name="test", field_type=FieldType.STRING)
         assert field.max_length is None
 
+    def test_default_searchable_false(self):
+        """Field should not be searchable by default."""
+        field = FieldSpec(name="test", field_type=FieldType.STRING)
+        assert field.searchable is False
+
+    def test_searchable_requires_text_type(self):
+        """Only STRING and TEXT fields can be searchable."""
+        assert FieldSpec(name="body", field_type=FieldType.TEXT, searchable=True).searchable
+        with pytest.raises(ValidationError, match="only str and text fields can be searchable"):
+            FieldSpec(name="price", field_type=FieldType.FLOAT, searchable=True)
+
     def test_set_all_attributes(self):
         """All field attributes should be settable."""
         field = FieldSpec(
@@ -482,6 +500,43 @@ class TestEntitySpec:
         assert entity.async_mode is True
         assert entity.with_events is True
 
+    def test_default_count_mode_exact(self):
+        """Entity should count list totals exactly by default."""
+        entity = EntitySpec(
+            name="Product",
+            capability="catalog",
+            fields=[FieldSpec(name="title", field_type=FieldType.STRING)],
+        )
+        assert entity.count_mode == CountMode.EXACT
+
+    def test_entity_cache_disabled_by_default(self):
+        """Entity cache should be opt-in."""
+        entity = EntitySpec(
+            name="Country",
+            capability="geo",
+            fields=[FieldSpec(name="code", field_type=FieldType.STRING)],
+        )
+        assert entity.cache is False
+        assert EntitySpec(**{**entity.model_dump(), "cache": True}).cache is True
+
+    def test_count_mode_from_yaml_mapping(self):
+        """count_mode should parse from the string used in entity YAML."""
+        entity = EntitySpec(
+            name="Event",
+            capability="audit",
+            fields=[{"name": "kind", "field_type": "str"}],
+            count_mode="none",
+        )
+        assert entity.count_mode == CountMode.NONE
+
+        with pytest.raises(ValidationError):
+            EntitySpec(
+                name="Event",
+                capability="audit",
+                fields=[{"name": "kind", "field_type": "str"}],
+                count_mode="approximate",
+            )
+
 
 # ============================================================================
 # TEST ENTITYSPEC PROPERTIES
@@ -649,6 +704,109 @@ class TestEntitySpecProperties:
         )
         assert entity.table_name == entity.plural_name
 
+    def test_search_fields_flagged(self):
+        """search_fields should be the searchable fields when any are flagged."""
+        entity = EntitySpec(
+            name="Article",
+            capability="blog",
+            fields=[
+                FieldSpec(name="title", field_type=FieldType.STRING, searchable=True),
+                FieldSpec(name="slug", field_type=FieldType.STRING),
+                FieldSpec(name="views", field_type=FieldType.INTEGER),
+            ],
+        )
+        assert [field.name for field in entity.search_fields] == ["title"]
+
+    def test_search_fields_default_to_text_fields(self):
+        """Without flags, every STRING and TEXT field is searchable."""
+        entity = EntitySpec(
+            name="Article",
+            capability="blog",
+            fields=[
+                FieldSpec(name="title", field_type=FieldType.STRING),
+                FieldSpec(name="views", field_type=FieldType.INTEGER),
+                FieldSpec(name="body", field_type=FieldType.TEXT),
+            ],
+        )
+        assert [field.name for field in entity.search_fields] == ["title", "body"]
+
+
+
+# ============================================================================
+# TEST INDEXES
+# ============================================================================
+
+
+class TestTableIndexes:
+    """Tests for IndexSpec and EntitySpec.table_indexes."""
+
+    def test_basic_entity_indexes(self):
+        """Basic entities get the active list index plus field indexes."""
+        entity = EntitySpec(
+            name="Product",
+            capability="catalog",
+            fields=[
+                FieldSpec(name="sku", field_type=FieldType.STRING, unique=True),
+                FieldSpec(name="category", field_type=FieldType.STRING, indexed=True),
+                FieldSpec(name="price", field_type=FieldType.FLOAT),
+            ],
+        )
+        indexes = {index.name: index for index in entity.table_indexes}
+
+        assert list(indexes) == [
+            "ix_products_active_created_at",
+            "uq_products_sku",
+            "ix_products_category",
+        ]
+        assert indexes["ix_products_active_created_at"].columns == ["created_at"]
+        assert indexes["ix_products_active_created_at"].where == ACTIVE_ROWS
+        assert indexes["uq_products_sku"].unique is True
+        assert indexes["ix_products_category"].serves == [
+            "ProductRepository.get_by_category(): category = ?"
+        ]
+
+    def test_authorized_entity_indexes_lead_with_tenant(self):
+        """Authorized entities prefix every index, declared ones included, with organization_id."""
+        entity = EntitySpec(
+            name="Product",
+            capability="catalog",
+            authorized=True,
+            fields=[FieldSpec(name="status", field_type=FieldType.STRING)],
+            indexes=[
+                IndexSpec(columns=["status", "created_at"], where=ACTIVE_ROWS),
+                IndexSpec(columns=["organization_id", "created_at", "id"], where=ACTIVE_ROWS),
+            ],
+        )
+        indexes = entity.table_indexes
+
+        assert all(index.columns[0] == "organization_id" for index in indexes)
+        # The second declared index duplicates the derived list index
+        assert [index.name for index in indexes] == [
+            "ix_products_org_created_at",
+            "ix_products_org_status_created_at",
+        ]
+        assert indexes[0].columns == ["organization_id", "created_at", "id"]
+        assert indexes[1].serves == ["declared in EntitySpec.indexes"]
+
+    def test_index_unknown_column_rejected(self):
+        """Declared indexes must reference entity fields or base columns."""
+        with pytest.raises(ValidationError, match="unknown column"):
+            EntitySpec(
+                name="Product",
+                capability="catalog",
+                fields=[FieldSpec(name="sku", field_type=FieldType.STRING)],
+                indexes=[IndexSpec(columns=["color"])],
+            )
+
+    def test_index_spec_validation(self):
+        """IndexSpec rejects empty, duplicate and unsafe definitions."""
+        with pytest.raises(ValidationError):
+            IndexSpec(columns=[])
+        with pytest.raises(ValidationError):
+            IndexSpec(columns=["sku", "sku"])
+        with pytest.raises(ValidationError):
+            IndexSpec(columns=["sku"], where='status = "x"')
+
 
 # ============================================================================
 # TEST SERIALIZATION
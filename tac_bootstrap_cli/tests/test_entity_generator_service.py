@@ -6,7 +6,10 @@ from pathlib import Path
 import pytest
 import yaml
 
-from tac_bootstrap.application.entity_generator_service import EntityGeneratorService
+from tac_bootstrap.application.entity_generator_service import (
+    EntityGeneratorService,
+    alembic_heads,
+)
 from tac_bootstrap.domain.entity_config import EntitySpec, FieldSpec, FieldType
 from tac_bootstrap.domain.models import (
     Architecture,
@@ -247,6 +250,29 @@ class TestBuildGenerationPlan:
         file_names = [op.path.name for op in plan]
         assert "product_events.py" in file_names
 
+    def test_authorized_plan_includes_search_migration(self, temp_project_dir):
+        """Test authorized entities with text fields get a search index migration."""
+        service = EntityGeneratorService()
+        config = service.validate_project(temp_project_dir)
+
+        entity_spec = EntitySpec(
+            name="Product",
+            capability="catalog",
+            fields=[FieldSpec(name="name", field_type=FieldType.STRING, searchable=True)],
+            authorized=True,
+        )
+
+        plan = service.build_generation_plan(entity_spec, config)
+
+        assert len(plan) == 7
+        migration = plan[-1]
+        assert migration.path == Path("alembic") / "versions" / "products_search_index.py"
+        assert migration.template_name == "capabilities/crud_authorized/search_migration.py.j2"
+
+        # Basic templates keep their own search; no migration
+        entity_spec = entity_spec.model_copy(update={"authorized": False})
+        assert len(service.build_generation_plan(entity_spec, config)) == 6
+
 
 class TestGenerate:
     """Test generate method."""
@@ -344,3 +370,51 @@ class TestGenerate:
         new_content = entity_path.read_text()
         assert "# OLD CONTENT" not in new_content
         assert "class Product(Entity):" in new_content
+
+    def test_search_migration_chains_onto_alembic_head(self, temp_project_dir):
+        """Test the search migration extends the existing chain instead of adding a base."""
+        versions = temp_project_dir / "alembic" / "versions"
+        versions.mkdir(parents=True)
+        (versions / "0001_create_products.py").write_text(
+            'revision = "0001"\ndown_revision = None\n'
+        )
+        (versions / "0002_add_price.py").write_text(
+            'revision: str = "0002"\ndown_revision: str | None = "0001"\n'
+        )
+        entity_spec = EntitySpec(
+            name="Product",
+            capability="catalog",
+            fields=[FieldSpec(name="name", field_type=FieldType.STRING, searchable=True)],
+            authorized=True,
+        )
+
+        EntityGeneratorService().generate(entity_spec, temp_project_dir)
+        migration = (versions / "products_search_index.py").read_text()
+
+        assert 'down_revision = "0002"' in migration
+        compile(migration, "<string>", "exec")
+
+        # Regenerating does not chain the migration onto itself
+        EntityGeneratorService().generate(entity_spec, temp_project_dir, force=True)
+        assert 'down_revision = "0002"' in (versions / "products_search_index.py").read_text()
+
+
+class TestAlembicHeads:
+    """Test alembic_heads helper."""
+
+    def test_missing_versions_dir(self, tmp_path):
+        """Test a project without Alembic has no heads."""
+        assert alembic_heads(tmp_path / "alembic" / "versions") == []
+
+    def test_branches_are_all_heads(self, tmp_path):
+        """Test every unreferenced revision is a head and unparsable files are skipped."""
+        (tmp_path / "a.py").write_text('revision = "a"\ndown_revision = None\n')
+        (tmp_path / "b.py").write_text('revision = "b"\ndown_revision = "a"\n')
+        (tmp_path / "c.py").write_text('revision = "c"\ndown_revision = "a"\n')
+        (tmp_path / "broken.py").write_text("revision = (\n")
+
+        assert alembic_heads(tmp_path) == ["b", "c"]
+
+        (tmp_path / "merge.py").write_text('revision = "m"\ndown_revision = ("b", "c")\n')
+        assert alembic_heads(tmp_path) == ["m"]
+        assert alembic_heads(tmp_path, exclude="m") == ["b", "c"]
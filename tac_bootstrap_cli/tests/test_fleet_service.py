@@ -0,0 +1,229 @@
+"""
+Tests for FleetService
+
+Covers repository list parsing, render/upgrade/doctor across several repositories
+(in-process and with a worker pool), the JSONL result log, summary timings and the
+`fleet` CLI command.
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, List
+
+import pytest
+import yaml
+from typer.testing import CliRunner
+
+from tac_bootstrap import __version__
+from tac_bootstrap.application.fleet_service import (
+    FleetOptions,
+    FleetService,
+    FleetSummary,
+    RepoResult,
+    read_repo_list,
+)
+from tac_bootstrap.infrastructure.toolchain_probe import ToolProbe
+from tac_bootstrap.interfaces.cli import app
+
+runner = CliRunner()
+
+
+class FakeToolchain:
+    """Picklable toolchain reporting every tool as installed, counting probe calls."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def probe(self, tools: List[str], refresh: bool = False) -> Dict[str, ToolProbe]:
+        self.calls += 1
+        return {tool: ToolProbe(tool=tool, installed=True, version="99.0.0") for tool in tools}
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+
+def make_repo(root: Path, name: str, version: str = __version__) -> Path:
+    """Create a repository containing only a config.yml."""
+    repo = root / name
+    repo.mkdir()
+    config = {
+        "version": version,
+        "project": {"name": name, "language": "python", "package_manager": "uv"},
+        "commands": {"start": "uv run python -m app", "test": "uv run pytest"},
+        "claude": {"settings": {"project_name": name}},
+    }
+    (repo / "config.yml").write_text(yaml.dump(config))
+    return repo
+
+
+@pytest.fixture
+def repos(tmp_path: Path) -> List[Path]:
+    return [make_repo(tmp_path, "alpha"), make_repo(tmp_path, "beta")]
+
+
+def read_log(path: Path) -> List[dict]:
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+# ============================================================================
+# TEST REPOSITORY LIST
+# ============================================================================
+
+
+class TestReadRepoList:
+    """Test parsing of the --repos file."""
+
+    def test_comments_blanks_relative_paths_and_duplicates(self, tmp_path: Path):
+        repos_file = tmp_path / "repos.txt"
+        repos_file.write_text(
+            "# production repos\n"
+            "alpha\n"
+            "\n"
+            "/srv/beta   # absolute\n"
+            "./alpha\n"
+        )
+
+        assert read_repo_list(repos_file) == [tmp_path / "alpha", Path("/srv/beta")]
+
+
+# ============================================================================
+# TEST FLEET RUNS
+# ============================================================================
+
+
+class TestFleetRender:
+    """Render many repositories sharing templates and one toolchain probe."""
+
+    def test_render_in_process(self, tmp_path: Path, repos: List[Path]):
+        toolchain = FakeToolchain()
+        log_path = tmp_path / "logs" / "render.jsonl"
+        seen: List[RepoResult] = []
+
+        summary = FleetService(toolchain=toolchain, concurrency=1).run(
+            "render", repos + [tmp_path / "missing"], log_path=log_path, on_result=seen.append
+        )
+
+        assert (summary.total, summary.ok, summary.failed) == (3, 2, 1)
+        assert summary.workers == 1
+        assert [result.repo for result in summary.results] == [
+            str(repos[0]),
+            str(repos[1]),
+            str(tmp_path / "missing"),
+        ]
+        assert summary.results[0].details["files_created"] > 0
+        assert (repos[0] / ".claude").is_dir()
+        assert "No config.yml" in summary.results[2].error
+        assert toolchain.calls == 1  # probed once for the whole fleet
+
+        records = read_log(log_path)
+        assert [record["repo"] for record in records] == [result.repo for result in seen]
+        assert records[2]["status"] == "failed"
+
+    def test_render_with_worker_pool(self, tmp_path: Path, repos: List[Path]):
+        repos.append(make_repo(tmp_path, "gamma"))
+        log_path = tmp_path / "render.jsonl"
+
+        summary = FleetService(toolchain=FakeToolchain(), concurrency=2).run(
+            "render", repos, log_path=log_path
+        )
+
+        assert summary.workers == 2
+        assert summary.ok == 3, [result.error for result in summary.results]
+        assert all((repo / "adws").is_dir() for repo in repos)
+        assert sorted(record["repo"] for record in read_log(log_path)) == sorted(
+            str(repo) for repo in repos
+        )
+
+    def test_dry_run_writes_nothing(self, repos: List[Path]):
+        summary = FleetService(toolchain=FakeToolchain(), concurrency=1).run(
+            "render", repos[:1], FleetOptions(dry_run=True)
+        )
+
+        assert summary.results[0].details["files_planned"] > 0
+        assert not (repos[0] / ".claude").exists()
+
+
+class TestFleetUpgradeAndDoctor:
+    """Upgrade and doctor report per-repository outcomes."""
+
+    def test_upgrade_skips_current_and_previews_outdated(self, tmp_path: Path):
+        current = make_repo(tmp_path, "current")
+        outdated = make_repo(tmp_path, "outdated", version="0.1.0")
+
+        summary = FleetService(toolchain=FakeToolchain(), concurrency=1).run(
+            "upgrade", [current, outdated], FleetOptions(dry_run=True)
+        )
+
+        skipped, previewed = summary.results
+        assert skipped.status == "skipped"
+        assert previewed.status == "ok"
+        assert previewed.details["from_version"] == "0.1.0"
+        assert previewed.details["changes"]
+
+    def test_doctor_reports_unhealthy_repos_as_failed(self, tmp_path: Path):
+        toolchain = FakeToolchain()
+
+        summary = FleetService(toolchain=toolchain, concurrency=1).run(
+            "doctor", [make_repo(tmp_path, "bare")]
+        )
+
+        result = summary.results[0]
+        assert result.status == "failed"
+        assert result.details["error"] > 0
+        assert result.details["issues"]
+        assert toolchain.calls == 0  # doctor needs neither templates nor tools
+
+    def test_unknown_command(self, repos: List[Path]):
+        with pytest.raises(ValueError, match="Unknown fleet command"):
+            FleetService(toolchain=FakeToolchain()).run("deploy", repos)
+
+
+class TestFleetSummary:
+    """Test aggregate timings."""
+
+    def test_percentiles_and_slowest(self):
+        results = [
+            RepoResult(f"r{index}", "render", "ok", float(index)) for index in range(1, 101)
+        ]
+        summary = FleetSummary("render", workers=4, setup_ms=0.0, wall_ms=0.0, results=results)
+
+        assert (summary.p50_ms, summary.p95_ms, summary.max_ms) == (50.0, 95.0, 100.0)
+        assert [result.repo for result in summary.slowest(2)] == ["r100", "r99"]
+
+    def test_empty_summary(self):
+        summary = FleetSummary("doctor", workers=1, setup_ms=0.0, wall_ms=0.0)
+
+        assert (summary.total, summary.p95_ms, summary.max_ms) == (0, 0.0, 0.0)
+
+
+# ============================================================================
+# TEST CLI
+# ============================================================================
+
+
+class TestFleetCli:
+    """Test the `fleet` command group."""
+
+    def test_fleet_doctor_writes_log_and_fails_on_unhealthy(self, tmp_path: Path):
+        make_repo(tmp_path, "bare")
+        repos_file = tmp_path / "repos.txt"
+        repos_file.write_text("bare\n")
+        log_path = tmp_path / "doctor.jsonl"
+
+        result = runner.invoke(
+            app, ["fleet", "doctor", "--repos", str(repos_file), "--log", str(log_path)]
+        )
+
+        assert result.exit_code == 1
+        assert "Fleet doctor summary" in result.stdout
+        assert read_log(log_path)[0]["repo"] == str(tmp_path / "bare")
+
+    def test_missing_repos_file(self, tmp_path: Path):
+        result = runner.invoke(
+            app, ["fleet", "render", "--repos", str(tmp_path / "nope.txt")]
+        )
+
+        assert result.exit_code == 1
+        assert "Repository list not found" in result.stdout
@@ -11,6 +11,8 @@ from tac_bootstrap.domain.models import (
     ClaudeConfig,
     ClaudeSettings,
     CommandsSpec,
+    DatabaseConfig,
+    DatabaseProfile,
     Framework,
     Language,
     PackageManager,
@@ -236,6 +238,36 @@ class TestTACConfig:
         assert config.agentic.worktrees.enabled is True
         assert config.agentic.worktrees.max_parallel == 5
 
+    def test_database_defaults(self):
+        """Database section should default to the dev profile."""
+        config = TACConfig(
+            project=ProjectSpec(
+                name="test",
+                language=Language.PYTHON,
+                package_manager=PackageManager.UV,
+            ),
+            commands=CommandsSpec(start="echo start", test="echo test"),
+            claude=ClaudeConfig(settings=ClaudeSettings(project_name="test")),
+        )
+        assert config.database.profile == DatabaseProfile.DEV
+        assert config.database.slow_query_ms == 200
+
+    def test_database_profile_from_dict(self):
+        """Database profile should be read from config.yml data."""
+        config = TACConfig.model_validate(
+            {
+                "project": {"name": "test", "language": "python", "package_manager": "uv"},
+                "commands": {"start": "echo start", "test": "echo test"},
+                "claude": {"settings": {"project_name": "test"}},
+                "database": {"profile": "serverless", "pool_size": 3},
+            }
+        )
+        assert config.database.profile == DatabaseProfile.SERVERLESS
+        assert config.database.pool_size == 3
+
+        with pytest.raises(ValueError):
+            DatabaseConfig(profile="mainframe")
+
 
 # ============================================================================
 # TEST HELPER FUNCTIONS
@@ -1590,6 +1590,102 @@ class TestCommunityService:
         results = service.browse_templates(query="auth")
         assert len(results) > 0
 
+    def test_published_items_are_indexed_incrementally(self, tmp_path: Path) -> None:
+        """Published templates should be searchable, including from a new service."""
+        from tac_bootstrap.application.community_service import CommunityService
+
+        base_dir = tmp_path / "community"
+        service = CommunityService(base_dir=base_dir)
+        service.publish_template(
+            "grpc-gateway", description="gRPC gateway with protobuf", tags=["grpc"]
+        )
+        service.share_plugin("grpc-tracing", description="Tracing interceptors", tags=["grpc"])
+        assert [t.name for t in service.browse_templates(query="grpc")] == ["grpc-gateway"]
+
+        assert (base_dir / "search-index.json").is_file()
+        fresh = CommunityService(base_dir=base_dir)
+        assert [t.name for t in fresh.browse_templates(query="protobuf")] == ["grpc-gateway"]
+        assert [p.name for p in fresh.browse_plugins(query="grpc")] == ["grpc-tracing"]
+        assert [t.name for t in fresh.browse_templates(query="protobf")] == ["grpc-gateway"]
+
+    def test_browse_ranks_query_matches_by_relevance(self, tmp_path: Path) -> None:
+        """Name matches should outrank description-only matches."""
+        from tac_bootstrap.application.community_service import CommunityService
+
+        service = CommunityService(base_dir=tmp_path / "community")
+        results = service.browse_templates(query="dashboard")
+        assert results[0].name == "nextjs-dashboard"
+
+    def test_browsing_does_not_create_files(self, tmp_path: Path) -> None:
+        """Read-only calls on a fresh install should not write anything."""
+        from tac_bootstrap.application.community_service import CommunityService
+
+        base_dir = tmp_path / "community"
+        service = CommunityService(base_dir=base_dir)
+        assert service.browse_plugins()
+        assert service.get_profile().plugins_shared == 0
+        assert service.get_community_stats().total_templates > 0
+        assert not base_dir.exists()
+
+    def test_legacy_json_data_is_imported(self, tmp_path: Path) -> None:
+        """items.json and profile.json from earlier versions should move to the database."""
+        from tac_bootstrap.application.community_service import CommunityService
+
+        base_dir = tmp_path / "community"
+        base_dir.mkdir()
+        (base_dir / "items.json").write_text(
+            json.dumps([{"name": "legacy-plugin", "item_type": "plugin", "tags": ["old"]}])
+        )
+        (base_dir / "profile.json").write_text(
+            json.dumps(
+                {
+                    "plugins_shared": 1,
+                    "total_points": 20,
+                    "member_since": "2024-01-01T00:00:00+00:00",
+                    "achievements": [
+                        {"id": "first-share", "name": "Community Contributor", "earned": True}
+                    ],
+                }
+            )
+        )
+
+        service = CommunityService(base_dir=base_dir)
+        assert [p.name for p in service.browse_plugins(query="legacy")] == ["legacy-plugin"]
+        profile = service.get_profile()
+        assert profile.plugins_shared == 1
+        assert profile.member_since == "2024-01-01T00:00:00+00:00"
+        assert service.earn_achievement("first-share") is None
+        assert (base_dir / "items.json.migrated").is_file()
+        assert not (base_dir / "profile.json").exists()
+
+        service.share_plugin("new-plugin")
+        fresh = CommunityService(base_dir=base_dir)
+        assert fresh.get_profile().plugins_shared == 2
+        names = {p.name for p in fresh.browse_plugins(limit=100)}
+        assert {"legacy-plugin", "new-plugin"} <= names
+
+    def test_concurrent_shares_update_profile_counters(self, tmp_path: Path) -> None:
+        """Parallel writers should not lose profile counter updates."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        from tac_bootstrap.application.community_service import CommunityService
+
+        base_dir = tmp_path / "community"
+
+        def share(worker: int) -> None:
+            service = CommunityService(base_dir=base_dir)
+            for number in range(5):
+                service.share_plugin(f"plugin-{worker}-{number}")
+            service.earn_achievement("first-share")
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(share, range(4)))
+
+        profile = CommunityService(base_dir=base_dir).get_profile()
+        assert profile.plugins_shared == 20
+        assert profile.total_points == 20
+        assert [a.id for a in profile.achievements] == ["first-share"]
+
     def test_community_item_model(self) -> None:
         """CommunityItem model should have correct defaults."""
         from tac_bootstrap.application.community_service import CommunityItem
@@ -5,8 +5,9 @@ plugin service, hook execution, error handling, and edge cases.
 """
 
 import tempfile
+import time
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 import pytest
 import yaml
@@ -502,6 +503,203 @@ class TestPluginService:
         assert service.plugin_count == 0
 
 
+# ============================================================================
+# TEST LAZY DISPATCH, TIMEOUTS AND STATS
+# ============================================================================
+
+
+def write_plugin(
+    plugins_path: Path, name: str, hooks: list, source: str, **manifest: Any
+) -> Path:
+    """Create a plugin whose hooks.py appends its name to imports.log when imported."""
+    plugin_path = plugins_path / name
+    plugin_path.mkdir(parents=True)
+    data = {"name": name, "version": "1.0.0", "author": "Test", "hooks": hooks, **manifest}
+    (plugin_path / "plugin.yaml").write_text(yaml.dump(data))
+    log = plugins_path / "imports.log"
+    (plugin_path / "hooks.py").write_text(
+        f"with open({str(log)!r}, 'a') as f:\n    f.write({name!r} + '\\n')\n" + source
+    )
+    return plugin_path
+
+
+def imported(plugins_path: Path) -> list:
+    log = plugins_path / "imports.log"
+    return log.read_text().split() if log.exists() else []
+
+
+class TestLazyHookDispatch:
+    """Declared hooks are dispatched without importing unrelated plugins."""
+
+    def test_hooks_py_imported_on_first_dispatch_only(self, tmp_path: Path):
+        plugins_path = tmp_path / "plugins"
+        write_plugin(
+            plugins_path, "lazy-scaffold", ["pre_scaffold"],
+            "def pre_scaffold(**kw): return {'from': 'lazy-scaffold'}\n",
+        )
+        write_plugin(
+            plugins_path, "lazy-error", ["on_error"], "def on_error(**kw): return {}\n"
+        )
+        service = PluginService()
+
+        plugins = service.load_plugins(plugins_path)
+        assert imported(plugins_path) == []
+        assert [p.hook_names for p in plugins] == [["on_error"], ["pre_scaffold"]]
+        assert service.get_hooks_for_type("pre_scaffold") == ["lazy-scaffold"]
+
+        results = service.execute_hook("pre_scaffold")
+        service.execute_hook("pre_scaffold")
+
+        assert [r.data for r in results] == [{"from": "lazy-scaffold"}]
+        assert imported(plugins_path) == ["lazy-scaffold"]
+        assert service.get_plugin("lazy-scaffold").import_ms is not None
+        assert not service.get_plugin("lazy-error").hooks_loaded
+
+    def test_declared_but_missing_hook_is_skipped(self, tmp_path: Path):
+        plugins_path = tmp_path / "plugins"
+        write_plugin(
+            plugins_path, "half-done", ["pre_scaffold", "post_scaffold"],
+            "def pre_scaffold(**kw): return {}\n",
+        )
+        service = PluginService()
+        service.load_plugins(plugins_path)
+
+        assert service.execute_hook("post_scaffold") == []
+        assert service.get_hooks_for_type("post_scaffold") == []
+
+    def test_import_error_disables_plugin_on_first_dispatch(self, tmp_path: Path):
+        plugins_path = tmp_path / "plugins"
+        write_plugin(plugins_path, "broken", ["on_command"], "raise RuntimeError('bad import')\n")
+        service = PluginService()
+        service.load_plugins(plugins_path)
+        assert service.get_plugin("broken").enabled is True
+
+        results = service.execute_hook("on_command")
+
+        assert len(results) == 1 and results[0].success is False
+        assert "bad import" in results[0].message
+        assert service.get_plugin("broken").enabled is False
+        assert service.execute_hook("on_command") == []
+
+    def test_undeclared_hooks_fall_back_to_eager_import(self, tmp_path: Path):
+        plugins_path = tmp_path / "plugins"
+        write_plugin(plugins_path, "legacy", [], "def on_command(**kw): return {}\n")
+
+        plugin = PluginLoader().load_plugin(plugins_path / "legacy")
+
+        assert plugin.hooks_loaded
+        assert plugin.hook_names == ["on_command"]
+        assert imported(plugins_path) == ["legacy"]
+
+    def test_dispatch_table_follows_registry_changes(self, service: PluginService):
+        first = PluginManifest(name="first", version="1.0.0", author="Test")
+        service.register_plugin(Plugin(manifest=first, hooks={"on_command": lambda: {}}))
+        assert len(service.execute_hook("on_command")) == 1
+
+        second = PluginManifest(name="second", version="1.0.0", author="Test")
+        service.register_plugin(Plugin(manifest=second, hooks={"on_command": lambda: {}}))
+        assert len(service.execute_hook("on_command")) == 2
+
+        service.unregister_plugin("first")
+        assert [r.plugin_name for r in service.execute_hook("on_command")] == ["second"]
+
+
+def sleeping_plugin(name: str, seconds: float, timeout: Optional[float] = None) -> Plugin:
+    manifest = PluginManifest(name=name, version="1.0.0", author="Test", timeout=timeout)
+
+    def on_command(**kwargs: Any) -> Dict[str, Any]:
+        time.sleep(seconds)
+        return {"slept": seconds}
+
+    return Plugin(manifest=manifest, hooks={"on_command": on_command})
+
+
+class TestHookTimeoutsAndConcurrency:
+    """Per-plugin timeouts and concurrent dispatch."""
+
+    def test_manifest_timeout_fails_slow_hook(self, service: PluginService):
+        service.register_plugin(sleeping_plugin("slow", 2.0, timeout=0.1))
+        service.register_plugin(sleeping_plugin("fast", 0.0, timeout=0.1))
+
+        start = time.perf_counter()
+        slow, fast = service.execute_hook("on_command")
+
+        assert time.perf_counter() - start < 1.0
+        assert slow.success is False and "timed out after 0.1s" in slow.message
+        assert fast.success is True
+
+    def test_default_timeout_applies_without_manifest_timeout(self):
+        service = PluginService(default_timeout=0.1)
+        service.register_plugin(sleeping_plugin("slow", 2.0))
+
+        assert service.execute_hook("on_command")[0].success is False
+
+    def test_concurrent_mode_overlaps_hooks(self, service: PluginService):
+        for index in range(3):
+            service.register_plugin(sleeping_plugin(f"sleeper-{index}", 0.3))
+
+        start = time.perf_counter()
+        results = service.execute_hook_concurrent("on_command")
+
+        assert time.perf_counter() - start < 0.75  # sequential takes at least 0.9s
+        assert [r.plugin_name for r in results] == ["sleeper-0", "sleeper-1", "sleeper-2"]
+        assert all(r.success for r in results)
+
+
+class TestHookStats:
+    """Per-hook latency counters."""
+
+    def test_counters_per_hook_and_plugin(self, service: PluginService):
+        service.register_plugin(sleeping_plugin("slow", 2.0, timeout=0.05))
+        service.register_plugin(sleeping_plugin("fast", 0.0))
+        service.register_hook("on_command", lambda **kw: {})
+
+        service.execute_hook("on_command")
+        service.execute_hook("on_command")
+
+        stats = service.hook_stats()["on_command"]
+        assert set(stats) == {"slow", "fast", "custom"}
+        assert (stats["slow"].calls, stats["slow"].timeouts, stats["slow"].failures) == (2, 2, 2)
+        assert stats["slow"].max_ms >= 50
+        assert (stats["fast"].calls, stats["fast"].failures) == (2, 0)
+        assert stats["fast"].avg_ms == stats["fast"].total_ms / 2
+
+    def test_save_merges_into_file(self, tmp_path: Path, service: PluginService):
+        stats_path = tmp_path / "plugin_stats.json"
+        service.register_plugin(sleeping_plugin("fast", 0.0))
+
+        service.execute_hook("on_command")
+        service.save_stats(stats_path)
+        service.execute_hook("on_command")
+        service.save_stats(stats_path)
+
+        assert service.hook_stats() == {}
+        assert PluginService.load_stats(stats_path)["on_command"]["fast"].calls == 2
+
+    def test_load_missing_or_corrupt_file(self, tmp_path: Path):
+        assert PluginService.load_stats(tmp_path / "missing.json") == {}
+        (tmp_path / "bad.json").write_text("[1, 2]")
+        assert PluginService.load_stats(tmp_path / "bad.json") == {}
+
+    def test_plugin_stats_command(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        from typer.testing import CliRunner
+
+        from tac_bootstrap.application import plugin_service
+        from tac_bootstrap.interfaces.cli import app
+
+        stats_path = tmp_path / "plugin_stats.json"
+        monkeypatch.setattr(plugin_service, "DEFAULT_STATS_PATH", stats_path)
+        service = PluginService()
+        service.register_plugin(sleeping_plugin("fast", 0.0))
+        service.execute_hook("on_command")
+        service.save_stats(stats_path)
+
+        result = CliRunner().invoke(app, ["plugin", "stats"], env={"COLUMNS": "200"})
+
+        assert result.exit_code == 0
+        assert "on_command" in result.stdout and "fast" in result.stdout
+
+
 # ============================================================================
 # TEST HOOK TYPE ENUM
 # ============================================================================
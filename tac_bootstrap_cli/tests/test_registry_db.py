@@ -0,0 +1,130 @@
+"""
+Tests for RegistryDatabase
+
+Covers WAL mode, versioned migrations, transactions, revision triggers and the
+one-time import of legacy JSON files.
+"""
+
+import json
+import sqlite3
+from pathlib import Path
+from typing import Any, Iterator, List
+
+import pytest
+
+from tac_bootstrap.infrastructure.registry_db import RegistryDatabase, revision_triggers
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+SCHEMA = [
+    """
+    CREATE TABLE notes (
+        id TEXT PRIMARY KEY,
+        body TEXT NOT NULL,
+        rev INTEGER NOT NULL DEFAULT 0
+    );
+    """
+    + revision_triggers("notes", "id"),
+]
+
+
+@pytest.fixture
+def db(tmp_path: Path) -> Iterator[RegistryDatabase]:
+    database = RegistryDatabase(tmp_path / "registry.db", SCHEMA)
+    yield database
+    database.close()
+
+
+# ============================================================================
+# CONNECTION AND MIGRATIONS
+# ============================================================================
+
+
+def test_database_is_created_lazily_in_wal_mode(db: RegistryDatabase) -> None:
+    assert not db.exists()
+    assert db.query_one("PRAGMA journal_mode")[0] == "wal"
+    assert db.exists()
+
+
+def test_migrations_are_applied_once(tmp_path: Path) -> None:
+    path = tmp_path / "registry.db"
+    first = RegistryDatabase(path, SCHEMA)
+    first.execute("INSERT INTO notes (id, body) VALUES ('a', 'x')")
+    first.close()
+
+    upgraded = RegistryDatabase(path, SCHEMA + ["ALTER TABLE notes ADD COLUMN pinned INTEGER"])
+    row = upgraded.query_one("SELECT body, pinned FROM notes WHERE id = 'a'")
+    assert (row["body"], row["pinned"]) == ("x", None)
+    assert upgraded.query_one("PRAGMA user_version")[0] == 2
+    upgraded.close()
+
+
+# ============================================================================
+# TRANSACTIONS AND REVISIONS
+# ============================================================================
+
+
+def test_transaction_rolls_back_on_error(db: RegistryDatabase) -> None:
+    with pytest.raises(RuntimeError):
+        with db.transaction() as connection:
+            connection.execute("INSERT INTO notes (id, body) VALUES ('a', 'x')")
+            raise RuntimeError("boom")
+    assert db.query("SELECT * FROM notes") == []
+    assert db.revision() == 0
+
+
+def test_nested_transactions_join_the_outer_one(db: RegistryDatabase) -> None:
+    with pytest.raises(sqlite3.IntegrityError):
+        with db.transaction() as outer:
+            outer.execute("INSERT INTO notes (id, body) VALUES ('a', 'x')")
+            with db.transaction() as inner:
+                inner.execute("INSERT INTO notes (id, body) VALUES ('a', 'y')")
+    assert db.query("SELECT * FROM notes") == []
+
+
+def test_revision_triggers_stamp_changed_rows(db: RegistryDatabase) -> None:
+    db.execute("INSERT INTO notes (id, body) VALUES ('a', 'x')")
+    db.execute("INSERT INTO notes (id, body) VALUES ('b', 'y')")
+    db.execute("UPDATE notes SET body = 'z' WHERE id = 'a'")
+    assert db.revision() == 3
+    assert [row["id"] for row in db.query("SELECT id FROM notes WHERE rev > 2")] == ["a"]
+
+    db.execute("DELETE FROM notes WHERE id = 'b'")
+    assert db.revision() == 4
+
+
+# ============================================================================
+# LEGACY IMPORT
+# ============================================================================
+
+
+def test_legacy_json_is_imported_once(db: RegistryDatabase, tmp_path: Path) -> None:
+    legacy = tmp_path / "notes.json"
+    legacy.write_text(json.dumps({"a": "x", "b": "y"}))
+    seen: List[Any] = []
+
+    def load(connection: sqlite3.Connection, data: Any) -> None:
+        seen.append(data)
+        for key, body in data.items():
+            connection.execute("INSERT INTO notes (id, body) VALUES (?, ?)", (key, body))
+
+    assert db.import_legacy_json(legacy, load)
+    assert not legacy.exists()
+    assert (tmp_path / "notes.json.migrated").is_file()
+
+    # A restored copy of the file is not imported a second time
+    legacy.write_text(json.dumps({"c": "z"}))
+    assert not db.import_legacy_json(legacy, load)
+    assert seen == [{"a": "x", "b": "y"}]
+    assert len(db.query("SELECT * FROM notes")) == 2
+
+
+def test_unreadable_legacy_json_is_set_aside(db: RegistryDatabase, tmp_path: Path) -> None:
+    legacy = tmp_path / "notes.json"
+    legacy.write_text("{not json")
+
+    assert db.import_legacy_json(legacy, lambda connection, data: None)
+    assert (tmp_path / "notes.json.migrated").read_text() == "{not json"
+    assert db.query("SELECT * FROM notes") == []
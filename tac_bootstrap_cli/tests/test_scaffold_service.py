@@ -712,6 +712,14 @@ class TestScaffoldServiceSharedInfrastructure:
         # Assert infrastructure files
         assert "src/shared/infrastructure/base_repository.py" in file_paths
         assert "src/shared/infrastructure/base_repository_async.py" in file_paths
+        assert "src/shared/infrastructure/pagination.py" in file_paths
+        assert "src/shared/infrastructure/counting.py" in file_paths
+        assert "src/shared/infrastructure/bulk.py" in file_paths
+        assert "src/shared/infrastructure/entity_cache.py" in file_paths
+        assert "src/shared/infrastructure/export.py" in file_paths
+        assert "src/shared/infrastructure/serialization.py" in file_paths
+        assert "src/shared/infrastructure/search.py" in file_paths
+        assert "src/shared/infrastructure/db_metrics.py" in file_paths
         assert "src/shared/infrastructure/database.py" in file_paths
         assert "src/shared/infrastructure/exceptions.py" in file_paths
         assert "src/shared/infrastructure/responses.py" in file_paths
@@ -719,6 +727,7 @@ class TestScaffoldServiceSharedInfrastructure:
 
         # Assert API files
         assert "src/shared/api/health.py" in file_paths
+        assert "scripts/bench_list_endpoint.py" in file_paths
 
         # All should use CREATE action
         shared_files = [f for f in plan.files if f.path.startswith("src/shared/")]
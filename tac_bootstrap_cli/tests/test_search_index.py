@@ -0,0 +1,175 @@
+"""
+Tests for SearchIndex
+
+Covers tokenization, BM25 ranking, trigram substring and fuzzy matching, facet
+filters, incremental updates and the on-disk copy of the index.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from tac_bootstrap.infrastructure.search_index import IndexDocument, SearchIndex, tokenize
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+
+def doc(name: str, description: str = "", tags=(), **facets) -> IndexDocument:
+    return IndexDocument(
+        fields={"name": name, "description": description, "tags": list(tags)},
+        facets={"tags": list(tags), **facets},
+    )
+
+
+CLI_DOC = doc("CLI Tool", "Typer command line tool with an API client", ["python"])
+
+
+@pytest.fixture
+def index() -> SearchIndex:
+    index = SearchIndex(field_weights={"name": 3.0, "tags": 2.0})
+    index.add("fastapi", doc("FastAPI Starter", "REST API with DDD", ["python", "api"]))
+    index.add("nextjs", doc("Next.js Starter", "React frontend", ["typescript", "react"]))
+    index.add("cli", CLI_DOC)
+    return index
+
+
+# ============================================================================
+# TEST QUERIES
+# ============================================================================
+
+
+class TestSearch:
+    """Test ranking and term matching."""
+
+    def test_tokenize(self):
+        assert tokenize("Next.js + FastAPI_v2, health-check") == [
+            "next",
+            "js",
+            "fastapi",
+            "v2",
+            "health",
+            "check",
+        ]
+
+    def test_field_weights_rank_name_matches_first(self, index: SearchIndex):
+        hits = index.search("api")
+
+        assert [doc_id for doc_id, _ in hits] == ["fastapi", "cli"]
+        assert hits[0][1] > hits[1][1] > 0
+
+    def test_substring_match_scores_below_exact(self):
+        index = SearchIndex()
+        index.add("exact", doc("Gateway API"))
+        index.add("substring", doc("Gateway FastAPI"))
+        index.add("other", doc("Gateway"))
+
+        assert [doc_id for doc_id, _ in index.search("api")] == ["exact", "substring"]
+        assert [doc_id for doc_id, _ in index.search("fast")] == ["substring"]
+
+    def test_fuzzy_match_for_typos(self, index: SearchIndex):
+        assert [doc_id for doc_id, _ in index.search("typscript")] == ["nextjs"]
+        assert index.search("kubernetes") == []
+
+    def test_match_all_requires_every_word(self, index: SearchIndex):
+        assert {doc_id for doc_id, _ in index.search("python react")} == {
+            "fastapi",
+            "cli",
+            "nextjs",
+        }
+        assert index.search("python react", match_all=True) == []
+        assert [d for d, _ in index.search("python tool", match_all=True)] == ["cli"]
+
+    def test_empty_query_returns_filtered_documents(self, index: SearchIndex):
+        assert index.search("") == [("cli", 0.0), ("fastapi", 0.0), ("nextjs", 0.0)]
+        assert index.search("", {"tags": ["Python"]}) == [("cli", 0.0), ("fastapi", 0.0)]
+
+
+class TestFacets:
+    """Test facet filters answered from posting lists."""
+
+    def test_values_are_ored_and_facets_anded(self, index: SearchIndex):
+        index.add("react-py", doc("Hybrid", "", ["python", "react"], owner=["me"]))
+
+        either = {d for d, _ in index.search("", {"tags": ["react", "api"]})}
+        both = [d for d, _ in index.search("", {"tags": ["react"], "owner": ["ME"]})]
+
+        assert either == {"fastapi", "nextjs", "react-py"}
+        assert both == ["react-py"]
+        assert index.search("", {"owner": ["nobody"]}) == []
+
+    def test_facet_values(self, index: SearchIndex):
+        index.add("flag", doc("Flagged", installed=[True]))
+
+        assert index.facet_values("tags") == ["api", "python", "react", "typescript"]
+        assert index.facet_values("installed") == ["true"]
+
+
+# ============================================================================
+# TEST UPDATES AND STORAGE
+# ============================================================================
+
+
+class TestUpdates:
+    """Test incremental indexing and persistence."""
+
+    def test_unchanged_document_is_not_reindexed(self, index: SearchIndex):
+        assert index.add("cli", CLI_DOC) is False
+        assert index.add("cli", doc("CLI Tool", "Rich output", ["python"])) is True
+
+        assert "cli" not in dict(index.search("typer"))
+        assert "cli" in dict(index.search("rich"))
+
+    def test_remove_drops_terms_and_facets(self, index: SearchIndex):
+        index.search("fast")  # builds the trigram index
+        assert index.remove("fastapi") is True
+        assert index.remove("fastapi") is False
+
+        assert index.search("fast") == []
+        assert index.search("ddd") == []
+        assert "api" not in index.facet_values("tags")
+        assert len(index) == 2
+
+    def test_sync_adds_updates_and_removes(self, index: SearchIndex):
+        documents = {"cli": CLI_DOC, "go": doc("Gin Service", "Go API", ["go"])}
+
+        assert index.sync(documents) is True
+        assert sorted(d for d, _ in index.search("")) == ["cli", "go"]
+        assert index.sync(documents) is False
+
+    def test_round_trip_through_disk(self, tmp_path: Path, index: SearchIndex):
+        path = tmp_path / "index" / "search-index.json"
+        stored = SearchIndex(path, index.field_weights)
+        stored.sync({"a": doc("Alpha API", "", ["x"])})
+        stored.save()
+
+        reloaded = SearchIndex(path, index.field_weights)
+
+        assert len(reloaded) == 1
+        assert reloaded.search("alp") == stored.search("alp")
+        assert reloaded.search("", {"tags": ["x"]}) == [("a", 0.0)]
+        assert reloaded.add("a", doc("Alpha API", "", ["x"])) is False
+        assert json.loads(path.read_text())["schema_version"] == 1
+
+    def test_corrupt_or_foreign_file_starts_empty(self, tmp_path: Path):
+        path = tmp_path / "search-index.json"
+        path.write_text("{not json")
+        assert len(SearchIndex(path)) == 0
+
+        path.write_text(json.dumps({"schema_version": 99, "documents": {"a": {}}}))
+        assert len(SearchIndex(path)) == 0
+
+    def test_save_only_writes_after_changes(self, tmp_path: Path):
+        path = tmp_path / "search-index.json"
+        index = SearchIndex(path)
+        index.save()
+        assert not path.exists()
+
+        index.add("a", doc("Alpha"))
+        index.save()
+        mtime = path.stat().st_mtime_ns
+        SearchIndex(path).save()
+
+        assert path.stat().st_mtime_ns == mtime
@@ -3,16 +3,21 @@
 Comprehensive unit tests for opt-in telemetry tracking including
 event tracking, error tracking, performance tracking, statistics
 aggregation, opt-in/opt-out, daily log rotation, data clearing,
-and configuration persistence.
+buffered writes, daily rollups with log compaction, and configuration
+persistence.
 """
 
+import fcntl
+import gc
+import gzip
 import json
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
-from tac_bootstrap.infrastructure.telemetry import TelemetryService
+from tac_bootstrap.infrastructure import telemetry as telemetry_module
+from tac_bootstrap.infrastructure.telemetry import DurationSketch, TelemetryService
 
 # ============================================================================
 # FIXTURES
@@ -124,6 +129,7 @@ class TestTelemetryEventTracking:
     def test_track_event_when_enabled(self, enabled_service: TelemetryService):
         """track_event should write event to daily log when enabled."""
         enabled_service.track_event("command_executed", {"command": "init"})
+        enabled_service.flush()
 
         # Find the log file
         log_files = list(enabled_service.storage_dir.glob("*.jsonl"))
@@ -150,6 +156,7 @@ class TestTelemetryEventTracking:
     def test_track_event_without_properties(self, enabled_service: TelemetryService):
         """track_event should work with just an event name."""
         enabled_service.track_event("startup")
+        enabled_service.flush()
 
         daily_logs = [
             f for f in enabled_service.storage_dir.glob("*.jsonl")
@@ -167,6 +174,7 @@ class TestTelemetryEventTracking:
         enabled_service.track_event("event_1")
         enabled_service.track_event("event_2")
         enabled_service.track_event("event_3")
+        enabled_service.flush()
 
         daily_logs = [
             f for f in enabled_service.storage_dir.glob("*.jsonl")
@@ -187,6 +195,7 @@ class TestTelemetryEventTracking:
         from datetime import datetime
 
         enabled_service.track_event("test_event")
+        enabled_service.flush()
 
         daily_logs = [
             f for f in enabled_service.storage_dir.glob("*.jsonl")
@@ -215,6 +224,8 @@ class TestTelemetryErrorTracking:
         except ValueError as e:
             enabled_service.track_error(e, {"operation": "test_op"})
 
+        enabled_service.flush()
+
         error_file = enabled_service.storage_dir / "errors.jsonl"
         assert error_file.exists()
 
@@ -232,6 +243,8 @@ class TestTelemetryErrorTracking:
         except RuntimeError as e:
             enabled_service.track_error(e)
 
+        enabled_service.flush()
+
         error_file = enabled_service.storage_dir / "errors.jsonl"
         content = error_file.read_text()
 
@@ -247,6 +260,8 @@ class TestTelemetryErrorTracking:
         except FileNotFoundError as e:
             enabled_service.track_error(e)
 
+        enabled_service.flush()
+
         error_file = enabled_service.storage_dir / "errors.jsonl"
         content = error_file.read_text().strip()
         event = json.loads(content)
@@ -274,6 +289,8 @@ class TestTelemetryErrorTracking:
         except TypeError as e:
             enabled_service.track_error(e)
 
+        enabled_service.flush()
+
         error_file = enabled_service.storage_dir / "errors.jsonl"
         content = error_file.read_text().strip()
         event = json.loads(content)
@@ -291,6 +308,7 @@ class TestTelemetryPerformanceTracking:
     def test_track_performance_when_enabled(self, enabled_service: TelemetryService):
         """track_performance should write to daily log when enabled."""
         enabled_service.track_performance("template_rendering", 567.89)
+        enabled_service.flush()
 
         daily_logs = [
             f for f in enabled_service.storage_dir.glob("*.jsonl")
@@ -315,6 +333,7 @@ class TestTelemetryPerformanceTracking:
     def test_track_performance_rounds_duration(self, enabled_service: TelemetryService):
         """track_performance should round duration to 2 decimal places."""
         enabled_service.track_performance("scaffold_creation", 2345.6789)
+        enabled_service.flush()
 
         daily_logs = [
             f for f in enabled_service.storage_dir.glob("*.jsonl")
@@ -495,6 +514,7 @@ class TestTelemetryFileStorage:
         from datetime import datetime, timezone
 
         enabled_service.track_event("test")
+        enabled_service.flush()
 
         today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
         expected_file = enabled_service.storage_dir / f"{today}.jsonl"
@@ -504,6 +524,7 @@ class TestTelemetryFileStorage:
         """Each line in log file should be valid JSON."""
         enabled_service.track_event("event_1", {"key": "value1"})
         enabled_service.track_event("event_2", {"key": "value2"})
+        enabled_service.flush()
 
         daily_logs = [
             f for f in enabled_service.storage_dir.glob("*.jsonl")
@@ -523,6 +544,8 @@ class TestTelemetryFileStorage:
         except ValueError as e:
             enabled_service.track_error(e)
 
+        enabled_service.flush()
+
         error_file = enabled_service.storage_dir / "errors.jsonl"
         assert error_file.exists()
 
@@ -545,6 +568,7 @@ class TestTelemetryFileStorage:
             enabled_service.track_error(e)
 
         enabled_service.track_performance("test_op", 100.0)
+        enabled_service.flush()
 
         # Verify daily log has 2 entries (event + performance)
         daily_logs = [
@@ -579,6 +603,8 @@ class TestTelemetryDataClearing:
         except ValueError as e:
             enabled_service.track_error(e)
 
+        enabled_service.flush()
+
         # Verify files exist
         log_files = list(enabled_service.storage_dir.glob("*.jsonl"))
         assert len(log_files) > 0
@@ -607,6 +633,8 @@ class TestTelemetryDataClearing:
         except ValueError as e:
             enabled_service.track_error(e)
 
+        enabled_service.flush()
+
         count = enabled_service.clear_data()
         # At least 2 files: daily log + errors.jsonl
         assert count >= 2
@@ -630,6 +658,222 @@ class TestTelemetryDataClearing:
         assert config_file.read_text().strip() == "enabled"
 
 
+# ============================================================================
+# TEST BUFFERED WRITES
+# ============================================================================
+
+
+class TestTelemetryBuffering:
+    """Tests for the in-process event buffer."""
+
+    def test_events_are_buffered_until_flush(self, enabled_service: TelemetryService):
+        """Tracked events should not touch disk until flushed."""
+        enabled_service.track_event("event_1")
+        enabled_service.track_performance("op", 10.0)
+
+        assert list(enabled_service.storage_dir.glob("*.jsonl")) == []
+
+        enabled_service.flush()
+        daily_logs = list(enabled_service.storage_dir.glob("*.jsonl"))
+        assert len(daily_logs) == 1
+        assert len(daily_logs[0].read_text().splitlines()) == 2
+
+    def test_full_buffer_flushes(self, telemetry_home: Path):
+        """Reaching buffer_size should flush without an explicit call."""
+        with patch.object(Path, "home", return_value=telemetry_home):
+            service = TelemetryService(enabled=True, buffer_size=2)
+
+        service.track_event("event_1")
+        assert list(service.storage_dir.glob("*.jsonl")) == []
+        service.track_event("event_2")
+
+        daily_logs = list(service.storage_dir.glob("*.jsonl"))
+        assert len(daily_logs[0].read_text().splitlines()) == 2
+
+    def test_exit_hook_flushes_live_services(self, enabled_service: TelemetryService):
+        """The finalizer should run at interpreter exit and flush buffered events."""
+        enabled_service.track_event("event_1")
+
+        assert enabled_service._finalizer.atexit
+        enabled_service._finalizer()
+
+        assert len(list(enabled_service.storage_dir.glob("*.jsonl"))) == 1
+
+    def test_collected_service_flushes_buffer(self, telemetry_home: Path):
+        """Dropping the last reference should write buffered events, not lose them."""
+        with patch.object(Path, "home", return_value=telemetry_home):
+            service = TelemetryService(enabled=True)
+        storage_dir = service.storage_dir
+        service.track_event("event_1")
+
+        del service
+        gc.collect()
+
+        daily_logs = list(storage_dir.glob("*.jsonl"))
+        assert len(daily_logs) == 1
+        assert json.loads(daily_logs[0].read_text())["event"] == "event_1"
+
+    def test_statistics_include_buffered_events(self, enabled_service: TelemetryService):
+        """get_statistics should flush before reading."""
+        enabled_service.track_event("command_executed", {"command": "init"})
+
+        assert enabled_service.get_statistics()["commands"] == {"init": 1}
+
+    def test_clear_data_discards_buffer(self, enabled_service: TelemetryService):
+        """Buffered events should not survive clear_data."""
+        enabled_service.track_event("event_1")
+        enabled_service.clear_data()
+        enabled_service.flush()
+
+        assert list(enabled_service.storage_dir.glob("*.jsonl")) == []
+
+
+# ============================================================================
+# TEST ROLLUPS AND COMPACTION
+# ============================================================================
+
+
+def write_day(storage_dir: Path, day: str, events: list) -> Path:
+    """Write raw events to a daily log as if flushed on that day."""
+    log_file = storage_dir / f"{day}.jsonl"
+    with open(log_file, "a", encoding="utf-8") as f:
+        for event in events:
+            f.write(json.dumps({"timestamp": f"{day}T12:00:00+00:00", **event}) + "\n")
+    return log_file
+
+
+class TestTelemetryRollup:
+    """Tests for incremental daily rollups and compressed logs."""
+
+    def test_statistics_fold_only_new_lines(self, enabled_service: TelemetryService):
+        """Each query should parse only log lines written since the previous one."""
+        write_day(enabled_service.storage_dir, "2026-01-01", [{"event": "a"}, {"event": "b"}])
+        assert enabled_service.get_statistics()["total_events"] == 2
+
+        write_day(enabled_service.storage_dir, "2026-01-01", [{"event": "c"}])
+        assert enabled_service.compact(compress=False)["events_rolled_up"] == 1
+        assert enabled_service.get_statistics()["total_events"] == 3
+
+        rollup = json.loads((enabled_service.storage_dir / "rollup.json").read_text())
+        assert rollup["days"]["2026-01-01"]["events"] == 3
+
+    def test_compact_compresses_past_days(self, enabled_service: TelemetryService):
+        """Fully rolled-up logs before today should be gzipped and stats preserved."""
+        write_day(
+            enabled_service.storage_dir,
+            "2026-01-01",
+            [
+                {"event": "command_executed", "command": "init", "duration_ms": 100},
+                {"event": "performance", "operation": "op", "duration_ms": 300},
+            ],
+        )
+        enabled_service.track_event("command_executed", {"command": "init"})
+
+        result = enabled_service.compact()
+        stats = enabled_service.get_statistics()
+
+        assert result == {"events_rolled_up": 3, "files_compressed": 1}
+        assert (enabled_service.storage_dir / "2026-01-01.jsonl.gz").exists()
+        assert not (enabled_service.storage_dir / "2026-01-01.jsonl").exists()
+        assert stats["total_events"] == 3
+        assert stats["events_today"] == 1
+        assert stats["commands"] == {"init": 2}
+        assert stats["avg_duration_ms"] == 200.0
+        assert stats["log_files"] == 2
+
+    def test_late_events_for_compressed_day(self, enabled_service: TelemetryService):
+        """Events flushed to an already compressed day should be added, not re-counted."""
+        write_day(enabled_service.storage_dir, "2026-01-01", [{"event": "a"}])
+        enabled_service.compact()
+        write_day(enabled_service.storage_dir, "2026-01-01", [{"event": "b"}])
+        enabled_service.compact()
+
+        assert enabled_service.get_statistics()["total_events"] == 2
+        archive = enabled_service.storage_dir / "2026-01-01.jsonl.gz"
+        with gzip.open(archive, "rt") as f:
+            assert len(f.read().splitlines()) == 2
+
+    def test_corrupt_rollup_is_rebuilt_from_archives(self, enabled_service: TelemetryService):
+        """A lost rollup should be rebuilt from compressed and raw logs."""
+        write_day(enabled_service.storage_dir, "2026-01-01", [{"event": "a"}])
+        enabled_service.compact()
+        try:
+            raise ValueError("test")
+        except ValueError as e:
+            enabled_service.track_error(e)
+        enabled_service.track_event("event_today")
+        enabled_service.flush()
+        (enabled_service.storage_dir / "rollup.json").write_text("{not json")
+
+        stats = enabled_service.get_statistics()
+
+        assert stats["total_events"] == 2
+        assert stats["errors"] == {"ValueError": 1}
+
+    def test_partial_trailing_line_is_left_for_later(self, enabled_service: TelemetryService):
+        """A line still being written should not be folded until complete."""
+        log_file = write_day(enabled_service.storage_dir, "2026-01-01", [{"event": "a"}])
+        with open(log_file, "a", encoding="utf-8") as f:
+            f.write('{"event": "b"')
+
+        assert enabled_service.get_statistics()["total_events"] == 1
+
+        with open(log_file, "a", encoding="utf-8") as f:
+            f.write("}\n")
+        assert enabled_service.get_statistics()["total_events"] == 2
+
+    def test_rollup_update_holds_the_lock(self, enabled_service: TelemetryService):
+        """Saving the rollup should happen while the lock file is held exclusively."""
+        write_day(enabled_service.storage_dir, "2026-01-01", [{"event": "a"}])
+        lock_path = enabled_service.storage_dir / telemetry_module.ROLLUP_LOCK_FILE
+        save_rollup = enabled_service._save_rollup
+        held = []
+
+        def checked_save(rollup: dict) -> None:
+            with open(lock_path, "ab") as other:
+                try:
+                    fcntl.flock(other.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    held.append(True)
+            save_rollup(rollup)
+
+        with patch.object(enabled_service, "_save_rollup", side_effect=checked_save):
+            enabled_service.compact()
+
+        assert held == [True, True]
+
+    def test_compact_when_disabled(self, disabled_service: TelemetryService):
+        """compact should be a no-op when disabled."""
+        assert disabled_service.compact() == {"events_rolled_up": 0, "files_compressed": 0}
+
+
+class TestDurationSketch:
+    """Tests for the mergeable duration sketch."""
+
+    def test_quantiles_within_relative_error(self):
+        sketch = DurationSketch()
+        for value in range(1, 1001):
+            sketch.add(float(value))
+
+        assert sketch.mean == 500.5
+        assert abs(sketch.quantile(0.5) - 500) / 500 < 0.02
+        assert abs(sketch.quantile(0.95) - 950) / 950 < 0.02
+        assert (sketch.quantile(0.0), sketch.quantile(1.0)) == (1.0, 1000.0)
+
+    def test_merge_and_round_trip(self):
+        left, right = DurationSketch(), DurationSketch()
+        for value in (0.0, 5.0, 10.0):
+            left.add(value)
+        right.add(20.0)
+
+        merged = DurationSketch.from_dict(json.loads(json.dumps(left.to_dict())))
+        merged.merge(right)
+
+        assert (merged.count, merged.total, merged.min, merged.max) == (4, 35.0, 0.0, 20.0)
+        assert merged.zeros == 1
+        assert DurationSketch().quantile(0.5) == 0.0
+
+
 # ============================================================================
 # TEST CLI INTEGRATION
 # ============================================================================
@@ -694,6 +938,27 @@ class TestTelemetryCLIIntegration:
         assert result.exit_code == 0
         assert "cleared" in result.stdout.lower()
 
+    def test_telemetry_compact_command(self, telemetry_home: Path):
+        """CLI telemetry compact command should report rolled-up events."""
+        from typer.testing import CliRunner
+
+        from tac_bootstrap.interfaces.cli import app
+
+        runner = CliRunner()
+        storage_dir = telemetry_home / ".tac-bootstrap" / "telemetry"
+        storage_dir.mkdir(parents=True)
+        write_day(storage_dir, "2026-01-01", [{"event": "a"}])
+
+        with patch.object(Path, "home", return_value=telemetry_home):
+            result = runner.invoke(app, ["telemetry", "compact"])
+            assert "disabled" in result.stdout.lower()
+            runner.invoke(app, ["telemetry", "enable"])
+            result = runner.invoke(app, ["telemetry", "compact"])
+
+        assert result.exit_code == 0
+        assert "Rolled up 1 new event(s)" in result.stdout
+        assert (storage_dir / "2026-01-01.jsonl.gz").exists()
+
     def test_telemetry_invalid_action(self, telemetry_home: Path):
         """CLI telemetry with invalid action should fail."""
         from typer.testing import CliRunner
@@ -758,6 +1023,7 @@ class TestTelemetryScaffoldIntegration:
 
         service = ScaffoldService(telemetry=telemetry)
         service.build_plan(config)
+        telemetry.flush()
 
         # Check that performance event was logged
         daily_logs = [
@@ -812,6 +1078,7 @@ class TestTelemetryScaffoldIntegration:
         result = service.apply_plan(plan, output_dir, config)
 
         assert result.success
+        telemetry.flush()
 
         # Check that scaffold_applied event was logged
         daily_logs = [
@@ -849,6 +1116,7 @@ class TestTelemetryPrivacy:
             "command": "init",
             "duration_ms": 1234,
         })
+        enabled_service.flush()
 
         daily_logs = [
             f for f in enabled_service.storage_dir.glob("*.jsonl")
@@ -868,6 +1136,8 @@ class TestTelemetryPrivacy:
         except IOError as e:
             enabled_service.track_error(e)
 
+        enabled_service.flush()
+
         error_file = enabled_service.storage_dir / "errors.jsonl"
         content = error_file.read_text()
 
@@ -883,6 +1153,8 @@ class TestTelemetryPrivacy:
         except PermissionError as e:
             enabled_service.track_error(e)
 
+        enabled_service.flush()
+
         error_file = enabled_service.storage_dir / "errors.jsonl"
         event = json.loads(error_file.read_text().strip())
 
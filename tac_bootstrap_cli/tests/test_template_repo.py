@@ -454,6 +454,40 @@ class TestAutoescape:
         assert "&lt;/script&gt;" in result
 
 
+# ============================================================================
+# TEST PRECOMPILE
+# ============================================================================
+
+
+class TestPrecompile:
+    """Test compiling templates up front."""
+
+    def test_precompile_caches_every_template(self, repo: TemplateRepository):
+        """All .j2 templates are compiled into the environment cache."""
+        assert repo.precompile() == 6
+        assert len(repo.env.cache) == 6
+
+    def test_precompile_skips_broken_templates(
+        self, temp_templates_dir: Path, sample_config: TACConfig
+    ):
+        """A template with a syntax error is skipped, and render still reports it."""
+        (temp_templates_dir / "broken.txt.j2").write_text("{# never closed")
+        repo = TemplateRepository(templates_dir=temp_templates_dir)
+
+        assert repo.precompile() == 6
+        with pytest.raises(TemplateRenderError):
+            repo.render("broken.txt.j2", sample_config)
+
+    def test_cache_holds_more_than_default_lru_size(self, tmp_path: Path):
+        """Compiled templates are never evicted, even past Jinja's 400-entry default."""
+        for index in range(450):
+            (tmp_path / f"t{index}.txt.j2").write_text(str(index))
+        repo = TemplateRepository(templates_dir=tmp_path)
+
+        assert repo.precompile() == 450
+        assert len(repo.env.cache) == 450
+
+
 # ============================================================================
 # TEST ERROR MESSAGES
 # ============================================================================
@@ -6,6 +6,7 @@ template store service, search, install, rating, and edge cases.
 
 import json
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict
 
@@ -227,6 +228,92 @@ class TestTemplateStore:
         downloads = [r.downloads for r in results]
         assert downloads == sorted(downloads, reverse=True)
 
+    def test_search_ranks_and_tolerates_typos(self, populated_store: TemplateStore):
+        """Name matches rank first; misspelled words still match by trigrams."""
+        assert [r.id for r in populated_store.search("jwt")][0] == "auth/jwt-template"
+        assert [r.id for r in populated_store.search("fastpi")] == ["api/rest-starter"]
+        assert populated_store.search("react python") == []  # every word must match
+
+    def test_search_installed_filter_follows_install(
+        self, populated_store: TemplateStore
+    ):
+        """Installing updates the installed facet of the search index."""
+        assert populated_store.search(filters={"installed": True}) == []
+
+        populated_store.install("frontend/react-app")
+
+        installed = populated_store.search(filters={"installed": True})
+        assert [t.id for t in installed] == ["frontend/react-app"]
+
+    def test_search_index_catches_up_with_other_writers(
+        self, store_dir: Path, populated_store: TemplateStore
+    ):
+        """The persisted index picks up changes made through another store instance."""
+        assert [t.id for t in populated_store.search("jwt")] == ["auth/jwt-template"]
+        assert (store_dir / "search-index.json").is_file()
+
+        other = TemplateStore(store_dir=store_dir)
+        react = other.get_metadata("frontend/react-app")
+        other.add_template(TemplateMetadata(**{**react, "description": "React with GraphQL"}))
+        other.remove_template("auth/jwt-template")
+
+        assert [t.id for t in populated_store.search("graphql")] == ["frontend/react-app"]
+        assert populated_store.search("jwt") == []
+        assert [t.id for t in TemplateStore(store_dir=store_dir).search("graphql")] == [
+            "frontend/react-app"
+        ]
+
+    def test_legacy_registry_json_is_imported_once(self, store_dir: Path):
+        """An existing registry.json is migrated into SQLite and kept as a backup."""
+        store_dir.mkdir(parents=True)
+        legacy = {
+            "a/one": {"id": "a/one", "name": "One", "tags": ["Python"], "downloads": 3},
+            "a/bad": {"id": "a/bad", "name": "Bad", "rating": 99},
+        }
+        (store_dir / "registry.json").write_text(json.dumps(legacy))
+
+        store = TemplateStore(store_dir=store_dir)
+
+        assert store.template_count == 1
+        assert store.get_metadata("a/one")["downloads"] == 3
+        assert [t.id for t in store.search(filters={"tags": ["python"]})] == ["a/one"]
+        assert not (store_dir / "registry.json").exists()
+        assert (store_dir / "registry.json.migrated").is_file()
+
+        (store_dir / "registry.json.migrated").rename(store_dir / "registry.json")
+        assert TemplateStore(store_dir=store_dir).template_count == 1
+
+    def test_concurrent_ratings_are_not_lost(
+        self, store_dir: Path, sample_template: TemplateMetadata
+    ):
+        """Ratings from separate store instances on several threads all count."""
+        TemplateStore(store_dir=store_dir).add_template(sample_template)
+
+        def rate_many(_: int) -> None:
+            store = TemplateStore(store_dir=store_dir)
+            for _ in range(10):
+                store.rate("test/my-template", 4)
+                store.install("test/my-template")
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(rate_many, range(4)))
+
+        metadata = TemplateStore(store_dir=store_dir).get_metadata("test/my-template")
+        assert metadata["rating_count"] == 40
+        assert metadata["rating"] == 4.0
+        assert metadata["downloads"] == 40
+
+    def test_add_template_replaces_existing(
+        self, store: TemplateStore, sample_template: TemplateMetadata
+    ):
+        """Adding an existing ID updates it in place, including its tags."""
+        store.add_template(sample_template)
+        store.add_template(sample_template.model_copy(update={"tags": ["go"]}))
+
+        assert store.template_count == 1
+        assert store.search(filters={"tags": ["python"]}) == []
+        assert [t.id for t in store.search(filters={"tags": ["GO"]})] == ["test/my-template"]
+
     def test_install(self, store: TemplateStore, sample_template: TemplateMetadata):
         """Install should mark template as installed."""
         store.add_template(sample_template)
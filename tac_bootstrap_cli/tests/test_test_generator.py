@@ -4,11 +4,15 @@ Comprehensive test suite covering test scaffolding generation for
 unit, integration, E2E, and load tests, plus coverage config and CI workflows.
 """
 
+import importlib.util
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 
 import pytest
 
-from tac_bootstrap.application.test_generator import TestGenerator
+from tac_bootstrap.application.test_generator import TestGenerator, discover_load_scenarios
 
 
 # ============================================================================
@@ -193,11 +197,58 @@ class TestE2ETestGeneration:
 class TestLoadTestGeneration:
     """Tests for load test scaffolding."""
 
+    ROUTES = (
+        '''from fastapi import APIRouter, Depends, Query
+
+router = APIRouter(prefix="/products", tags=["Products"])
+
+
+@router.get("/search")
+async def search_products(
+    q: str = Query(..., min_length=1),
+    limit: int = Query(20),
+    current_user=Depends(get_current_user),
+):
+    pass
+
+
+@router.get("/export")
+async def export_products():
+    pass
+
+
+@router.get("/{id}")
+async def get_product(id: str):
+    pass
+
+
+@router.get("/")
+async def list_products(page: int = Query(1), service=Depends(get_service)):
+    pass
+
+
+@router.post("/")
+async def create_product(data: dict):
+    pass
+'''
+    )
+
+    @staticmethod
+    def _load_module(path: Path):
+        spec = importlib.util.spec_from_file_location("generated_load_test", path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+
     def test_generate_load_tests(self, test_gen: TestGenerator):
-        """Load tests should reference Locust and include standalone option."""
+        """Load tests are an asyncio harness with open and closed loop modes."""
         content = test_gen.generate_load_tests()
-        assert "locust" in content.lower() or "Locust" in content
-        assert "run_simple_load_test" in content
+        assert "import asyncio" in content
+        assert "run_simple_load_test" not in content
+        assert "def closed_loop" in content
+        assert "def open_loop" in content
+        assert '"path": "/health"' in content
+        compile(content, "test_load.py", "exec")
 
     def test_load_tests_to_file(self, test_gen: TestGenerator, project_dir: Path):
         """Should write load test files."""
@@ -208,10 +259,116 @@ class TestLoadTestGeneration:
         assert (load_dir / "test_load.py").exists()
 
     def test_load_tests_has_metrics(self, test_gen: TestGenerator):
-        """Load tests should track performance metrics."""
+        """Load tests should report tail latencies and throughput."""
         content = test_gen.generate_load_tests()
-        assert "avg_time" in content
-        assert "requests_per_second" in content
+        assert "p99_9" in content
+        assert "throughput_rps" in content
+        assert "--compare" in content
+
+    def test_discover_scenarios_from_routes(self, project_dir: Path):
+        """GET routes without path parameters become scenarios."""
+        routes = project_dir / "src" / "catalog" / "api" / "product_routes.py"
+        routes.parent.mkdir(parents=True)
+        routes.write_text(self.ROUTES)
+        ignored = project_dir / ".venv" / "lib" / "other_routes.py"
+        ignored.parent.mkdir(parents=True)
+        ignored.write_text(self.ROUTES)
+
+        scenarios = {s["name"]: s for s in discover_load_scenarios(project_dir)}
+
+        assert set(scenarios) == {"health", "search_products", "list_products"}
+        assert scenarios["search_products"]["path"] == "/products/search"
+        assert scenarios["search_products"]["query"] == {"q": "test"}
+        assert scenarios["search_products"]["authorized"] is True
+        assert scenarios["list_products"]["path"] == "/products/"
+        assert scenarios["list_products"]["weight"] > scenarios["health"]["weight"]
+
+    def test_histogram_percentiles(self, test_gen: TestGenerator, project_dir: Path):
+        """Percentiles are within 0.1% of the recorded latencies."""
+        test_gen.generate_load_tests(project_path=project_dir)
+        module = self._load_module(project_dir / "tests" / "load" / "test_load.py")
+
+        histogram = module.LatencyHistogram()
+        for millis in range(1, 1001):
+            histogram.record(millis / 1000)
+        summary = histogram.summary()
+
+        assert summary["p50"] == pytest.approx(500, rel=0.001)
+        assert summary["p99"] == pytest.approx(990, rel=0.001)
+        assert summary["p99_9"] == pytest.approx(999, rel=0.001)
+        assert summary["max"] == 1000
+
+    def test_compare_reports_flags_regressions(
+        self, test_gen: TestGenerator, project_dir: Path
+    ):
+        """p99 and error-rate regressions past the threshold are reported."""
+        test_gen.generate_load_tests(project_path=project_dir)
+        module = self._load_module(project_dir / "tests" / "load" / "test_load.py")
+
+        def report(p99: float, failed: int) -> dict:
+            entry = {
+                "requests": 100,
+                "failed": failed,
+                "throughput_rps": 50.0,
+                "latency_ms": {"p99": p99},
+            }
+            return {"config": {"mode": "closed"}, "total": entry, "scenarios": {"health": entry}}
+
+        assert module.compare_reports(report(10.0, 0), report(10.5, 0), 10.0) == []
+        regressions = module.compare_reports(report(10.0, 0), report(20.0, 20), 10.0)
+        assert any("health: p99" in message for message in regressions)
+        assert any("error rate" in message for message in regressions)
+
+    def test_harness_runs_against_local_server(
+        self, test_gen: TestGenerator, project_dir: Path
+    ):
+        """A short closed-loop run against a local HTTP server produces a JSON report."""
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                body = b'{"status": "ok"}'
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            test_gen.generate_load_tests(project_path=project_dir)
+            module = self._load_module(project_dir / "tests" / "load" / "test_load.py")
+            output = project_dir / "load.json"
+            exit_code = module.main(
+                [
+                    "--base-url",
+                    f"http://127.0.0.1:{server.server_port}",
+                    "--duration",
+                    "0.3",
+                    "--warmup",
+                    "0",
+                    "--concurrency",
+                    "2",
+                    "--output",
+                    str(output),
+                ]
+            )
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert exit_code == 0
+        report = json.loads(output.read_text())
+        assert report["total"]["requests"] > 0
+        assert report["total"]["failed"] == 0
+        assert report["scenarios"]["health"]["status_codes"] == {
+            "200": report["scenarios"]["health"]["requests"]
+        }
 
 
 # ============================================================================
@@ -0,0 +1,253 @@
+"""
+Tests for ToolchainProbe
+
+Covers concurrent probing, the on-disk cache (hits, binary changes, TTL, corrupt
+files) and ValidationService using a toolchain probe. Tools are fake shell scripts
+on a temporary PATH.
+"""
+
+import json
+import os
+import shutil
+import sys
+import time
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from tac_bootstrap.application.validation_service import ValidationService
+from tac_bootstrap.domain.models import (
+    ClaudeConfig,
+    ClaudeSettings,
+    CommandsSpec,
+    Language,
+    PackageManager,
+    ProjectSpec,
+    TACConfig,
+)
+from tac_bootstrap.infrastructure.toolchain_probe import ToolchainProbe, ToolProbe
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="uses shell script tools")
+
+# Resolved before tests replace PATH with a directory of fake tools
+SLEEP = shutil.which("sleep") or "sleep"
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+
+@pytest.fixture
+def bin_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Empty directory that is the only entry on PATH."""
+    directory = tmp_path / "bin"
+    directory.mkdir()
+    monkeypatch.setenv("PATH", str(directory))
+    return directory
+
+
+@pytest.fixture
+def cache_path(tmp_path: Path) -> Path:
+    return tmp_path / "cache" / "toolchain.json"
+
+
+def make_tool(bin_dir: Path, name: str, output: str, delay: float = 0.0) -> Path:
+    """Create a fake tool that logs each call and prints output for --version."""
+    script = bin_dir / name
+    log = bin_dir / f"{name}.calls"
+    script.write_text(
+        "#!/bin/sh\n"
+        f"echo called >> '{log}'\n"
+        f"{SLEEP} {delay}\n"
+        f"echo '{output}'\n"
+    )
+    script.chmod(0o755)
+    return script
+
+
+def calls(bin_dir: Path, name: str) -> int:
+    log = bin_dir / f"{name}.calls"
+    return len(log.read_text().splitlines()) if log.exists() else 0
+
+
+# ============================================================================
+# TEST PROBING
+# ============================================================================
+
+
+class TestProbe:
+    """Test detection and version parsing."""
+
+    def test_detects_versions(self, bin_dir, cache_path):
+        make_tool(bin_dir, "git", "git version 2.39.1")
+        make_tool(bin_dir, "python3", "Python 3.12.1")
+
+        probes = ToolchainProbe(cache_path).probe(["git", "python", "uv"])
+
+        assert probes["git"] == ToolProbe(
+            tool="git", installed=True, path=str(bin_dir / "git"), version="2.39.1"
+        )
+        assert probes["python"].version == "3.12.1"
+        assert probes["uv"] == ToolProbe(tool="uv", installed=False)
+
+    def test_python_falls_back_to_python(self, bin_dir, cache_path):
+        make_tool(bin_dir, "python", "Python 3.11.4")
+
+        probes = ToolchainProbe(cache_path).probe(["python"])
+
+        assert probes["python"].path == str(bin_dir / "python")
+        assert probes["python"].version == "3.11.4"
+
+    def test_python_falls_back_when_python3_probe_fails(self, bin_dir, cache_path):
+        broken = bin_dir / "python3"
+        broken.write_text(f"#!/bin/sh\necho called >> '{bin_dir / 'python3.calls'}'\nexit 1\n")
+        broken.chmod(0o755)
+        make_tool(bin_dir, "python", "Python 3.11.4")
+
+        probe = ToolchainProbe(cache_path).probe(["python"])["python"]
+        assert (probe.path, probe.version) == (str(bin_dir / "python"), "3.11.4")
+
+        cached = ToolchainProbe(cache_path).probe(["python"])["python"]
+        assert (cached.path, cached.version, cached.cached) == (probe.path, "3.11.4", True)
+        assert calls(bin_dir, "python3") == 1
+        assert calls(bin_dir, "python") == 1
+
+    def test_unparseable_version(self, bin_dir, cache_path):
+        make_tool(bin_dir, "gh", "no version here")
+
+        probe = ToolchainProbe(cache_path).probe(["gh"])["gh"]
+
+        assert probe.installed is True
+        assert probe.version is None
+
+    def test_probes_run_concurrently(self, bin_dir, cache_path):
+        for name in ("git", "uv", "gh"):
+            make_tool(bin_dir, name, f"{name} 1.0.0", delay=0.5)
+
+        start = time.perf_counter()
+        probes = ToolchainProbe(cache_path).probe(["git", "uv", "gh"])
+        elapsed = time.perf_counter() - start
+
+        assert all(probe.version == "1.0.0" for probe in probes.values())
+        assert elapsed < 1.2  # sequential would take at least 1.5s
+
+
+# ============================================================================
+# TEST CACHE
+# ============================================================================
+
+
+class TestCache:
+    """Test the on-disk probe cache."""
+
+    def test_second_probe_uses_cache(self, bin_dir, cache_path):
+        make_tool(bin_dir, "git", "git version 2.39.1")
+
+        first = ToolchainProbe(cache_path).probe(["git"])["git"]
+        second = ToolchainProbe(cache_path).probe(["git"])["git"]
+
+        assert first.cached is False
+        assert second.cached is True
+        assert second.version == "2.39.1"
+        assert calls(bin_dir, "git") == 1
+        assert str(bin_dir / "git") in json.loads(cache_path.read_text())["binaries"]
+
+    def test_changed_binary_is_probed_again(self, bin_dir, cache_path):
+        make_tool(bin_dir, "git", "git version 2.39.1")
+        ToolchainProbe(cache_path).probe(["git"])
+
+        script = make_tool(bin_dir, "git", "git version 2.45.0 (upgraded)")
+        os.utime(script, ns=(time.time_ns(), time.time_ns() + 1_000_000_000))
+        probe = ToolchainProbe(cache_path).probe(["git"])["git"]
+
+        assert probe.cached is False
+        assert probe.version == "2.45.0"
+
+    def test_expired_entry_is_probed_again(self, bin_dir, cache_path):
+        make_tool(bin_dir, "git", "git version 2.39.1")
+        ToolchainProbe(cache_path).probe(["git"])
+
+        probe = ToolchainProbe(cache_path, ttl_seconds=-1).probe(["git"])["git"]
+
+        assert probe.cached is False
+        assert calls(bin_dir, "git") == 2
+
+    def test_refresh_and_clear(self, bin_dir, cache_path):
+        make_tool(bin_dir, "git", "git version 2.39.1")
+        toolchain = ToolchainProbe(cache_path)
+        toolchain.probe(["git"])
+
+        assert toolchain.probe(["git"], refresh=True)["git"].cached is False
+        toolchain.clear()
+        assert not cache_path.exists()
+
+    def test_corrupt_cache_is_ignored(self, bin_dir, cache_path):
+        make_tool(bin_dir, "git", "git version 2.39.1")
+        cache_path.parent.mkdir(parents=True)
+        cache_path.write_text("{not json")
+
+        probe = ToolchainProbe(cache_path).probe(["git"])["git"]
+
+        assert probe.version == "2.39.1"
+        assert json.loads(cache_path.read_text())["schema_version"] == 1
+
+    def test_instance_reuses_results_without_cache_file(self, bin_dir):
+        make_tool(bin_dir, "git", "git version 2.39.1")
+        toolchain = ToolchainProbe(cache_path=None)
+
+        toolchain.probe(["git"])
+        probe = toolchain.probe(["git", "uv"])["git"]
+
+        assert probe.version == "2.39.1"
+        assert calls(bin_dir, "git") == 1
+
+    def test_unwritable_cache_does_not_fail(self, bin_dir, tmp_path):
+        make_tool(bin_dir, "git", "git version 2.39.1")
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+
+        probe = ToolchainProbe(blocker / "toolchain.json").probe(["git"])["git"]
+
+        assert probe.version == "2.39.1"
+
+    def test_missing_tools_are_not_cached(self, bin_dir, cache_path):
+        make_tool(bin_dir, "git", "git version 2.39.1")
+
+        ToolchainProbe(cache_path).probe(["git", "uv"])
+
+        assert list(json.loads(cache_path.read_text())["binaries"]) == [str(bin_dir / "git")]
+
+
+# ============================================================================
+# TEST VALIDATION SERVICE INTEGRATION
+# ============================================================================
+
+
+class TestValidationServiceToolchain:
+    """ValidationService with a toolchain probe."""
+
+    def test_system_requirements_use_probe_results(self):
+        toolchain = Mock()
+        toolchain.probe.return_value = {
+            "git": ToolProbe(tool="git", installed=True, version="2.29.0"),
+            "python": ToolProbe(tool="python", installed=True, version="3.12.1"),
+            "uv": ToolProbe(tool="uv", installed=False),
+        }
+        config = TACConfig(
+            project=ProjectSpec(
+                name="test-app", language=Language.PYTHON, package_manager=PackageManager.UV
+            ),
+            commands=CommandsSpec(start="uv run app", test="uv run pytest"),
+            claude=ClaudeConfig(settings=ClaudeSettings(project_name="test-app")),
+        )
+        service = ValidationService(Mock(), toolchain=toolchain)
+
+        result = service.validate_system_requirements(config)
+
+        toolchain.probe.assert_called_once_with(["git", "python", "uv"])
+        messages = [issue.message for issue in result.errors()]
+        assert any("2.29.0" in message for message in messages)
+        assert any(message.startswith("uv is not installed") for message in messages)
+        assert not any("python" in message.lower() for message in messages)
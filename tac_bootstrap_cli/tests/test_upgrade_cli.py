@@ -1,5 +1,6 @@
 """Tests for upgrade CLI command."""
 
+import json
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -24,7 +25,7 @@ def test_upgrade_command_already_up_to_date(tmp_path: Path) -> None:
     config_file = tmp_path / "config.yml"
     config_file.write_text("version: 0.10.2\nproject:\n  name: test\n")
 
-    with patch("tac_bootstrap.interfaces.cli.UpgradeService") as mock_service:
+    with patch("tac_bootstrap.interfaces.commands.upgrade.UpgradeService") as mock_service:
         mock_instance = MagicMock()
         mock_instance.needs_upgrade.return_value = (False, "0.10.2", "0.10.2")
         mock_service.return_value = mock_instance
@@ -41,7 +42,7 @@ def test_upgrade_command_dry_run(tmp_path: Path) -> None:
     config_file = tmp_path / "config.yml"
     config_file.write_text("version: 0.1.0\nproject:\n  name: test\n")
 
-    with patch("tac_bootstrap.interfaces.cli.UpgradeService") as mock_service:
+    with patch("tac_bootstrap.interfaces.commands.upgrade.UpgradeService") as mock_service:
         mock_instance = MagicMock()
         mock_instance.needs_upgrade.return_value = (True, "0.1.0", "0.10.2")
         mock_instance.get_changes_preview.return_value = [
@@ -65,7 +66,7 @@ def test_upgrade_command_user_cancels(tmp_path: Path) -> None:
     config_file = tmp_path / "config.yml"
     config_file.write_text("version: 0.1.0\nproject:\n  name: test\n")
 
-    with patch("tac_bootstrap.interfaces.cli.UpgradeService") as mock_service:
+    with patch("tac_bootstrap.interfaces.commands.upgrade.UpgradeService") as mock_service:
         mock_instance = MagicMock()
         mock_instance.needs_upgrade.return_value = (True, "0.1.0", "0.10.2")
         mock_instance.get_changes_preview.return_value = ["Update adws/ directory"]
@@ -85,7 +86,7 @@ def test_upgrade_command_success(tmp_path: Path) -> None:
     config_file = tmp_path / "config.yml"
     config_file.write_text("version: 0.1.0\nproject:\n  name: test\n")
 
-    with patch("tac_bootstrap.interfaces.cli.UpgradeService") as mock_service:
+    with patch("tac_bootstrap.interfaces.commands.upgrade.UpgradeService") as mock_service:
         mock_instance = MagicMock()
         mock_instance.needs_upgrade.return_value = (True, "0.1.0", "0.10.2")
         mock_instance.get_changes_preview.return_value = ["Update adws/ directory"]
@@ -107,7 +108,7 @@ def test_upgrade_command_no_backup(tmp_path: Path) -> None:
     config_file = tmp_path / "config.yml"
     config_file.write_text("version: 0.1.0\nproject:\n  name: test\n")
 
-    with patch("tac_bootstrap.interfaces.cli.UpgradeService") as mock_service:
+    with patch("tac_bootstrap.interfaces.commands.upgrade.UpgradeService") as mock_service:
         mock_instance = MagicMock()
         mock_instance.needs_upgrade.return_value = (True, "0.1.0", "0.10.2")
         mock_instance.get_changes_preview.return_value = ["Update adws/ directory"]
@@ -129,7 +130,7 @@ def test_upgrade_command_force(tmp_path: Path) -> None:
     config_file = tmp_path / "config.yml"
     config_file.write_text("version: 0.10.2\nproject:\n  name: test\n")
 
-    with patch("tac_bootstrap.interfaces.cli.UpgradeService") as mock_service:
+    with patch("tac_bootstrap.interfaces.commands.upgrade.UpgradeService") as mock_service:
         mock_instance = MagicMock()
         mock_instance.needs_upgrade.return_value = (False, "0.10.2", "0.10.2")
         mock_instance.get_changes_preview.return_value = ["Update adws/ directory"]
@@ -150,7 +151,7 @@ def test_upgrade_command_failure(tmp_path: Path) -> None:
     config_file = tmp_path / "config.yml"
     config_file.write_text("version: 0.1.0\nproject:\n  name: test\n")
 
-    with patch("tac_bootstrap.interfaces.cli.UpgradeService") as mock_service:
+    with patch("tac_bootstrap.interfaces.commands.upgrade.UpgradeService") as mock_service:
         mock_instance = MagicMock()
         mock_instance.needs_upgrade.return_value = (True, "0.1.0", "0.10.2")
         mock_instance.get_changes_preview.return_value = ["Update adws/ directory"]
@@ -170,7 +171,7 @@ def test_upgrade_newer_project_version(tmp_path: Path) -> None:
     config_file = tmp_path / "config.yml"
     config_file.write_text("version: 0.10.2\nproject:\n  name: test\n")
 
-    with patch("tac_bootstrap.interfaces.cli.UpgradeService") as mock_service:
+    with patch("tac_bootstrap.interfaces.commands.upgrade.UpgradeService") as mock_service:
         mock_instance = MagicMock()
         # Simulate project version (0.10.2) > CLI version (0.10.2)
         mock_instance.needs_upgrade.return_value = (False, "0.10.2", "0.10.2")
@@ -181,3 +182,32 @@ def test_upgrade_newer_project_version(tmp_path: Path) -> None:
         assert result.exit_code == 0
         assert "already up to date" in result.stdout
         mock_instance.perform_upgrade.assert_not_called()
+
+
+def test_upgrade_plan_prints_json(tmp_path: Path) -> None:
+    """Test upgrade --plan prints a JSON plan and writes nothing."""
+    config_file = tmp_path / "config.yml"
+    config_file.write_text(
+        "version: 0.1.0\n"
+        "project: {name: test, language: python, package_manager: uv}\n"
+        "commands: {start: uv run app, test: uv run pytest}\n"
+        "claude: {settings: {project_name: test}}\n"
+    )
+
+    result = runner.invoke(app, ["upgrade", str(tmp_path), "--plan"])
+
+    assert result.exit_code == 0
+    plan = json.loads(result.stdout)
+    assert plan["needs_upgrade"] is True
+    assert plan["summary"]["created"] > 0
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["config.yml"]
+
+
+def test_upgrade_plan_invalid_config(tmp_path: Path) -> None:
+    """Test upgrade --plan exits with an error when config.yml cannot be loaded."""
+    (tmp_path / "config.yml").write_text("version: 0.1.0\nproject:\n  name: test\n")
+
+    result = runner.invoke(app, ["upgrade", str(tmp_path), "--plan"])
+
+    assert result.exit_code == 1
+    assert "Error planning upgrade" in result.output
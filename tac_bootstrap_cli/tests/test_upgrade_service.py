@@ -171,6 +171,39 @@ class TestUpgradeService:
         # Verify content is preserved
         assert (backup_path / "adws" / "dummy.txt").read_text() == "old content"
 
+    def test_create_backup_is_incremental(self, mock_project: Path) -> None:
+        """A second backup should link unchanged files and copy only changed ones."""
+        service = UpgradeService(mock_project)
+        service.backup_store._reflink_supported = False
+        first = service.create_backup()
+        (mock_project / "adws" / "dummy.txt").write_text("new content!")
+
+        second = service.create_backup()
+
+        assert second != first
+        assert service.last_backup.previous == first
+        assert (service.last_backup.copied, service.last_backup.linked) == (1, 3)
+        assert (second / "adws" / "dummy.txt").read_text() == "new content!"
+        assert (first / "adws" / "dummy.txt").read_text() == "old content"
+        assert service.backup_store.verify(second, deep=True) == []
+
+    def test_create_backup_reads_retention_without_loading_config(
+        self, mock_project: Path
+    ) -> None:
+        """Backup retention should come from config.yml without validating the config."""
+        config_file = mock_project / "config.yml"
+        config_data = yaml.safe_load(config_file.read_text())
+        config_data["bootstrap"] = {"backup_retention": 1}
+        config_file.write_text(yaml.dump(config_data))
+        service = UpgradeService(mock_project)
+
+        with patch.object(service, "load_existing_config") as mock_load:
+            service.create_backup()
+            latest = service.create_backup()
+
+        mock_load.assert_not_called()
+        assert list(mock_project.glob(".tac-backup-*")) == [latest]
+
     # ============================================================================
     # TEST PREVIEW AND CONFIG LOADING
     # ============================================================================
@@ -589,3 +622,117 @@ class TestUpgradeServiceEdgeCases:
 
         # Should default to 0.1.0 for non-dict content
         assert version == "0.1.0"
+
+
+# ============================================================================
+# TEST UPGRADE PLAN
+# ============================================================================
+
+
+def snapshot_tree(root: Path) -> dict:
+    """Map every file under root to its content, for asserting nothing changed."""
+    return {
+        path.relative_to(root).as_posix(): path.read_bytes()
+        for path in root.rglob("*")
+        if path.is_file()
+    }
+
+
+class TestUpgradePlan:
+    """Tests for the in-memory upgrade plan."""
+
+    def test_plan_writes_nothing(self, mock_project: Path) -> None:
+        """plan_upgrade should leave the working tree untouched."""
+        before = snapshot_tree(mock_project)
+
+        plan = UpgradeService(mock_project).plan_upgrade()
+
+        assert snapshot_tree(mock_project) == before
+        assert not list(mock_project.glob(".tac-backup-*"))
+        assert plan.needs_upgrade is True
+        assert plan.from_version == "0.1.0"
+
+    def test_plan_reports_created_modified_and_deleted(self, mock_project: Path) -> None:
+        """Framework files are created, stale ones deleted and config.yml diffed."""
+        plan = UpgradeService(mock_project).plan_upgrade()
+        changes = {change.path: change for change in plan.changes}
+
+        assert plan.count("created") > 100
+        assert changes["adws/dummy.txt"].status == "deleted"
+        assert changes["scripts/dummy.txt"].status == "deleted"
+        assert "src/main.py" not in changes
+        config_change = changes["config.yml"]
+        assert config_change.status == "modified"
+        assert config_change.diff.startswith("--- a/config.yml\n+++ b/config.yml\n")
+        assert f'+version: "{__version__}"' in config_change.diff or (
+            f"+version: {__version__}" in config_change.diff
+        )
+        assert [change.path for change in plan.changes] == sorted(changes)
+
+    def test_plan_after_upgrade_shows_only_local_edits(self, mock_project: Path) -> None:
+        """After an upgrade, only files edited since are reported."""
+        service = UpgradeService(mock_project)
+        success, _ = service.perform_upgrade(backup=False)
+        assert success
+        script = next(path for path in (mock_project / "scripts").iterdir() if path.is_file())
+        rel = script.relative_to(mock_project).as_posix()
+        script.write_text(script.read_text() + "\n# local edit\n")
+        (mock_project / ".claude" / "notes.md").write_text("mine")
+
+        plan = UpgradeService(mock_project).plan_upgrade()
+        changes = {change.path: change for change in plan.changes}
+
+        assert plan.count("created") == 0
+        assert plan.unchanged > 100
+        assert "-# local edit\n" in changes[rel].diff
+        assert changes[rel].previous_sha256 != changes[rel].sha256
+        assert changes[".claude/notes.md"].status == "deleted"
+        assert set(changes) <= {rel, ".claude/notes.md", "config.yml"}
+
+    def test_plan_on_up_to_date_repo_reports_no_changes(self, mock_project: Path) -> None:
+        """The last_upgrade timestamp alone should not make config.yml modified."""
+        success, _ = UpgradeService(mock_project).perform_upgrade(backup=False)
+        assert success
+
+        plan = UpgradeService(mock_project).plan_upgrade()
+
+        assert plan.needs_upgrade is False
+        assert plan.changes == []
+
+    def test_plan_patches_non_utf8_files(self, mock_project: Path) -> None:
+        """Patched files with undecodable bytes should be planned, not crash the plan."""
+        success, _ = UpgradeService(mock_project).perform_upgrade(backup=False)
+        assert success
+        gitignore = mock_project / ".gitignore"
+        gitignore.write_bytes(gitignore.read_bytes() + b"caf\xe9/\n")
+
+        plan = UpgradeService(mock_project).plan_upgrade()
+
+        assert ".gitignore" not in {change.path for change in plan.changes}
+
+    def test_plan_without_diffs(self, mock_project: Path) -> None:
+        """include_diffs=False should still classify files by hash."""
+        plan = UpgradeService(mock_project).plan_upgrade(include_diffs=False)
+
+        config_change = next(change for change in plan.changes if change.path == "config.yml")
+        assert config_change.status == "modified"
+        assert config_change.diff is None
+
+    def test_plan_to_dict_is_json_serializable(self, mock_project: Path) -> None:
+        """to_dict should produce a JSON document with a summary."""
+        import json
+
+        data = json.loads(json.dumps(UpgradeService(mock_project).plan_upgrade().to_dict()))
+
+        assert data["summary"]["deleted"] == 3
+        assert data["summary"]["created"] == len(
+            [change for change in data["changes"] if change["status"] == "created"]
+        )
+        assert set(data["timings_ms"]) == {"render", "compare"}
+
+    def test_plan_requires_loadable_config(self, tmp_path: Path) -> None:
+        """plan_upgrade should raise when the config cannot be loaded."""
+        (tmp_path / "config.yml").write_text("invalid: yaml: content:\n  - broken")
+
+        with pytest.raises(ValueError, match="Could not load existing configuration"):
+            UpgradeService(tmp_path).plan_upgrade()